@@ -808,6 +808,8 @@ class Tags(enum.Enum):
     INITIAL_COUNTER_VALUE                  = 0x4200D1
     INVOCATION_FIELD_LENGTH                = 0x4200D2
     ATTESTATION_CAPABLE_INDICATOR          = 0x4200D3
+    OFFSET_ITEMS                           = 0x4200D4
+    LOCATED_ITEMS                          = 0x4200D5
 
 
 class Types(enum.Enum):
@@ -16,6 +16,7 @@
 from kmip.core.factories.payloads import PayloadFactory
 
 from kmip.core.messages.payloads import activate
+from kmip.core.messages.payloads import cancel
 from kmip.core.messages.payloads import create
 from kmip.core.messages.payloads import create_key_pair
 from kmip.core.messages.payloads import destroy
@@ -23,6 +24,7 @@ from kmip.core.messages.payloads import discover_versions
 from kmip.core.messages.payloads import get
 from kmip.core.messages.payloads import get_attribute_list
 from kmip.core.messages.payloads import locate
+from kmip.core.messages.payloads import poll
 from kmip.core.messages.payloads import query
 from kmip.core.messages.payloads import rekey_key_pair
 from kmip.core.messages.payloads import register
@@ -66,3 +68,9 @@ class RequestPayloadFactory(PayloadFactory):
 
     def _create_revoke_payload(self):
         return revoke.RevokeRequestPayload()
+
+    def _create_cancel_payload(self):
+        return cancel.CancelRequestPayload()
+
+    def _create_poll_payload(self):
+        return poll.PollRequestPayload()
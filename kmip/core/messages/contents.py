@@ -307,6 +307,14 @@ class MessageExtension(Struct):
         super(MessageExtension, self).__init__(enums.Tags.MESSAGE_EXTENSION)
 
 
+# 4.27
+class CancellationResult(Enumeration):
+
+    def __init__(self, value=None):
+        super(CancellationResult, self).__init__(
+            enums.CancellationResult, value, enums.Tags.CANCELLATION_RESULT)
+
+
 # 9.1.3.2.2
 class KeyCompressionType(Enumeration):
 
@@ -0,0 +1,190 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.core import enums
+
+from kmip.core.messages import contents
+
+from kmip.core.primitives import Struct
+
+from kmip.core.utils import BytearrayStream
+
+
+class CancelRequestPayload(Struct):
+    """
+    A request payload for the Cancel operation.
+
+    The payload contains the asynchronous correlation value of an outstanding
+    asynchronous operation the client wants to cancel. See Section 4.27 of
+    the KMIP 1.1 specification for more information.
+
+    Attributes:
+        asynchronous_correlation_value: The correlation value returned by the
+            server when the original operation was accepted.
+    """
+    def __init__(self,
+                 asynchronous_correlation_value=None):
+        """
+        Construct a CancelRequestPayload object.
+
+        Args:
+            asynchronous_correlation_value (AsynchronousCorrelationValue): The
+                correlation value of the outstanding operation. Optional,
+                defaults to None.
+        """
+        super(CancelRequestPayload, self).__init__(
+            tag=enums.Tags.REQUEST_PAYLOAD)
+        self.asynchronous_correlation_value = asynchronous_correlation_value
+        self.validate()
+
+    def read(self, istream):
+        """
+        Read the data encoding the CancelRequestPayload object and decode it
+        into its constituent parts.
+
+        Args:
+            istream (Stream): A data stream containing encoded object data,
+                supporting a read method; usually a BytearrayStream object.
+        """
+        super(CancelRequestPayload, self).read(istream)
+        tstream = BytearrayStream(istream.read(self.length))
+
+        self.asynchronous_correlation_value = \
+            contents.AsynchronousCorrelationValue()
+        self.asynchronous_correlation_value.read(tstream)
+
+        self.is_oversized(tstream)
+        self.validate()
+
+    def write(self, ostream):
+        """
+        Write the data encoding the CancelRequestPayload object to a stream.
+
+        Args:
+            ostream (Stream): A data stream in which to encode object data,
+                supporting a write method; usually a BytearrayStream object.
+        """
+        tstream = BytearrayStream()
+
+        # Write the contents of the request payload
+        if self.asynchronous_correlation_value is not None:
+            self.asynchronous_correlation_value.write(tstream)
+
+        # Write the length and value of the request payload
+        self.length = tstream.length()
+        super(CancelRequestPayload, self).write(ostream)
+        ostream.write(tstream.buffer)
+
+    def validate(self):
+        """
+        Error check the attributes of the CancelRequestPayload object.
+        """
+        if self.asynchronous_correlation_value is not None:
+            if not isinstance(self.asynchronous_correlation_value,
+                              contents.AsynchronousCorrelationValue):
+                msg = "invalid asynchronous correlation value"
+                raise TypeError(msg)
+
+
+class CancelResponsePayload(Struct):
+    """
+    A response payload for the Cancel operation.
+
+    The payload contains the correlation value of the operation the client
+    asked to cancel, along with the result of the cancellation. See Section
+    4.27 of the KMIP 1.1 specification for more information.
+
+    Attributes:
+        asynchronous_correlation_value: The correlation value of the
+            outstanding operation.
+        cancellation_result: An enumeration describing the outcome of the
+            cancellation request.
+    """
+    def __init__(self,
+                 asynchronous_correlation_value=None,
+                 cancellation_result=None):
+        """
+        Construct a CancelResponsePayload object.
+
+        Args:
+            asynchronous_correlation_value (AsynchronousCorrelationValue): The
+                correlation value of the outstanding operation. Optional,
+                defaults to None.
+            cancellation_result (CancellationResult): The outcome of the
+                cancellation request. Optional, defaults to None.
+        """
+        super(CancelResponsePayload, self).__init__(
+            tag=enums.Tags.RESPONSE_PAYLOAD)
+        self.asynchronous_correlation_value = asynchronous_correlation_value
+        self.cancellation_result = cancellation_result
+        self.validate()
+
+    def read(self, istream):
+        """
+        Read the data encoding the CancelResponsePayload object and decode it
+        into its constituent parts.
+
+        Args:
+            istream (Stream): A data stream containing encoded object data,
+                supporting a read method; usually a BytearrayStream object.
+        """
+        super(CancelResponsePayload, self).read(istream)
+        tstream = BytearrayStream(istream.read(self.length))
+
+        self.asynchronous_correlation_value = \
+            contents.AsynchronousCorrelationValue()
+        self.asynchronous_correlation_value.read(tstream)
+
+        self.cancellation_result = contents.CancellationResult()
+        self.cancellation_result.read(tstream)
+
+        self.is_oversized(tstream)
+        self.validate()
+
+    def write(self, ostream):
+        """
+        Write the data encoding the CancelResponsePayload object to a stream.
+
+        Args:
+            ostream (Stream): A data stream in which to encode object data,
+                supporting a write method; usually a BytearrayStream object.
+        """
+        tstream = BytearrayStream()
+
+        # Write the contents of the response payload
+        if self.asynchronous_correlation_value is not None:
+            self.asynchronous_correlation_value.write(tstream)
+        if self.cancellation_result is not None:
+            self.cancellation_result.write(tstream)
+
+        # Write the length and value of the response payload
+        self.length = tstream.length()
+        super(CancelResponsePayload, self).write(ostream)
+        ostream.write(tstream.buffer)
+
+    def validate(self):
+        """
+        Error check the attributes of the CancelResponsePayload object.
+        """
+        if self.asynchronous_correlation_value is not None:
+            if not isinstance(self.asynchronous_correlation_value,
+                              contents.AsynchronousCorrelationValue):
+                msg = "invalid asynchronous correlation value"
+                raise TypeError(msg)
+        if self.cancellation_result is not None:
+            if not isinstance(self.cancellation_result,
+                              contents.CancellationResult):
+                msg = "invalid cancellation result"
+                raise TypeError(msg)
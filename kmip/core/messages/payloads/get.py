@@ -105,6 +105,25 @@ class GetRequestPayload(Struct):
         pass
 
 
+class EncodedSecret(object):
+    """
+    A secret that has already been encoded.
+
+    Used in place of a secret object by a GetResponsePayload that is only
+    written, so that a stored TTLV encoding can be sent without decoding and
+    re-encoding it.
+    """
+
+    def __init__(self, encoding):
+        self.encoding = encoding
+
+    def write(self, ostream):
+        ostream.write(self.encoding)
+
+    def validate(self):
+        pass
+
+
 class GetResponsePayload(Struct):
 
     def __init__(self,
@@ -40,17 +40,31 @@ class LocateRequestPayload(Struct):
             super(LocateRequestPayload.MaximumItems, self).__init__(
                 value, Tags.MAXIMUM_ITEMS)
 
+    class OffsetItems(Integer):
+        """
+        The number of matching items to skip, as added in KMIP 1.3.
+        """
+
+        def __init__(self, value=None):
+            super(LocateRequestPayload.OffsetItems, self).__init__(
+                value, Tags.OFFSET_ITEMS)
+
     # 9.1.3.3.2
-    class StorageStatusMask(Enumeration):
+    class StorageStatusMask(Integer):
+        """
+        A bit mask of StorageStatus values.
+        """
 
         def __init__(self, value=None):
             super(LocateRequestPayload.StorageStatusMask, self).__init__(
-                enums.StorageStatusMask, value, Tags.STORAGE_STATUS_MASK)
+                value, Tags.STORAGE_STATUS_MASK)
 
     def __init__(self, maximum_items=None, storage_status_mask=None,
-                 object_group_member=None, attributes=None):
+                 object_group_member=None, attributes=None,
+                 offset_items=None):
         super(LocateRequestPayload, self).__init__(enums.Tags.REQUEST_PAYLOAD)
         self.maximum_items = maximum_items
+        self.offset_items = offset_items
         self.storage_status_mask = storage_status_mask
         self.object_group_member = object_group_member
         self.attributes = attributes or []
@@ -62,6 +76,9 @@ class LocateRequestPayload(Struct):
         if self.is_tag_next(Tags.MAXIMUM_ITEMS, tstream):
             self.maximum_items = LocateRequestPayload.MaximumItems()
             self.maximum_items.read(tstream)
+        if self.is_tag_next(Tags.OFFSET_ITEMS, tstream):
+            self.offset_items = LocateRequestPayload.OffsetItems()
+            self.offset_items.read(tstream)
         if self.is_tag_next(Tags.STORAGE_STATUS_MASK, tstream):
             self.storage_status_mask = LocateRequestPayload.StorageStatusMask()
             self.storage_status_mask.read(tstream)
@@ -79,6 +96,8 @@ class LocateRequestPayload(Struct):
         tstream = BytearrayStream()
         if self.maximum_items is not None:
             self.maximum_items.write(tstream)
+        if self.offset_items is not None:
+            self.offset_items.write(tstream)
         if self.storage_status_mask is not None:
             self.storage_status_mask.write(tstream)
         if self.object_group_member is not None:
@@ -102,9 +121,19 @@ class LocateRequestPayload(Struct):
 
 class LocateResponsePayload(Struct):
 
-    def __init__(self, unique_identifiers=[]):
+    class LocatedItems(Integer):
+        """
+        The total number of items matching a search, as added in KMIP 1.3.
+        """
+
+        def __init__(self, value=None):
+            super(LocateResponsePayload.LocatedItems, self).__init__(
+                value, Tags.LOCATED_ITEMS)
+
+    def __init__(self, unique_identifiers=[], located_items=None):
         super(LocateResponsePayload, self).__init__(
             enums.Tags.RESPONSE_PAYLOAD)
+        self.located_items = located_items
         self.unique_identifiers = unique_identifiers or []
         self.validate()
 
@@ -112,6 +141,10 @@ class LocateResponsePayload(Struct):
         super(LocateResponsePayload, self).read(istream)
         tstream = BytearrayStream(istream.read(self.length))
 
+        if self.is_tag_next(Tags.LOCATED_ITEMS, tstream):
+            self.located_items = LocateResponsePayload.LocatedItems()
+            self.located_items.read(tstream)
+
         while self.is_tag_next(Tags.UNIQUE_IDENTIFIER, tstream):
             ui = attributes.UniqueIdentifier()
             ui.read(tstream)
@@ -123,6 +156,9 @@ class LocateResponsePayload(Struct):
     def write(self, ostream):
         tstream = BytearrayStream()
 
+        if self.located_items is not None:
+            self.located_items.write(tstream)
+
         for ui in self.unique_identifiers:
             ui.write(tstream)
 
@@ -0,0 +1,98 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.core import enums
+
+from kmip.core.messages import contents
+
+from kmip.core.primitives import Struct
+
+from kmip.core.utils import BytearrayStream
+
+
+class PollRequestPayload(Struct):
+    """
+    A request payload for the Poll operation.
+
+    The payload contains the asynchronous correlation value of an outstanding
+    asynchronous operation whose status the client wants to check. See
+    Section 4.28 of the KMIP 1.1 specification for more information.
+
+    Attributes:
+        asynchronous_correlation_value: The correlation value returned by the
+            server when the original operation was accepted.
+    """
+    def __init__(self,
+                 asynchronous_correlation_value=None):
+        """
+        Construct a PollRequestPayload object.
+
+        Args:
+            asynchronous_correlation_value (AsynchronousCorrelationValue): The
+                correlation value of the outstanding operation. Optional,
+                defaults to None.
+        """
+        super(PollRequestPayload, self).__init__(
+            tag=enums.Tags.REQUEST_PAYLOAD)
+        self.asynchronous_correlation_value = asynchronous_correlation_value
+        self.validate()
+
+    def read(self, istream):
+        """
+        Read the data encoding the PollRequestPayload object and decode it
+        into its constituent parts.
+
+        Args:
+            istream (Stream): A data stream containing encoded object data,
+                supporting a read method; usually a BytearrayStream object.
+        """
+        super(PollRequestPayload, self).read(istream)
+        tstream = BytearrayStream(istream.read(self.length))
+
+        self.asynchronous_correlation_value = \
+            contents.AsynchronousCorrelationValue()
+        self.asynchronous_correlation_value.read(tstream)
+
+        self.is_oversized(tstream)
+        self.validate()
+
+    def write(self, ostream):
+        """
+        Write the data encoding the PollRequestPayload object to a stream.
+
+        Args:
+            ostream (Stream): A data stream in which to encode object data,
+                supporting a write method; usually a BytearrayStream object.
+        """
+        tstream = BytearrayStream()
+
+        # Write the contents of the request payload
+        if self.asynchronous_correlation_value is not None:
+            self.asynchronous_correlation_value.write(tstream)
+
+        # Write the length and value of the request payload
+        self.length = tstream.length()
+        super(PollRequestPayload, self).write(ostream)
+        ostream.write(tstream.buffer)
+
+    def validate(self):
+        """
+        Error check the attributes of the PollRequestPayload object.
+        """
+        if self.asynchronous_correlation_value is not None:
+            if not isinstance(self.asynchronous_correlation_value,
+                              contents.AsynchronousCorrelationValue):
+                msg = "invalid asynchronous correlation value"
+                raise TypeError(msg)
@@ -13,9 +13,76 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import json
+import six
+
 from kmip.core import enums
 
 
+def parse_policy(policy):
+    """
+    Convert a policy loaded from JSON into its enumeration form.
+
+    Args:
+        policy (dict): A mapping of ObjectType names to mappings of
+            Operation names to Policy names, e.g.
+            {"SYMMETRIC_KEY": {"GET": "ALLOW_ALL"}}. Required.
+
+    Returns:
+        dict: The same policy keyed by ObjectType and Operation
+            enumerations, with Policy enumeration values.
+    """
+    result = {}
+
+    for object_type, operation_policies in six.iteritems(policy):
+        processed_operation_policies = {}
+
+        for operation, permission in six.iteritems(operation_policies):
+            processed_operation_policies[enums.Operation[operation]] = \
+                enums.Policy[permission]
+
+        result[enums.ObjectType[object_type]] = processed_operation_policies
+
+    return result
+
+
+def read_policy_from_file(path):
+    """
+    Load the operation policies defined in a JSON file.
+
+    Args:
+        path (string): The path to a JSON file mapping policy names to
+            policies in the format accepted by parse_policy. Required.
+
+    Returns:
+        dict: The policies defined in the file, keyed by policy name.
+
+    Raises:
+        ValueError: Raised if the file is not valid JSON or if a policy in
+            the file cannot be parsed.
+    """
+    with open(path, 'r') as f:
+        try:
+            policy_blob = json.loads(f.read())
+        except Exception as e:
+            raise ValueError(
+                "An error occurred while attempting to parse the JSON "
+                "file. {0}".format(e)
+            )
+
+    policies = {}
+
+    for name, policy in six.iteritems(policy_blob):
+        try:
+            policies[name] = parse_policy(policy)
+        except Exception as e:
+            raise ValueError(
+                "Failure parsing policy '{0}': {1}".format(name, e)
+            )
+
+    return policies
+
+
 policies = {
     'default': {
         enums.ObjectType.CERTIFICATE: {
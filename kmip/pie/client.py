@@ -293,6 +293,79 @@ class ProxyKmipClient(api.KmipClient):
             message = result.result_message.value
             raise exceptions.KmipOperationFailure(status, reason, message)
 
+    def locate_iter(self, attributes=None, page_size=1000,
+                    storage_status_mask=None, object_group_member=None):
+        """
+        Iterate over the IDs of the managed objects matching a search.
+
+        The IDs are requested one page at a time, using the Maximum Items
+        and Offset Items fields of Locate, so that arbitrarily large result
+        sets can be read with bounded memory. The iteration ends with the
+        first page holding fewer than page_size IDs.
+
+        Args:
+            attributes (list): A list of Attribute objects the located
+                objects must match. Optional, defaults to None.
+            page_size (int): The maximum number of IDs requested per Locate.
+                Optional, defaults to 1000.
+            storage_status_mask (int): A bit mask of StorageStatus values
+                limiting the search. Optional, defaults to None.
+            object_group_member (ObjectGroupMember): An ObjectGroupMember
+                enumeration limiting the search. Optional, defaults to None.
+
+        Returns:
+            generator: A generator yielding the unique ID string of each
+                located object.
+
+        Raises:
+            ClientConnectionNotOpen: if the client connection is unusable
+            KmipOperationFailure: if the operation result is a failure
+            TypeError: if the input arguments are invalid
+            ValueError: if the page size is not positive
+        """
+        # Check input
+        if not isinstance(page_size, six.integer_types):
+            raise TypeError("page_size must be an integer")
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+
+        # Verify that operations can be given at this time
+        if not self._is_open:
+            raise exceptions.ClientConnectionNotOpen()
+
+        return self._locate_pages(
+            attributes or [],
+            page_size,
+            storage_status_mask,
+            object_group_member
+        )
+
+    def _locate_pages(self, attributes, page_size, storage_status_mask,
+                      object_group_member):
+        offset = 0
+        while True:
+            result = self.proxy.locate(
+                maximum_items=page_size,
+                storage_status_mask=storage_status_mask,
+                object_group_member=object_group_member,
+                attributes=attributes,
+                offset_items=offset
+            )
+
+            status = result.result_status.value
+            if status != enums.ResultStatus.SUCCESS:
+                reason = result.result_reason.value
+                message = result.result_message.value
+                raise exceptions.KmipOperationFailure(status, reason, message)
+
+            uids = result.uuids or []
+            for uid in uids:
+                yield uid.value
+
+            if len(uids) < page_size:
+                return
+            offset += len(uids)
+
     def get(self, uid):
         """
         Get a managed object from a KMIP appliance.
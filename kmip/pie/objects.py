@@ -14,9 +14,10 @@
 # under the License.
 
 from abc import abstractmethod
-from sqlalchemy import Column, event, ForeignKey, Integer, String, VARBINARY
+from sqlalchemy import Column, event, ForeignKey, Index, Integer
+from sqlalchemy import LargeBinary, String
 from sqlalchemy.ext.associationproxy import association_proxy
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 
 import binascii
 import six
@@ -44,10 +45,23 @@ class ManagedObject(sql.Base):
     """
 
     __tablename__ = 'managed_objects'
-    unique_identifier = Column('uid', Integer, primary_key=True)
-    _object_type = Column('object_type', sql.EnumType(enums.ObjectType))
+    # IDs are generated when objects are stored, rather than by the data
+    # store, so that they are known before anything is written.
+    unique_identifier = Column(
+        'uid',
+        String(36),
+        primary_key=True,
+        default=sql.generate_ulid
+    )
+    _object_type = Column(
+        'object_type',
+        sql.EnumType(enums.ObjectType),
+        index=True
+    )
     _class_type = Column('class_type', String(50))
-    value = Column('value', VARBINARY(1024))
+    # Secret values are unbounded and only loaded when asked for, so that
+    # metadata queries do not read them.
+    value = deferred(Column('value', LargeBinary))
     name_index = Column(Integer, default=0)
     _names = relationship('ManagedObjectName', back_populates='mo',
                           cascade='all, delete-orphan')
@@ -55,17 +69,33 @@ class ManagedObject(sql.Base):
     operation_policy_name = Column(
         'operation_policy_name',
         String(50),
-        default='default'
+        default='default',
+        index=True
+    )
+    _owner = Column('owner', String(50), default=None, index=True)
+    _encoded_secret = deferred(
+        Column('encoded_secret', LargeBinary, default=None)
     )
-    _owner = Column('owner', String(50), default=None)
 
     __mapper_args__ = {
         'polymorphic_identity': 'ManagedObject',
         'polymorphic_on': _class_type
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
+    # The composite indexes match the operation policy checks, which filter
+    # on object type and policy name, and on owner for owner-only policies.
+    __table_args__ = (
+        Index(
+            'ix_managed_objects_object_type_policy',
+            'object_type',
+            'operation_policy_name'
+        ),
+        Index(
+            'ix_managed_objects_owner_object_type_policy',
+            'owner',
+            'object_type',
+            'operation_policy_name'
+        )
+    )
 
     @abstractmethod
     def __init__(self):
@@ -86,6 +116,7 @@ class ManagedObject(sql.Base):
         self._application_specific_informations = list()
         self._contact_information = None
         self._object_groups = list()
+        self._encoded_secret = None
 
         # The following attributes are placeholders for attributes that are
         # unsupported by kmip.core
@@ -154,7 +185,7 @@ class CryptographicObject(ManagedObject):
     """
 
     __tablename__ = 'crypto_objects'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('managed_objects.uid'),
                                primary_key=True)
     cryptographic_usage_masks = Column('cryptographic_usage_mask',
@@ -162,9 +193,6 @@ class CryptographicObject(ManagedObject):
     __mapper_args__ = {
         'polymorphic_identity': 'CryptographicObject'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     @abstractmethod
     def __init__(self):
@@ -213,21 +241,28 @@ class Key(CryptographicObject):
     """
 
     __tablename__ = 'keys'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('crypto_objects.uid'),
                                primary_key=True)
     cryptographic_algorithm = Column(
-        'cryptographic_algorithm', sql.EnumType(enums.CryptographicAlgorithm))
-    cryptographic_length = Column('cryptographic_length', Integer)
+        'cryptographic_algorithm',
+        sql.EnumType(enums.CryptographicAlgorithm),
+        index=True
+    )
+    cryptographic_length = Column('cryptographic_length', Integer, index=True)
     key_format_type = Column(
         'key_format_type', sql.EnumType(enums.KeyFormatType))
 
     __mapper_args__ = {
         'polymorphic_identity': 'Key'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
+    __table_args__ = (
+        Index(
+            'ix_keys_algorithm_length',
+            'cryptographic_algorithm',
+            'cryptographic_length'
+        ),
+    )
 
     @abstractmethod
     def __init__(self):
@@ -268,16 +303,13 @@ class SymmetricKey(Key):
     """
 
     __tablename__ = 'symmetric_keys'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('keys.uid'),
                                primary_key=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'SymmetricKey'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, algorithm, length, value, masks=None,
                  name='Symmetric Key'):
@@ -409,16 +441,13 @@ class PublicKey(Key):
     """
 
     __tablename__ = 'public_keys'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('keys.uid'),
                                primary_key=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'PublicKey'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, algorithm, length, value,
                  format_type=enums.KeyFormatType.X_509, masks=None,
@@ -563,16 +592,13 @@ class PrivateKey(Key):
     """
 
     __tablename__ = 'private_keys'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('keys.uid'),
                                primary_key=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'PrivateKey'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, algorithm, length, value, format_type, masks=None,
                  name='Private Key'):
@@ -712,7 +738,7 @@ class Certificate(CryptographicObject):
     """
 
     __tablename__ = 'certificates'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('crypto_objects.uid'),
                                primary_key=True)
     certificate_type = Column(
@@ -721,9 +747,6 @@ class Certificate(CryptographicObject):
     __mapper_args__ = {
         'polymorphic_identity': 'Certificate'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     @abstractmethod
     def __init__(self, certificate_type, value, masks=None,
@@ -814,16 +837,13 @@ class X509Certificate(Certificate):
     """
 
     __tablename__ = 'x509_certificates'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('certificates.uid'),
                                primary_key=True)
 
     __mapper_args__ = {
         'polymorphic_identity': 'Certificate'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, value, masks=None, name='X.509 Certificate'):
         """
@@ -890,16 +910,13 @@ class SecretData(CryptographicObject):
     """
 
     __tablename__ = 'secret_data_objects'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('crypto_objects.uid'),
                                primary_key=True)
     data_type = Column('data_type', sql.EnumType(enums.SecretDataType))
     __mapper_args__ = {
         'polymorphic_identity': 'SecretData'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, value, data_type, masks=None, name='Secret Data'):
         """
@@ -1006,16 +1023,13 @@ class OpaqueObject(ManagedObject):
     """
 
     __tablename__ = 'opaque_objects'
-    unique_identifier = Column('uid', Integer,
+    unique_identifier = Column('uid', String(36),
                                ForeignKey('managed_objects.uid'),
                                primary_key=True)
     opaque_type = Column('opaque_type', sql.EnumType(enums.OpaqueDataType))
     __mapper_args__ = {
         'polymorphic_identity': 'OpaqueData'
     }
-    __table_args__ = {
-        'sqlite_autoincrement': True
-    }
 
     def __init__(self, value, opaque_type, name='Opaque Object'):
         """
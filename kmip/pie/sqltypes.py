@@ -14,15 +14,202 @@
 # under the License.
 
 from kmip.core import enums
-from sqlalchemy import Column, ForeignKey, Integer, String
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
+import binascii
+import os
+import sqlalchemy
 import sqlalchemy.types as types
+import threading
+import time
+import uuid
 
 
 Base = declarative_base()
 
+_CROCKFORD_BASE32 = '0123456789ABCDEFGHJKMNPQRSTVWXYZ'
+_ulid_lock = threading.Lock()
+_ulid_last = [0, 0]
+
+
+def generate_ulid():
+    """
+    Generate a new object ID in the ULID format: a 48-bit timestamp in
+    milliseconds followed by 80 random bits, as 26 Crockford base32 digits.
+
+    ULIDs sort in the order they were created, which keeps inserts at the
+    end of the ID index. Within the same millisecond, the random part of
+    each ULID is one more than the last one generated by the process.
+
+    Returns:
+        string: The new ID.
+    """
+    with _ulid_lock:
+        timestamp = int(time.time() * 1000)
+        if timestamp > _ulid_last[0]:
+            randomness = int(binascii.hexlify(os.urandom(10)), 16)
+        else:
+            timestamp = _ulid_last[0]
+            randomness = _ulid_last[1] + 1
+            if randomness >> 80:
+                timestamp += 1
+                randomness = 0
+        _ulid_last[:] = [timestamp, randomness]
+
+    value = (timestamp << 80) | randomness
+    return ''.join(
+        _CROCKFORD_BASE32[(value >> shift) & 0x1F]
+        for shift in range(125, -1, -5)
+    )
+
+
+def generate_uuid():
+    """
+    Generate a new object ID in the format of a random (version 4) UUID.
+
+    Returns:
+        string: The new ID.
+    """
+    return str(uuid.uuid4())
+
+
+# The object ID generators by name of their format.
+IDENTIFIER_FORMATS = {
+    'ulid': generate_ulid,
+    'uuid': generate_uuid
+}
+
+
+def _needs_rebuild(inspector):
+    """
+    Check whether the object tables of a data store were created by an
+    earlier version with column types that cannot be altered in place:
+    integer object IDs, or a VARBINARY secret value column of bounded
+    length.
+    """
+    if 'managed_objects' not in inspector.get_table_names():
+        return False
+    for column in inspector.get_columns('managed_objects'):
+        if column['name'] == 'uid':
+            if isinstance(column['type'], types.Integer):
+                return True
+        elif column['name'] == 'value':
+            if not isinstance(column['type'], types.LargeBinary):
+                return True
+    return False
+
+
+def _rebuild_tables(data_store):
+    """
+    Rebuild the object tables of a data store created by an earlier version
+    with the current column types. Integer object IDs become strings holding
+    the same numbers, so that clients keep finding their objects, and the
+    VARBINARY(1024) secret value column becomes unbounded.
+
+    The tables holding IDs are renamed and their indexes dropped. The tables
+    are then created anew, and their rows copied over with the IDs cast to
+    strings, before the old tables are dropped. SQLite cannot change the type
+    of a column, and every table referring to the managed objects is rebuilt
+    with them so that no reference is left to a renamed table.
+    """
+    inspector = sqlalchemy.inspect(data_store)
+    if not _needs_rebuild(inspector):
+        return
+    table_names = inspector.get_table_names()
+
+    id_columns = ('uid', 'mo_uid')
+    tables = [
+        x for x in Base.metadata.sorted_tables
+        if x.name in table_names and
+        any(y.name in id_columns for y in x.columns)
+    ]
+    quote = data_store.dialect.identifier_preparer.quote
+
+    with data_store.begin() as connection:
+        for table in tables:
+            old_table = sqlalchemy.Table(
+                table.name,
+                sqlalchemy.MetaData(),
+                autoload=True,
+                autoload_with=connection
+            )
+            for index in old_table.indexes:
+                index.drop(connection)
+            connection.execute(sqlalchemy.text(
+                "ALTER TABLE {0} RENAME TO {1}".format(
+                    quote(table.name),
+                    quote(table.name + '_old')
+                )
+            ))
+
+        Base.metadata.create_all(connection, tables=tables)
+
+        for table in tables:
+            old_table = sqlalchemy.Table(
+                table.name + '_old',
+                sqlalchemy.MetaData(),
+                autoload=True,
+                autoload_with=connection
+            )
+            names = [x.name for x in table.columns if x.name in old_table.c]
+            connection.execute(table.insert().from_select(
+                names,
+                sqlalchemy.select([
+                    sqlalchemy.cast(old_table.c[x], table.c[x].type)
+                    if x in id_columns else old_table.c[x]
+                    for x in names
+                ])
+            ))
+
+        for table in reversed(tables):
+            connection.execute(sqlalchemy.text(
+                "DROP TABLE {0}".format(quote(table.name + '_old'))
+            ))
+
+
+def upgrade_schema(data_store):
+    """
+    Bring the schema of a data store up to date with the table definitions.
+
+    Missing tables are created as usual. Tables created by earlier versions
+    also get the columns and indexes added to them since, so that existing
+    databases keep working and benefit from new indexes. New columns must
+    be nullable. Tables with integer object IDs or a bounded secret value
+    column are rebuilt, keeping their rows. Nothing else is ever dropped.
+
+    Args:
+        data_store (Engine): The SQLAlchemy engine of the data store.
+    """
+    _rebuild_tables(data_store)
+    Base.metadata.create_all(data_store)
+
+    inspector = sqlalchemy.inspect(data_store)
+    quote = data_store.dialect.identifier_preparer.quote
+
+    with data_store.begin() as connection:
+        for table in Base.metadata.sorted_tables:
+            columns = set(
+                x['name'] for x in inspector.get_columns(table.name)
+            )
+            for column in table.columns:
+                if column.name not in columns:
+                    connection.execute(sqlalchemy.text(
+                        "ALTER TABLE {0} ADD COLUMN {1} {2}".format(
+                            quote(table.name),
+                            quote(column.name),
+                            column.type.compile(dialect=data_store.dialect)
+                        )
+                    ))
+
+            indexes = set(
+                x['name'] for x in inspector.get_indexes(table.name)
+            )
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(connection)
+
 
 def attribute_append_factory(index_attribute):
     def attribute_append(list_container, list_attribute, initiator):
@@ -43,6 +230,10 @@ class UsageMaskType(types.TypeDecorator):
 
     impl = types.Integer
 
+    # The enums of every bitmask read so far, shared by all columns. Stored
+    # bitmasks only combine the few masks in use, so the table stays small.
+    _masks = dict()
+
     def process_bind_param(self, value, dialect):
         """
         Returns the integer value of the usage mask bitmask. This value is
@@ -68,12 +259,14 @@ class UsageMaskType(types.TypeDecorator):
                 to create the list of enums.CryptographicUsageMask Enums.
             dialect(string): SQL dialect
         """
-        masks = list()
-        if value:
-            for e in enums.CryptographicUsageMask:
-                if e.value & value:
-                    masks.append(e)
-        return masks
+        masks = UsageMaskType._masks.get(value)
+        if masks is None:
+            masks = tuple(
+                e for e in enums.CryptographicUsageMask
+                if value and e.value & value
+            )
+            UsageMaskType._masks[value] = masks
+        return list(masks)
 
 
 class EnumType(types.TypeDecorator):
@@ -127,8 +320,13 @@ class ManagedObjectName(Base):
 
     __tablename__ = 'managed_object_names'
     id = Column('id', Integer, primary_key=True)
-    mo_uid = Column('mo_uid', Integer, ForeignKey('managed_objects.uid'))
-    name = Column('name', String)
+    mo_uid = Column(
+        'mo_uid',
+        String(36),
+        ForeignKey('managed_objects.uid'),
+        index=True
+    )
+    name = Column('name', String, index=True)
     index = Column('name_index', Integer)
     name_type = Column('name_type', EnumType(enums.NameType))
 
@@ -162,3 +360,25 @@ class ManagedObjectName(Base):
             return not (self == other)
         else:
             return NotImplemented
+
+
+class ManagedObjectChange(Base):
+    """
+    A record of a change to a stored managed object.
+
+    Servers sharing a data store read the records written since they last
+    looked to invalidate their cached copies of the changed objects.
+    """
+
+    __tablename__ = 'managed_object_changes'
+    id = Column('id', Integer, primary_key=True)
+    mo_uid = Column('mo_uid', String(36))
+    changed_at = Column('changed_at', Float, index=True)
+
+    __table_args__ = {
+        'sqlite_autoincrement': True
+    }
+
+    def __init__(self, mo_uid, changed_at):
+        self.mo_uid = mo_uid
+        self.changed_at = changed_at
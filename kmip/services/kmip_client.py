@@ -347,11 +347,13 @@ class KMIPProxy(KMIP):
             return results[0]
 
     def locate(self, maximum_items=None, storage_status_mask=None,
-               object_group_member=None, attributes=None, credential=None):
+               object_group_member=None, attributes=None, credential=None,
+               offset_items=None):
         return self._locate(maximum_items=maximum_items,
                             storage_status_mask=storage_status_mask,
                             object_group_member=object_group_member,
-                            attributes=attributes, credential=credential)
+                            attributes=attributes, credential=credential,
+                            offset_items=offset_items)
 
     def query(self, batch=False, query_functions=None, credential=None):
         """
@@ -800,16 +802,20 @@ class KMIPProxy(KMIP):
         return result
 
     def _locate(self, maximum_items=None, storage_status_mask=None,
-                object_group_member=None, attributes=[], credential=None):
+                object_group_member=None, attributes=[], credential=None,
+                offset_items=None):
 
         operation = Operation(OperationEnum.LOCATE)
 
         mxi = None
+        ofi = None
         ssmask = None
         objgrp = None
 
         if maximum_items is not None:
             mxi = locate.LocateRequestPayload.MaximumItems(maximum_items)
+        if offset_items is not None:
+            ofi = locate.LocateRequestPayload.OffsetItems(offset_items)
         if storage_status_mask is not None:
             m = storage_status_mask
             ssmask = locate.LocateRequestPayload.StorageStatusMask(m)
@@ -820,7 +826,8 @@ class KMIPProxy(KMIP):
         payload = locate.LocateRequestPayload(maximum_items=mxi,
                                               storage_status_mask=ssmask,
                                               object_group_member=objgrp,
-                                              attributes=attributes)
+                                              attributes=attributes,
+                                              offset_items=ofi)
 
         batch_item = messages.RequestBatchItem(operation=operation,
                                                request_payload=payload)
@@ -835,15 +842,19 @@ class KMIPProxy(KMIP):
         batch_item = batch_items[0]
         payload = batch_item.response_payload
 
+        located_items = None
         if payload is None:
             uuids = None
         else:
             uuids = payload.unique_identifiers
+            if payload.located_items is not None:
+                located_items = payload.located_items.value
 
         result = LocateResult(batch_item.result_status,
                               batch_item.result_reason,
                               batch_item.result_message,
-                              uuids)
+                              uuids,
+                              located_items)
         return result
 
     # TODO (peter-hamilton) Augment to handle device credentials
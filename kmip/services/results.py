@@ -194,10 +194,12 @@ class LocateResult(OperationResult):
                  result_status,
                  result_reason=None,
                  result_message=None,
-                 uuids=None):
+                 uuids=None,
+                 located_items=None):
         super(LocateResult, self).__init__(
             result_status, result_reason, result_message)
         self.uuids = uuids
+        self.located_items = located_items
 
 
 class QueryResult(OperationResult):
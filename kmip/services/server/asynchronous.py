@@ -0,0 +1,284 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import binascii
+import collections
+import logging
+import os
+import threading
+import time
+
+from six.moves import queue
+
+from kmip.core import enums
+from kmip.core import exceptions
+
+
+class AsynchronousOperation(object):
+    """
+    An operation accepted for asynchronous processing.
+
+    Attributes:
+        correlation_value (bytes): The value handed back to the client to
+            identify the operation in later Poll and Cancel requests.
+        operation (Operation): The enumeration of the original operation.
+        payload (Struct): The request payload of the original operation.
+        protocol_version (ProtocolVersion): The protocol version of the
+            original request, under which the operation is processed.
+        owner (string): The identity of the client that submitted the
+            operation.
+        state (string): One of 'pending', 'processing', 'completed' or
+            'canceled'.
+        result (tuple): The (status, reason, message, payload) result of the
+            operation once completed, otherwise None.
+        completed_at (float): The time at which the operation finished or was
+            canceled, otherwise None.
+    """
+
+    PENDING = 'pending'
+    PROCESSING = 'processing'
+    COMPLETED = 'completed'
+    CANCELED = 'canceled'
+
+    def __init__(self, correlation_value, operation, payload,
+                 protocol_version, owner):
+        self.correlation_value = correlation_value
+        self.operation = operation
+        self.payload = payload
+        self.protocol_version = protocol_version
+        self.owner = owner
+
+        self.state = self.PENDING
+        self.result = None
+        self.completed_at = None
+
+
+class AsynchronousOperationManager(object):
+    """
+    A background executor for asynchronous KMIP operations.
+
+    Submitted operations are queued and processed by a fixed pool of worker
+    threads. The number of queued operations is bounded, overall and per
+    client. Results are retained for a limited time after completion so
+    that clients can collect them with the Poll operation.
+    """
+
+    def __init__(self, processor, workers=2, result_ttl=300, queue_size=1024,
+                 client_limit=64):
+        """
+        Create an AsynchronousOperationManager.
+
+        Args:
+            processor (callable): A function taking an AsynchronousOperation
+                and returning its (status, reason, message, payload) result.
+                Required.
+            workers (int): The number of worker threads used to process
+                operations. The threads are started with the first
+                submission. Optional, defaults to 2.
+            result_ttl (int): The number of seconds a finished operation is
+                retained before it is discarded. Optional, defaults to 300.
+            queue_size (int): The maximum number of operations queued or
+                being processed at once. Optional, defaults to 1024.
+            client_limit (int): The maximum number of operations a single
+                client may have queued or being processed at once. Optional,
+                defaults to 64.
+        """
+        self._logger = logging.getLogger('kmip.server.asynchronous')
+
+        self._processor = processor
+        self._workers = workers
+        self._result_ttl = result_ttl
+        self._queue_size = queue_size
+        self._client_limit = client_limit
+
+        self._lock = threading.Lock()
+        self._operations = dict()
+        self._queue = queue.Queue()
+        self._threads = list()
+
+        # Operations count against the limits until a worker takes them off
+        # the queue and, unless canceled, finishes processing them.
+        self._queued_count = 0
+        self._client_counts = dict()
+
+        # Finished operations as (expiry time, correlation value) pairs.
+        # The TTL is fixed, so operations expire in the order they finish.
+        self._expiry = collections.deque()
+
+    def submit(self, operation, payload, protocol_version, owner):
+        """
+        Queue an operation for background processing.
+
+        Args:
+            operation (Operation): The enumeration of the operation.
+            payload (Struct): The request payload of the operation.
+            protocol_version (ProtocolVersion): The protocol version of the
+                request that submitted the operation.
+            owner (string): The identity of the submitting client.
+
+        Returns:
+            bytes: The asynchronous correlation value of the operation.
+
+        Raises:
+            KmipError: if the queue is full or the client already has the
+                maximum number of operations queued.
+        """
+        correlation_value = binascii.hexlify(os.urandom(16))
+        job = AsynchronousOperation(
+            correlation_value,
+            operation,
+            payload,
+            protocol_version,
+            owner
+        )
+
+        with self._lock:
+            self._purge_expired()
+
+            client_count = self._client_counts.get(owner, 0)
+            if self._queued_count >= self._queue_size:
+                raise exceptions.KmipError(
+                    reason=enums.ResultReason.GENERAL_FAILURE,
+                    message="Too many asynchronous operations are queued. "
+                            "Retry the operation later."
+                )
+            if client_count >= self._client_limit:
+                raise exceptions.KmipError(
+                    reason=enums.ResultReason.GENERAL_FAILURE,
+                    message="The client has too many asynchronous operations "
+                            "queued. Retry the operation later."
+                )
+            self._queued_count += 1
+            self._client_counts[owner] = client_count + 1
+
+            self._operations[correlation_value] = job
+            self._start_workers()
+
+        self._queue.put(job)
+        return correlation_value
+
+    def get(self, correlation_value, owner):
+        """
+        Look up an operation submitted by the given client.
+
+        Args:
+            correlation_value (bytes): The correlation value of the operation.
+            owner (string): The identity of the requesting client.
+
+        Returns:
+            AsynchronousOperation: The operation, or None if no unexpired
+                operation with that value was submitted by the client.
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._operations.get(correlation_value)
+            if job is None or job.owner != owner:
+                return None
+            return job
+
+    def cancel(self, correlation_value, owner):
+        """
+        Attempt to cancel an operation submitted by the given client.
+
+        Only operations that have not started processing can be canceled.
+
+        Args:
+            correlation_value (bytes): The correlation value of the operation.
+            owner (string): The identity of the requesting client.
+
+        Returns:
+            CancellationResult: The outcome of the cancellation request.
+        """
+        with self._lock:
+            self._purge_expired()
+            job = self._operations.get(correlation_value)
+            if job is None or job.owner != owner:
+                return enums.CancellationResult.UNAVAILABLE
+
+            if job.state == AsynchronousOperation.PENDING:
+                job.state = AsynchronousOperation.CANCELED
+                self._finish(job)
+                return enums.CancellationResult.CANCELED
+            elif job.state == AsynchronousOperation.PROCESSING:
+                return enums.CancellationResult.UNABLE_TO_CANCEL
+            elif job.state == AsynchronousOperation.CANCELED:
+                return enums.CancellationResult.CANCELED
+            elif job.result[0] == enums.ResultStatus.SUCCESS:
+                return enums.CancellationResult.COMPLETED
+            else:
+                return enums.CancellationResult.FAILED
+
+    def _start_workers(self):
+        while len(self._threads) < self._workers:
+            thread = threading.Thread(
+                target=self._run_worker,
+                name="kmip-async-{0}".format(len(self._threads))
+            )
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+    def _finish(self, job):
+        job.completed_at = time.time()
+        self._expiry.append(
+            (job.completed_at + self._result_ttl, job.correlation_value)
+        )
+
+    def _release(self, job):
+        self._queued_count -= 1
+        client_count = self._client_counts[job.owner] - 1
+        if client_count:
+            self._client_counts[job.owner] = client_count
+        else:
+            del self._client_counts[job.owner]
+
+    def _purge_expired(self):
+        now = time.time()
+        while self._expiry and self._expiry[0][0] < now:
+            _, correlation_value = self._expiry.popleft()
+            self._operations.pop(correlation_value, None)
+
+    def _run_worker(self):
+        while True:
+            job = self._queue.get()
+
+            with self._lock:
+                if job.state != AsynchronousOperation.PENDING:
+                    self._release(job)
+                    continue
+                job.state = AsynchronousOperation.PROCESSING
+
+            try:
+                result = self._processor(job)
+            except Exception as e:
+                self._logger.warning(
+                    "Error occurred while processing asynchronous operation."
+                )
+                self._logger.exception(e)
+                result = (
+                    enums.ResultStatus.OPERATION_FAILED,
+                    enums.ResultReason.GENERAL_FAILURE,
+                    "Operation failed. See the server logs for more "
+                    "information.",
+                    None
+                )
+
+            with self._lock:
+                job.result = result
+                job.state = AsynchronousOperation.COMPLETED
+                job.payload = None
+                job.protocol_version = None
+                self._finish(job)
+                self._release(job)
@@ -0,0 +1,84 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import sqlalchemy
+
+from kmip.pie import sqltypes
+
+
+def _get_rows(managed_object):
+    """
+    Map a new pie object to one row for each table of its class, base table
+    first. The object is given a new unique identifier if it has none.
+    """
+    mapper = sqlalchemy.inspect(managed_object).mapper
+    rows = list()
+
+    if managed_object.unique_identifier is None:
+        managed_object.unique_identifier = sqltypes.generate_ulid()
+
+    for class_mapper in reversed(list(mapper.iterate_to_root())):
+        table = class_mapper.local_table
+        row = dict()
+        for column in table.columns:
+            prop = mapper.get_property_by_column(column)
+            value = getattr(managed_object, prop.key)
+
+            # Every row of an executemany call needs the same keys, so
+            # Python-side defaults are applied here, as the ORM would.
+            if value is None and column.default is not None:
+                if column.default.is_scalar:
+                    value = column.default.arg
+            row[column.key] = value
+        rows.append((table, row))
+
+    return rows
+
+
+def insert_managed_objects(connection, managed_objects):
+    """
+    Insert new pie objects into the data store with as few statements as
+    possible.
+
+    The rows of every table and the names of all objects are inserted with
+    a single executemany call per table. Objects without a unique identifier
+    are given one first. The objects are not added to any session.
+
+    Args:
+        connection (Connection): The connection to insert with. The caller
+            owns the transaction.
+        managed_objects (list): The new ManagedObjects to insert.
+    """
+    names = sqltypes.ManagedObjectName.__table__
+    table_rows = collections.defaultdict(list)
+    name_rows = list()
+
+    for managed_object in managed_objects:
+        for table, row in _get_rows(managed_object):
+            table_rows[table].append(row)
+        for name in managed_object._names:
+            name_rows.append({
+                'mo_uid': managed_object.unique_identifier,
+                'name': name.name,
+                'name_index': name.index,
+                'name_type': name.name_type
+            })
+
+    for table in sqltypes.Base.metadata.sorted_tables:
+        if table_rows.get(table):
+            connection.execute(table.insert(), table_rows[table])
+    if name_rows:
+        connection.execute(names.insert(), name_rows)
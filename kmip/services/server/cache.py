@@ -0,0 +1,232 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import threading
+import time
+
+
+class CachedObject(object):
+    """
+    A managed object held by the ManagedObjectCache.
+
+    Attributes:
+        managed_object (ManagedObject): The detached pie object, without its
+            secret value or encoding.
+        secret (bytearray): The secret value of the object, owned by the
+            cache so that it can be zeroized.
+        encoding (bytearray): The TTLV encoding of the secret, if stored
+            with the object, otherwise None.
+        expires_at (float): The time after which the entry is discarded.
+    """
+
+    def __init__(self, managed_object, secret, encoding, expires_at):
+        self.managed_object = managed_object
+        self.secret = secret
+        self.encoding = encoding
+        self.expires_at = expires_at
+
+    @property
+    def size(self):
+        size = len(self.secret)
+        if self.encoding is not None:
+            size += len(self.encoding)
+        return size
+
+    def zeroize(self):
+        # Assigning a slice of the same length overwrites the buffer in
+        # place instead of allocating a new one.
+        self.secret[:] = b'\x00' * len(self.secret)
+        if self.encoding is not None:
+            self.encoding[:] = b'\x00' * len(self.encoding)
+
+
+class ManagedObjectCache(object):
+    """
+    A bounded LRU cache of managed objects keyed by unique identifier.
+
+    Entries expire after a fixed time and the total size of the cached
+    secret values and encodings is capped. Both are overwritten with zeros
+    when their entry is evicted, expired, invalidated or cleared. Callers
+    receive copies of them, so zeroizing an entry never affects an object
+    that is still being used.
+
+    The cache also tracks the last change record it has applied, so that
+    changes made by other processes sharing the data store can be applied
+    to it. See KmipEngine for how change records are written.
+    """
+
+    def __init__(self, max_entries=1024, ttl=60, max_secret_bytes=16777216):
+        """
+        Create a ManagedObjectCache.
+
+        Args:
+            max_entries (int): The maximum number of cached objects.
+                Optional, defaults to 1024.
+            ttl (int): The number of seconds an object stays cached.
+                Optional, defaults to 60.
+            max_secret_bytes (int): The maximum total size, in bytes, of the
+                cached secret values and encodings. Optional, defaults to
+                16777216.
+        """
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._max_secret_bytes = max_secret_bytes
+
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        self._secret_bytes = 0
+        self._last_change = None
+
+    @property
+    def ttl(self):
+        return self._ttl
+
+    @property
+    def last_change(self):
+        """
+        The ID of the last change record applied to the cache, or None if
+        the cache has not been synchronized with the data store yet.
+        """
+        with self._lock:
+            return self._last_change
+
+    def get(self, unique_identifier):
+        """
+        Look up a cached object.
+
+        Args:
+            unique_identifier (string): The ID of the object.
+
+        Returns:
+            tuple: The cached ManagedObject and bytes copies of its secret
+                value and encoding, or None if the object is not cached. The
+                encoding is None if the object has none.
+        """
+        with self._lock:
+            entry = self._entries.pop(unique_identifier, None)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                self._discard(entry)
+                return None
+            self._entries[unique_identifier] = entry
+            encoding = None
+            if entry.encoding is not None:
+                encoding = bytes(entry.encoding)
+            return entry.managed_object, bytes(entry.secret), encoding
+
+    def put(self, unique_identifier, managed_object, secret, last_change,
+            encoding=None):
+        """
+        Add an object to the cache, evicting the least recently used objects
+        as needed.
+
+        Objects whose secret value and encoding alone exceed the memory cap
+        are not cached. Neither are objects read before the last change record
+        applied to the cache, since that change may concern them.
+
+        Args:
+            unique_identifier (string): The ID of the object.
+            managed_object (ManagedObject): The detached pie object.
+            secret (bytes): The secret value of the object.
+            last_change (int): The ID of the last change record applied to
+                the cache when the object was read.
+            encoding (bytes): The TTLV encoding of the secret. Optional,
+                defaults to None.
+        """
+        if encoding is not None:
+            encoding = bytearray(encoding)
+        entry = CachedObject(
+            managed_object,
+            bytearray(secret),
+            encoding,
+            time.time() + self._ttl
+        )
+        if entry.size > self._max_secret_bytes or self._max_entries < 1:
+            entry.zeroize()
+            return
+
+        with self._lock:
+            if last_change != self._last_change:
+                entry.zeroize()
+                return
+            previous = self._entries.pop(unique_identifier, None)
+            if previous is not None:
+                self._discard(previous)
+            while self._entries and (
+                    len(self._entries) >= self._max_entries or
+                    self._secret_bytes + entry.size >
+                    self._max_secret_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._discard(evicted)
+            self._entries[unique_identifier] = entry
+            self._secret_bytes += entry.size
+
+    def invalidate(self, unique_identifier):
+        """
+        Remove an object from the cache, if present.
+
+        Args:
+            unique_identifier (string): The ID of the object.
+        """
+        with self._lock:
+            entry = self._entries.pop(unique_identifier, None)
+            if entry is not None:
+                self._discard(entry)
+
+    def apply_changes(self, changes):
+        """
+        Invalidate the objects named by a sequence of change records.
+
+        Args:
+            changes (list): A list of (change ID, unique identifier) tuples,
+                ordered by change ID.
+        """
+        with self._lock:
+            for change, unique_identifier in changes:
+                entry = self._entries.pop(unique_identifier, None)
+                if entry is not None:
+                    self._discard(entry)
+                if self._last_change is None or change > self._last_change:
+                    self._last_change = change
+
+    def synchronize(self, last_change):
+        """
+        Record the change record the cache is up to date with.
+
+        Args:
+            last_change (int): The ID of the change record.
+        """
+        with self._lock:
+            if self._last_change is None or last_change > self._last_change:
+                self._last_change = last_change
+
+    def clear(self):
+        """
+        Remove every object from the cache.
+        """
+        with self._lock:
+            while self._entries:
+                _, entry = self._entries.popitem()
+                self._discard(entry)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def _discard(self, entry):
+        self._secret_bytes -= entry.size
+        entry.zeroize()
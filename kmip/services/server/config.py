@@ -43,6 +43,69 @@ class KmipServerConfig(object):
             'ca_path',
             'auth_suite'
         ]
+        self._optional_settings = [
+            'buffer_size',
+            'max_buffer_size',
+            'max_in_flight_requests',
+            'asynchronous_workers',
+            'asynchronous_result_ttl',
+            'asynchronous_queue_size',
+            'asynchronous_client_limit',
+            'session_idle_timeout',
+            'tcp_keepalive_idle',
+            'max_sessions',
+            'shutdown_timeout',
+            'restart_socket_path',
+            'policy_path',
+            'policy_reload_interval',
+            'object_cache_size',
+            'object_cache_ttl',
+            'object_cache_memory',
+            'precompute_get_responses',
+            'database_url',
+            'database_pool_size',
+            'database_max_overflow',
+            'database_pool_pre_ping',
+            'sqlite_journal_mode',
+            'sqlite_synchronous',
+            'sqlite_busy_timeout',
+            'sqlite_mmap_size',
+            'identifier_format',
+            'database_replica_urls',
+            'database_replica_lag',
+            'database_shard_urls'
+        ]
+
+        self.settings['buffer_size'] = 4096
+        self.settings['max_buffer_size'] = 1048576
+        self.settings['max_in_flight_requests'] = 1
+        self.settings['asynchronous_workers'] = 2
+        self.settings['asynchronous_result_ttl'] = 300
+        self.settings['asynchronous_queue_size'] = 1024
+        self.settings['asynchronous_client_limit'] = 64
+        self.settings['session_idle_timeout'] = 0
+        self.settings['tcp_keepalive_idle'] = 0
+        self.settings['max_sessions'] = 0
+        self.settings['shutdown_timeout'] = 10
+        self.settings['restart_socket_path'] = None
+        self.settings['policy_path'] = None
+        self.settings['policy_reload_interval'] = 0
+        self.settings['object_cache_size'] = 1024
+        self.settings['object_cache_ttl'] = 60
+        self.settings['object_cache_memory'] = 16777216
+        self.settings['precompute_get_responses'] = False
+        self.settings['database_url'] = 'sqlite:////tmp/pykmip.database'
+        self.settings['database_pool_size'] = 5
+        self.settings['database_max_overflow'] = 10
+        self.settings['database_pool_pre_ping'] = False
+        self.settings['sqlite_journal_mode'] = 'WAL'
+        self.settings['sqlite_synchronous'] = 'FULL'
+        self.settings['sqlite_busy_timeout'] = 5000
+        self.settings['sqlite_mmap_size'] = 0
+        self.settings['identifier_format'] = 'ulid'
+        self.settings['database_replica_urls'] = []
+        self.settings['database_replica_lag'] = 5
+        self.settings['database_shard_urls'] = []
 
     def set_setting(self, setting, value):
         """
@@ -60,7 +123,7 @@ class KmipServerConfig(object):
             ConfigurationError: Raised if the setting is not supported or if
                 the setting value is invalid.
         """
-        if setting not in self._expected_settings:
+        if setting not in self._expected_settings + self._optional_settings:
             raise exceptions.ConfigurationError(
                 "Setting '{0}' is not supported.".format(setting)
             )
@@ -75,6 +138,66 @@ class KmipServerConfig(object):
             self._set_key_path(value)
         elif setting == 'ca_path':
             self._set_ca_path(value)
+        elif setting == 'buffer_size':
+            self._set_buffer_size(value)
+        elif setting == 'max_buffer_size':
+            self._set_max_buffer_size(value)
+        elif setting == 'max_in_flight_requests':
+            self._set_max_in_flight_requests(value)
+        elif setting == 'asynchronous_workers':
+            self._set_asynchronous_workers(value)
+        elif setting == 'asynchronous_result_ttl':
+            self._set_asynchronous_result_ttl(value)
+        elif setting == 'asynchronous_queue_size':
+            self._set_asynchronous_queue_size(value)
+        elif setting == 'asynchronous_client_limit':
+            self._set_asynchronous_client_limit(value)
+        elif setting == 'session_idle_timeout':
+            self._set_session_idle_timeout(value)
+        elif setting == 'tcp_keepalive_idle':
+            self._set_tcp_keepalive_idle(value)
+        elif setting == 'max_sessions':
+            self._set_max_sessions(value)
+        elif setting == 'shutdown_timeout':
+            self._set_shutdown_timeout(value)
+        elif setting == 'restart_socket_path':
+            self._set_restart_socket_path(value)
+        elif setting == 'policy_path':
+            self._set_policy_path(value)
+        elif setting == 'policy_reload_interval':
+            self._set_policy_reload_interval(value)
+        elif setting == 'object_cache_size':
+            self._set_object_cache_size(value)
+        elif setting == 'object_cache_ttl':
+            self._set_object_cache_ttl(value)
+        elif setting == 'object_cache_memory':
+            self._set_object_cache_memory(value)
+        elif setting == 'precompute_get_responses':
+            self._set_precompute_get_responses(value)
+        elif setting == 'database_url':
+            self._set_database_url(value)
+        elif setting == 'database_pool_size':
+            self._set_database_pool_size(value)
+        elif setting == 'database_max_overflow':
+            self._set_database_max_overflow(value)
+        elif setting == 'database_pool_pre_ping':
+            self._set_database_pool_pre_ping(value)
+        elif setting == 'sqlite_journal_mode':
+            self._set_sqlite_journal_mode(value)
+        elif setting == 'sqlite_synchronous':
+            self._set_sqlite_synchronous(value)
+        elif setting == 'sqlite_busy_timeout':
+            self._set_sqlite_busy_timeout(value)
+        elif setting == 'sqlite_mmap_size':
+            self._set_sqlite_mmap_size(value)
+        elif setting == 'identifier_format':
+            self._set_identifier_format(value)
+        elif setting == 'database_replica_urls':
+            self._set_database_replica_urls(value)
+        elif setting == 'database_replica_lag':
+            self._set_database_replica_lag(value)
+        elif setting == 'database_shard_urls':
+            self._set_database_shard_urls(value)
         else:
             self._set_auth_suite(value)
 
@@ -114,7 +237,8 @@ class KmipServerConfig(object):
 
         settings = [x[0] for x in parser.items('server')]
         for setting in settings:
-            if setting not in self._expected_settings:
+            if setting not in self._expected_settings + \
+                    self._optional_settings:
                 raise exceptions.ConfigurationError(
                     "Setting '{0}' is not a supported setting. Please "
                     "remove it from the configuration file.".format(setting)
@@ -141,6 +265,120 @@ class KmipServerConfig(object):
             self._set_ca_path(parser.get('server', 'ca_path'))
         if parser.has_option('server', 'auth_suite'):
             self._set_auth_suite(parser.get('server', 'auth_suite'))
+        if parser.has_option('server', 'buffer_size'):
+            self._set_buffer_size(parser.getint('server', 'buffer_size'))
+        if parser.has_option('server', 'max_buffer_size'):
+            self._set_max_buffer_size(
+                parser.getint('server', 'max_buffer_size')
+            )
+        if parser.has_option('server', 'max_in_flight_requests'):
+            self._set_max_in_flight_requests(
+                parser.getint('server', 'max_in_flight_requests')
+            )
+        if parser.has_option('server', 'asynchronous_workers'):
+            self._set_asynchronous_workers(
+                parser.getint('server', 'asynchronous_workers')
+            )
+        if parser.has_option('server', 'asynchronous_result_ttl'):
+            self._set_asynchronous_result_ttl(
+                parser.getint('server', 'asynchronous_result_ttl')
+            )
+        if parser.has_option('server', 'asynchronous_queue_size'):
+            self._set_asynchronous_queue_size(
+                parser.getint('server', 'asynchronous_queue_size')
+            )
+        if parser.has_option('server', 'asynchronous_client_limit'):
+            self._set_asynchronous_client_limit(
+                parser.getint('server', 'asynchronous_client_limit')
+            )
+        if parser.has_option('server', 'session_idle_timeout'):
+            self._set_session_idle_timeout(
+                parser.getint('server', 'session_idle_timeout')
+            )
+        if parser.has_option('server', 'tcp_keepalive_idle'):
+            self._set_tcp_keepalive_idle(
+                parser.getint('server', 'tcp_keepalive_idle')
+            )
+        if parser.has_option('server', 'max_sessions'):
+            self._set_max_sessions(parser.getint('server', 'max_sessions'))
+        if parser.has_option('server', 'shutdown_timeout'):
+            self._set_shutdown_timeout(
+                parser.getint('server', 'shutdown_timeout')
+            )
+        if parser.has_option('server', 'restart_socket_path'):
+            self._set_restart_socket_path(
+                parser.get('server', 'restart_socket_path')
+            )
+        if parser.has_option('server', 'policy_path'):
+            self._set_policy_path(parser.get('server', 'policy_path'))
+        if parser.has_option('server', 'policy_reload_interval'):
+            self._set_policy_reload_interval(
+                parser.getint('server', 'policy_reload_interval')
+            )
+        if parser.has_option('server', 'object_cache_size'):
+            self._set_object_cache_size(
+                parser.getint('server', 'object_cache_size')
+            )
+        if parser.has_option('server', 'object_cache_ttl'):
+            self._set_object_cache_ttl(
+                parser.getint('server', 'object_cache_ttl')
+            )
+        if parser.has_option('server', 'object_cache_memory'):
+            self._set_object_cache_memory(
+                parser.getint('server', 'object_cache_memory')
+            )
+        if parser.has_option('server', 'precompute_get_responses'):
+            self._set_precompute_get_responses(
+                parser.getboolean('server', 'precompute_get_responses')
+            )
+        if parser.has_option('server', 'database_url'):
+            self._set_database_url(
+                parser.get('server', 'database_url')
+            )
+        if parser.has_option('server', 'database_pool_size'):
+            self._set_database_pool_size(
+                parser.getint('server', 'database_pool_size')
+            )
+        if parser.has_option('server', 'database_max_overflow'):
+            self._set_database_max_overflow(
+                parser.getint('server', 'database_max_overflow')
+            )
+        if parser.has_option('server', 'database_pool_pre_ping'):
+            self._set_database_pool_pre_ping(
+                parser.getboolean('server', 'database_pool_pre_ping')
+            )
+        if parser.has_option('server', 'sqlite_journal_mode'):
+            self._set_sqlite_journal_mode(
+                parser.get('server', 'sqlite_journal_mode')
+            )
+        if parser.has_option('server', 'sqlite_synchronous'):
+            self._set_sqlite_synchronous(
+                parser.get('server', 'sqlite_synchronous')
+            )
+        if parser.has_option('server', 'sqlite_busy_timeout'):
+            self._set_sqlite_busy_timeout(
+                parser.getint('server', 'sqlite_busy_timeout')
+            )
+        if parser.has_option('server', 'sqlite_mmap_size'):
+            self._set_sqlite_mmap_size(
+                parser.getint('server', 'sqlite_mmap_size')
+            )
+        if parser.has_option('server', 'identifier_format'):
+            self._set_identifier_format(
+                parser.get('server', 'identifier_format')
+            )
+        if parser.has_option('server', 'database_replica_urls'):
+            self._set_database_replica_urls(
+                parser.get('server', 'database_replica_urls').split()
+            )
+        if parser.has_option('server', 'database_replica_lag'):
+            self._set_database_replica_lag(
+                parser.getint('server', 'database_replica_lag')
+            )
+        if parser.has_option('server', 'database_shard_urls'):
+            self._set_database_shard_urls(
+                parser.get('server', 'database_shard_urls').split()
+            )
 
     def _set_hostname(self, value):
         if isinstance(value, six.string_types):
@@ -224,3 +462,278 @@ class KmipServerConfig(object):
             )
         else:
             self.settings['auth_suite'] = value
+
+    def _set_buffer_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 8:
+            self.settings['buffer_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The buffer size value must be an integer greater than or "
+                "equal to 8."
+            )
+
+    def _set_max_buffer_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 8:
+            self.settings['max_buffer_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The maximum buffer size value must be an integer greater "
+                "than or equal to 8."
+            )
+
+    def _set_max_in_flight_requests(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['max_in_flight_requests'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The maximum in-flight requests value must be a positive "
+                "integer."
+            )
+
+    def _set_asynchronous_workers(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['asynchronous_workers'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The asynchronous workers value must be a positive integer."
+            )
+
+    def _set_asynchronous_result_ttl(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['asynchronous_result_ttl'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The asynchronous result TTL value must be a non-negative "
+                "integer."
+            )
+
+    def _set_asynchronous_queue_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['asynchronous_queue_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The asynchronous queue size value must be a positive "
+                "integer."
+            )
+
+    def _set_asynchronous_client_limit(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['asynchronous_client_limit'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The asynchronous client limit value must be a positive "
+                "integer."
+            )
+
+    def _set_session_idle_timeout(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['session_idle_timeout'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The session idle timeout value must be a non-negative "
+                "integer."
+            )
+
+    def _set_tcp_keepalive_idle(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['tcp_keepalive_idle'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The TCP keepalive idle value must be a non-negative integer."
+            )
+
+    def _set_max_sessions(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['max_sessions'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The maximum sessions value must be a non-negative integer."
+            )
+
+    def _set_shutdown_timeout(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['shutdown_timeout'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The shutdown timeout value must be a non-negative integer."
+            )
+
+    def _set_restart_socket_path(self, value):
+        if value is None or isinstance(value, six.string_types):
+            self.settings['restart_socket_path'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The restart socket path value, if specified, must be a "
+                "string."
+            )
+
+    def _set_policy_path(self, value):
+        if value is None:
+            self.settings['policy_path'] = None
+        elif isinstance(value, six.string_types):
+            if os.path.isdir(value):
+                self.settings['policy_path'] = value
+            else:
+                raise exceptions.ConfigurationError(
+                    "The policy path value, if specified, must be a valid "
+                    "string path to a directory."
+                )
+        else:
+            raise exceptions.ConfigurationError(
+                "The policy path value, if specified, must be a valid string "
+                "path to a directory."
+            )
+
+    def _set_policy_reload_interval(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['policy_reload_interval'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The policy reload interval value must be a non-negative "
+                "integer."
+            )
+
+    def _set_object_cache_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['object_cache_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The object cache size value must be a non-negative integer."
+            )
+
+    def _set_object_cache_ttl(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['object_cache_ttl'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The object cache TTL value must be a positive integer."
+            )
+
+    def _set_object_cache_memory(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['object_cache_memory'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The object cache memory value must be a non-negative "
+                "integer."
+            )
+
+    def _set_precompute_get_responses(self, value):
+        if isinstance(value, bool):
+            self.settings['precompute_get_responses'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The precompute Get responses value must be a boolean."
+            )
+
+    def _set_database_url(self, value):
+        if isinstance(value, six.string_types) and value:
+            self.settings['database_url'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database URL value must be a non-empty string."
+            )
+
+    def _set_database_pool_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 1:
+            self.settings['database_pool_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database pool size value must be a positive integer."
+            )
+
+    def _set_database_max_overflow(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['database_max_overflow'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database max overflow value must be a non-negative "
+                "integer."
+            )
+
+    def _set_database_pool_pre_ping(self, value):
+        if isinstance(value, bool):
+            self.settings['database_pool_pre_ping'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database pool pre-ping value must be a boolean."
+            )
+
+    def _set_sqlite_journal_mode(self, value):
+        modes = ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF']
+        if isinstance(value, six.string_types) and value.upper() in modes:
+            self.settings['sqlite_journal_mode'] = value.upper()
+        else:
+            raise exceptions.ConfigurationError(
+                "The SQLite journal mode value must be one of: {0}.".format(
+                    ', '.join(modes)
+                )
+            )
+
+    def _set_sqlite_synchronous(self, value):
+        modes = ['OFF', 'NORMAL', 'FULL', 'EXTRA']
+        if isinstance(value, six.string_types) and value.upper() in modes:
+            self.settings['sqlite_synchronous'] = value.upper()
+        else:
+            raise exceptions.ConfigurationError(
+                "The SQLite synchronous value must be one of: {0}.".format(
+                    ', '.join(modes)
+                )
+            )
+
+    def _set_sqlite_busy_timeout(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['sqlite_busy_timeout'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The SQLite busy timeout value must be a non-negative "
+                "integer."
+            )
+
+    def _set_sqlite_mmap_size(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['sqlite_mmap_size'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The SQLite mmap size value must be a non-negative integer."
+            )
+
+    def _set_identifier_format(self, value):
+        formats = ['ULID', 'UUID']
+        if isinstance(value, six.string_types) and value.upper() in formats:
+            self.settings['identifier_format'] = value.lower()
+        else:
+            raise exceptions.ConfigurationError(
+                "The identifier format value must be one of: {0}.".format(
+                    ', '.join(formats)
+                )
+            )
+
+    def _set_database_replica_urls(self, value):
+        if isinstance(value, list) and all(
+                isinstance(x, six.string_types) and x for x in value):
+            self.settings['database_replica_urls'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database replica URLs value must be a list of "
+                "non-empty strings."
+            )
+
+    def _set_database_replica_lag(self, value):
+        if isinstance(value, six.integer_types) and value >= 0:
+            self.settings['database_replica_lag'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database replica lag value must be a non-negative "
+                "integer."
+            )
+
+    def _set_database_shard_urls(self, value):
+        if isinstance(value, list) and all(
+                isinstance(x, six.string_types) and x for x in value):
+            self.settings['database_shard_urls'] = value
+        else:
+            raise exceptions.ConfigurationError(
+                "The database shard URLs value must be a list of non-empty "
+                "strings."
+            )
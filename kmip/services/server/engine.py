@@ -13,10 +13,15 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import collections
+import itertools
 import logging
+import os
 import six
 import sqlalchemy
 
+from six.moves.urllib import parse
+from sqlalchemy import event
 from sqlalchemy.orm import exc
 
 import threading
@@ -32,24 +37,305 @@ from kmip.core.factories import secrets
 from kmip.core.messages import contents
 from kmip.core.messages import messages
 
+from kmip.core.messages.payloads import cancel
 from kmip.core.messages.payloads import create
 from kmip.core.messages.payloads import create_key_pair
 from kmip.core.messages.payloads import destroy
 from kmip.core.messages.payloads import discover_versions
 from kmip.core.messages.payloads import get
+from kmip.core.messages.payloads import locate
 from kmip.core.messages.payloads import query
 from kmip.core.messages.payloads import register
 
 from kmip.core import misc
+from kmip.core import utils
 
-from kmip.core.policy import policies
+from kmip.core import policy as operation_policy
 
 from kmip.pie import factory
 from kmip.pie import objects
 from kmip.pie import sqltypes
 
+from kmip.services.server import asynchronous
+from kmip.services.server import cache
 from kmip.services.server import policy
 from kmip.services.server.crypto import engine
+from kmip.services.server.repo import lmdb_store
+from kmip.services.server.repo import log_store
+from kmip.services.server.repo import memory_store
+from kmip.services.server.repo import sharded_store
+from kmip.services.server.repo import sqlalchemy_store
+from kmip.services.server.repo import store
+
+
+class RequestContext(object):
+    """
+    The state of a single request being processed by the KmipEngine.
+
+    Each thread processing a request works with its own RequestContext, so
+    that concurrent requests do not see each other's protocol version,
+    client identity, ID placeholder or data store session.
+
+    Attributes:
+        protocol_version (ProtocolVersion): The protocol version of the
+            request.
+        attribute_policy (AttributePolicy): The attribute policy for the
+            protocol version of the request.
+        client_identity (string): The identity of the requesting client.
+        is_asynchronous (bool): Whether the request asked for asynchronous
+            processing.
+        id_placeholder (string): The unique identifier of the last object
+            created or registered by the request.
+        data_session (Session): The data store session used by the request.
+        is_replica_session (bool): Whether the data session reads from a
+            read replica rather than from the data store itself.
+        pending_objects (list): The new objects created or registered by a
+            batch that are inserted together once every item has been
+            processed, or None if new objects are stored right away.
+        holds_write_lock (bool): Whether the request holds the write lock of
+            the engine.
+        cache_entries (list): The objects read by a batch that are added to
+            the object cache once the batch has been committed, or None if
+            objects are cached right away.
+        version (tuple): The major and minor numbers of the protocol version,
+            kept up to date with protocol_version for cheap comparisons.
+    """
+
+    def __init__(self, protocol_version, attribute_policy):
+        self.protocol_version = protocol_version
+        self.attribute_policy = attribute_policy
+        self.client_identity = None
+        self.is_asynchronous = False
+        self.id_placeholder = None
+        self.data_session = None
+        self.is_replica_session = False
+        self.pending_objects = None
+        self.holds_write_lock = False
+        self.cache_entries = None
+
+    @property
+    def protocol_version(self):
+        return self._protocol_version
+
+    @protocol_version.setter
+    def protocol_version(self, value):
+        self._protocol_version = value
+        self.version = _get_version_key(value)
+
+
+def _get_version_key(protocol_version):
+    return (
+        protocol_version.protocol_version_major.value,
+        protocol_version.protocol_version_minor.value
+    )
+
+
+def _enable_sqlite_savepoints(data_store):
+    """
+    Make SQLAlchemy, rather than pysqlite, start SQLite transactions.
+
+    pysqlite only issues BEGIN before data changes, so a SAVEPOINT issued
+    first opens a transaction that is committed when the savepoint is
+    released. Batches run each item in a savepoint, so pysqlite's
+    transaction handling is turned off and BEGIN is issued explicitly.
+    """
+    def connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    def begin(connection):
+        # Sessions sharing a single connection, as with an in-memory
+        # database, join the transaction already open on it.
+        if getattr(connection.connection, 'in_transaction', False):
+            return
+        execute = getattr(connection, 'exec_driver_sql', connection.execute)
+        execute('BEGIN')
+
+    event.listen(data_store, 'connect', connect)
+    event.listen(data_store, 'begin', begin)
+
+
+# Pragmas cannot take bound parameters, so their values are checked against
+# the values SQLite accepts before they are formatted into statements.
+_SQLITE_PRAGMA_VALUES = {
+    'journal_mode': ('DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'),
+    'synchronous': ('OFF', 'NORMAL', 'FULL', 'EXTRA')
+}
+
+
+def _set_sqlite_pragmas(data_store, pragmas):
+    """
+    Apply SQLite pragmas to every new connection to the data store.
+
+    Args:
+        pragmas (list): A list of (name, value) tuples, e.g.
+            ('journal_mode', 'WAL'). Values are either one of the values
+            listed for the pragma in _SQLITE_PRAGMA_VALUES or integers.
+
+    Raises:
+        ConfigurationError: if a pragma value is not valid.
+    """
+    for name, value in pragmas:
+        values = _SQLITE_PRAGMA_VALUES.get(name)
+        if values is None:
+            is_valid = isinstance(value, six.integer_types) and \
+                not isinstance(value, bool)
+        else:
+            is_valid = isinstance(value, six.string_types) and \
+                value.upper() in values
+        if not is_valid:
+            raise exceptions.ConfigurationError(
+                "Invalid value for the SQLite {0} pragma: {1}".format(
+                    name,
+                    value
+                )
+            )
+
+    def connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas:
+            cursor.execute('PRAGMA {0} = {1}'.format(name, value))
+        cursor.close()
+
+    event.listen(data_store, 'connect', connect)
+
+
+def _create_data_store(
+        url,
+        pool_size=5,
+        max_overflow=10,
+        pool_pre_ping=False,
+        sqlite_pragmas=None):
+    """
+    Create the SQLAlchemy engine used to reach the data store.
+
+    Connection pool sizes only apply to client/server databases. SQLite
+    databases keep the pool SQLAlchemy picks for them and instead get their
+    pragmas applied on connect, along with the transaction handling that
+    batches rely on.
+
+    Args:
+        url (string): The SQLAlchemy database URL.
+        pool_size (int): The number of connections kept open. Optional,
+            defaults to 5.
+        max_overflow (int): The number of connections opened beyond the pool
+            size under load. Optional, defaults to 10.
+        pool_pre_ping (bool): Whether connections are tested before use, so
+            that connections dropped by the database are replaced. Optional,
+            defaults to False.
+        sqlite_pragmas (list): A list of (name, value) tuples applied to
+            SQLite connections. Optional, defaults to None.
+
+    Returns:
+        Engine: The SQLAlchemy engine.
+    """
+    url = sqlalchemy.engine.url.make_url(url)
+    is_sqlite = url.drivername.split('+')[0] == 'sqlite'
+
+    options = {
+        'echo': False,
+        'pool_pre_ping': pool_pre_ping
+    }
+    if not is_sqlite:
+        options['pool_size'] = pool_size
+        options['max_overflow'] = max_overflow
+
+    data_store = sqlalchemy.create_engine(url, **options)
+    if is_sqlite:
+        _enable_sqlite_savepoints(data_store)
+        if sqlite_pragmas:
+            _set_sqlite_pragmas(data_store, sqlite_pragmas)
+
+    return data_store
+
+
+def _create_object_store(url, **options):
+    """
+    Create the store of managed objects named by a data store URL.
+
+    'memory://' names a store kept in memory, 'lmdb:///path' an LMDB
+    database in the given directory, whose map_size can be given as a query
+    parameter, and 'log:///path' an append-only log in the given directory.
+    Any other URL is a SQLAlchemy database URL, whose schema is brought up
+    to date.
+
+    Args:
+        url (string): The data store URL.
+        options (dict): The keyword arguments of _create_data_store used for
+            SQLAlchemy URLs.
+
+    Returns:
+        ObjectStore: The object store.
+    """
+    parts = parse.urlsplit(url)
+    if parts.scheme == 'memory':
+        return memory_store.MemoryStore()
+    elif parts.scheme == 'lmdb':
+        query = dict(parse.parse_qsl(parts.query))
+        try:
+            map_size = int(query.get('map_size', lmdb_store.DEFAULT_MAP_SIZE))
+        except ValueError:
+            raise exceptions.ConfigurationError(
+                "The LMDB map_size must be an integer."
+            )
+        return lmdb_store.LmdbStore(parts.path, map_size=map_size)
+    elif parts.scheme == 'log':
+        return log_store.LogStore(parts.path)
+
+    data_store = _create_data_store(url, **options)
+    sqltypes.upgrade_schema(data_store)
+    return sqlalchemy_store.SqlAlchemyStore(data_store)
+
+
+def _create_server_object_store(database_url, database_shard_urls=None,
+                                **options):
+    """
+    Create the object store a server keeps its managed objects in.
+
+    Args:
+        database_url (string): The URL of the data store, used if no shard
+            URLs are given.
+        database_shard_urls (list): The URLs of the data stores objects are
+            spread across. Optional, defaults to None.
+        options (dict): The keyword arguments of _create_data_store used for
+            SQLAlchemy URLs.
+
+    Returns:
+        ObjectStore: A ShardedStore over the shards if any are given, and
+            the store named by database_url otherwise.
+    """
+    if database_shard_urls:
+        return sharded_store.ShardedStore([
+            _create_object_store(x, **options) for x in database_shard_urls
+        ])
+    return _create_object_store(database_url, **options)
+
+
+class _NullLock(object):
+    """
+    A lock that never waits, for object stores that lock their own writers.
+    """
+
+    def acquire(self):
+        pass
+
+    def release(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _context_property(name):
+    def getter(self):
+        return getattr(self._get_context(), name)
+
+    def setter(self, value):
+        setattr(self._get_context(), name, value)
+
+    return property(getter, setter)
 
 
 class KmipEngine(object):
@@ -64,8 +350,6 @@ class KmipEngine(object):
         * KMIP versions > 1.2
         * Numerous operations, objects, and attributes.
         * User authentication
-        * Batch processing options: UNDO
-        * Asynchronous operations
         * Operation policies
         * Object archival
         * Key compression
@@ -77,26 +361,169 @@ class KmipEngine(object):
         * Cryptographic usage mask enforcement per object type
     """
 
-    def __init__(self):
+    def __init__(
+            self,
+            asynchronous_workers=2,
+            asynchronous_result_ttl=300,
+            asynchronous_queue_size=1024,
+            asynchronous_client_limit=64,
+            policy_path=None,
+            policy_reload_interval=0,
+            object_cache_size=1024,
+            object_cache_ttl=60,
+            object_cache_memory=16777216,
+            precompute_get_responses=False,
+            database_url='sqlite:////tmp/pykmip.database',
+            database_pool_size=5,
+            database_max_overflow=10,
+            database_pool_pre_ping=False,
+            sqlite_journal_mode='WAL',
+            sqlite_synchronous='FULL',
+            sqlite_busy_timeout=5000,
+            sqlite_mmap_size=0,
+            identifier_format='ulid',
+            database_replica_urls=None,
+            database_replica_lag=5,
+            database_shard_urls=None):
         """
         Create a KmipEngine.
+
+        Args:
+            asynchronous_workers (int): The number of background threads used
+                to process asynchronous operations. Optional, defaults to 2.
+            asynchronous_result_ttl (int): The number of seconds the result
+                of a finished asynchronous operation is retained for Poll
+                requests. Optional, defaults to 300.
+            asynchronous_queue_size (int): The maximum number of asynchronous
+                operations queued or being processed at once. Further
+                submissions fail until the queue drains. Optional, defaults
+                to 1024.
+            asynchronous_client_limit (int): The maximum number of
+                asynchronous operations a single client may have queued or
+                being processed at once. Optional, defaults to 64.
+            policy_path (string): The path to a directory of JSON files
+                defining additional operation policies. Optional, defaults
+                to None.
+            policy_reload_interval (int): The number of seconds between
+                checks of the policy directory for changed files. Changed
+                policies are reloaded without interrupting requests. 0
+                disables reloading. Optional, defaults to 0.
+            object_cache_size (int): The maximum number of managed objects
+                kept in memory for Get requests. 0 disables the cache.
+                Optional, defaults to 1024.
+            object_cache_ttl (int): The number of seconds a managed object
+                stays in the cache. Optional, defaults to 60.
+            object_cache_memory (int): The maximum total size, in bytes, of
+                the secret values kept in the cache. Optional, defaults to
+                16777216.
+            precompute_get_responses (bool): Whether the encoded secret of a
+                new object is stored with it, to be reused by Get requests.
+                Optional, defaults to False.
+            database_url (string): The URL of the data store, either a
+                SQLAlchemy database URL, 'memory://', 'lmdb:///path' or
+                'log:///path'.
+                Optional, defaults to 'sqlite:////tmp/pykmip.database'.
+            database_pool_size (int): The number of connections kept open to
+                a client/server database. Optional, defaults to 5.
+            database_max_overflow (int): The number of connections opened
+                beyond the pool size under load. Optional, defaults to 10.
+            database_pool_pre_ping (bool): Whether connections are tested
+                before use. Optional, defaults to False.
+            sqlite_journal_mode (string): The journal mode of a SQLite data
+                store. Optional, defaults to 'WAL'.
+            sqlite_synchronous (string): The synchronous setting of a SQLite
+                data store. 'NORMAL' is faster with the 'WAL' journal mode,
+                but may lose the last committed transactions on power loss.
+                Optional, defaults to 'FULL'.
+            sqlite_busy_timeout (int): The number of milliseconds a SQLite
+                connection waits for a lock held by another process.
+                Optional, defaults to 5000.
+            sqlite_mmap_size (int): The number of bytes of a SQLite data
+                store read through memory mapping. Optional, defaults to 0.
+            identifier_format (string): The format of the IDs given to new
+                objects, either 'ulid' or 'uuid'. Optional, defaults to
+                'ulid'.
+            database_replica_urls (list): The SQLAlchemy URLs of read
+                replicas of the data store, which must itself be a
+                SQLAlchemy database. Batches that only read are spread
+                across the replicas. Optional, defaults to None.
+            database_replica_lag (int): The number of seconds after a
+                client writes during which its reads go to the data store
+                rather than to a replica, so that it sees its own changes.
+                Optional, defaults to 5.
+            database_shard_urls (list): The URLs of the data stores that
+                objects are spread across by ID, in place of database_url.
+                The list must not change once objects are stored. Optional,
+                defaults to None.
         """
         self._logger = logging.getLogger('kmip.server.engine')
 
+        # IDs are generated in-process, so that new objects need no round
+        # trip to the data store before their ID is known.
+        if identifier_format not in sqltypes.IDENTIFIER_FORMATS:
+            raise exceptions.ConfigurationError(
+                "The identifier format must be one of: {0}.".format(
+                    ', '.join(sorted(sqltypes.IDENTIFIER_FORMATS))
+                )
+            )
+        self._generate_identifier = sqltypes.IDENTIFIER_FORMATS[
+            identifier_format
+        ]
+
         self._cryptography_engine = engine.CryptographyEngine()
 
-        self._data_store = sqlalchemy.create_engine(
-            'sqlite:////tmp/pykmip.database',
-            echo=False
-        )
-        sqltypes.Base.metadata.create_all(self._data_store)
-        self._data_store_session_factory = sqlalchemy.orm.sessionmaker(
-            bind=self._data_store
+        # Managed objects are only reached through the object store, with
+        # the session of the current request.
+        data_store_options = {
+            'pool_size': database_pool_size,
+            'max_overflow': database_max_overflow,
+            'pool_pre_ping': database_pool_pre_ping,
+            'sqlite_pragmas': [
+                ('journal_mode', sqlite_journal_mode),
+                ('synchronous', sqlite_synchronous),
+                ('busy_timeout', sqlite_busy_timeout),
+                ('mmap_size', sqlite_mmap_size)
+            ]
+        }
+        self._object_store = _create_server_object_store(
+            database_url,
+            database_shard_urls,
+            **data_store_options
         )
-
-        self._lock = threading.RLock()
-
-        self._id_placeholder = None
+        self._data_store = self._object_store.data_store
+        self._data_store_session_factory = self._object_store.open_session
+
+        # Batches that only read run on a read replica, picked in turn. The
+        # SQLAlchemy store works with any session on the same schema, so a
+        # replica only needs its own session factory. Replicas lag behind
+        # the data store, so a client that has written reads from the data
+        # store until its changes have had time to reach the replicas.
+        self._replica_session_factories = list()
+        if database_replica_urls:
+            if self._data_store is None:
+                raise exceptions.ConfigurationError(
+                    "Read replicas require a SQLAlchemy data store."
+                )
+            for url in database_replica_urls:
+                self._replica_session_factories.append(
+                    sqlalchemy.orm.sessionmaker(
+                        bind=_create_data_store(url, **data_store_options)
+                    )
+                )
+        self._replica_lag = database_replica_lag
+        self._replica_counter = itertools.count()
+        self._last_writes = dict()
+
+        # SQLite allows a single writer at a time, so operations that write
+        # to the data store are serialized, unless the object store locks
+        # its writers itself. Everything else runs concurrently, with
+        # per-request state kept in a RequestContext owned by the processing
+        # thread.
+        if self._object_store.locks_writes:
+            self._lock = _NullLock()
+        else:
+            self._lock = threading.RLock()
+        self._context = threading.local()
 
         self._protocol_versions = [
             contents.ProtocolVersion.create(1, 2),
@@ -104,8 +531,6 @@ class KmipEngine(object):
             contents.ProtocolVersion.create(1, 0)
         ]
 
-        self._protocol_version = self._protocol_versions[0]
-
         self._object_map = {
             enums.ObjectType.CERTIFICATE: objects.X509Certificate,
             enums.ObjectType.SYMMETRIC_KEY: objects.SymmetricKey,
@@ -117,26 +542,144 @@ class KmipEngine(object):
             enums.ObjectType.OPAQUE_DATA: objects.OpaqueObject
         }
 
-        self._attribute_policy = policy.AttributePolicy(self._protocol_version)
-        self._operation_policies = policies
+        # Objects read by Get are cached. Changes are recorded in the data
+        # store, so that servers sharing it drop their stale copies.
+        self._object_cache_ttl = object_cache_ttl
+        self._object_cache = None
+        if object_cache_size:
+            self._object_cache = cache.ManagedObjectCache(
+                max_entries=object_cache_size,
+                ttl=object_cache_ttl,
+                max_secret_bytes=object_cache_memory
+            )
+
+        # New objects can be stored with their encoded secret, so that Get
+        # sends it as is instead of rebuilding and re-encoding the secret.
+        self._precompute_get_responses = precompute_get_responses
+
+        # Attribute policies are immutable, so one is built per supported
+        # version and shared by all requests.
+        self._attribute_policies = dict(
+            (str(version), policy.AttributePolicy(version))
+            for version in self._protocol_versions
+        )
+        self._policy_path = policy_path
+        self._policy_file_times = dict()
+        self._operation_policy_table = policy.OperationPolicyTable(
+            operation_policy.policies
+        )
+        if self._policy_path:
+            self._load_operation_policies()
+            if policy_reload_interval:
+                t = threading.Thread(
+                    target=self._monitor_operation_policies,
+                    name="policy-monitor",
+                    args=(policy_reload_interval, )
+                )
+                t.daemon = True
+                t.start()
+
+        # Operations are dispatched through a registry that maps each
+        # operation to its handler and the set of protocol versions it
+        # applies to, computed once at registration. Operations that write
+        # to the data store are tracked alongside.
+        self._operation_handlers = dict()
+        self._write_operations = set()
+        for operation, handler, version, writes in [
+            (enums.Operation.CREATE, '_process_create', (1, 0), True),
+            (enums.Operation.CREATE_KEY_PAIR, '_process_create_key_pair',
+             (1, 0), True),
+            (enums.Operation.REGISTER, '_process_register', (1, 0), True),
+            (enums.Operation.LOCATE, '_process_locate', (1, 0), False),
+            (enums.Operation.GET, '_process_get', (1, 0), False),
+            (enums.Operation.DESTROY, '_process_destroy', (1, 0), True),
+            (enums.Operation.QUERY, '_process_query', (1, 0), False),
+            (enums.Operation.DISCOVER_VERSIONS, '_process_discover_versions',
+             (1, 1), False),
+            (enums.Operation.CANCEL, '_process_cancel', (1, 0), False)
+        ]:
+            self.register_operation(
+                operation,
+                handler,
+                contents.ProtocolVersion.create(*version),
+                writes=writes
+            )
+
+        # Paged Locate searches remember where each page ended, so that the
+        # next page is read with a keyset seek on the identifier instead of
+        # an OFFSET scan over every skipped row.
+        self._locate_cursors = collections.OrderedDict()
+        self._locate_cursor_limit = 1024
+        self._locate_cursor_lock = threading.Lock()
+
+        self._asynchronous_operations = [
+            enums.Operation.CREATE,
+            enums.Operation.CREATE_KEY_PAIR
+        ]
+        # Create and CreateKeyPair read nothing from the data store before
+        # storing their new objects, so they generate key material before
+        # taking the write lock.
+        self._key_operations = [
+            enums.Operation.CREATE,
+            enums.Operation.CREATE_KEY_PAIR
+        ]
+        self._bulk_operations = [
+            enums.Operation.CREATE,
+            enums.Operation.REGISTER
+        ]
+        self._asynchronous_manager = asynchronous.AsynchronousOperationManager(
+            self._process_asynchronous_operation,
+            workers=asynchronous_workers,
+            result_ttl=asynchronous_result_ttl,
+            queue_size=asynchronous_queue_size,
+            client_limit=asynchronous_client_limit
+        )
+
+    _protocol_version = _context_property('protocol_version')
+    _attribute_policy = _context_property('attribute_policy')
+    _client_identity = _context_property('client_identity')
+    _id_placeholder = _context_property('id_placeholder')
+    _data_session = _context_property('data_session')
+    _is_replica_session = _context_property('is_replica_session')
+    _pending_objects = _context_property('pending_objects')
+    _holds_write_lock = _context_property('holds_write_lock')
+    _cache_entries = _context_property('cache_entries')
+    is_asynchronous = _context_property('is_asynchronous')
+
+    def _new_context(self, protocol_version=None):
+        if protocol_version is None:
+            protocol_version = self._protocol_versions[0]
+        context = RequestContext(
+            protocol_version,
+            self._attribute_policies[str(protocol_version)]
+        )
+        self._context.value = context
+        return context
 
-        self._client_identity = None
+    def _get_context(self):
+        context = getattr(self._context, 'value', None)
+        if context is None:
+            context = self._new_context()
+        return context
 
     def _get_enum_string(self, e):
         return ''.join([x.capitalize() for x in e.name.split('_')])
 
     def _kmip_version_supported(supported):
+        minimum = tuple(int(x) for x in supported.split('.'))
+
         def decorator(function):
+            operation = ''.join(
+                [x.capitalize() for x in function.__name__[9:].split('_')]
+            )
+
             def wrapper(self, *args, **kwargs):
-                if float(str(self._protocol_version)) < float(supported):
-                    name = function.__name__
-                    operation = ''.join(
-                        [x.capitalize() for x in name[9:].split('_')]
-                    )
+                context = self._get_context()
+                if context.version < minimum:
                     raise exceptions.OperationNotSupported(
                         "{0} is not supported by KMIP {1}".format(
                             operation,
-                            self._protocol_version
+                            context.protocol_version
                         )
                     )
                 else:
@@ -144,18 +687,9 @@ class KmipEngine(object):
             return wrapper
         return decorator
 
-    def _synchronize(function):
-        def decorator(self, *args, **kwargs):
-            with self._lock:
-                return function(self, *args, **kwargs)
-        return decorator
-
     def _set_protocol_version(self, protocol_version):
         if protocol_version in self._protocol_versions:
-            self._protocol_version = protocol_version
-            self._attribute_policy = policy.AttributePolicy(
-                self._protocol_version
-            )
+            self._new_context(protocol_version)
         else:
             raise exceptions.InvalidMessage(
                 "KMIP {0} is not supported by the server.".format(
@@ -175,7 +709,6 @@ class KmipEngine(object):
         # form of client identity.
         self._client_identity = connection_credential
 
-    @_synchronize
     def process_request(self, request, credential=None):
         """
         Process a KMIP request message.
@@ -184,7 +717,7 @@ class KmipEngine(object):
         processes the request header, handles any message errors that may
         result, and then passes the set of request batch items on for
         processing. This routine is thread-safe, allowing multiple client
-        connections to use the same KmipEngine.
+        connections to use the same KmipEngine concurrently.
 
         Args:
             request (RequestMessage): The request message containing the batch
@@ -197,10 +730,9 @@ class KmipEngine(object):
             ResponseMessage: The response containing all of the results from
                 the request batch items.
         """
-        self._client_identity = None
         header = request.request_header
 
-        # Process the protocol version
+        # Process the protocol version, starting a new request context
         self._set_protocol_version(header.protocol_version)
 
         # Process the maximum response size
@@ -256,11 +788,6 @@ class KmipEngine(object):
         if header.asynchronous_indicator is not None:
             self.is_asynchronous = header.asynchronous_indicator.value
 
-        if self.is_asynchronous:
-            raise exceptions.InvalidMessage(
-                "Asynchronous operations are not supported."
-            )
-
         # Process the authentication credentials
         if header.authentication:
             auth_credentials = header.authentication.credential
@@ -273,11 +800,6 @@ class KmipEngine(object):
         if header.batch_error_cont_option is not None:
             batch_error_option = header.batch_error_cont_option.value
 
-        if batch_error_option == enums.BatchErrorContinuationOption.UNDO:
-            raise exceptions.InvalidMessage(
-                "Undo option for batch handling is not supported."
-            )
-
         # Process the batch order option
         batch_order_option = False
         if header.batch_order_option:
@@ -334,94 +856,344 @@ class KmipEngine(object):
 
     def _process_batch(self, request_batch, batch_handling, batch_order):
         response_batch = list()
+        completed_batch = list()
+        undo = batch_handling == enums.BatchErrorContinuationOption.UNDO
+
+        # SQLite allows a single writer, so a batch that writes holds the
+        # write lock from its first use of the data store until its
+        # transaction is committed.
+        is_writer = any(
+            x.operation is not None and
+            self._is_write_operation(x.operation.value)
+            for x in request_batch
+        )
 
-        self._data_session = self._data_store_session_factory()
-
-        for batch_item in request_batch:
-            error_occurred = False
+        # The whole batch runs in a single data store transaction that is
+        # committed once, after the last item. Each item runs in its own
+        # savepoint, so that a failed item can be rolled back on its own.
+        self._data_session = self._open_data_session(is_writer)
+
+        # The objects of a batch that only creates and registers objects are
+        # inserted together after the last item, which lets a relational
+        # store share one statement per table among them. Such batches never
+        # read an object back, and new objects get their IDs when they are
+        # built, so no item needs an earlier one to be inserted.
+        is_bulk = (
+            len(request_batch) > 1 and
+            not self.is_asynchronous and
+            all(
+                x.operation is not None and
+                x.operation.value in self._bulk_operations
+                for x in request_batch
+            )
+        )
+        if is_bulk:
+            self._pending_objects = list()
 
-            response_payload = None
-            result_status = None
-            result_reason = None
-            result_message = None
+        # Objects read by the batch are only cached once it has committed,
+        # since an undone or failed batch may not leave them as they were
+        # read.
+        self._cache_entries = list()
 
-            operation = batch_item.operation
-            request_payload = batch_item.request_payload
+        try:
+            for batch_item in request_batch:
+                error_occurred = False
+
+                response_payload = None
+                result_status = None
+                result_reason = None
+                result_message = None
+                async_correlation_value = None
+
+                operation = batch_item.operation
+                request_payload = batch_item.request_payload
+
+                # Process batch item ID.
+                if len(request_batch) > 1:
+                    if not batch_item.unique_batch_item_id:
+                        raise exceptions.InvalidMessage(
+                            "Batch item ID is undefined."
+                        )
 
-            # Process batch item ID.
-            if len(request_batch) > 1:
-                if not batch_item.unique_batch_item_id:
-                    raise exceptions.InvalidMessage(
-                        "Batch item ID is undefined."
+                # Process batch message extension.
+                # TODO (peterhamilton) Add support for message extension
+                # handling.
+                # 1. Extract the vendor identification and criticality
+                #    indicator.
+                # 2. If the indicator is True, raise an error.
+                # 3. If the indicator is False, ignore the extension.
+
+                # Process batch payload. Operations that could not be undone
+                # once submitted are processed inline for UNDO batches.
+                pending_count = 0
+                if is_bulk:
+                    pending_count = len(self._pending_objects)
+                cache_count = len(self._cache_entries)
+                # Operations that generate keys take the write lock once
+                # their key material is ready.
+                if is_writer and operation is not None and \
+                        operation.value not in self._key_operations:
+                    self._lock_writes()
+                savepoint = self._data_session.begin_nested()
+                try:
+                    if operation.value == enums.Operation.POLL:
+                        (
+                            operation,
+                            result_status,
+                            result_reason,
+                            result_message,
+                            response_payload,
+                            async_correlation_value
+                        ) = self._process_poll(request_payload)
+                        if result_status == \
+                                enums.ResultStatus.OPERATION_FAILED:
+                            error_occurred = True
+                    elif self.is_asynchronous and not undo and (
+                            operation.value in self._asynchronous_operations):
+                        async_correlation_value = self._submit_operation(
+                            operation.value,
+                            request_payload
+                        )
+                        result_status = enums.ResultStatus.OPERATION_PENDING
+                    else:
+                        response_payload = self._process_operation(
+                            operation.value,
+                            request_payload
+                        )
+                        result_status = enums.ResultStatus.SUCCESS
+                except exceptions.KmipError as e:
+                    error_occurred = True
+                    result_status = e.status
+                    result_reason = e.reason
+                    result_message = str(e)
+                except Exception as e:
+                    self._logger.warning(
+                        "Error occurred while processing operation."
+                    )
+                    self._logger.exception(e)
+
+                    error_occurred = True
+                    result_status = enums.ResultStatus.OPERATION_FAILED
+                    result_reason = enums.ResultReason.GENERAL_FAILURE
+                    result_message = (
+                        "Operation failed. See the server logs for more "
+                        "information."
                     )
 
-            # Process batch message extension.
-            # TODO (peterhamilton) Add support for message extension handling.
-            # 1. Extract the vendor identification and criticality indicator.
-            # 2. If the indicator is True, raise an error.
-            # 3. If the indicator is False, ignore the extension.
+                if error_occurred:
+                    savepoint.rollback()
+                    if is_bulk:
+                        del self._pending_objects[pending_count:]
+                    del self._cache_entries[cache_count:]
+                else:
+                    savepoint.commit()
+
+                # Compose operation result.
+                result_status = contents.ResultStatus(result_status)
+                if result_reason:
+                    result_reason = contents.ResultReason(result_reason)
+                if result_message:
+                    result_message = contents.ResultMessage(result_message)
+                if async_correlation_value:
+                    async_correlation_value = \
+                        contents.AsynchronousCorrelationValue(
+                            async_correlation_value
+                        )
 
-            # Process batch payload.
-            try:
-                response_payload = self._process_operation(
-                    operation.value,
-                    request_payload
+                batch_item = messages.ResponseBatchItem(
+                    operation=operation,
+                    unique_batch_item_id=batch_item.unique_batch_item_id,
+                    result_status=result_status,
+                    result_reason=result_reason,
+                    result_message=result_message,
+                    async_correlation_value=async_correlation_value,
+                    response_payload=response_payload
                 )
+                response_batch.append(batch_item)
+                if not error_occurred:
+                    completed_batch.append(batch_item)
+
+                # Handle batch error if necessary.
+                if error_occurred:
+                    if undo:
+                        self._undo_batch(completed_batch)
+                        break
+                    if batch_handling == \
+                            enums.BatchErrorContinuationOption.STOP:
+                        break
 
-                result_status = enums.ResultStatus.SUCCESS
-            except exceptions.KmipError as e:
-                error_occurred = True
-                result_status = e.status
-                result_reason = e.reason
-                result_message = str(e)
+            try:
+                if is_writer:
+                    self._lock_writes()
+                if self._pending_objects:
+                    self._insert_pending_objects()
+                self._data_session.commit()
+                if is_writer:
+                    self._record_write()
+                self._cache_objects()
             except Exception as e:
                 self._logger.warning(
-                    "Error occurred while processing operation."
+                    "Error occurred while committing the batch."
                 )
                 self._logger.exception(e)
+                self._data_session.rollback()
+                for batch_item in completed_batch:
+                    batch_item.result_status = contents.ResultStatus(
+                        enums.ResultStatus.OPERATION_FAILED
+                    )
+                    batch_item.result_reason = contents.ResultReason(
+                        enums.ResultReason.GENERAL_FAILURE
+                    )
+                    batch_item.result_message = contents.ResultMessage(
+                        "Operation failed. See the server logs for more "
+                        "information."
+                    )
+                    batch_item.response_payload = None
+        finally:
+            # Release the data store connection held by this request.
+            self._data_session.close()
+            self._pending_objects = None
+            self._cache_entries = None
+            self._unlock_writes()
 
-                error_occurred = True
-                result_status = enums.ResultStatus.OPERATION_FAILED
-                result_reason = enums.ResultReason.GENERAL_FAILURE
-                result_message = (
-                    "Operation failed. See the server logs for more "
-                    "information."
-                )
+        return response_batch
+
+    def _lock_writes(self):
+        """
+        Take the write lock for the rest of the request, unless the request
+        already holds it.
+        """
+        if not self._holds_write_lock:
+            self._lock.acquire()
+            self._holds_write_lock = True
 
-            # Compose operation result.
-            result_status = contents.ResultStatus(result_status)
-            if result_reason:
-                result_reason = contents.ResultReason(result_reason)
-            if result_message:
-                result_message = contents.ResultMessage(result_message)
+    def _unlock_writes(self):
+        if self._holds_write_lock:
+            self._holds_write_lock = False
+            self._lock.release()
+
+    def _open_data_session(self, is_writer):
+        """
+        Open the data store session of a batch, on a read replica if the
+        batch only reads and its client has not written recently.
+        """
+        factories = self._replica_session_factories
+        self._is_replica_session = False
+        if factories and not is_writer:
+            last_write = self._last_writes.get(self._client_identity)
+            if last_write is None or \
+                    time.time() - last_write >= self._replica_lag:
+                index = next(self._replica_counter) % len(factories)
+                self._is_replica_session = True
+                return factories[index]()
+        return self._data_store_session_factory()
+
+    def _record_write(self):
+        """
+        Note that the client of the request has committed a write, so that
+        its reads go to the data store until the replicas have caught up.
+        """
+        if not self._replica_session_factories:
+            return
 
-            batch_item = messages.ResponseBatchItem(
-                operation=batch_item.operation,
-                unique_batch_item_id=batch_item.unique_batch_item_id,
-                result_status=result_status,
-                result_reason=result_reason,
-                result_message=result_message,
-                response_payload=response_payload
+        now = time.time()
+        self._last_writes[self._client_identity] = now
+
+        # Clients that stopped writing are dropped once there are many.
+        if len(self._last_writes) > 1024:
+            for client, last_write in list(self._last_writes.items()):
+                if now - last_write >= self._replica_lag:
+                    self._last_writes.pop(client, None)
+
+    def _insert_pending_objects(self):
+        """
+        Insert the objects queued by a bulk batch.
+        """
+        self._object_store.insert_objects(
+            self._data_session,
+            [managed_object for managed_object, _ in self._pending_objects]
+        )
+
+        for managed_object, action in self._pending_objects:
+            self._log_new_object(managed_object, action)
+
+    def _undo_batch(self, completed_batch):
+        """
+        Roll back every batch item processed so far and mark the completed
+        items as undone.
+        """
+        self._data_session.rollback()
+        if self._pending_objects is not None:
+            del self._pending_objects[:]
+        if self._cache_entries is not None:
+            del self._cache_entries[:]
+        for batch_item in completed_batch:
+            batch_item.result_status = contents.ResultStatus(
+                enums.ResultStatus.OPERATION_UNDONE
+            )
+            batch_item.response_payload = None
+        del completed_batch[:]
+
+    def _submit_operation(self, operation, payload):
+        correlation_value = self._asynchronous_manager.submit(
+            operation,
+            payload,
+            self._protocol_version,
+            self._client_identity
+        )
+        self._logger.info(
+            "Accepted asynchronous {0} operation: {1}".format(
+                self._get_enum_string(operation),
+                correlation_value
             )
-            response_batch.append(batch_item)
+        )
+        return correlation_value
 
-            # Handle batch error if necessary.
-            if error_occurred:
-                if batch_handling == enums.BatchErrorContinuationOption.STOP:
-                    break
+    def _process_asynchronous_operation(self, job):
+        """
+        Process an asynchronous operation on behalf of a background worker.
 
-        return response_batch
+        The request state captured when the operation was accepted is
+        restored in a new request context before the operation is processed.
+        """
+        self._set_protocol_version(job.protocol_version)
+        self._client_identity = job.owner
+        self._data_session = self._data_store_session_factory()
 
-    def _get_object_type(self, unique_identifier):
         try:
-            object_type = self._data_session.query(
-                objects.ManagedObject._object_type
-            ).filter(
-                objects.ManagedObject.unique_identifier == unique_identifier
-            ).one()[0]
-        except exc.NoResultFound as e:
+            if job.operation not in self._key_operations:
+                self._lock_writes()
+            response_payload = self._process_operation(
+                job.operation,
+                job.payload
+            )
+            self._lock_writes()
+            self._data_session.commit()
+            self._record_write()
+        except exceptions.KmipError as e:
+            return (e.status, e.reason, str(e), None)
+        finally:
+            self._data_session.close()
+            self._unlock_writes()
+
+        return (enums.ResultStatus.SUCCESS, None, None, response_payload)
+
+    def _get_managed_object(self, unique_identifier, load_secret=False):
+        """
+        Load a stored object as an instance of its own class.
+
+        The secret value and its stored encoding are only read if
+        load_secret is True.
+        """
+        try:
+            managed_object = self._object_store.get_object(
+                self._data_session,
+                unique_identifier,
+                load_secret=load_secret
+            )
+        except KeyError as e:
             self._logger.warning(
-                "Could not identify object type for object: {0}".format(
+                "Could not find object with ID: {0}".format(
                     unique_identifier
                 )
             )
@@ -437,8 +1209,8 @@ class KmipEngine(object):
             )
             raise e
 
-        class_type = self._object_map.get(object_type)
-        if class_type is None:
+        object_type = managed_object._object_type
+        if self._object_map.get(object_type) is None:
             name = object_type.name
             raise exceptions.InvalidField(
                 "The {0} object type is not supported.".format(
@@ -448,9 +1220,170 @@ class KmipEngine(object):
                 )
             )
 
-        return class_type
+        return managed_object
+
+    def _get_cached_object(self, unique_identifier):
+        """
+        Load a stored object through the object cache.
+
+        Returns:
+            tuple: The ManagedObject, its secret value and the stored
+                encoding of its secret, if any. The object may be shared with
+                other requests and must not be modified.
+        """
+        if self._object_cache is None:
+            managed_object = self._get_managed_object(
+                unique_identifier,
+                load_secret=True
+            )
+            return (
+                managed_object,
+                managed_object.value,
+                managed_object._encoded_secret
+            )
+
+        last_change = self._refresh_object_cache()
+        cached = self._object_cache.get(unique_identifier)
+        if cached is not None:
+            return cached
+
+        managed_object = self._get_managed_object(
+            unique_identifier,
+            load_secret=True
+        )
+        value = managed_object.value
+        encoding = managed_object._encoded_secret
+
+        # An object read from a replica may predate the last change record,
+        # which would keep it cached after it changed.
+        if self._is_replica_session:
+            return managed_object, value, encoding
+
+        # Detach the object so that it outlives the session, and keep the
+        # secret value and its encoding only in the cache's own buffers.
+        self._object_store.detach(self._data_session, managed_object)
+        entry = (unique_identifier, managed_object, value, last_change,
+                 encoding)
+        if self._cache_entries is None:
+            self._object_cache.put(*entry)
+        else:
+            self._cache_entries.append(entry)
+
+        return managed_object, value, encoding
+
+    def _cache_objects(self):
+        """
+        Add the objects read by a committed batch to the object cache.
+        """
+        for entry in self._cache_entries:
+            if entry is not None:
+                self._object_cache.put(*entry)
+        del self._cache_entries[:]
+
+    def _refresh_object_cache(self):
+        """
+        Invalidate the cached objects changed since the last refresh.
+
+        Change records are always read from the data store itself, since a
+        replica may not have received the latest ones yet.
+
+        Returns:
+            int: The ID of the last change record seen by this request.
+        """
+        if not self._is_replica_session:
+            return self._read_object_changes(self._data_session)
+
+        session = self._data_store_session_factory()
+        try:
+            return self._read_object_changes(session)
+        finally:
+            session.close()
+
+    def _read_object_changes(self, session):
+        last_change = self._object_cache.last_change
+
+        if last_change is None:
+            last_change = self._object_store.get_last_change(session)
+            self._object_cache.synchronize(last_change)
+            return last_change
+
+        records = self._object_store.get_changes(session, last_change)
+        if records:
+            self._object_cache.apply_changes(records)
+            last_change = records[-1][0]
+
+        return last_change
+
+    def _record_object_change(self, unique_identifier):
+        """
+        Drop a changed object from the cache and record the change for other
+        servers sharing the data store.
+
+        Records older than the cache TTL are pruned, since every cached copy
+        they could concern has expired.
+        """
+        now = time.time()
+        self._object_store.record_change(
+            self._data_session,
+            unique_identifier,
+            now,
+            now - self._object_cache_ttl
+        )
+
+        if self._object_cache is not None:
+            self._object_cache.invalidate(str(unique_identifier))
+            # Keep the batch from caching the copy it read before the
+            # change.
+            entries = self._cache_entries or []
+            for i, entry in enumerate(entries):
+                if entry is not None and \
+                        entry[0] == str(unique_identifier):
+                    entries[i] = None
+
+    def _store_new_object(self, managed_object, action):
+        """
+        Give a new object its ID and add it to the data store, or queue it
+        if the batch inserts its objects in bulk.
+
+        Args:
+            managed_object (ManagedObject): The new object.
+            action (string): How the object came to be, for the log, e.g.
+                'Created'.
+        """
+        managed_object.unique_identifier = self._generate_identifier()
+
+        if self._pending_objects is not None:
+            self._pending_objects.append((managed_object, action))
+            return
+
+        # The transaction is committed once the whole batch has been
+        # processed.
+        self._lock_writes()
+        self._object_store.add_objects(self._data_session, [managed_object])
+
+        self._log_new_object(managed_object, action)
+
+    def _log_new_object(self, managed_object, action):
+        self._logger.info(
+            "{0} a {1} with ID: {2}".format(
+                action,
+                self._get_enum_string(managed_object.object_type),
+                managed_object.unique_identifier
+            )
+        )
+
+    def _encode_secret(self, managed_object):
+        """
+        Store the encoded secret of a new object with it, if enabled.
+        """
+        if not self._precompute_get_responses:
+            return
+
+        stream = utils.BytearrayStream()
+        self._build_core_object(managed_object).write(stream)
+        managed_object._encoded_secret = bytes(stream.buffer)
 
-    def _build_core_object(self, obj):
+    def _build_core_object(self, obj, secret=None):
         try:
             object_type = obj._object_type
         except Exception:
@@ -458,44 +1391,47 @@ class KmipEngine(object):
                 "Cannot build an unsupported object type."
             )
 
+        if secret is None:
+            secret = getattr(obj, 'value', None)
+
         value = {}
 
         if object_type == enums.ObjectType.CERTIFICATE:
             value = {
                 'certificate_type': obj.certificate_type,
-                'certificate_value': obj.value
+                'certificate_value': secret
             }
         elif object_type == enums.ObjectType.SYMMETRIC_KEY:
             value = {
                 'cryptographic_algorithm': obj.cryptographic_algorithm,
                 'cryptographic_length': obj.cryptographic_length,
                 'key_format_type': obj.key_format_type,
-                'key_value': obj.value
+                'key_value': secret
             }
         elif object_type == enums.ObjectType.PUBLIC_KEY:
             value = {
                 'cryptographic_algorithm': obj.cryptographic_algorithm,
                 'cryptographic_length': obj.cryptographic_length,
                 'key_format_type': obj.key_format_type,
-                'key_value': obj.value
+                'key_value': secret
             }
         elif object_type == enums.ObjectType.PRIVATE_KEY:
             value = {
                 'cryptographic_algorithm': obj.cryptographic_algorithm,
                 'cryptographic_length': obj.cryptographic_length,
                 'key_format_type': obj.key_format_type,
-                'key_value': obj.value
+                'key_value': secret
             }
         elif object_type == enums.ObjectType.SECRET_DATA:
             value = {
                 'key_format_type': enums.KeyFormatType.OPAQUE,
-                'key_value': obj.value,
+                'key_value': secret,
                 'secret_data_type': obj.data_type
             }
         elif object_type == enums.ObjectType.OPAQUE_DATA:
             value = {
                 'opaque_data_type': obj.opaque_type,
-                'opaque_data_value': obj.value
+                'opaque_data_value': secret
             }
         else:
             name = object_type.name
@@ -644,25 +1580,29 @@ class KmipEngine(object):
             object_type,
             operation
     ):
-        policy_set = self._operation_policies.get(operation_policy)
-        if not policy_set:
+        # Read the table once; a reload may replace it at any time.
+        table = self._operation_policy_table
+        decision = table.get_decision(operation_policy, object_type, operation)
+
+        if decision == enums.Policy.ALLOW_ALL:
+            return True
+        elif decision == enums.Policy.ALLOW_OWNER:
+            return session_identity == object_owner
+        elif decision is not None:
+            return False
+
+        if operation_policy not in table.policy_names:
             self._logger.warning(
                 "The '{0}' policy does not exist.".format(operation_policy)
             )
-            return False
-
-        object_policy = policy_set.get(object_type)
-        if not object_policy:
+        elif not table.has_object_type(operation_policy, object_type):
             self._logger.warning(
                 "The '{0}' policy does not apply to {1} objects.".format(
                     operation_policy,
                     self._get_enum_string(object_type)
                 )
             )
-            return False
-
-        operation_object_policy = object_policy.get(operation)
-        if not operation_object_policy:
+        else:
             self._logger.warning(
                 "The '{0}' policy does not apply to {1} operations on {2} "
                 "objects.".format(
@@ -671,43 +1611,172 @@ class KmipEngine(object):
                     self._get_enum_string(object_type)
                 )
             )
-            return False
+        return False
 
-        if operation_object_policy == enums.Policy.ALLOW_ALL:
-            return True
-        elif operation_object_policy == enums.Policy.ALLOW_OWNER:
-            if session_identity == object_owner:
-                return True
-            else:
-                return False
-        elif operation_object_policy == enums.Policy.DISALLOW_ALL:
-            return False
+    def _load_operation_policies(self):
+        """
+        Rebuild the operation policy table from the built-in policies and the
+        policy files in the policy directory.
+
+        The new table is built off to the side and swapped in with a single
+        assignment, so requests in progress are never blocked and always see
+        either the old or the new set of policies.
+        """
+        operation_policies = dict(operation_policy.policies)
+        file_times = dict()
+
+        if not os.path.isdir(self._policy_path):
+            self._logger.warning(
+                "The policy path '{0}' is not a directory.".format(
+                    self._policy_path
+                )
+            )
+            filenames = []
         else:
+            filenames = sorted(os.listdir(self._policy_path))
+
+        for filename in filenames:
+            path = os.path.join(self._policy_path, filename)
+            if not filename.endswith('.json') or not os.path.isfile(path):
+                continue
+            file_times[path] = os.path.getmtime(path)
+
+            self._logger.info(
+                "Loading user-defined operation policies from: {0}".format(
+                    path
+                )
+            )
+            try:
+                file_policies = operation_policy.read_policy_from_file(path)
+            except Exception as e:
+                self._logger.error(
+                    "A failure occurred while loading policies from: "
+                    "{0}".format(path)
+                )
+                self._logger.exception(e)
+                continue
+
+            for name, policy_set in six.iteritems(file_policies):
+                if name in operation_policy.policies:
+                    self._logger.warning(
+                        "Loaded policy '{0}' overwrites a reserved policy "
+                        "and will be ignored.".format(name)
+                    )
+                elif name in operation_policies:
+                    self._logger.warning(
+                        "Loaded policy '{0}' overwrites a previously loaded "
+                        "policy and will be ignored.".format(name)
+                    )
+                else:
+                    self._logger.info(
+                        "Loading user-defined operation policy: {0}".format(
+                            name
+                        )
+                    )
+                    operation_policies[name] = policy_set
+
+        self._policy_file_times = file_times
+        self._operation_policy_table = policy.OperationPolicyTable(
+            operation_policies
+        )
+
+    def _are_operation_policies_modified(self):
+        file_times = dict()
+        if os.path.isdir(self._policy_path):
+            for filename in os.listdir(self._policy_path):
+                path = os.path.join(self._policy_path, filename)
+                if filename.endswith('.json') and os.path.isfile(path):
+                    file_times[path] = os.path.getmtime(path)
+        return file_times != self._policy_file_times
+
+    def _monitor_operation_policies(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                if self._are_operation_policies_modified():
+                    self._logger.info("Reloading operation policies.")
+                    self._load_operation_policies()
+            except Exception as e:
+                self._logger.warning(
+                    "Error occurred while reloading operation policies."
+                )
+                self._logger.exception(e)
+
+    def _is_write_operation(self, operation):
+        """
+        Tell whether an operation may write to the data store. Operations
+        without a registered handler are assumed to, except for Poll, which
+        is answered from the asynchronous operation manager.
+        """
+        if operation == enums.Operation.POLL:
             return False
+        if operation not in self._operation_handlers:
+            return True
+        return operation in self._write_operations
 
-    def _process_operation(self, operation, payload):
-        if operation == enums.Operation.CREATE:
-            return self._process_create(payload)
-        elif operation == enums.Operation.CREATE_KEY_PAIR:
-            return self._process_create_key_pair(payload)
-        elif operation == enums.Operation.REGISTER:
-            return self._process_register(payload)
-        elif operation == enums.Operation.GET:
-            return self._process_get(payload)
-        elif operation == enums.Operation.DESTROY:
-            return self._process_destroy(payload)
-        elif operation == enums.Operation.QUERY:
-            return self._process_query(payload)
-        elif operation == enums.Operation.DISCOVER_VERSIONS:
-            return self._process_discover_versions(payload)
+    def register_operation(self, operation, handler, version=None,
+                           writes=True):
+        """
+        Register the handler used to process a KMIP operation.
+
+        Registering a handler for an operation the engine already supports
+        replaces the built-in handler.
+
+        Args:
+            operation (Operation): An Operation enumeration specifying the
+                operation to handle. Required.
+            handler (callable or string): A callable that takes the request
+                payload and returns the response payload, or the name of an
+                engine method that does. Handlers run in the context of the
+                request, so they may use the engine's data session, client
+                identity and access control helpers, and should raise
+                KmipError subclasses to report failures. Required.
+            version (ProtocolVersion): The earliest protocol version that
+                supports the operation. Optional, defaults to KMIP 1.0.
+            writes (bool): Whether the handler may write to the data store.
+                Batches holding such operations take the engine's write lock
+                and are never sent to a read replica. Optional, defaults to
+                True.
+        """
+        if version is None:
+            version = contents.ProtocolVersion.create(1, 0)
+        minimum = _get_version_key(version)
+
+        versions = frozenset(
+            _get_version_key(x) for x in self._protocol_versions
+            if _get_version_key(x) >= minimum
+        )
+        self._operation_handlers[operation] = (handler, versions)
+        if writes:
+            self._write_operations.add(operation)
         else:
+            self._write_operations.discard(operation)
+
+    def _process_operation(self, operation, payload):
+        entry = self._operation_handlers.get(operation)
+        if entry is None:
             raise exceptions.OperationNotSupported(
                 "{0} operation is not supported by the server.".format(
                     operation.name.title()
                 )
             )
 
-    @_kmip_version_supported('1.0')
+        handler, versions = entry
+        context = self._get_context()
+        if context.version not in versions:
+            raise exceptions.OperationNotSupported(
+                "{0} is not supported by KMIP {1}".format(
+                    self._get_enum_string(operation),
+                    context.protocol_version
+                )
+            )
+
+        # Built-in handlers are looked up by name so that subclasses can
+        # override them.
+        if isinstance(handler, six.string_types):
+            handler = getattr(self, handler)
+        return handler(payload)
+
     def _process_create(self, payload):
         self._logger.info("Processing operation: Create")
 
@@ -775,18 +1844,9 @@ class KmipEngine(object):
 
         # TODO (peterhamilton) Set additional server-only attributes.
         managed_object._owner = self._client_identity
+        self._encode_secret(managed_object)
 
-        self._data_session.add(managed_object)
-
-        # NOTE (peterhamilton) SQLAlchemy will *not* assign an ID until
-        # commit is called. This makes future support for UNDO problematic.
-        self._data_session.commit()
-
-        self._logger.info(
-            "Created a SymmetricKey with ID: {0}".format(
-                managed_object.unique_identifier
-            )
-        )
+        self._store_new_object(managed_object, 'Created')
 
         response_payload = create.CreateResponsePayload(
             object_type=payload.object_type,
@@ -800,7 +1860,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_create_key_pair(self, payload):
         self._logger.info("Processing operation: CreateKeyPair")
 
@@ -943,13 +2002,18 @@ class KmipEngine(object):
         # TODO (peterhamilton) Set additional server-only attributes.
         public_key._owner = self._client_identity
         private_key._owner = self._client_identity
-
-        self._data_session.add(public_key)
-        self._data_session.add(private_key)
-
-        # NOTE (peterhamilton) SQLAlchemy will *not* assign an ID until
-        # commit is called. This makes future support for UNDO problematic.
-        self._data_session.commit()
+        self._encode_secret(public_key)
+        self._encode_secret(private_key)
+
+        # The transaction is committed once the whole batch has been
+        # processed.
+        public_key.unique_identifier = self._generate_identifier()
+        private_key.unique_identifier = self._generate_identifier()
+        self._lock_writes()
+        self._object_store.add_objects(
+            self._data_session,
+            [public_key, private_key]
+        )
 
         self._logger.info(
             "Created a PublicKey with ID: {0}".format(
@@ -974,7 +2038,6 @@ class KmipEngine(object):
         self._id_placeholder = str(private_key.unique_identifier)
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_register(self, payload):
         self._logger.info("Processing operation: Register")
 
@@ -1017,19 +2080,9 @@ class KmipEngine(object):
 
         # TODO (peterhamilton) Set additional server-only attributes.
         managed_object._owner = self._client_identity
+        self._encode_secret(managed_object)
 
-        self._data_session.add(managed_object)
-
-        # NOTE (peterhamilton) SQLAlchemy will *not* assign an ID until
-        # commit is called. This makes future support for UNDO problematic.
-        self._data_session.commit()
-
-        self._logger.info(
-            "Registered a {0} with ID: {1}".format(
-                ''.join([x.capitalize() for x in object_type.name.split('_')]),
-                managed_object.unique_identifier
-            )
-        )
+        self._store_new_object(managed_object, 'Registered')
 
         response_payload = register.RegisterResponsePayload(
             unique_identifier=attributes.UniqueIdentifier(
@@ -1041,7 +2094,167 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
+    def _process_locate(self, payload):
+        self._logger.info("Processing operation: Locate")
+
+        maximum_items = None
+        if payload.maximum_items is not None:
+            maximum_items = payload.maximum_items.value
+
+        # Objects are never archived, so only searches that include online
+        # storage can match anything.
+        include_online = True
+        if payload.storage_status_mask is not None:
+            mask = payload.storage_status_mask.value
+            include_online = bool(
+                mask & enums.StorageStatus.ONLINE_STORAGE.value
+            )
+
+        offset_items = 0
+        if payload.offset_items is not None:
+            offset_items = payload.offset_items.value
+            if offset_items < 0:
+                raise exceptions.InvalidField(
+                    "Offset Items must not be negative."
+                )
+
+        identifiers = list()
+        if include_online and payload.object_group_member is None:
+            criteria = self._build_locate_criteria(payload.attributes)
+            if criteria is not None:
+                search = self._get_locate_search_key(payload)
+                last_identifier = None
+                offset = 0
+                if offset_items:
+                    last_identifier = self._get_locate_cursor(
+                        (search, offset_items)
+                    )
+                    if last_identifier is None:
+                        offset = offset_items
+                rows = self._object_store.locate(
+                    self._data_session,
+                    criteria,
+                    after=last_identifier,
+                    offset=offset,
+                    limit=maximum_items
+                )
+                if rows and maximum_items is not None:
+                    self._set_locate_cursor(
+                        (search, offset_items + len(rows)),
+                        rows[-1]
+                    )
+                identifiers = [str(x) for x in rows]
+
+        self._logger.info(
+            "Located {0} object(s).".format(len(identifiers))
+        )
+
+        response_payload = locate.LocateResponsePayload(
+            unique_identifiers=[
+                attributes.UniqueIdentifier(x) for x in identifiers
+            ]
+        )
+
+        return response_payload
+
+    def _get_locate_search_key(self, payload):
+        stream = utils.BytearrayStream()
+        for attribute in payload.attributes:
+            attribute.write(stream)
+        mask = None
+        if payload.storage_status_mask is not None:
+            mask = payload.storage_status_mask.value
+        return (self._client_identity, mask, stream.buffer)
+
+    def _get_locate_cursor(self, key):
+        """
+        Get the identifier of the last object returned by a previous page of
+        a Locate search, or None if that page is not remembered.
+        """
+        with self._locate_cursor_lock:
+            last_identifier = self._locate_cursors.pop(key, None)
+            if last_identifier is not None:
+                self._locate_cursors[key] = last_identifier
+            return last_identifier
+
+    def _set_locate_cursor(self, key, last_identifier):
+        with self._locate_cursor_lock:
+            self._locate_cursors.pop(key, None)
+            self._locate_cursors[key] = last_identifier
+            while len(self._locate_cursors) > self._locate_cursor_limit:
+                self._locate_cursors.popitem(last=False)
+
+    def _build_locate_criteria(self, locate_attributes):
+        """
+        Build the search for the objects matching the Locate attributes that
+        the client may locate.
+
+        The operation policy check is part of the search, so that the store
+        can apply it, and maximum_items, without loading matching objects.
+
+        Returns:
+            LocateCriteria: The search, or None if no object can match.
+        """
+        criteria = store.LocateCriteria(owner=self._client_identity)
+        object_types = [k for k, v in six.iteritems(self._object_map) if v]
+
+        for attribute in locate_attributes:
+            name = attribute.attribute_name.value
+            value = attribute.attribute_value
+
+            if not self._attribute_policy.is_attribute_supported(name):
+                raise exceptions.InvalidField(
+                    "The {0} attribute is unsupported.".format(name)
+                )
+
+            if name == 'Object Type':
+                object_types = [x for x in object_types if x == value.value]
+            elif name == 'Name':
+                criteria.names.append(value.name_value.value)
+            elif name == 'Cryptographic Algorithm':
+                criteria.cryptographic_algorithms.append(value.value)
+            elif name == 'Cryptographic Length':
+                criteria.cryptographic_lengths.append(value.value)
+            elif name == 'Operation Policy Name':
+                criteria.operation_policy_names.append(value.value)
+            elif name == 'State':
+                # The server does not support the operations that move an
+                # object out of its initial state.
+                if value.value != enums.State.PRE_ACTIVE:
+                    return None
+            elif name == 'Object Group':
+                # Object groups are not stored, so no object is a member.
+                return None
+            else:
+                raise exceptions.InvalidField(
+                    "The {0} attribute is not supported by Locate.".format(
+                        name
+                    )
+                )
+
+        # Restrict the results to the objects whose operation policy lets
+        # the client locate them.
+        table = self._operation_policy_table
+        for object_type in object_types:
+            allow_all = table.get_policy_names(
+                object_type,
+                enums.Operation.LOCATE,
+                enums.Policy.ALLOW_ALL
+            )
+            allow_owner = table.get_policy_names(
+                object_type,
+                enums.Operation.LOCATE,
+                enums.Policy.ALLOW_OWNER
+            )
+            if allow_all:
+                criteria.permit(object_type, allow_all)
+            if allow_owner:
+                criteria.permit(object_type, allow_owner, owner_only=True)
+        if not criteria.permissions:
+            return None
+
+        return criteria
+
     def _process_get(self, payload):
         self._logger.info("Processing operation: Get")
 
@@ -1066,11 +2279,9 @@ class KmipEngine(object):
         # TODO (peterhamilton) Process key wrapping information
         # 1. Error check wrapping keys for accessibility and usability
 
-        object_type = self._get_object_type(unique_identifier)
-
-        managed_object = self._data_session.query(object_type).filter(
-            object_type.unique_identifier == unique_identifier
-        ).one()
+        managed_object, value, encoding = self._get_cached_object(
+            unique_identifier
+        )
 
         # Determine if the request should be carried out under the object's
         # operation policy. If not, feign ignorance of the object.
@@ -1110,7 +2321,12 @@ class KmipEngine(object):
             )
         )
 
-        core_secret = self._build_core_object(managed_object)
+        # Conversion and wrapping have been ruled out above, so a stored
+        # encoding matches the secret the client asked for.
+        if encoding is not None:
+            core_secret = get.EncodedSecret(encoding)
+        else:
+            core_secret = self._build_core_object(managed_object, value)
 
         response_payload = get.GetResponsePayload(
             object_type=attributes.ObjectType(managed_object._object_type),
@@ -1120,7 +2336,6 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_destroy(self, payload):
         self._logger.info("Processing operation: Destroy")
 
@@ -1129,15 +2344,11 @@ class KmipEngine(object):
         else:
             unique_identifier = self._id_placeholder
 
-        object_type = self._get_object_type(unique_identifier)
-
         # TODO (peterhamilton) Process attributes to see if destroy possible
         # 1. Check object state. If invalid, error out.
         # 2. Check object deactivation date. If invalid, error out.
 
-        managed_object = self._data_session.query(object_type).filter(
-            object_type.unique_identifier == unique_identifier
-        ).one()
+        managed_object = self._get_managed_object(unique_identifier)
 
         # Determine if the request should be carried out under the object's
         # operation policy. If not, feign ignorance of the object.
@@ -1157,19 +2368,15 @@ class KmipEngine(object):
             "Destroying an object with ID: {0}".format(unique_identifier)
         )
 
-        self._data_session.query(objects.ManagedObject).filter(
-            objects.ManagedObject.unique_identifier == unique_identifier
-        ).delete()
+        self._object_store.delete_object(self._data_session, unique_identifier)
+        self._record_object_change(unique_identifier)
 
         response_payload = destroy.DestroyResponsePayload(
             unique_identifier=attributes.UniqueIdentifier(unique_identifier)
         )
 
-        self._data_session.commit()
-
         return response_payload
 
-    @_kmip_version_supported('1.0')
     def _process_query(self, payload):
         self._logger.info("Processing operation: Query")
 
@@ -1187,9 +2394,12 @@ class KmipEngine(object):
                 contents.Operation(enums.Operation.CREATE),
                 contents.Operation(enums.Operation.CREATE_KEY_PAIR),
                 contents.Operation(enums.Operation.REGISTER),
+                contents.Operation(enums.Operation.LOCATE),
                 contents.Operation(enums.Operation.GET),
                 contents.Operation(enums.Operation.DESTROY),
-                contents.Operation(enums.Operation.QUERY)
+                contents.Operation(enums.Operation.QUERY),
+                contents.Operation(enums.Operation.CANCEL),
+                contents.Operation(enums.Operation.POLL)
             ])
 
             if self._protocol_version == contents.ProtocolVersion.create(1, 1):
@@ -1222,7 +2432,72 @@ class KmipEngine(object):
 
         return response_payload
 
-    @_kmip_version_supported('1.1')
+    def _process_cancel(self, payload):
+        self._logger.info("Processing operation: Cancel")
+
+        correlation_value = None
+        if payload.asynchronous_correlation_value:
+            correlation_value = payload.asynchronous_correlation_value.value
+
+        result = self._asynchronous_manager.cancel(
+            correlation_value,
+            self._client_identity
+        )
+
+        response_payload = cancel.CancelResponsePayload(
+            asynchronous_correlation_value=contents.
+            AsynchronousCorrelationValue(correlation_value),
+            cancellation_result=contents.CancellationResult(result)
+        )
+
+        return response_payload
+
+    @_kmip_version_supported('1.0')
+    def _process_poll(self, payload):
+        self._logger.info("Processing operation: Poll")
+
+        correlation_value = None
+        if payload.asynchronous_correlation_value:
+            correlation_value = payload.asynchronous_correlation_value.value
+
+        job = self._asynchronous_manager.get(
+            correlation_value,
+            self._client_identity
+        )
+        if job is None:
+            raise exceptions.ItemNotFound(
+                "Could not locate asynchronous operation: {0}".format(
+                    correlation_value
+                )
+            )
+
+        # The response to a Poll carries the operation, result and payload
+        # of the original operation once it has finished.
+        operation = contents.Operation(job.operation)
+        result = job.result
+
+        if job.state == asynchronous.AsynchronousOperation.CANCELED:
+            return (
+                operation,
+                enums.ResultStatus.OPERATION_FAILED,
+                enums.ResultReason.OPERATION_CANCELED_BY_REQUESTER,
+                "The asynchronous operation was canceled.",
+                None,
+                None
+            )
+        elif result is None:
+            return (
+                operation,
+                enums.ResultStatus.OPERATION_PENDING,
+                None,
+                None,
+                None,
+                correlation_value
+            )
+        else:
+            status, reason, message, response_payload = result
+            return (operation, status, reason, message, response_payload, None)
+
     def _process_discover_versions(self, payload):
         self._logger.info("Processing operation: DiscoverVersions")
         supported_versions = list()
@@ -0,0 +1,257 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import array
+import errno
+import os
+import shutil
+import six
+import socket
+import struct
+import tempfile
+
+from kmip.core import exceptions
+
+
+# The first file descriptor passed by systemd socket activation.
+LISTEN_FDS_START = 3
+
+# The byte a new server process sends once it is ready to accept connections
+# on a socket handed over by the previous process.
+READY = b'\x01'
+
+# The number of seconds either process waits for the other during a handoff.
+TIMEOUT = 30
+
+
+def get_activation_socket():
+    """
+    Get the listening socket passed in by systemd-style socket activation.
+
+    The LISTEN_PID and LISTEN_FDS environment variables are checked to see
+    if a listening socket was passed to this process. If so, the variables
+    are cleared so that they are not inherited by child processes.
+
+    Returns:
+        socket: The inherited listening socket, or None if no socket was
+            passed to this process.
+    """
+    if os.environ.get('LISTEN_PID') != str(os.getpid()):
+        return None
+
+    try:
+        count = int(os.environ.get('LISTEN_FDS', '0'))
+    except ValueError:
+        count = 0
+
+    for variable in ('LISTEN_PID', 'LISTEN_FDS', 'LISTEN_FDNAMES'):
+        os.environ.pop(variable, None)
+
+    if count < 1:
+        return None
+
+    return _socket_from_fd(LISTEN_FDS_START)
+
+
+def listen(path):
+    """
+    Listen for handoff requests on a Unix domain socket at path.
+
+    The socket is bound in a private directory and made accessible to the
+    current user only before it is moved to path, so that no other user can
+    connect to it at any time.
+
+    Args:
+        path (string): The path of the Unix domain socket. An existing file
+            at path is replaced. Required.
+
+    Returns:
+        socket: The listening Unix domain socket.
+    """
+    _check_support()
+
+    directory = tempfile.mkdtemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            temporary_path = os.path.join(directory, 'handoff.sock')
+            listener.bind(temporary_path)
+            os.chmod(temporary_path, 0o600)
+            os.rename(temporary_path, path)
+            listener.listen(1)
+        except Exception:
+            listener.close()
+            raise
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    return listener
+
+
+def get_peer_uid(connection):
+    """
+    Get the user ID of the process at the other end of a Unix domain socket.
+
+    Args:
+        connection (socket): The Unix domain socket connection. Required.
+
+    Returns:
+        int: The user ID of the peer process, or None if the platform does
+            not report it.
+    """
+    option = getattr(socket, 'SO_PEERCRED', None)
+    if option is None:
+        return None
+    credentials = connection.getsockopt(
+        socket.SOL_SOCKET,
+        option,
+        struct.calcsize('3i')
+    )
+    return struct.unpack('3i', credentials)[1]
+
+
+def check_peer(connection):
+    """
+    Check that a Unix domain socket connection comes from a process running
+    as the same user as this one.
+
+    Args:
+        connection (socket): The Unix domain socket connection. Required.
+
+    Raises:
+        NetworkingError: Raised if the peer runs as another user, or if its
+            user cannot be determined.
+    """
+    uid = get_peer_uid(connection)
+    if uid is None:
+        raise exceptions.NetworkingError(
+            "The user of the peer server process cannot be verified on this "
+            "platform."
+        )
+    if uid != os.getuid():
+        raise exceptions.NetworkingError(
+            "The peer server process runs as another user: {0}".format(uid)
+        )
+
+
+def request_socket(path, timeout=TIMEOUT):
+    """
+    Ask the server process listening at path for its listening socket.
+
+    Args:
+        path (string): The path of the Unix domain socket on which the
+            running server process accepts handoff requests. Required.
+        timeout (int): The number of seconds to wait for the running server
+            process to respond. Optional, defaults to 30.
+
+    Returns:
+        tuple: The received listening socket and the handoff connection, or
+            None if no server process is listening at path. The caller must
+            send READY on the connection once it can accept client
+            connections and then wait for the connection to be closed by the
+            previous process.
+
+    Raises:
+        NetworkingError: Raised if the running server process does not hand
+            over a socket, or runs as another user.
+    """
+    _check_support()
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(timeout)
+    try:
+        connection.connect(path)
+    except socket.error as e:
+        connection.close()
+        if e.errno in (errno.ENOENT, errno.ECONNREFUSED):
+            return None
+        raise
+
+    try:
+        check_peer(connection)
+        fd = receive_fd(connection)
+    except Exception:
+        connection.close()
+        raise
+
+    return _socket_from_fd(fd), connection
+
+
+def send_fd(connection, fd):
+    """
+    Send a file descriptor over a connected Unix domain socket.
+
+    Args:
+        connection (socket): The Unix domain socket connection. Required.
+        fd (int): The file descriptor to send. Required.
+    """
+    _check_support()
+    connection.sendmsg(
+        [b'\x00'],
+        [(socket.SOL_SOCKET, socket.SCM_RIGHTS, array.array('i', [fd]))]
+    )
+
+
+def receive_fd(connection):
+    """
+    Receive a file descriptor sent with send_fd.
+
+    Args:
+        connection (socket): The Unix domain socket connection. Required.
+
+    Returns:
+        int: The received file descriptor, owned by the caller.
+
+    Raises:
+        NetworkingError: Raised if no file descriptor was received.
+    """
+    _check_support()
+    fds = array.array('i')
+    data, ancillary_data, flags, address = connection.recvmsg(
+        1,
+        socket.CMSG_LEN(fds.itemsize)
+    )
+    for level, message_type, message_data in ancillary_data:
+        if level == socket.SOL_SOCKET and message_type == socket.SCM_RIGHTS:
+            fds.frombytes(message_data[:fds.itemsize])
+    if not fds:
+        raise exceptions.NetworkingError(
+            "No socket was received from the running server process."
+        )
+    return fds[0]
+
+
+def _check_support():
+    if not hasattr(socket, 'AF_UNIX'):
+        supported = False
+    else:
+        supported = hasattr(socket.socket, 'sendmsg')
+
+    if not supported:
+        raise exceptions.NetworkingError(
+            "Socket handoff is not supported on this platform."
+        )
+
+
+def _socket_from_fd(fd):
+    if six.PY2:
+        # Python 2 cannot detect the address family of a descriptor.
+        sock = socket.fromfd(fd, socket.AF_INET, socket.SOCK_STREAM)
+        os.close(fd)
+        return sock
+
+    # The family is read from the descriptor, so that IPv6 listeners keep
+    # theirs. The new socket takes ownership of the descriptor.
+    return socket.socket(fileno=fd)
@@ -0,0 +1,341 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Load managed objects from a file straight into the server data store.
+
+The file holds one JSON object per line, for example:
+
+    {"object_type": "SYMMETRIC_KEY", "cryptographic_algorithm": "AES",
+     "cryptographic_length": 128, "value": "00112233445566778899aabbccddeeff",
+     "name": "Key 1", "owner": "client-1"}
+
+Values are hex-encoded. Symmetric keys need cryptographic_algorithm and
+cryptographic_length, secret data needs secret_data_type and opaque objects
+need opaque_data_type, each given by enumeration name. name, owner,
+operation_policy_name and cryptographic_usage_mask (a list of enumeration
+names) are optional.
+"""
+
+import binascii
+import json
+import optparse
+import six
+import sys
+import time
+
+from six.moves.urllib import parse
+
+from kmip.core import enums
+from kmip.core import exceptions
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import config
+from kmip.services.server import engine
+
+
+def _get_enum(enumeration, name, key):
+    try:
+        return enumeration[name]
+    except (KeyError, TypeError):
+        raise ValueError("Missing or invalid {0}: {1}".format(key, name))
+
+
+def build_managed_object(record, owner=None):
+    """
+    Build a new pie object from a decoded line of an import file.
+
+    Args:
+        record (dict): The decoded line.
+        owner (string): The owner of the object if the record names none.
+            Optional, defaults to None.
+
+    Returns:
+        ManagedObject: The new object.
+
+    Raises:
+        ValueError: Raised if the record is invalid.
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Each line must hold a JSON object.")
+
+    object_type = _get_enum(
+        enums.ObjectType,
+        record.get('object_type'),
+        'object_type'
+    )
+    try:
+        value = binascii.unhexlify(record['value'])
+    except (KeyError, TypeError, binascii.Error):
+        raise ValueError("Missing or invalid value.")
+
+    masks = [
+        _get_enum(
+            enums.CryptographicUsageMask,
+            x,
+            'cryptographic_usage_mask'
+        )
+        for x in record.get('cryptographic_usage_mask', [])
+    ]
+
+    if object_type == enums.ObjectType.SYMMETRIC_KEY:
+        length = record.get('cryptographic_length')
+        if not isinstance(length, six.integer_types):
+            raise ValueError(
+                "Missing or invalid cryptographic_length: {0}".format(length)
+            )
+        managed_object = objects.SymmetricKey(
+            _get_enum(
+                enums.CryptographicAlgorithm,
+                record.get('cryptographic_algorithm'),
+                'cryptographic_algorithm'
+            ),
+            length,
+            value,
+            masks=masks
+        )
+    elif object_type == enums.ObjectType.SECRET_DATA:
+        managed_object = objects.SecretData(
+            value,
+            _get_enum(
+                enums.SecretDataType,
+                record.get('secret_data_type'),
+                'secret_data_type'
+            ),
+            masks=masks
+        )
+    elif object_type == enums.ObjectType.OPAQUE_DATA:
+        managed_object = objects.OpaqueObject(
+            value,
+            _get_enum(
+                enums.OpaqueDataType,
+                record.get('opaque_data_type'),
+                'opaque_data_type'
+            )
+        )
+    else:
+        raise ValueError(
+            "Unsupported object_type: {0}".format(record['object_type'])
+        )
+
+    if 'name' in record:
+        managed_object.names = [record['name']]
+    managed_object.operation_policy_name = record.get(
+        'operation_policy_name',
+        'default'
+    )
+    managed_object._owner = record.get('owner', owner)
+
+    return managed_object
+
+
+def import_objects(object_store, lines, chunk_size=10000, owner=None,
+                   generate_identifier=sqltypes.generate_ulid):
+    """
+    Insert the objects described by the lines of an import file.
+
+    Objects are inserted in bulk, committing once per chunk. Blank lines are
+    skipped.
+
+    Args:
+        object_store (ObjectStore): The store of the server's objects.
+        lines (iterable): The lines of the import file.
+        chunk_size (int): The number of objects inserted per transaction.
+            Optional, defaults to 10000.
+        owner (string): The owner of the objects whose lines name none.
+            Optional, defaults to None.
+        generate_identifier (callable): The function giving each object its
+            ID. Optional, defaults to generate_ulid.
+
+    Returns:
+        int: The number of objects inserted.
+
+    Raises:
+        ValueError: Raised if a line is invalid. The chunks before it are
+            committed.
+    """
+    def insert(chunk):
+        session = object_store.open_session()
+        try:
+            object_store.insert_objects(session, chunk)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+        return len(chunk)
+
+    count = 0
+    chunk = list()
+
+    for number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            managed_object = build_managed_object(json.loads(line), owner)
+        except ValueError as e:
+            raise ValueError("Line {0}: {1}".format(number, e))
+        managed_object.unique_identifier = generate_identifier()
+        chunk.append(managed_object)
+
+        if len(chunk) >= chunk_size:
+            count += insert(chunk)
+            chunk = list()
+
+    if chunk:
+        count += insert(chunk)
+
+    return count
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options] FILE",
+        description="Load managed objects into the PyKMIP server data "
+                    "store. FILE holds one JSON object per line, or is '-' "
+                    "to read from standard input."
+    )
+    parser.add_option(
+        "-f",
+        "--config_path",
+        action="store",
+        type="str",
+        default=None,
+        dest="config_path",
+        help=(
+            "A string representing a path to a server configuration file, "
+            "whose database settings are used. Defaults to None."
+        ),
+    )
+    parser.add_option(
+        "-d",
+        "--database_url",
+        action="store",
+        type="str",
+        default=None,
+        dest="database_url",
+        help=(
+            "The URL of the data store, in any form the server accepts "
+            "except memory://. Overrides the configuration file, including "
+            "its shard URLs. Defaults to the server default."
+        ),
+    )
+    parser.add_option(
+        "-o",
+        "--owner",
+        action="store",
+        type="str",
+        default=None,
+        dest="owner",
+        help=(
+            "The owner of the objects whose lines name none. Defaults to "
+            "None."
+        ),
+    )
+    parser.add_option(
+        "-s",
+        "--chunk_size",
+        action="store",
+        type="int",
+        default=10000,
+        dest="chunk_size",
+        help=(
+            "The number of objects inserted per transaction. Defaults to "
+            "10000."
+        ),
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, args = parser.parse_args(sys.argv[1:] if args is None else args)
+    if len(args) != 1:
+        parser.error("Exactly one import file must be given.")
+    if opts.chunk_size < 1:
+        parser.error("The chunk size must be a positive integer.")
+
+    settings = config.KmipServerConfig()
+    try:
+        if opts.config_path:
+            settings.load_settings(opts.config_path)
+        if opts.database_url:
+            settings.set_setting('database_url', opts.database_url)
+            settings.set_setting('database_shard_urls', [])
+    except exceptions.ConfigurationError as e:
+        parser.error(str(e))
+    settings = settings.settings
+
+    # Objects are written to the shards when the server spreads them
+    # across several data stores.
+    database_url = settings.get('database_url')
+    database_shard_urls = settings.get('database_shard_urls')
+    for url in database_shard_urls or [database_url]:
+        if parse.urlsplit(url).scheme == 'memory':
+            parser.error(
+                "Objects cannot be imported into the memory object store, "
+                "which does not outlive the server process."
+            )
+
+    try:
+        object_store = engine._create_server_object_store(
+            database_url,
+            database_shard_urls,
+            pool_size=settings.get('database_pool_size'),
+            max_overflow=settings.get('database_max_overflow'),
+            pool_pre_ping=settings.get('database_pool_pre_ping'),
+            sqlite_pragmas=[
+                ('journal_mode', settings.get('sqlite_journal_mode')),
+                ('synchronous', settings.get('sqlite_synchronous')),
+                ('busy_timeout', settings.get('sqlite_busy_timeout')),
+                ('mmap_size', settings.get('sqlite_mmap_size'))
+            ]
+        )
+    except exceptions.ConfigurationError as e:
+        parser.error(str(e))
+
+    start = time.time()
+    if args[0] == '-':
+        import_file = sys.stdin
+    else:
+        import_file = open(args[0], 'r')
+    try:
+        count = import_objects(
+            object_store,
+            import_file,
+            chunk_size=opts.chunk_size,
+            owner=opts.owner,
+            generate_identifier=sqltypes.IDENTIFIER_FORMATS[
+                settings.get('identifier_format')
+            ]
+        )
+    except ValueError as e:
+        sys.exit("Import stopped: {0}".format(e))
+    finally:
+        if import_file is not sys.stdin:
+            import_file.close()
+        object_store.close()
+
+    print("Imported {0} objects in {1:.1f} s".format(
+        count,
+        time.time() - start
+    ))
+
+
+if __name__ == '__main__':
+    main()
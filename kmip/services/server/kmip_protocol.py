@@ -13,7 +13,7 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from struct import unpack
+from struct import unpack_from
 
 import binascii
 import logging
@@ -24,9 +24,11 @@ from kmip.core.utils import BytearrayStream
 class KMIPProtocol(object):
     HEADER_SIZE = 8
 
-    def __init__(self, socket, buffer_size=1024):
+    def __init__(self, socket, buffer_size=1024, max_message_size=16777216):
         self.socket = socket
         self.logger = logging.getLogger(__name__)
+        self._buffer = bytearray(max(buffer_size, self.HEADER_SIZE))
+        self._max_message_size = max_message_size
 
     def write(self, data):
         if len(data) > 0:
@@ -37,35 +39,43 @@ class KMIPProtocol(object):
 
     def read(self):
         try:
-            header = self._recv_all(self.HEADER_SIZE)
+            self._recv_all(0, self.HEADER_SIZE)
         except RequestLengthMismatch as e:
             if e.received == 0:
                 raise EOFError("No request to process")
             else:
                 raise
-        msg_size = unpack('!I', header[4:])[0]
+        msg_size = unpack_from('!I', self._buffer, 4)[0]
+        total_size = self.HEADER_SIZE + msg_size
 
-        payload = self._recv_all(msg_size)
-        data = BytearrayStream(header + payload)
+        # Check the untrusted header length before reserving any memory.
+        if total_size > self._max_message_size:
+            raise MessageTooLarge(total_size, self._max_message_size)
+
+        if total_size > len(self._buffer):
+            buffer = bytearray(max(total_size, 2 * len(self._buffer)))
+            buffer[:self.HEADER_SIZE] = self._buffer[:self.HEADER_SIZE]
+            self._buffer = buffer
+
+        self._recv_all(self.HEADER_SIZE, total_size)
+        data = BytearrayStream(memoryview(self._buffer)[:total_size])
         self.logger.debug('KMIPProtocol.read: {0}'.format(
             binascii.hexlify(bytes(data.buffer))))
         return data
 
-    def _recv_all(self, total_bytes_to_be_read):
-        bytes_read = 0
-        total_msg = b''
-        while bytes_read < total_bytes_to_be_read:
-            msg = self.socket.recv(total_bytes_to_be_read - bytes_read)
-            if not msg:
+    def _recv_all(self, start, end):
+        view = memoryview(self._buffer)
+        bytes_read = start
+        while bytes_read < end:
+            msg_size = self.socket.recv_into(
+                view[bytes_read:end],
+                end - bytes_read
+            )
+            if not msg_size:
                 break
-            bytes_read += len(msg)
-            total_msg += msg
-        if bytes_read != total_bytes_to_be_read:
-            msg = "expected {0}, received {1} bytes".format(
-                total_bytes_to_be_read, bytes_read)
-            raise RequestLengthMismatch(total_bytes_to_be_read, bytes_read)
-
-        return total_msg
+            bytes_read += msg_size
+        if bytes_read != end:
+            raise RequestLengthMismatch(end - start, bytes_read - start)
 
 
 class KMIPProtocolFactory(object):
@@ -91,3 +101,22 @@ class RequestLengthMismatch(Exception):
 
     def __repr__(self):
         return self.__str__()
+
+
+class MessageTooLarge(Exception):
+    """
+    This exception raised when the header of a message read from stream
+    advertises a length larger than the maximum allowed.
+    """
+    def __init__(self, size, max_size, message="KMIPProtocol read error"):
+        super(MessageTooLarge, self).__init__(message)
+        self.message = message
+        self.size = size
+        self.max_size = max_size
+
+    def __str__(self):
+        return "{0}: message of {1} bytes exceeds the maximum of {2}".format(
+                self.message, self.size, self.max_size)
+
+    def __repr__(self):
+        return self.__str__()
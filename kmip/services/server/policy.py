@@ -23,7 +23,8 @@ class AttributeRuleSet(object):
 
     Every attribute defined by the KMIP specification comes with a set of
     rules defining how and under what conditions the attribute should be
-    used. This class acts as a basic struct storing those rules.
+    used. This class acts as a basic struct storing those rules. Rule sets
+    are shared between requests and cannot be modified once created.
 
     Attributes:
         always_has_value: A flag defining if the attribute is always set.
@@ -39,8 +40,8 @@ class AttributeRuleSet(object):
             multivalued.
         implicitly_set_by: A list of operations that can implicitly set the
             attribute.
-        applies_to_object_types: A list of object types that the attribute
-            is applicable for.
+        applies_to_object_types: A frozenset of object types that the
+            attribute is applicable for.
         version_added: The KMIP version in which support for the attribute
             was added.
         version_deprecated: The KMIP version in which support for the
@@ -90,16 +91,23 @@ class AttributeRuleSet(object):
                 to None.
         """
         self.always_has_value = always_has_value
-        self.initially_set_by = initially_set_by
+        self.initially_set_by = tuple(initially_set_by)
         self.modifiable_by_server = modifiable_by_server
         self.modifiable_by_client = modifiable_by_client
         self.deletable_by_client = deletable_by_client
         self.multiple_instances_permitted = multivalued
-        self.implicitly_set_by = implicitly_set_by
-        self.applies_to_object_types = applies_to_object_types
+        self.implicitly_set_by = tuple(implicitly_set_by)
+        self.applies_to_object_types = frozenset(applies_to_object_types)
         self.version_added = version_added
         self.version_deprecated = version_deprecated
 
+        self._is_frozen = True
+
+    def __setattr__(self, name, value):
+        if getattr(self, '_is_frozen', False):
+            raise AttributeError("AttributeRuleSet objects are read-only.")
+        super(AttributeRuleSet, self).__setattr__(name, value)
+
 
 class AttributePolicy(object):
     """
@@ -117,6 +125,10 @@ class AttributePolicy(object):
     * Is this attribute deprecated in KMIP 1.1?
     * Is this attribute applicable for the SymmetricKey object type?
     * Is this attribute allowed to have multiple values?
+
+    The answers that depend only on the KMIP version are computed once, when
+    the policy is created, so a policy should be built once per supported
+    version and shared.
     """
 
     def __init__(self, version):
@@ -1078,6 +1090,61 @@ class AttributePolicy(object):
             ),
         }
 
+        self._supported_attributes = frozenset(
+            name for name, rule_set in self._attribute_rule_sets.items()
+            if version >= rule_set.version_added
+        )
+        self._deprecated_attributes = frozenset(
+            name for name, rule_set in self._attribute_rule_sets.items()
+            if rule_set.version_deprecated and
+            version >= rule_set.version_deprecated
+        )
+        self._multivalued_attributes = frozenset(
+            name for name, rule_set in self._attribute_rule_sets.items()
+            if rule_set.multiple_instances_permitted
+        )
+
+    @property
+    def version(self):
+        """
+        The KMIP version under which this policy is evaluated.
+        """
+        return self._version
+
+    @property
+    def supported_attributes(self):
+        """
+        A frozenset of the names of attributes supported by this version.
+        """
+        return self._supported_attributes
+
+    @property
+    def deprecated_attributes(self):
+        """
+        A frozenset of the names of attributes deprecated by this version.
+        """
+        return self._deprecated_attributes
+
+    @property
+    def multivalued_attributes(self):
+        """
+        A frozenset of the names of attributes allowed multiple instances.
+        """
+        return self._multivalued_attributes
+
+    def get_rule_set(self, attribute):
+        """
+        Get the read-only rule set for an attribute.
+
+        Args:
+            attribute (string): The name of the attribute (e.g., 'Name').
+                Required.
+        Returns:
+            AttributeRuleSet: The rule set of the attribute, or None if the
+                attribute is not known.
+        """
+        return self._attribute_rule_sets.get(attribute)
+
     def is_attribute_supported(self, attribute):
         """
         Check if the attribute is supported by the current KMIP version.
@@ -1089,14 +1156,7 @@ class AttributePolicy(object):
             bool: True if the attribute is supported by the current KMIP
                 version. False otherwise.
         """
-        if attribute not in self._attribute_rule_sets.keys():
-            return False
-
-        rule_set = self._attribute_rule_sets.get(attribute)
-        if self._version >= rule_set.version_added:
-            return True
-        else:
-            return False
+        return attribute in self._supported_attributes
 
     def is_attribute_deprecated(self, attribute):
         """
@@ -1106,14 +1166,7 @@ class AttributePolicy(object):
             attribute (string): The name of the attribute
                 (e.g., 'Unique Identifier'). Required.
         """
-        rule_set = self._attribute_rule_sets.get(attribute)
-        if rule_set.version_deprecated:
-            if self._version >= rule_set.version_deprecated:
-                return True
-            else:
-                return False
-        else:
-            return False
+        return attribute in self._deprecated_attributes
 
     def is_attribute_applicable_to_object_type(self, attribute, object_type):
         """
@@ -1130,10 +1183,7 @@ class AttributePolicy(object):
         """
         # TODO (peterhamilton) Handle applicability between certificate types
         rule_set = self._attribute_rule_sets.get(attribute)
-        if object_type in rule_set.applies_to_object_types:
-            return True
-        else:
-            return False
+        return object_type in rule_set.applies_to_object_types
 
     def is_attribute_multivalued(self, attribute):
         """
@@ -1144,5 +1194,108 @@ class AttributePolicy(object):
                 (e.g., 'State'). Required.
         """
         # TODO (peterhamilton) Handle multivalue swap between certificate types
-        rule_set = self._attribute_rule_sets.get(attribute)
-        return rule_set.multiple_instances_permitted
+        return attribute in self._multivalued_attributes
+
+
+class OperationPolicyTable(object):
+    """
+    A compiled, read-only table of operation policy decisions.
+
+    Operation policies are nested mappings of policy name to object type to
+    operation to Policy value. The table flattens them into a single
+    mapping keyed by (policy name, object type, operation), so that an
+    authorization check is one dictionary lookup. Tables are never modified
+    after they are built; new policies are applied by building a new table
+    and replacing the old one.
+    """
+
+    def __init__(self, policies):
+        """
+        Create an OperationPolicyTable.
+
+        Args:
+            policies (dict): The operation policies to compile, keyed by
+                policy name. Required.
+        """
+        decisions = dict()
+        object_types = set()
+        names_by_decision = dict()
+
+        for name, policy_set in policies.items():
+            for object_type, object_policy in policy_set.items():
+                object_types.add((name, object_type))
+                for operation, decision in object_policy.items():
+                    decisions[(name, object_type, operation)] = decision
+                    names_by_decision.setdefault(
+                        (object_type, operation, decision),
+                        set()
+                    ).add(name)
+
+        self._policies = policies
+        self._policy_names = frozenset(policies.keys())
+        self._object_types = frozenset(object_types)
+        self._decisions = decisions
+        self._names_by_decision = dict(
+            (k, frozenset(v)) for k, v in names_by_decision.items()
+        )
+
+    @property
+    def policies(self):
+        """
+        The operation policies the table was compiled from.
+        """
+        return self._policies
+
+    @property
+    def policy_names(self):
+        """
+        A frozenset of the names of the policies in the table.
+        """
+        return self._policy_names
+
+    def has_object_type(self, policy_name, object_type):
+        """
+        Check if a policy defines any rules for an object type.
+
+        Args:
+            policy_name (string): The name of the policy. Required.
+            object_type (ObjectType): An ObjectType enumeration. Required.
+        Returns:
+            bool: True if the policy has rules for the object type. False
+                otherwise.
+        """
+        return (policy_name, object_type) in self._object_types
+
+    def get_decision(self, policy_name, object_type, operation):
+        """
+        Look up the policy decision for an operation on an object type.
+
+        Args:
+            policy_name (string): The name of the policy. Required.
+            object_type (ObjectType): An ObjectType enumeration. Required.
+            operation (Operation): An Operation enumeration. Required.
+        Returns:
+            Policy: The Policy enumeration for the operation, or None if the
+                policy does not cover it.
+        """
+        return self._decisions.get((policy_name, object_type, operation))
+
+    def get_policy_names(self, object_type, operation, decision):
+        """
+        Find the policies that make a decision for an operation on an object
+        type.
+
+        This is the inverse of get_decision, used to turn a policy check into
+        a filter on stored objects.
+
+        Args:
+            object_type (ObjectType): An ObjectType enumeration. Required.
+            operation (Operation): An Operation enumeration. Required.
+            decision (Policy): A Policy enumeration. Required.
+        Returns:
+            frozenset: The names of the policies with the given decision.
+        """
+        return self._names_by_decision.get(
+            (object_type, operation, decision),
+            frozenset()
+        )
@@ -0,0 +1,137 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.core import exceptions
+
+from kmip.services.server.repo import store
+
+try:
+    import lmdb
+except ImportError:
+    lmdb = None
+
+
+DEFAULT_MAP_SIZE = 1 << 30
+
+# The longest key LMDB accepts with its default build options.
+_MAX_KEY_SIZE = 511
+
+
+def _get_key(unique_identifier):
+    """
+    Encode an object ID as a key. Returns None for IDs that no object can
+    have.
+    """
+    key = str(unique_identifier).encode('utf-8')
+    if not key or len(key) > _MAX_KEY_SIZE:
+        return None
+    return key
+
+
+class LmdbStore(store.BufferedStore):
+    """
+    An object store kept in an embedded LMDB database, for read-heavy
+    workloads.
+
+    LMDB readers work on a snapshot of the memory-mapped database and never
+    wait for the writer. Object attributes, secret values and stored
+    encodings live in separate databases keyed by ID, so that reading an
+    object without its secret does not touch the secret pages. The store is
+    meant to be used by a single server process, which keeps the attributes
+    Locate searches by in memory.
+
+    Requires the lmdb package.
+    """
+
+    def __init__(self, path, map_size=DEFAULT_MAP_SIZE):
+        """
+        Create an LmdbStore.
+
+        Args:
+            path (string): The path to the directory of the database, which
+                is created if missing.
+            map_size (int): The maximum size of the database in bytes.
+                Optional, defaults to 1 GiB.
+
+        Raises:
+            ConfigurationError: Raised if the lmdb package is missing.
+        """
+        if lmdb is None:
+            raise exceptions.ConfigurationError(
+                "The lmdb package is required for LMDB data stores."
+            )
+        super(LmdbStore, self).__init__()
+
+        self._environment = lmdb.open(path, map_size=map_size, max_dbs=3)
+        self._objects = self._environment.open_db(b'objects')
+        self._secrets = self._environment.open_db(b'secrets')
+        self._encoded_secrets = self._environment.open_db(b'encoded_secrets')
+
+        with self._environment.begin() as transaction:
+            for key, data in transaction.cursor(db=self._objects):
+                managed_object = store.decode_object(data)
+                self._catalogue[str(managed_object.unique_identifier)] = \
+                    store.get_locate_entry(managed_object)
+
+    def _load_object(self, unique_identifier, load_secret):
+        key = _get_key(unique_identifier)
+        if key is None:
+            return None
+
+        with self._environment.begin() as transaction:
+            data = transaction.get(key, db=self._objects)
+            if data is None:
+                return None
+            if not load_secret:
+                return store.decode_object(data)
+            return store.decode_object(
+                data,
+                transaction.get(key, db=self._secrets),
+                transaction.get(key, db=self._encoded_secrets)
+            )
+
+    def _write_changes(self, changes):
+        with self._environment.begin(write=True) as transaction:
+            for unique_identifier, managed_object in changes:
+                key = _get_key(unique_identifier)
+                if managed_object is None:
+                    transaction.delete(key, db=self._objects)
+                    transaction.delete(key, db=self._secrets)
+                    transaction.delete(key, db=self._encoded_secrets)
+                    continue
+
+                transaction.put(
+                    key,
+                    store.encode_object(managed_object),
+                    db=self._objects
+                )
+                if managed_object.value is not None:
+                    transaction.put(
+                        key,
+                        bytes(managed_object.value),
+                        db=self._secrets
+                    )
+                if managed_object._encoded_secret is not None:
+                    transaction.put(
+                        key,
+                        bytes(managed_object._encoded_secret),
+                        db=self._encoded_secrets
+                    )
+
+    def close(self):
+        """
+        Close the database.
+        """
+        self._environment.close()
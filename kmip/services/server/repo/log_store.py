@@ -0,0 +1,403 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import logging
+import mmap
+import os
+import struct
+import threading
+import zlib
+
+from kmip.services.server.repo import store
+
+
+DEFAULT_COMPACTION_RATIO = 0.5
+DEFAULT_COMPACTION_MIN_SIZE = 1 << 20
+
+_LOG_NAME = 'objects.log'
+_COMPACTION_NAME = 'objects.log.compact'
+_COMPACTION_FRAME_ENTRIES = 1000
+
+# A frame holds the changes of one commit: its payload length and CRC-32,
+# then the entries. An entry holds the length of its ID, its operation and
+# its ID; a put entry then holds the lengths of the object attributes,
+# secret value and stored encoding, -1 standing for None, and the data
+# itself.
+_FRAME_HEADER = struct.Struct('>II')
+_ENTRY_HEADER = struct.Struct('>HB')
+_PUT_LENGTHS = struct.Struct('>iii')
+
+_DELETE = 0
+_PUT = 1
+
+
+# The place of a put entry in the log. The attributes, secret and encoding
+# are (offset, length) tuples, or None for a missing secret or encoding.
+_Location = collections.namedtuple(
+    '_Location',
+    ['offset', 'size', 'attributes', 'secret', 'encoded_secret']
+)
+
+
+def _open_log_file(path):
+    descriptor = os.open(path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+    return os.fdopen(descriptor, 'a+b')
+
+
+def _map_log_file(log_file, size):
+    if size == 0:
+        return b''
+    return mmap.mmap(log_file.fileno(), size, access=mmap.ACCESS_READ)
+
+
+def _sync_directory(path):
+    descriptor = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+def _build_frame(entries):
+    payload = b''.join(entries)
+    return _FRAME_HEADER.pack(
+        len(payload),
+        zlib.crc32(payload) & 0xffffffff
+    ) + payload
+
+
+def _build_entry(unique_identifier, managed_object):
+    identifier = unique_identifier.encode('utf-8')
+    if managed_object is None:
+        return _ENTRY_HEADER.pack(len(identifier), _DELETE) + identifier
+
+    parts = [
+        store.encode_object(managed_object),
+        managed_object.value,
+        managed_object._encoded_secret
+    ]
+    parts = [None if x is None else bytes(x) for x in parts]
+    lengths = [-1 if x is None else len(x) for x in parts]
+
+    return b''.join(
+        [
+            _ENTRY_HEADER.pack(len(identifier), _PUT),
+            identifier,
+            _PUT_LENGTHS.pack(*lengths)
+        ] + [x for x in parts if x is not None]
+    )
+
+
+def _scan(mapping, start, end):
+    """
+    Parse the frames of a log between two offsets, stopping at the first
+    frame that is incomplete or fails its checksum.
+
+    Returns:
+        tuple: The offset at which the last complete frame ends, and a list
+            of (ID, _Location) tuples in log order, where a None location
+            stands for a deletion.
+    """
+    offset = start
+    entries = list()
+
+    while offset + _FRAME_HEADER.size <= end:
+        payload_length, checksum = _FRAME_HEADER.unpack_from(mapping, offset)
+        payload_start = offset + _FRAME_HEADER.size
+        payload_end = payload_start + payload_length
+        if payload_end > end:
+            break
+        payload = mapping[payload_start:payload_end]
+        if zlib.crc32(payload) & 0xffffffff != checksum:
+            break
+
+        position = payload_start
+        while position < payload_end:
+            entry_start = position
+            identifier_length, operation = _ENTRY_HEADER.unpack_from(
+                mapping,
+                position
+            )
+            position += _ENTRY_HEADER.size
+            unique_identifier = mapping[
+                position:position + identifier_length
+            ].decode('utf-8')
+            position += identifier_length
+
+            if operation == _DELETE:
+                entries.append((unique_identifier, None))
+                continue
+
+            lengths = _PUT_LENGTHS.unpack_from(mapping, position)
+            position += _PUT_LENGTHS.size
+            parts = list()
+            for length in lengths:
+                if length < 0:
+                    parts.append(None)
+                else:
+                    parts.append((position, length))
+                    position += length
+            entries.append((
+                unique_identifier,
+                _Location(entry_start, position - entry_start, *parts)
+            ))
+
+        offset = payload_end
+
+    return offset, entries
+
+
+def _apply_entries(index, entries):
+    """
+    Point an index at the entries of a log.
+
+    Returns:
+        int: The change in the number of bytes of live entries.
+    """
+    change = 0
+    for unique_identifier, location in entries:
+        previous = index.pop(unique_identifier, None)
+        if previous is not None:
+            change -= previous.size
+        if location is not None:
+            index[unique_identifier] = location
+            change += location.size
+    return change
+
+
+def _read(mapping, part):
+    if part is None:
+        return None
+    offset, length = part
+    return bytes(mapping[offset:offset + length])
+
+
+class LogStore(store.BufferedStore):
+    """
+    An object store kept in an append-only log file, for read-heavy
+    workloads.
+
+    Each commit appends one checksummed frame holding the objects it adds
+    and the IDs it deletes, and is synced to disk before it returns. An
+    in-memory index maps IDs to their latest entry, which readers read
+    through a memory map of the log without taking a lock. On opening, the
+    log is replayed and an incomplete frame left at its end by a crash is
+    discarded.
+
+    Deleted objects leave dead entries behind. Once they make up more than
+    the compaction ratio of the log, the live entries are copied to a new
+    log in a background thread, which then replaces the old log. The store
+    is meant to be used by a single server process.
+    """
+
+    def __init__(self,
+                 path,
+                 compaction_ratio=DEFAULT_COMPACTION_RATIO,
+                 compaction_min_size=DEFAULT_COMPACTION_MIN_SIZE):
+        """
+        Create a LogStore.
+
+        Args:
+            path (string): The path to the directory of the log, which is
+                created if missing.
+            compaction_ratio (float): The share of dead entries in the log
+                above which it is compacted. Optional, defaults to 0.5.
+            compaction_min_size (int): The size in bytes below which the log
+                is never compacted. Optional, defaults to 1 MiB.
+        """
+        super(LogStore, self).__init__()
+        self._logger = logging.getLogger('kmip.server.log_store')
+
+        self._path = path
+        self._log_path = os.path.join(path, _LOG_NAME)
+        self._compaction_path = os.path.join(path, _COMPACTION_NAME)
+        self._compaction_ratio = compaction_ratio
+        self._compaction_min_size = compaction_min_size
+
+        self._compaction_lock = threading.Lock()
+        self._compaction = None
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        if os.path.exists(self._compaction_path):
+            # A compaction was interrupted before replacing the log, which
+            # is still complete.
+            os.remove(self._compaction_path)
+
+        self._recover()
+
+    def _recover(self):
+        self._file = _open_log_file(self._log_path)
+        _sync_directory(self._path)
+        size = os.fstat(self._file.fileno()).st_size
+        mapping = _map_log_file(self._file, size)
+
+        end, entries = _scan(mapping, 0, size)
+        if end < size:
+            self._logger.warning(
+                "Discarding {0} bytes of incomplete writes at the end of "
+                "{1}.".format(size - end, self._log_path)
+            )
+            self._file.truncate(end)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            mapping = _map_log_file(self._file, end)
+
+        index = dict()
+        self._size = end
+        self._live_size = _apply_entries(index, entries)
+        self._view = (mapping, index)
+
+        for unique_identifier, location in index.items():
+            managed_object = store.decode_object(
+                _read(mapping, location.attributes)
+            )
+            self._catalogue[unique_identifier] = store.get_locate_entry(
+                managed_object
+            )
+
+    def _load_object(self, unique_identifier, load_secret):
+        while True:
+            mapping, index = self._view
+            location = index.get(unique_identifier)
+            if location is None:
+                return None
+            # The index is updated after the view is replaced, so an entry
+            # past the end of the mapping is found again in a newer view.
+            if location.offset + location.size <= len(mapping):
+                break
+
+        attributes = _read(mapping, location.attributes)
+        if not load_secret:
+            return store.decode_object(attributes)
+        return store.decode_object(
+            attributes,
+            _read(mapping, location.secret),
+            _read(mapping, location.encoded_secret)
+        )
+
+    def _write_changes(self, changes):
+        frame = _build_frame([_build_entry(x, y) for x, y in changes])
+
+        start = self._size
+        try:
+            self._file.write(frame)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        except Exception:
+            # Later frames would be lost behind a partial one on recovery.
+            self._file.truncate(start)
+            raise
+
+        self._size = start + len(frame)
+        mapping = _map_log_file(self._file, self._size)
+        _, entries = _scan(mapping, start, self._size)
+        index = self._view[1]
+        self._view = (mapping, index)
+        self._live_size += _apply_entries(index, entries)
+
+        dead_size = self._size - self._live_size
+        if self._size >= self._compaction_min_size and \
+                dead_size > self._size * self._compaction_ratio:
+            if self._compaction is None or not self._compaction.is_alive():
+                self._compaction = threading.Thread(
+                    target=self._compact_in_background
+                )
+                self._compaction.daemon = True
+                self._compaction.start()
+
+    def _compact_in_background(self):
+        try:
+            self.compact()
+        except Exception as e:
+            self._logger.warning("Compacting {0} failed.".format(
+                self._log_path
+            ))
+            self._logger.exception(e)
+
+    def compact(self):
+        """
+        Rewrite the log with only its live entries.
+
+        The live entries are copied without blocking writers. Frames written
+        meanwhile are then copied as they are, and the new log replaces the
+        old one.
+        """
+        with self._compaction_lock:
+            with self._write_lock:
+                mapping, index = self._view
+                start = self._size
+                locations = list(index.values())
+
+            compaction_file = _open_log_file(self._compaction_path)
+            try:
+                compaction_file.truncate(0)
+                for i in range(0, len(locations), _COMPACTION_FRAME_ENTRIES):
+                    compaction_file.write(_build_frame(
+                        [
+                            mapping[x.offset:x.offset + x.size]
+                            for x in locations[
+                                i:i + _COMPACTION_FRAME_ENTRIES
+                            ]
+                        ]
+                    ))
+                compaction_file.flush()
+                compaction_size = os.fstat(compaction_file.fileno()).st_size
+
+                compaction_index = dict()
+                live_size = _apply_entries(
+                    compaction_index,
+                    _scan(
+                        _map_log_file(compaction_file, compaction_size),
+                        0,
+                        compaction_size
+                    )[1]
+                )
+
+                with self._write_lock:
+                    compaction_file.write(
+                        self._view[0][start:self._size]
+                    )
+                    compaction_file.flush()
+                    os.fsync(compaction_file.fileno())
+                    size = os.fstat(compaction_file.fileno()).st_size
+                    getattr(os, 'replace', os.rename)(
+                        self._compaction_path,
+                        self._log_path
+                    )
+                    _sync_directory(self._path)
+
+                    mapping = _map_log_file(compaction_file, size)
+                    live_size += _apply_entries(
+                        compaction_index,
+                        _scan(mapping, compaction_size, size)[1]
+                    )
+                    self._file, compaction_file = compaction_file, self._file
+                    self._size = size
+                    self._live_size = live_size
+                    self._view = (mapping, compaction_index)
+            finally:
+                compaction_file.close()
+                if os.path.exists(self._compaction_path):
+                    os.remove(self._compaction_path)
+
+    def close(self):
+        """
+        Wait for a running compaction and close the log.
+        """
+        if self._compaction is not None:
+            self._compaction.join()
+        self._file.close()
@@ -0,0 +1,44 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from kmip.services.server.repo import store
+
+
+class MemoryStore(store.BufferedStore):
+    """
+    An object store that keeps objects in memory, for tests and benchmarks.
+
+    Nothing survives the process. Readers never take a lock: committed
+    objects live in a dictionary that is only changed one key at a time,
+    which is atomic in CPython.
+    """
+
+    def __init__(self):
+        super(MemoryStore, self).__init__()
+        self._objects = dict()
+
+    def _load_object(self, unique_identifier, load_secret):
+        return self._objects.get(unique_identifier)
+
+    def _write_changes(self, changes):
+        for unique_identifier, managed_object in changes:
+            if managed_object is None:
+                self._objects.pop(unique_identifier, None)
+            else:
+                self._objects[unique_identifier] = managed_object
+
+    def detach(self, session, managed_object):
+        # The stored object is the only copy, secret included.
+        pass
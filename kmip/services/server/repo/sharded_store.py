@@ -0,0 +1,351 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import heapq
+import threading
+import zlib
+
+from concurrent import futures
+
+from kmip.services.server.repo import store
+
+
+def _scatter(executor, function, arguments):
+    """
+    Call a function once per argument and return the results in the order
+    of the arguments. The first call runs in the calling thread and the
+    others in the executor. The first error raised by a call is raised
+    again once every call has returned.
+    """
+    if len(arguments) < 2:
+        return [function(x) for x in arguments]
+
+    submitted = [executor.submit(function, x) for x in arguments[1:]]
+    try:
+        first = function(arguments[0])
+    finally:
+        futures.wait(submitted)
+    return [first] + [x.result() for x in submitted]
+
+
+class _Savepoint(object):
+
+    def __init__(self, session):
+        self._session = session
+        self._marks = (len(session.changes), len(session.records))
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        del self._session.changes[self._marks[0]:]
+        del self._session.records[self._marks[1]:]
+
+
+class ShardedSession(object):
+    """
+    A session of a ShardedStore.
+
+    A session of a shard is opened the first time the session reads from
+    it. Changes are kept as a list of (ID, ManagedObject) tuples, where a
+    None object stands for a deletion, and change records as a list of
+    record_change arguments, until the session is committed.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self._sessions = dict()
+        self.changes = list()
+        self.records = list()
+
+    def get_session(self, index):
+        """
+        Get the session of a shard, opening it if needed.
+        """
+        session = self._sessions.get(index)
+        if session is None:
+            session = self._store.shards[index].open_session()
+            self._sessions[index] = session
+        return session
+
+    def begin_nested(self):
+        return _Savepoint(self)
+
+    def commit(self):
+        """
+        Write the changes of the session to their shards, holding the locks
+        of those shards, and commit every shard session.
+
+        The changes are written to every shard before any shard is
+        committed, so that a change a shard refuses leaves every shard
+        untouched. A shard that fails to commit after others have committed
+        leaves them committed.
+        """
+        changes = collections.defaultdict(collections.OrderedDict)
+        added = set()
+        for unique_identifier, managed_object in self.changes:
+            index = self._store.get_shard_index(unique_identifier)
+            changes[index][unique_identifier] = managed_object
+            if managed_object is not None:
+                added.add(unique_identifier)
+        indexes = set(changes)
+        if self.records:
+            indexes.add(0)
+
+        # Locks are always taken in shard order, so that two sessions never
+        # wait for each other.
+        indexes = sorted(indexes)
+        locks = [self._store.locks[x] for x in indexes]
+        for lock in locks:
+            lock.acquire()
+        try:
+            for index in indexes:
+                self._write_changes(index, changes[index], added)
+            for index in sorted(self._sessions):
+                self._sessions[index].commit()
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+            self.changes = list()
+            self.records = list()
+
+    def _write_changes(self, index, changes, added):
+        shard = self._store.shards[index]
+        session = self.get_session(index)
+
+        new_objects = [x for x in changes.values() if x is not None]
+        if new_objects:
+            shard.insert_objects(session, new_objects)
+        for unique_identifier, managed_object in changes.items():
+            # Objects both added and deleted in the session were never
+            # written.
+            if managed_object is None and unique_identifier not in added:
+                shard.delete_object(session, unique_identifier)
+
+        if index == 0:
+            for record in self.records:
+                shard.record_change(session, *record)
+
+    def rollback(self):
+        for session in self._sessions.values():
+            session.rollback()
+        self.changes = list()
+        self.records = list()
+
+    def close(self):
+        for session in self._sessions.values():
+            session.close()
+        self._sessions = dict()
+        self.changes = list()
+        self.records = list()
+
+    def find(self, unique_identifier):
+        """
+        Look up the latest change to an object made in the session.
+
+        Returns:
+            tuple: True and the object, or None if it was deleted, if the
+                session changed the object, and False and None otherwise.
+        """
+        for changed_identifier, managed_object in reversed(self.changes):
+            if changed_identifier == unique_identifier:
+                return True, managed_object
+        return False, None
+
+
+class ShardedStore(store.ObjectStore):
+    """
+    An object store that spreads objects across independent object stores,
+    the shards, by a hash of their IDs.
+
+    Each shard keeps its own connections, and writers only wait for the
+    writers of the same shards: sessions buffer their changes and take the
+    locks of the shards they write to when they are committed. Reading an
+    object only reaches its own shard, while Locate searches every shard in
+    parallel and merges the results. Change records are kept by the first
+    shard. A commit that writes to several shards is not atomic.
+    """
+
+    locks_writes = True
+
+    def __init__(self, shards, max_workers=None):
+        """
+        Create a ShardedStore.
+
+        Args:
+            shards (list): The ObjectStores holding the objects. Objects are
+                placed by the number and order of the shards, which must not
+                change once objects are stored.
+            max_workers (int): The number of threads that query shards on
+                behalf of Locate and get_objects calls, started as they are
+                needed and reused. Optional, defaults to four per shard
+                beyond the first, which the calling thread queries itself.
+        """
+        self.shards = list(shards)
+        self.locks = [threading.Lock() for _ in self.shards]
+
+        if max_workers is None:
+            max_workers = max(4 * (len(self.shards) - 1), 1)
+        self._executor = futures.ThreadPoolExecutor(max_workers=max_workers)
+
+    def get_shard_index(self, unique_identifier):
+        """
+        Get the index of the shard holding an object. IDs are hashed with
+        CRC-32, which is the same in every process.
+        """
+        data = str(unique_identifier).encode('utf-8')
+        return (zlib.crc32(data) & 0xffffffff) % len(self.shards)
+
+    def _group(self, unique_identifiers):
+        groups = collections.defaultdict(list)
+        for unique_identifier in unique_identifiers:
+            groups[self.get_shard_index(unique_identifier)].append(
+                str(unique_identifier)
+            )
+        return groups
+
+    def _read_shards(self, function, indexes):
+        """
+        Call function(index, session) for each of the given shards in
+        parallel. Sessions may not be shared between threads, so each call
+        runs in a shard session of its own, which is closed before the call
+        returns. Sharded sessions hold no uncommitted writes in their shard
+        sessions, so the calls see the same objects they would.
+        """
+        def read(index):
+            session = self.shards[index].open_session()
+            try:
+                return function(index, session)
+            finally:
+                session.close()
+
+        return _scatter(self._executor, read, indexes)
+
+    def close(self):
+        """
+        Stop the threads that query the shards, and close the shards.
+        """
+        self._executor.shutdown(wait=True)
+        for shard in self.shards:
+            shard.close()
+
+    def open_session(self):
+        return ShardedSession(self)
+
+    def add_objects(self, session, managed_objects):
+        for managed_object in managed_objects:
+            store.apply_defaults(managed_object)
+            session.changes.append(
+                (str(managed_object.unique_identifier), managed_object)
+            )
+
+    def get_object(self, session, unique_identifier, load_secret=False):
+        unique_identifier = str(unique_identifier)
+        found, managed_object = session.find(unique_identifier)
+        if found:
+            if managed_object is None:
+                raise KeyError(unique_identifier)
+            return managed_object
+
+        index = self.get_shard_index(unique_identifier)
+        return self.shards[index].get_object(
+            session.get_session(index),
+            unique_identifier,
+            load_secret=load_secret
+        )
+
+    def get_objects(self, session, unique_identifiers, load_secret=False):
+        found = dict()
+        remaining = list()
+        for unique_identifier in unique_identifiers:
+            unique_identifier = str(unique_identifier)
+            changed, managed_object = session.find(unique_identifier)
+            if not changed:
+                remaining.append(unique_identifier)
+            elif managed_object is not None:
+                found[unique_identifier] = managed_object
+
+        groups = self._group(remaining)
+        results = self._read_shards(
+            lambda index, shard_session: self.shards[index].get_objects(
+                shard_session,
+                groups[index],
+                load_secret=load_secret
+            ),
+            sorted(groups)
+        )
+        for result in results:
+            found.update(result)
+        return found
+
+    def detach(self, session, managed_object):
+        # Objects not yet committed are still to be written with their
+        # secrets.
+        unique_identifier = str(managed_object.unique_identifier)
+        found, _ = session.find(unique_identifier)
+        if not found:
+            index = self.get_shard_index(unique_identifier)
+            self.shards[index].detach(
+                session.get_session(index),
+                managed_object
+            )
+
+    def delete_object(self, session, unique_identifier):
+        session.changes.append((str(unique_identifier), None))
+
+    def locate(self, session, criteria, after=None, offset=0, limit=None):
+        changed = dict(session.changes)
+
+        # Each shard returns enough IDs to fill the page once the objects
+        # the session changed are accounted for.
+        shard_limit = None
+        if limit is not None:
+            shard_limit = offset + limit + len(changed)
+        results = self._read_shards(
+            lambda index, shard_session: self.shards[index].locate(
+                shard_session,
+                criteria,
+                after=after,
+                limit=shard_limit
+            ),
+            list(range(len(self.shards)))
+        )
+
+        results = [[x for x in y if x not in changed] for y in results]
+        results.append(sorted(
+            unique_identifier
+            for unique_identifier, managed_object in changed.items()
+            if managed_object is not None and
+            (after is None or unique_identifier > after) and
+            criteria.matches(store.get_locate_entry(managed_object))
+        ))
+
+        identifiers = list(heapq.merge(*results))[offset:]
+        if limit is not None:
+            identifiers = identifiers[:limit]
+        return identifiers
+
+    def get_last_change(self, session):
+        return self.shards[0].get_last_change(session.get_session(0))
+
+    def get_changes(self, session, after):
+        return self.shards[0].get_changes(session.get_session(0), after)
+
+    def record_change(self, session, unique_identifier, changed_at,
+                      expire_before):
+        session.records.append(
+            (str(unique_identifier), changed_at, expire_before)
+        )
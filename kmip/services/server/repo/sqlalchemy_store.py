@@ -0,0 +1,215 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sqlalchemy
+
+from sqlalchemy.orm import exc
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import bulk
+from kmip.services.server.repo import store
+
+
+_CHUNK_SIZE = 500
+
+
+class SqlAlchemyStore(store.ObjectStore):
+    """
+    An object store backed by a relational database through SQLAlchemy.
+
+    Sessions are SQLAlchemy Sessions. Every Locate filter maps to an indexed
+    column and the operation policy check is part of the query, so that
+    matching objects are never loaded. The store only works through the
+    sessions it is given, which can also be sessions on a replica of the
+    database.
+    """
+
+    def __init__(self, data_store):
+        """
+        Create a SqlAlchemyStore.
+
+        Args:
+            data_store (Engine): The SQLAlchemy engine of the database. The
+                schema must be up to date.
+        """
+        self.data_store = data_store
+        self._session_factory = sqlalchemy.orm.sessionmaker(bind=data_store)
+
+        # Stored objects are loaded with all subclass tables joined, so that
+        # an object of any type is fetched in a single query.
+        self._managed_objects = sqlalchemy.orm.with_polymorphic(
+            objects.ManagedObject,
+            '*'
+        )
+
+    def open_session(self):
+        return self._session_factory()
+
+    def add_objects(self, session, managed_objects):
+        for managed_object in managed_objects:
+            session.add(managed_object)
+
+        # Flushing assigns the IDs. The transaction is committed by the
+        # owner of the session.
+        session.flush()
+
+    def insert_objects(self, session, managed_objects):
+        bulk.insert_managed_objects(session.connection(), managed_objects)
+
+    def close(self):
+        self.data_store.dispose()
+
+    def _query_objects(self, session, load_secret, load_names):
+        # Names are loaded up front with the given strategy, rather than by
+        # one query per object when first used. The secret value and its
+        # stored encoding are deferred, and only read by the main query if
+        # asked for.
+        query = session.query(self._managed_objects).options(
+            load_names(self._managed_objects._names)
+        )
+        if load_secret:
+            query = query.options(
+                sqlalchemy.orm.undefer(self._managed_objects.value),
+                sqlalchemy.orm.undefer(self._managed_objects._encoded_secret)
+            )
+        return query
+
+    def get_object(self, session, unique_identifier, load_secret=False):
+        # The names of a single object are joined into the query, which
+        # saves a round trip.
+        query = self._query_objects(
+            session,
+            load_secret,
+            sqlalchemy.orm.joinedload
+        )
+        try:
+            return query.filter(
+                self._managed_objects.unique_identifier == unique_identifier
+            ).one()
+        except exc.NoResultFound:
+            raise KeyError(unique_identifier)
+
+    def get_objects(self, session, unique_identifiers, load_secret=False):
+        unique_identifiers = list(unique_identifiers)
+        found = dict()
+        # The names of many objects are read by a second query, instead of
+        # repeating every object row once per name. IDs are sent in chunks
+        # that stay below the SQLite limit on bound parameters, so that the
+        # number of queries only grows with the number of chunks.
+        for i in range(0, len(unique_identifiers), _CHUNK_SIZE):
+            query = self._query_objects(
+                session,
+                load_secret,
+                sqlalchemy.orm.selectinload
+            ).filter(
+                self._managed_objects.unique_identifier.in_(
+                    unique_identifiers[i:i + _CHUNK_SIZE]
+                )
+            )
+            for managed_object in query:
+                found[str(managed_object.unique_identifier)] = managed_object
+        return found
+
+    def detach(self, session, managed_object):
+        # Expunging the object keeps committing the session from expiring
+        # it.
+        session.expunge(managed_object)
+        super(SqlAlchemyStore, self).detach(session, managed_object)
+
+    def delete_object(self, session, unique_identifier):
+        session.query(objects.ManagedObject).filter(
+            objects.ManagedObject.unique_identifier == unique_identifier
+        ).delete()
+
+    def locate(self, session, criteria, after=None, offset=0, limit=None):
+        managed_object = objects.ManagedObject
+        keys = objects.Key.__table__
+        names = sqltypes.ManagedObjectName
+
+        permitted = list()
+        for object_type, policy_names, owner_only in criteria.permissions:
+            clauses = [
+                managed_object._object_type == object_type,
+                managed_object.operation_policy_name.in_(policy_names)
+            ]
+            if owner_only:
+                clauses.append(managed_object._owner == criteria.owner)
+            permitted.append(sqlalchemy.and_(*clauses))
+        if not permitted:
+            return list()
+
+        query = session.query(managed_object.unique_identifier).filter(
+            sqlalchemy.or_(*permitted)
+        )
+
+        for name in criteria.names:
+            query = query.filter(
+                managed_object.unique_identifier.in_(
+                    session.query(names.mo_uid).filter(names.name == name)
+                )
+            )
+        for policy_name in criteria.operation_policy_names:
+            query = query.filter(
+                managed_object.operation_policy_name == policy_name
+            )
+
+        key_filters = [
+            keys.c.cryptographic_algorithm == x
+            for x in criteria.cryptographic_algorithms
+        ]
+        key_filters.extend(
+            keys.c.cryptographic_length == x
+            for x in criteria.cryptographic_lengths
+        )
+        if key_filters:
+            query = query.join(
+                keys,
+                keys.c.uid == managed_object.unique_identifier
+            ).filter(*key_filters)
+
+        if after is not None:
+            query = query.filter(managed_object.unique_identifier > after)
+        query = query.order_by(managed_object.unique_identifier)
+        if offset:
+            query = query.offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+
+        return [row[0] for row in query]
+
+    def get_last_change(self, session):
+        changes = sqltypes.ManagedObjectChange
+        return session.query(sqlalchemy.func.max(changes.id)).scalar() or 0
+
+    def get_changes(self, session, after):
+        changes = sqltypes.ManagedObjectChange
+        return [
+            (x[0], str(x[1])) for x in session.query(
+                changes.id,
+                changes.mo_uid
+            ).filter(
+                changes.id > after
+            ).order_by(changes.id)
+        ]
+
+    def record_change(self, session, unique_identifier, changed_at,
+                      expire_before):
+        changes = sqltypes.ManagedObjectChange
+        session.add(changes(unique_identifier, changed_at))
+        session.query(changes).filter(
+            changes.changed_at < expire_before
+        ).delete(synchronize_session=False)
@@ -0,0 +1,530 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import collections
+import json
+import threading
+
+import sqlalchemy
+import sqlalchemy.types as types
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+
+_SECRET_COLUMNS = ('value', '_encoded_secret')
+
+
+LocateEntry = collections.namedtuple(
+    'LocateEntry',
+    [
+        'unique_identifier',
+        'object_type',
+        'operation_policy_name',
+        'owner',
+        'names',
+        'cryptographic_algorithm',
+        'cryptographic_length'
+    ]
+)
+
+
+def get_locate_entry(managed_object):
+    """
+    Build the LocateEntry of a pie object, holding the attributes Locate
+    searches by.
+    """
+    algorithm = None
+    length = None
+    if isinstance(managed_object, objects.Key):
+        algorithm = managed_object.cryptographic_algorithm
+        length = managed_object.cryptographic_length
+
+    return LocateEntry(
+        managed_object.unique_identifier,
+        managed_object._object_type,
+        managed_object.operation_policy_name,
+        managed_object._owner,
+        tuple(managed_object.names),
+        algorithm,
+        length
+    )
+
+
+def apply_defaults(managed_object):
+    """
+    Set the unset attributes of a new pie object that have column defaults,
+    including its unique identifier, as the ORM does when inserting it.
+    """
+    mapper = sqlalchemy.inspect(managed_object).mapper
+    for prop in mapper.column_attrs:
+        # Inherited columns, such as the ID, have their default on the base
+        # table column, which comes last.
+        default = prop.columns[-1].default
+        if default is None:
+            continue
+        if getattr(managed_object, prop.key) is not None:
+            continue
+        if default.is_scalar:
+            setattr(managed_object, prop.key, default.arg)
+        elif default.is_callable:
+            setattr(managed_object, prop.key, default.arg(None))
+
+
+def encode_object(managed_object):
+    """
+    Encode the attributes of a pie object, but not its secret, as JSON.
+
+    Column values are converted with the column types, as they would be for
+    the relational data store.
+    """
+    mapper = sqlalchemy.inspect(managed_object).mapper
+    record = {
+        'class_type': mapper.polymorphic_identity,
+        'names': [
+            [x.name, x.index, x.name_type.value]
+            for x in managed_object._names
+        ]
+    }
+    for prop in mapper.column_attrs:
+        if prop.key in _SECRET_COLUMNS:
+            continue
+        value = getattr(managed_object, prop.key)
+        column_type = prop.columns[0].type
+        if value is not None and isinstance(column_type, types.TypeDecorator):
+            value = column_type.process_bind_param(value, None)
+        record[prop.key] = value
+
+    return json.dumps(record).encode('utf-8')
+
+
+def decode_object(data, value=None, encoded_secret=None):
+    """
+    Build a pie object from its encoded attributes and its secret.
+
+    The object is built the way the ORM builds loaded objects, without
+    calling the constructor of its class.
+    """
+    record = json.loads(data.decode('utf-8'))
+    mapper = objects.ManagedObject.__mapper__.polymorphic_map[
+        record['class_type']
+    ]
+    managed_object = mapper.class_manager.new_instance()
+
+    for prop in mapper.column_attrs:
+        if prop.key in _SECRET_COLUMNS:
+            continue
+        attribute = record.get(prop.key)
+        column_type = prop.columns[0].type
+        if attribute is not None and isinstance(
+                column_type,
+                types.TypeDecorator):
+            attribute = column_type.process_result_value(attribute, None)
+        sqlalchemy.orm.attributes.set_committed_value(
+            managed_object,
+            prop.key,
+            attribute
+        )
+
+    sqlalchemy.orm.attributes.set_committed_value(
+        managed_object,
+        '_names',
+        [
+            sqltypes.ManagedObjectName(
+                name,
+                index=index,
+                name_type=enums.NameType(name_type)
+            )
+            for name, index, name_type in record['names']
+        ]
+    )
+    sqlalchemy.orm.attributes.set_committed_value(
+        managed_object,
+        'value',
+        value
+    )
+    sqlalchemy.orm.attributes.set_committed_value(
+        managed_object,
+        '_encoded_secret',
+        encoded_secret
+    )
+
+    return managed_object
+
+
+class LocateCriteria(object):
+    """
+    A description of a Locate search that does not depend on the store.
+
+    Every attribute list holds values an object must all match. An object
+    must also match at least one permission, given as an object type, the
+    operation policies under which objects of that type may be located, and
+    whether only the objects owned by the searching client qualify.
+
+    Attributes:
+        owner (string): The identity of the searching client.
+        names (list): The names an object must have.
+        cryptographic_algorithms (list): The algorithms a key must have.
+        cryptographic_lengths (list): The lengths a key must have.
+        operation_policy_names (list): The policy names an object must have.
+        permissions (list): A list of (ObjectType, list, bool) tuples.
+    """
+
+    def __init__(self, owner=None):
+        self.owner = owner
+        self.names = list()
+        self.cryptographic_algorithms = list()
+        self.cryptographic_lengths = list()
+        self.operation_policy_names = list()
+        self.permissions = list()
+
+    def permit(self, object_type, policy_names, owner_only=False):
+        """
+        Let the search find the objects of a type whose operation policy is
+        one of the given policies.
+
+        Args:
+            object_type (ObjectType): The object type.
+            policy_names (list): The names of the operation policies.
+            owner_only (bool): Whether only the objects owned by the
+                searching client are found. Optional, defaults to False.
+        """
+        self.permissions.append((object_type, list(policy_names), owner_only))
+
+    def matches(self, entry):
+        """
+        Check a LocateEntry against the search.
+
+        Returns:
+            bool: True if the entry matches, False otherwise.
+        """
+        for name in self.names:
+            if name not in entry.names:
+                return False
+        for algorithm in self.cryptographic_algorithms:
+            if entry.cryptographic_algorithm != algorithm:
+                return False
+        for length in self.cryptographic_lengths:
+            if entry.cryptographic_length != length:
+                return False
+        for policy_name in self.operation_policy_names:
+            if entry.operation_policy_name != policy_name:
+                return False
+
+        for object_type, policy_names, owner_only in self.permissions:
+            if entry.object_type != object_type:
+                continue
+            if entry.operation_policy_name not in policy_names:
+                continue
+            if owner_only and entry.owner != self.owner:
+                continue
+            return True
+
+        return False
+
+
+class ObjectStore(object):
+    """
+    The interface through which the KmipEngine stores managed objects.
+
+    Each request works in a session opened by the store. A session supports
+    begin_nested(), commit(), rollback() and close(), with the semantics of
+    a SQLAlchemy Session, and is passed to every other method of the store.
+    Objects read through a session are shared with the store and must not
+    be modified.
+
+    Attributes:
+        data_store (Engine): The SQLAlchemy engine behind the store, or None
+            if the store does not use one.
+        locks_writes (bool): Whether the store serializes its writers
+            itself, so that the KmipEngine need not.
+    """
+
+    data_store = None
+    locks_writes = False
+
+    def open_session(self):
+        """
+        Open a new session.
+        """
+        raise NotImplementedError
+
+    def add_objects(self, session, managed_objects):
+        """
+        Add new pie objects. Objects without a unique identifier are given
+        one before the method returns.
+        """
+        raise NotImplementedError
+
+    def insert_objects(self, session, managed_objects):
+        """
+        Add many new pie objects at once, in whatever way is fastest for the
+        store.
+        """
+        self.add_objects(session, managed_objects)
+
+    def get_object(self, session, unique_identifier, load_secret=False):
+        """
+        Read a stored object as an instance of its own class.
+
+        Args:
+            session: The session to read with.
+            unique_identifier (string): The ID of the object.
+            load_secret (bool): Whether the secret value and its stored
+                encoding are read as well. Optional, defaults to False.
+
+        Returns:
+            ManagedObject: The stored object.
+
+        Raises:
+            KeyError: Raised if no object has the ID.
+        """
+        raise NotImplementedError
+
+    def get_objects(self, session, unique_identifiers, load_secret=False):
+        """
+        Read many stored objects at once, in whatever way is fastest for the
+        store.
+
+        Args:
+            session: The session to read with.
+            unique_identifiers (list): The IDs of the objects.
+            load_secret (bool): Whether the secret values and their stored
+                encodings are read as well. Optional, defaults to False.
+
+        Returns:
+            dict: The objects found, keyed by their IDs as strings. IDs that
+                no object has are left out.
+        """
+        found = dict()
+        for unique_identifier in unique_identifiers:
+            try:
+                managed_object = self.get_object(
+                    session,
+                    unique_identifier,
+                    load_secret=load_secret
+                )
+            except KeyError:
+                continue
+            found[str(unique_identifier)] = managed_object
+        return found
+
+    def detach(self, session, managed_object):
+        """
+        Detach an object read with its secret, so that it can be kept after
+        the session is closed, and drop its secret value and encoding.
+        """
+        for name in _SECRET_COLUMNS:
+            sqlalchemy.orm.attributes.set_committed_value(
+                managed_object,
+                name,
+                None
+            )
+
+    def delete_object(self, session, unique_identifier):
+        """
+        Delete a stored object.
+        """
+        raise NotImplementedError
+
+    def locate(self, session, criteria, after=None, offset=0, limit=None):
+        """
+        Find the IDs of the objects matching a Locate search.
+
+        Args:
+            session: The session to search with.
+            criteria (LocateCriteria): The search.
+            after (string): Only IDs greater than this one are returned.
+                Optional, defaults to None.
+            offset (int): The number of matching IDs skipped. Optional,
+                defaults to 0.
+            limit (int): The maximum number of IDs returned. Optional,
+                defaults to None.
+
+        Returns:
+            list: The matching IDs, as strings in ascending order.
+        """
+        raise NotImplementedError
+
+    def get_last_change(self, session):
+        """
+        Get the ID of the last change record, or 0 if there is none.
+
+        Change records let servers sharing a store invalidate their cached
+        objects. Stores that a single server uses keep none.
+        """
+        return 0
+
+    def get_changes(self, session, after):
+        """
+        Get the change records written after the given one, as a list of
+        (record ID, object ID) tuples in the order they were written.
+        """
+        return list()
+
+    def record_change(self, session, unique_identifier, changed_at,
+                      expire_before):
+        """
+        Record a change to an object, and prune the records made before
+        expire_before.
+        """
+        pass
+
+    def close(self):
+        """
+        Release the files and connections held by the store.
+        """
+        pass
+
+
+class _Savepoint(object):
+
+    def __init__(self, session):
+        self._session = session
+        self._mark = len(session.changes)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        del self._session.changes[self._mark:]
+
+
+class StoreSession(object):
+    """
+    A session of a BufferedStore.
+
+    Changes are kept as a list of (ID, ManagedObject) tuples, where a None
+    object stands for a deletion, until the session is committed.
+    """
+
+    def __init__(self, store):
+        self._store = store
+        self.changes = list()
+
+    def begin_nested(self):
+        return _Savepoint(self)
+
+    def commit(self):
+        if self.changes:
+            self._store.apply_changes(self.changes)
+        self.changes = list()
+
+    def rollback(self):
+        self.changes = list()
+
+    def close(self):
+        self.changes = list()
+
+    def find(self, unique_identifier):
+        """
+        Look up the latest change to an object made in the session.
+
+        Returns:
+            tuple: True and the object, or None if it was deleted, if the
+                session changed the object, and False and None otherwise.
+        """
+        for changed_identifier, managed_object in reversed(self.changes):
+            if changed_identifier == unique_identifier:
+                return True, managed_object
+        return False, None
+
+
+class BufferedStore(ObjectStore):
+    """
+    The base of the stores that have no transactions of their own.
+
+    Sessions buffer their changes, which are written at once on commit.
+    Writers are serialized, while readers take no lock. The attributes Locate
+    searches by are kept in memory for every stored object.
+    """
+
+    def __init__(self):
+        self._catalogue = dict()
+        self._write_lock = threading.Lock()
+
+    def _load_object(self, unique_identifier, load_secret):
+        """
+        Read a committed object, or return None if there is none.
+        """
+        raise NotImplementedError
+
+    def _write_changes(self, changes):
+        raise NotImplementedError
+
+    def open_session(self):
+        return StoreSession(self)
+
+    def apply_changes(self, changes):
+        """
+        Write the changes of a committed session.
+        """
+        with self._write_lock:
+            self._write_changes(changes)
+            for unique_identifier, managed_object in changes:
+                if managed_object is None:
+                    self._catalogue.pop(unique_identifier, None)
+                else:
+                    self._catalogue[unique_identifier] = get_locate_entry(
+                        managed_object
+                    )
+
+    def add_objects(self, session, managed_objects):
+        for managed_object in managed_objects:
+            apply_defaults(managed_object)
+            session.changes.append(
+                (str(managed_object.unique_identifier), managed_object)
+            )
+
+    def get_object(self, session, unique_identifier, load_secret=False):
+        unique_identifier = str(unique_identifier)
+        found, managed_object = session.find(unique_identifier)
+        if not found:
+            managed_object = self._load_object(unique_identifier, load_secret)
+        if managed_object is None:
+            raise KeyError(unique_identifier)
+        return managed_object
+
+    def detach(self, session, managed_object):
+        # Objects not yet committed are still to be written with their
+        # secrets.
+        found, _ = session.find(str(managed_object.unique_identifier))
+        if not found:
+            super(BufferedStore, self).detach(session, managed_object)
+
+    def delete_object(self, session, unique_identifier):
+        session.changes.append((str(unique_identifier), None))
+
+    def locate(self, session, criteria, after=None, offset=0, limit=None):
+        changed = dict(session.changes)
+        entries = [
+            entry for unique_identifier, entry in list(self._catalogue.items())
+            if unique_identifier not in changed
+        ]
+        entries.extend(
+            get_locate_entry(x) for x in changed.values() if x is not None
+        )
+
+        identifiers = sorted(
+            x.unique_identifier for x in entries
+            if (after is None or x.unique_identifier > after) and
+            criteria.matches(x)
+        )
+        identifiers = identifiers[offset:]
+        if limit is not None:
+            identifiers = identifiers[:limit]
+        return identifiers
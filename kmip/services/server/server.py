@@ -23,11 +23,13 @@ import socket
 import ssl
 import sys
 import threading
+import time
 
 from kmip.core import exceptions
 from kmip.services import auth
 from kmip.services.server import config
 from kmip.services.server import engine
+from kmip.services.server import handoff
 from kmip.services.server import session
 
 
@@ -92,6 +94,8 @@ class KmipServer(object):
                 (e.g., '/var/log/pykmip/server.log'). Optional, defaults to
                 '/var/log/pykmip/server.log'.
         """
+        self._start_time = time.time()
+
         self._logger = logging.getLogger('kmip.server')
         self._setup_logging(log_path)
 
@@ -111,9 +115,65 @@ class KmipServer(object):
         else:
             self.auth_suite = auth.BasicAuthenticationSuite()
 
-        self._engine = engine.KmipEngine()
+        self._engine = engine.KmipEngine(
+            asynchronous_workers=self.config.settings.get(
+                'asynchronous_workers'
+            ),
+            asynchronous_result_ttl=self.config.settings.get(
+                'asynchronous_result_ttl'
+            ),
+            asynchronous_queue_size=self.config.settings.get(
+                'asynchronous_queue_size'
+            ),
+            asynchronous_client_limit=self.config.settings.get(
+                'asynchronous_client_limit'
+            ),
+            policy_path=self.config.settings.get('policy_path'),
+            policy_reload_interval=self.config.settings.get(
+                'policy_reload_interval'
+            ),
+            object_cache_size=self.config.settings.get('object_cache_size'),
+            object_cache_ttl=self.config.settings.get('object_cache_ttl'),
+            object_cache_memory=self.config.settings.get(
+                'object_cache_memory'
+            ),
+            precompute_get_responses=self.config.settings.get(
+                'precompute_get_responses'
+            ),
+            database_url=self.config.settings.get('database_url'),
+            database_pool_size=self.config.settings.get(
+                'database_pool_size'
+            ),
+            database_max_overflow=self.config.settings.get(
+                'database_max_overflow'
+            ),
+            database_pool_pre_ping=self.config.settings.get(
+                'database_pool_pre_ping'
+            ),
+            sqlite_journal_mode=self.config.settings.get(
+                'sqlite_journal_mode'
+            ),
+            sqlite_synchronous=self.config.settings.get('sqlite_synchronous'),
+            sqlite_busy_timeout=self.config.settings.get(
+                'sqlite_busy_timeout'
+            ),
+            sqlite_mmap_size=self.config.settings.get('sqlite_mmap_size'),
+            identifier_format=self.config.settings.get('identifier_format'),
+            database_replica_urls=self.config.settings.get(
+                'database_replica_urls'
+            ),
+            database_replica_lag=self.config.settings.get(
+                'database_replica_lag'
+            ),
+            database_shard_urls=self.config.settings.get(
+                'database_shard_urls'
+            )
+        )
         self._session_id = 1
+        self._sessions = []
         self._is_serving = False
+        self._is_socket_shared = False
+        self._handoff_connection = None
 
     def _setup_logging(self, path):
         # Create the logging directory/file if it doesn't exist.
@@ -175,12 +235,14 @@ class KmipServer(object):
         """
         self._logger.info("Starting server socket handler.")
 
-        # Create a TCP stream socket and configure it for immediate reuse.
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        listener = self._get_shared_socket()
+        if listener is None:
+            # Create a TCP stream socket and configure it for immediate reuse.
+            listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
         self._socket = ssl.wrap_socket(
-            self._socket,
+            listener,
             keyfile=self.config.settings.get('key_path'),
             certfile=self.config.settings.get('certificate_path'),
             server_side=True,
@@ -192,6 +254,15 @@ class KmipServer(object):
             ciphers=self.auth_suite.ciphers
         )
 
+        if self._is_socket_shared:
+            self._logger.info(
+                "Server adopted socket handler bound to {0}:{1}".format(
+                    *self._socket.getsockname()[:2]
+                )
+            )
+            self._is_serving = True
+            return
+
         try:
             self._socket.bind(
                 (
@@ -216,12 +287,47 @@ class KmipServer(object):
             )
             self._is_serving = True
 
+    def _get_shared_socket(self):
+        # Prefer a socket passed in by the service manager, then one handed
+        # over by a running server process, before binding a new one.
+        listener = handoff.get_activation_socket()
+        if listener is not None:
+            self._logger.info(
+                "Using the listening socket passed by socket activation."
+            )
+            self._is_socket_shared = True
+            return listener
+
+        path = self.config.settings.get('restart_socket_path')
+        if path:
+            try:
+                result = handoff.request_socket(path)
+            except Exception as e:
+                self._logger.warning(
+                    "Failed to take over the listening socket from the "
+                    "running server process."
+                )
+                self._logger.exception(e)
+                result = None
+
+            if result is not None:
+                listener, self._handoff_connection = result
+                self._logger.info(
+                    "Took over the listening socket from the running server "
+                    "process."
+                )
+                self._is_socket_shared = True
+                return listener
+
+        return None
+
     def stop(self):
         """
         Stop the server.
 
         Halt server client connections and clean up any existing connection
-        threads.
+        threads. All sessions are asked to close at once and are then given
+        a combined shutdown_timeout seconds to finish.
 
         Raises:
             NetworkingError: Raised if a failure occurs while sutting down
@@ -229,32 +335,41 @@ class KmipServer(object):
         """
         self._logger.info("Cleaning up remaining connection threads.")
 
-        for thread in threading.enumerate():
-            if thread is not threading.current_thread():
-                try:
-                    thread.join(10.0)
-                except Exception as e:
-                    self._logger.info(
-                        "Error occurred while attempting to cleanup thread: "
-                        "{0}".format(thread.name)
+        # Signal every session first so that they all wind down in parallel,
+        # then wait for them against a single shared deadline.
+        for session_thread in self._sessions:
+            session_thread.close()
+
+        deadline = time.time() + self.config.settings.get('shutdown_timeout')
+        for thread in self._sessions:
+            try:
+                thread.join(max(0.0, deadline - time.time()))
+            except Exception as e:
+                self._logger.info(
+                    "Error occurred while attempting to cleanup thread: "
+                    "{0}".format(thread.name)
+                )
+                self._logger.exception(e)
+            else:
+                if thread.is_alive():
+                    self._logger.warning(
+                        "Cleanup failed for thread: {0}. Thread is "
+                        "still alive".format(thread.name)
                     )
-                    self._logger.exception(e)
                 else:
-                    if thread.is_alive():
-                        self._logger.warning(
-                            "Cleanup failed for thread: {0}. Thread is "
-                            "still alive".format(thread.name)
-                        )
-                    else:
-                        self._logger.info(
-                            "Cleanup succeeded for thread: {0}".format(
-                                thread.name
-                            )
+                    self._logger.info(
+                        "Cleanup succeeded for thread: {0}".format(
+                            thread.name
                         )
+                    )
+        self._sessions = []
 
         self._logger.info("Shutting down server socket handler.")
         try:
-            self._socket.shutdown(socket.SHUT_RDWR)
+            # A shared socket stays in use by the service manager or by the
+            # process it was handed to, so only this process's copy is closed.
+            if not self._is_socket_shared:
+                self._socket.shutdown(socket.SHUT_RDWR)
             self._socket.close()
         except Exception as e:
             self._logger.exception(e)
@@ -270,7 +385,8 @@ class KmipServer(object):
         as connections are handled. Set up signal handling to shutdown
         connection service as needed.
         """
-        self._socket.listen(5)
+        if not self._is_socket_shared:
+            self._socket.listen(5)
 
         def _signal_handler(signal_number, stack_frame):
             self._is_serving = False
@@ -278,11 +394,33 @@ class KmipServer(object):
         signal.signal(signal.SIGINT, _signal_handler)
         signal.signal(signal.SIGTERM, _signal_handler)
 
+        if self._handoff_connection is not None:
+            self._complete_handoff()
+
+        restart_socket_path = self.config.settings.get('restart_socket_path')
+        if restart_socket_path:
+            # Wake up periodically so that the connection service notices
+            # when the listening socket has been handed off.
+            self._socket.settimeout(1.0)
+            t = threading.Thread(
+                target=self._serve_handoff,
+                name="handoff",
+                args=(restart_socket_path, )
+            )
+            t.daemon = True
+            t.start()
+
         self._logger.info("Starting connection service...")
+        self._logger.info(
+            "Server ready to serve connections. Startup took {0:.3f} "
+            "seconds.".format(time.time() - self._start_time)
+        )
 
         while self._is_serving:
             try:
                 connection, address = self._socket.accept()
+            except socket.timeout:
+                continue
             except socket.error as e:
                 if e.errno == errno.EINTR:
                     self._logger.warning("Interrupting connection service.")
@@ -302,6 +440,106 @@ class KmipServer(object):
 
         self._logger.info("Stopping connection service.")
 
+    def _complete_handoff(self):
+        # Tell the previous process this one is accepting connections, then
+        # wait for it to stop serving and release the restart socket path.
+        try:
+            self._handoff_connection.sendall(handoff.READY)
+            self._handoff_connection.settimeout(handoff.TIMEOUT)
+            self._handoff_connection.recv(1)
+        except Exception as e:
+            self._logger.warning(
+                "Error occurred while completing the socket handoff."
+            )
+            self._logger.exception(e)
+        finally:
+            self._handoff_connection.close()
+            self._handoff_connection = None
+
+    def _serve_handoff(self, path):
+        """
+        Hand the listening socket to a new server process on request.
+
+        A new server process started with the same restart_socket_path
+        connects to the Unix domain socket at path and receives the
+        listening socket. Once the new process reports that it is ready,
+        this process stops accepting connections, leaving its remaining
+        sessions to be drained by stop.
+
+        Only processes running as the same user as this one can connect to
+        the socket at path, and requests from any other user are refused.
+        """
+        try:
+            listener = handoff.listen(path)
+        except Exception as e:
+            self._logger.warning(
+                "Failed to start the socket handoff service."
+            )
+            self._logger.exception(e)
+            return
+        listener.settimeout(1.0)
+
+        try:
+            while self._is_serving:
+                try:
+                    connection, _ = listener.accept()
+                except socket.timeout:
+                    continue
+
+                try:
+                    handoff.check_peer(connection)
+                except Exception as e:
+                    self._logger.warning(
+                        "Refusing a socket handoff request."
+                    )
+                    self._logger.exception(e)
+                    connection.close()
+                    continue
+
+                self._logger.info(
+                    "Handing off the listening socket to a new server "
+                    "process."
+                )
+                try:
+                    connection.settimeout(handoff.TIMEOUT)
+                    handoff.send_fd(connection, self._socket.fileno())
+                    ready = connection.recv(1)
+                except Exception as e:
+                    self._logger.warning(
+                        "Error occurred while handing off the listening "
+                        "socket."
+                    )
+                    self._logger.exception(e)
+                    ready = None
+
+                if ready != handoff.READY:
+                    self._logger.warning(
+                        "The new server process did not start. Continuing "
+                        "connection service."
+                    )
+                    connection.close()
+                    continue
+
+                self._logger.info(
+                    "The new server process is serving connections. "
+                    "Draining remaining sessions."
+                )
+                self._is_socket_shared = True
+                self._is_serving = False
+                listener.close()
+                os.unlink(path)
+                connection.close()
+                return
+        except Exception as e:
+            self._logger.warning(
+                "Error occurred in the socket handoff service."
+            )
+            self._logger.exception(e)
+
+        listener.close()
+        if os.path.exists(path):
+            os.unlink(path)
+
     def _setup_connection_handler(self, connection, address):
         self._logger.info(
             "Receiving incoming connection from: {0}:{1}".format(
@@ -310,6 +548,28 @@ class KmipServer(object):
             )
         )
 
+        self._sessions = [x for x in self._sessions if x.is_alive()]
+        max_sessions = self.config.settings.get('max_sessions')
+        if max_sessions and len(self._sessions) >= max_sessions:
+            self._logger.warning(
+                "Rejecting connection from {0}:{1}. The maximum number of "
+                "concurrent sessions ({2}) has been reached.".format(
+                    address[0],
+                    address[1],
+                    max_sessions
+                )
+            )
+            try:
+                connection.shutdown(socket.SHUT_RDWR)
+            except socket.error:
+                pass
+            connection.close()
+            return
+
+        keepalive_idle = self.config.settings.get('tcp_keepalive_idle')
+        if keepalive_idle:
+            self._set_keepalive(connection, keepalive_idle)
+
         session_name = "{0:08}".format(self._session_id)
         self._session_id += 1
 
@@ -325,10 +585,17 @@ class KmipServer(object):
             s = session.KmipSession(
                 self._engine,
                 connection,
-                name=session_name
+                name=session_name,
+                buffer_size=self.config.settings.get('buffer_size'),
+                max_buffer_size=self.config.settings.get('max_buffer_size'),
+                max_in_flight_requests=self.config.settings.get(
+                    'max_in_flight_requests'
+                ),
+                idle_timeout=self.config.settings.get('session_idle_timeout')
             )
             s.daemon = True
             s.start()
+            self._sessions.append(s)
         except Exception as e:
             self._logger.warning(
                 "Failure occurred while starting session: {0}".format(
@@ -337,6 +604,26 @@ class KmipServer(object):
             )
             self._logger.exception(e)
 
+    def _set_keepalive(self, connection, idle):
+        # Probe idle connections so that sessions held open by vanished
+        # clients are torn down by the kernel. The per-connection timers are
+        # not available on every platform; fall back to the system defaults.
+        connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            connection.setsockopt(
+                socket.IPPROTO_TCP,
+                socket.TCP_KEEPIDLE,
+                idle
+            )
+        if hasattr(socket, 'TCP_KEEPINTVL'):
+            connection.setsockopt(
+                socket.IPPROTO_TCP,
+                socket.TCP_KEEPINTVL,
+                max(1, idle // 3)
+            )
+        if hasattr(socket, 'TCP_KEEPCNT'):
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+
     def __enter__(self):
         self.start()
         return self
@@ -13,11 +13,16 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import errno
 import logging
+import select
 import socket
+import ssl
 import struct
 import threading
 
+from six.moves import queue
+
 from cryptography import x509
 from cryptography.hazmat import backends
 
@@ -33,7 +38,16 @@ class KmipSession(threading.Thread):
     A session thread representing a single KMIP client/server interaction.
     """
 
-    def __init__(self, engine, connection, name=None):
+    def __init__(
+            self,
+            engine,
+            connection,
+            name=None,
+            buffer_size=4096,
+            max_buffer_size=1048576,
+            max_in_flight_requests=1,
+            idle_timeout=None,
+            max_request_size=1048576):
         """
         Create a KmipSession.
 
@@ -44,6 +58,27 @@ class KmipSession(threading.Thread):
                 representing a new KMIP connection. Required.
             name (str): The name of the KmipSession. Optional, defaults to
                 None.
+            buffer_size (int): The initial size in bytes of the receive buffer
+                used to read request messages. The buffer grows as needed to
+                hold larger messages. Optional, defaults to 4096.
+            max_buffer_size (int): The largest size in bytes the receive
+                buffer may retain between requests. A buffer grown beyond
+                this size is released once the request has been read.
+                Optional, defaults to 1048576.
+            max_in_flight_requests (int): The maximum number of requests
+                read from the connection that may be in progress at once.
+                A value greater than 1 enables pipelined mode, in which
+                requests are read, processed and answered by separate
+                threads, with responses always sent in request order.
+                Optional, defaults to 1.
+            idle_timeout (int): The number of seconds the session waits for
+                data from the client before closing the connection. None or
+                0 waits indefinitely. Optional, defaults to None.
+            max_request_size (int): The largest size in bytes of a request
+                message, header included. A request advertising a larger
+                size is answered with an error and the connection is closed
+                before any of its payload is read. Optional, defaults to
+                1048576.
         """
         super(KmipSession, self).__init__(
             group=None,
@@ -60,8 +95,22 @@ class KmipSession(threading.Thread):
         self._engine = engine
         self._connection = connection
 
-        self._max_buffer_size = 4096
-        self._max_request_size = 1048576
+        self._buffer_size = buffer_size
+        self._max_buffer_size = max_buffer_size
+        self._buffer = bytearray(self._buffer_size)
+        self._max_in_flight_requests = max_in_flight_requests
+        self._idle_timeout = idle_timeout
+
+        # An SSL connection may not be used by several threads at once, so
+        # every call on it holds this lock. In pipelined mode, the session
+        # thread only takes it for non-blocking reads once data has arrived,
+        # so that it never keeps the writer thread waiting for the client.
+        self._io_lock = threading.Lock()
+        self._is_closing = False
+        # In pipelined mode, close wakes up the session thread through this
+        # socket pair, instead of shutting down the SSL connection.
+        self._wake_sockets = None
+        self._max_request_size = max_request_size
         self._max_response_size = 1048576
 
     def run(self):
@@ -73,21 +122,73 @@ class KmipSession(threading.Thread):
         """
         self._logger.info("Starting session: {0}".format(self.name))
 
-        while True:
-            try:
-                self._handle_message_loop()
-            except exceptions.ConnectionClosed as e:
-                break
-            except Exception as e:
-                self._logger.info("Failure handling message loop")
-                self._logger.exception(e)
+        if self._idle_timeout:
+            self._connection.settimeout(self._idle_timeout)
+
+        if self._max_in_flight_requests > 1:
+            self._run_pipelined()
+        else:
+            while not self._is_closing:
+                try:
+                    self._handle_message_loop()
+                except exceptions.ConnectionClosed as e:
+                    break
+                except socket.timeout:
+                    self._logger.info(
+                        "Session idle timeout exceeded. Closing connection."
+                    )
+                    break
+                except exceptions.InvalidMessage as e:
+                    self._send_response(self._build_error_data(e))
+                    break
+                except Exception as e:
+                    if self._is_closing:
+                        break
+                    self._logger.info("Failure handling message loop")
+                    self._logger.exception(e)
 
-        self._connection.shutdown(socket.SHUT_RDWR)
+        try:
+            self._connection.shutdown(socket.SHUT_RDWR)
+        except socket.error:
+            # The connection may already have been shut down by the client
+            # or by a call to close.
+            pass
         self._connection.close()
         self._logger.info("Stopping session: {0}".format(self.name))
 
+    def close(self):
+        """
+        Ask the session to stop.
+
+        Wake up the session thread if it is waiting for a request. The
+        session finishes the requests it is currently processing, if any,
+        sends the responses over the secure connection and then exits. This
+        method does not wait for the thread to finish.
+        """
+        self._is_closing = True
+
+        wake_sockets = self._wake_sockets
+        if wake_sockets is not None:
+            try:
+                wake_sockets[1].send(b'\x00')
+            except Exception:
+                pass
+        elif self._max_in_flight_requests <= 1:
+            # SSLSocket.shutdown drops the SSL layer before shutting down the
+            # socket, after which responses would be sent unencrypted. Only
+            # the underlying socket is shut down, which makes a blocked read
+            # return. A serial session is never sending while it reads.
+            try:
+                if isinstance(self._connection, socket.socket):
+                    socket.socket.shutdown(self._connection, socket.SHUT_RD)
+                else:
+                    self._connection.shutdown(socket.SHUT_RD)
+            except Exception:
+                pass
+
     def _get_client_identity(self):
-        certificate_data = self._connection.getpeercert(binary_form=True)
+        with self._io_lock:
+            certificate_data = self._connection.getpeercert(binary_form=True)
         try:
             certificate = x509.load_der_x509_certificate(
                 certificate_data,
@@ -141,6 +242,10 @@ class KmipSession(threading.Thread):
 
     def _handle_message_loop(self):
         request_data = self._receive_request()
+        response_data = self._process_request(request_data)
+        self._send_response(response_data)
+
+    def _process_request(self, request_data):
         request = messages.RequestMessage()
 
         max_size = self._max_response_size
@@ -203,42 +308,277 @@ class KmipSession(threading.Thread):
             response_data = utils.BytearrayStream()
             response.write(response_data)
 
-        self._send_response(response_data.buffer)
+        return response_data.buffer
+
+    def _build_error_data(self, error):
+        response = self._engine.build_error_response(
+            contents.ProtocolVersion.create(1, 0),
+            error.reason,
+            str(error)
+        )
+        response_data = utils.BytearrayStream()
+        response.write(response_data)
+        return response_data.buffer
+
+    def _run_pipelined(self):
+        """
+        Run the message handling loop with pipelined request processing.
+
+        The session thread reads requests off the connection and hands them
+        to a pool of worker threads for decoding, processing and encoding. A
+        writer thread sends the responses back in the order the requests
+        were received. At most max_in_flight_requests requests are read but
+        not yet answered at any time.
+        """
+        in_flight = threading.Semaphore(self._max_in_flight_requests)
+        requests = queue.Queue()
+        responses = queue.Queue()
+
+        self._wake_sockets = socket.socketpair()
+
+        workers = []
+        for i in range(self._max_in_flight_requests):
+            worker = threading.Thread(
+                target=self._process_pipelined_requests,
+                name="{0}-worker-{1}".format(self.name, i),
+                args=(requests, )
+            )
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        writer = threading.Thread(
+            target=self._send_pipelined_responses,
+            name="{0}-writer".format(self.name),
+            args=(responses, in_flight)
+        )
+        writer.daemon = True
+        writer.start()
+
+        while not self._is_closing:
+            in_flight.acquire()
+            try:
+                request_data = self._receive_request()
+            except exceptions.ConnectionClosed:
+                in_flight.release()
+                break
+            except socket.timeout:
+                self._logger.info(
+                    "Session idle timeout exceeded. Closing connection."
+                )
+                in_flight.release()
+                break
+            except exceptions.InvalidMessage as e:
+                # The rest of the request is never read, so the error is
+                # the last response sent before closing the connection.
+                pending = PendingResponse()
+                pending.set(self._build_error_data(e))
+                responses.put(pending)
+                break
+            except Exception as e:
+                in_flight.release()
+                if self._is_closing:
+                    break
+                self._logger.info("Failure handling message loop")
+                self._logger.exception(e)
+            else:
+                pending = PendingResponse()
+                responses.put(pending)
+                requests.put((pending, request_data))
+
+        for worker in workers:
+            requests.put(None)
+        responses.put(None)
+
+        for worker in workers:
+            worker.join()
+        writer.join()
+
+        wake_sockets = self._wake_sockets
+        self._wake_sockets = None
+        for wake_socket in wake_sockets:
+            wake_socket.close()
+
+    def _process_pipelined_requests(self, requests):
+        while True:
+            item = requests.get()
+            if item is None:
+                break
+
+            pending, request_data = item
+            response_data = None
+            try:
+                response_data = self._process_request(request_data)
+            except Exception as e:
+                self._logger.info("Failure handling message loop")
+                self._logger.exception(e)
+            finally:
+                pending.set(response_data)
+
+    def _send_pipelined_responses(self, responses, in_flight):
+        while True:
+            pending = responses.get()
+            if pending is None:
+                break
+
+            try:
+                response_data = pending.wait()
+                if response_data is not None:
+                    self._send_response(response_data)
+            except Exception as e:
+                self._logger.info("Failure sending response message")
+                self._logger.exception(e)
+            finally:
+                in_flight.release()
 
     def _receive_request(self):
-        header = self._receive_bytes(8)
-        message_size = struct.unpack('!I', header[4:])[0]
+        self._receive_bytes(0, 8)
+        message_size = struct.unpack_from('!I', self._buffer, 4)[0]
+        total_size = 8 + message_size
 
-        payload = self._receive_bytes(message_size)
-        data = utils.BytearrayStream(header + payload)
+        # The header is untrusted, so its length is checked before any
+        # memory is reserved for the payload.
+        if total_size > self._max_request_size:
+            self._logger.warning(
+                "Request message length too large: "
+                "{0} bytes, max {1} bytes".format(
+                    total_size,
+                    self._max_request_size
+                )
+            )
+            raise exceptions.InvalidMessage(
+                "Request message length too large. See server logs for "
+                "more information."
+            )
 
-        return data
+        self._reserve_buffer(total_size)
+        self._receive_bytes(8, total_size)
+
+        data = utils.BytearrayStream(memoryview(self._buffer)[:total_size])
 
-    def _receive_bytes(self, message_size):
-        bytes_received = 0
-        message = b''
+        if len(self._buffer) > self._max_buffer_size:
+            self._buffer = bytearray(self._buffer_size)
+
+        return data
 
-        while bytes_received < message_size:
-            partial_message = self._connection.recv(
-                min(message_size - bytes_received, self._max_buffer_size)
+    def _reserve_buffer(self, size):
+        if size > len(self._buffer):
+            new_size = max(
+                size,
+                min(2 * len(self._buffer), self._max_buffer_size)
             )
+            new_buffer = bytearray(new_size)
+            new_buffer[:8] = self._buffer[:8]
+            self._buffer = new_buffer
+
+    def _receive_bytes(self, start, end):
+        view = memoryview(self._buffer)
+        bytes_received = start
+
+        while bytes_received < end:
+            if self._max_in_flight_requests > 1:
+                self._wait_for_data()
+                partial_size = self._receive_available(
+                    view[bytes_received:end]
+                )
+                if partial_size == -1:
+                    continue
+            else:
+                partial_size = self._connection.recv_into(
+                    view[bytes_received:end],
+                    end - bytes_received
+                )
 
-            if partial_message is None:
+            if partial_size is None:
                 break
-            elif len(partial_message) == 0:
+            elif partial_size == 0:
                 raise exceptions.ConnectionClosed()
             else:
-                bytes_received += len(partial_message)
-                message += partial_message
+                bytes_received += partial_size
 
-        if bytes_received != message_size:
+        if bytes_received != end:
             raise ValueError(
                 "Invalid KMIP message received. Actual message length "
                 "does not match the advertised header length."
             )
-        else:
-            return message
+
+    def _receive_available(self, view):
+        # The socket being readable does not mean a whole SSL record has
+        # arrived, so the read under the lock must not block, or a client
+        # stalling in the middle of a record would keep the writer thread
+        # from sending any response. -1 means nothing could be read yet.
+        with self._io_lock:
+            self._connection.settimeout(0.0)
+            try:
+                return self._connection.recv_into(view, len(view))
+            except (ssl.SSLWantReadError, ssl.SSLWantWriteError):
+                return -1
+            except socket.error as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return -1
+                raise
+            finally:
+                self._connection.settimeout(self._idle_timeout or None)
+
+    def _wait_for_data(self):
+        if self._is_closing:
+            raise exceptions.ConnectionClosed()
+
+        # Data already decrypted by the SSL connection is not seen by select.
+        pending = getattr(self._connection, 'pending', None)
+        if pending is not None and pending():
+            return
+
+        wait_list = [self._connection]
+        if self._wake_sockets is not None:
+            wait_list.append(self._wake_sockets[0])
+        readable, _, _ = select.select(
+            wait_list,
+            [],
+            [],
+            self._idle_timeout or None
+        )
+        if self._is_closing:
+            raise exceptions.ConnectionClosed()
+        if not readable:
+            raise socket.timeout()
 
     def _send_response(self, data):
         if len(data) > 0:
-            self._connection.sendall(bytes(data))
+            with self._io_lock:
+                self._connection.sendall(bytes(data))
+
+
+class PendingResponse(object):
+    """
+    A placeholder for the response to a pipelined request.
+
+    The writer thread waits on the placeholder until a worker thread has
+    finished processing the corresponding request.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._data = None
+
+    def set(self, data):
+        """
+        Store the encoded response and wake up any waiting thread.
+
+        Args:
+            data (bytes): The encoded response message, or None if no
+                response should be sent.
+        """
+        self._data = data
+        self._event.set()
+
+    def wait(self):
+        """
+        Block until the response is available.
+
+        Returns:
+            bytes: The encoded response message, or None if no response
+                should be sent.
+        """
+        self._event.wait()
+        return self._data
@@ -0,0 +1,231 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure KmipEngine Get throughput as the number of concurrent clients grows.
+
+Each client thread decodes a Get request, processes it with a shared
+KmipEngine backed by an on-disk SQLite database, and encodes the response,
+mirroring the work done by a KmipSession. Every run is repeated in a
+serialized mode, in which each request holds a single global lock as the
+engine used to, to show the effect of per-request contexts.
+
+Usage:
+    python -m kmip.tests.performance.engine_concurrency [options]
+"""
+
+import logging
+import optparse
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+
+import sqlalchemy
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import get
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import engine
+
+
+def build_engine(path, key_count):
+    """
+    Create a KmipEngine backed by a new SQLite database holding key_count
+    symmetric keys. Returns the engine and the key identifiers.
+    """
+    kmip_engine = engine.KmipEngine()
+    kmip_engine._logger.setLevel(logging.ERROR)
+
+    data_store = sqlalchemy.create_engine(
+        'sqlite:///{0}'.format(path),
+        echo=False
+    )
+    engine._enable_sqlite_savepoints(data_store)
+    sqltypes.Base.metadata.create_all(data_store)
+    kmip_engine._data_store = data_store
+    kmip_engine._data_store_session_factory = sqlalchemy.orm.sessionmaker(
+        bind=data_store
+    )
+
+    session = kmip_engine._data_store_session_factory()
+    keys = [
+        objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            os.urandom(16)
+        )
+        for _ in range(key_count)
+    ]
+    for key in keys:
+        key._owner = 'benchmark'
+        session.add(key)
+    session.commit()
+    identifiers = [str(key.unique_identifier) for key in keys]
+    session.close()
+
+    return kmip_engine, identifiers
+
+
+def build_get_request(unique_identifier):
+    """
+    Build the encoding of a Get request for the given object.
+    """
+    header = messages.RequestHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 2),
+        batch_count=contents.BatchCount(1)
+    )
+    batch_item = messages.RequestBatchItem(
+        operation=contents.Operation(enums.Operation.GET),
+        request_payload=get.GetRequestPayload(
+            unique_identifier=attributes.UniqueIdentifier(unique_identifier)
+        )
+    )
+    request = messages.RequestMessage(
+        request_header=header,
+        batch_items=[batch_item]
+    )
+    stream = utils.BytearrayStream()
+    request.write(stream)
+    return stream.buffer
+
+
+def run_clients(kmip_engine, requests, clients, duration, lock=None):
+    """
+    Run Get requests from the given number of client threads for duration
+    seconds. Returns the number of requests completed.
+    """
+    counts = [0] * clients
+    deadline = time.time() + duration
+
+    def client(index):
+        i = index
+        while time.time() < deadline:
+            request = messages.RequestMessage()
+            request.read(utils.BytearrayStream(requests[i % len(requests)]))
+            if lock is None:
+                response, _ = kmip_engine.process_request(
+                    request,
+                    'benchmark'
+                )
+            else:
+                with lock:
+                    response, _ = kmip_engine.process_request(
+                        request,
+                        'benchmark'
+                    )
+            response.write(utils.BytearrayStream())
+            counts[index] += 1
+            i += clients
+
+    threads = [
+        threading.Thread(target=client, args=(i, )) for i in range(clients)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return sum(counts)
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark concurrent Get processing in the KmipEngine."
+    )
+    parser.add_option(
+        "-c",
+        "--clients",
+        action="store",
+        type="str",
+        default="1,2,4,8,16",
+        dest="clients",
+        help="A comma-separated list of client counts. Defaults to "
+             "'1,2,4,8,16'."
+    )
+    parser.add_option(
+        "-d",
+        "--duration",
+        action="store",
+        type="float",
+        default=3.0,
+        dest="duration",
+        help="The number of seconds to run each measurement. Defaults to 3."
+    )
+    parser.add_option(
+        "-k",
+        "--keys",
+        action="store",
+        type="int",
+        default=1000,
+        dest="keys",
+        help="The number of keys stored in the database. Defaults to 1000."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+    client_counts = [int(x) for x in opts.clients.split(',')]
+
+    directory = tempfile.mkdtemp()
+    try:
+        kmip_engine, identifiers = build_engine(
+            os.path.join(directory, 'benchmark.db'),
+            opts.keys
+        )
+        requests = [build_get_request(x) for x in identifiers]
+
+        print("{0:>8} {1:>14} {2:>14} {3:>8}".format(
+            "clients", "serialized/s", "concurrent/s", "speedup"
+        ))
+        for clients in client_counts:
+            serialized = run_clients(
+                kmip_engine,
+                requests,
+                clients,
+                opts.duration,
+                lock=threading.Lock()
+            ) / opts.duration
+            concurrent = run_clients(
+                kmip_engine,
+                requests,
+                clients,
+                opts.duration
+            ) / opts.duration
+            print("{0:>8} {1:>14.1f} {2:>14.1f} {3:>7.2f}x".format(
+                clients,
+                serialized,
+                concurrent,
+                concurrent / serialized
+            ))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure KmipEngine Get latency against SQLite databases of growing size.
+
+For each object count, a database is filled with symmetric keys using the
+bulk loader of the Locate benchmark. Get requests for randomly chosen keys
+are then sent through KmipEngine.process_request and their latency
+reported.
+
+Usage:
+    python -m kmip.tests.performance.get [options]
+"""
+
+import optparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from kmip.core import attributes
+from kmip.core import enums
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import get
+
+from kmip.tests.performance import locate
+
+
+def build_get_request(unique_identifier):
+    """
+    Build a Get request message for the given object ID.
+    """
+    header = messages.RequestHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 2),
+        batch_count=contents.BatchCount(1)
+    )
+    batch_item = messages.RequestBatchItem(
+        operation=contents.Operation(enums.Operation.GET),
+        request_payload=get.GetRequestPayload(
+            unique_identifier=attributes.UniqueIdentifier(unique_identifier)
+        )
+    )
+    return messages.RequestMessage(
+        request_header=header,
+        batch_items=[batch_item]
+    )
+
+
+def measure(kmip_engine, object_count, owner_count, iterations):
+    """
+    Get iterations randomly chosen keys, each as its owner. Returns the
+    sorted latencies in milliseconds.
+    """
+    latencies = []
+    for _ in range(iterations):
+        uid = random.randint(1, object_count)
+        identity = 'client-{0}'.format(uid % owner_count)
+        request = build_get_request(str(uid))
+
+        start = time.time()
+        response, _ = kmip_engine.process_request(request, identity)
+        latencies.append((time.time() - start) * 1000)
+
+        status = response.batch_items[0].result_status.value
+        if status != enums.ResultStatus.SUCCESS:
+            raise RuntimeError("Get failed for object: {0}".format(uid))
+    return sorted(latencies)
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark Get latency in the KmipEngine."
+    )
+    parser.add_option(
+        "-n",
+        "--objects",
+        action="store",
+        type="string",
+        default="1000,10000,100000,1000000",
+        dest="objects",
+        help="A comma-separated list of the numbers of objects stored in "
+             "the database. Defaults to 1000,10000,100000,1000000."
+    )
+    parser.add_option(
+        "-o",
+        "--owners",
+        action="store",
+        type="int",
+        default=100,
+        dest="owners",
+        help="The number of clients owning the objects. Defaults to 100."
+    )
+    parser.add_option(
+        "-i",
+        "--iterations",
+        action="store",
+        type="int",
+        default=1000,
+        dest="iterations",
+        help="The number of Get requests per object count. Defaults to "
+             "1000."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+    object_counts = [int(x) for x in opts.objects.split(',')]
+
+    print("{0:>10} {1:>10} {2:>10} {3:>10}".format(
+        "objects", "mean ms", "p50 ms", "p99 ms"
+    ))
+    for object_count in object_counts:
+        directory = tempfile.mkdtemp()
+        try:
+            kmip_engine = locate.build_engine(
+                os.path.join(directory, 'benchmark.db'),
+                object_count,
+                opts.owners
+            )
+            latencies = measure(
+                kmip_engine,
+                object_count,
+                opts.owners,
+                opts.iterations
+            )
+            print("{0:>10} {1:>10.3f} {2:>10.3f} {3:>10.3f}".format(
+                object_count,
+                sum(latencies) / len(latencies),
+                latencies[len(latencies) // 2],
+                latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)]
+            ))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,277 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure KmipEngine Locate latency against a large SQLite database.
+
+The database is filled with symmetric keys using bulk inserts, spread over a
+number of owners, names, algorithms and lengths. Each Locate query is then
+sent through KmipEngine.process_request repeatedly and its latency reported.
+
+Usage:
+    python -m kmip.tests.performance.locate [options]
+"""
+
+import logging
+import optparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import sqlalchemy
+
+from kmip.core import attributes
+from kmip.core import enums
+
+from kmip.core.factories import attributes as attribute_factory
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import locate
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import engine
+
+
+ALGORITHMS = [
+    (enums.CryptographicAlgorithm.AES, 128),
+    (enums.CryptographicAlgorithm.AES, 256),
+    (enums.CryptographicAlgorithm.TRIPLE_DES, 192)
+]
+
+
+def build_engine(path, object_count, owner_count, chunk_size=10000):
+    """
+    Create a KmipEngine backed by a new SQLite database holding
+    object_count symmetric keys.
+    """
+    kmip_engine = engine.KmipEngine()
+    kmip_engine._logger.setLevel(logging.ERROR)
+
+    data_store = sqlalchemy.create_engine(
+        'sqlite:///{0}'.format(path),
+        echo=False
+    )
+    engine._enable_sqlite_savepoints(data_store)
+    sqltypes.Base.metadata.create_all(data_store)
+    kmip_engine._data_store = data_store
+    kmip_engine._data_store_session_factory = sqlalchemy.orm.sessionmaker(
+        bind=data_store
+    )
+
+    tables = [
+        objects.ManagedObject.__table__,
+        objects.CryptographicObject.__table__,
+        objects.Key.__table__,
+        objects.SymmetricKey.__table__,
+        sqltypes.ManagedObjectName.__table__
+    ]
+    usage_mask = [
+        enums.CryptographicUsageMask.ENCRYPT,
+        enums.CryptographicUsageMask.DECRYPT
+    ]
+
+    with data_store.begin() as connection:
+        for start in range(1, object_count + 1, chunk_size):
+            uids = range(start, min(start + chunk_size, object_count + 1))
+            rows = [[], [], [], [], []]
+            for uid in uids:
+                algorithm, length = ALGORITHMS[uid % len(ALGORITHMS)]
+                rows[0].append({
+                    'uid': uid,
+                    'object_type': enums.ObjectType.SYMMETRIC_KEY,
+                    'class_type': 'SymmetricKey',
+                    'value': os.urandom(length // 8),
+                    'name_index': 1,
+                    'operation_policy_name': 'default',
+                    'owner': 'client-{0}'.format(uid % owner_count)
+                })
+                rows[1].append({
+                    'uid': uid,
+                    'cryptographic_usage_mask': usage_mask
+                })
+                rows[2].append({
+                    'uid': uid,
+                    'cryptographic_algorithm': algorithm,
+                    'cryptographic_length': length,
+                    'key_format_type': enums.KeyFormatType.RAW
+                })
+                rows[3].append({'uid': uid})
+                rows[4].append({
+                    'mo_uid': uid,
+                    'name': 'key-{0}'.format(uid),
+                    'name_index': 0,
+                    'name_type': enums.NameType.UNINTERPRETED_TEXT_STRING
+                })
+            for table, values in zip(tables, rows):
+                connection.execute(table.insert(), values)
+
+    return kmip_engine
+
+
+def build_locate_request(attribute_list, maximum_items=None):
+    """
+    Build a Locate request message for the given attributes.
+    """
+    if maximum_items is not None:
+        maximum_items = locate.LocateRequestPayload.MaximumItems(
+            maximum_items
+        )
+    header = messages.RequestHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 2),
+        batch_count=contents.BatchCount(1)
+    )
+    batch_item = messages.RequestBatchItem(
+        operation=contents.Operation(enums.Operation.LOCATE),
+        request_payload=locate.LocateRequestPayload(
+            maximum_items=maximum_items,
+            attributes=attribute_list
+        )
+    )
+    return messages.RequestMessage(
+        request_header=header,
+        batch_items=[batch_item]
+    )
+
+
+def build_queries(object_count):
+    factory = attribute_factory.AttributeFactory()
+    name = factory.create_attribute(
+        enums.AttributeType.NAME,
+        attributes.Name.create(
+            'key-{0}'.format(object_count // 2),
+            enums.NameType.UNINTERPRETED_TEXT_STRING
+        )
+    )
+    algorithm = factory.create_attribute(
+        enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+        enums.CryptographicAlgorithm.AES
+    )
+    length = factory.create_attribute(
+        enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+        256
+    )
+    object_type = factory.create_attribute(
+        enums.AttributeType.OBJECT_TYPE,
+        enums.ObjectType.SYMMETRIC_KEY
+    )
+    return [
+        ("name", build_locate_request([name])),
+        ("owned keys, max 10", build_locate_request([object_type], 10)),
+        (
+            "algorithm+length, max 10",
+            build_locate_request([algorithm, length], 10)
+        ),
+        ("owned keys, max 1000", build_locate_request([], 1000))
+    ]
+
+
+def measure(kmip_engine, request, identity, iterations):
+    """
+    Send the request iterations times. Returns the sorted latencies in
+    milliseconds and the number of identifiers in the last response.
+    """
+    latencies = []
+    count = 0
+    for _ in range(iterations):
+        start = time.time()
+        response, _ = kmip_engine.process_request(request, identity)
+        latencies.append((time.time() - start) * 1000)
+        payload = response.batch_items[0].response_payload
+        count = len(payload.unique_identifiers)
+    return sorted(latencies), count
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark Locate latency in the KmipEngine."
+    )
+    parser.add_option(
+        "-n",
+        "--objects",
+        action="store",
+        type="int",
+        default=1000000,
+        dest="objects",
+        help="The number of objects stored in the database. Defaults to "
+             "1000000."
+    )
+    parser.add_option(
+        "-o",
+        "--owners",
+        action="store",
+        type="int",
+        default=100,
+        dest="owners",
+        help="The number of clients owning the objects. Defaults to 100."
+    )
+    parser.add_option(
+        "-i",
+        "--iterations",
+        action="store",
+        type="int",
+        default=100,
+        dest="iterations",
+        help="The number of times each query is run. Defaults to 100."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+
+    directory = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        kmip_engine = build_engine(
+            os.path.join(directory, 'benchmark.db'),
+            opts.objects,
+            opts.owners
+        )
+        print("Stored {0} objects in {1:.1f} seconds.".format(
+            opts.objects,
+            time.time() - start
+        ))
+
+        identity = 'client-{0}'.format((opts.objects // 2) % opts.owners)
+        print("{0:>26} {1:>8} {2:>10} {3:>10} {4:>10}".format(
+            "query", "results", "mean ms", "p50 ms", "p99 ms"
+        ))
+        for label, request in build_queries(opts.objects):
+            latencies, count = measure(
+                kmip_engine,
+                request,
+                identity,
+                opts.iterations
+            )
+            print("{0:>26} {1:>8} {2:>10.3f} {3:>10.3f} {4:>10.3f}".format(
+                label,
+                count,
+                sum(latencies) / len(latencies),
+                latencies[len(latencies) // 2],
+                latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)]
+            ))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Compare KmipEngine throughput across the object stores.
+
+A KmipEngine is created for each data store URL and filled with symmetric
+keys through its object store. Get requests for random keys, mixed with a
+given share of Create requests, are then sent from concurrent client
+threads, as in the engine concurrency benchmark. The object cache is
+disabled so that every Get reads from the store. The LMDB store is skipped
+if the lmdb package is not installed.
+
+Usage:
+    python -m kmip.tests.performance.object_store [options]
+"""
+
+import logging
+import optparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import objects as core_objects
+from kmip.core import utils
+
+from kmip.core.factories import attributes as factory
+
+from kmip.core.messages import contents
+from kmip.core.messages import messages
+from kmip.core.messages.payloads import create
+
+from kmip.pie import objects
+
+from kmip.services.server import engine
+from kmip.services.server.repo import lmdb_store
+
+from kmip.tests.performance import engine_concurrency
+
+
+def build_engine(key_count, **options):
+    """
+    Create a KmipEngine from the given keyword arguments, holding key_count
+    symmetric keys. Returns the engine and the key identifiers.
+    """
+    kmip_engine = engine.KmipEngine(object_cache_size=0, **options)
+    kmip_engine._logger.setLevel(logging.ERROR)
+
+    object_store = kmip_engine._object_store
+    session = object_store.open_session()
+    keys = [
+        objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            os.urandom(16)
+        )
+        for _ in range(key_count)
+    ]
+    for key in keys:
+        key._owner = 'benchmark'
+    object_store.insert_objects(session, keys)
+    session.commit()
+    session.close()
+
+    return kmip_engine, [str(key.unique_identifier) for key in keys]
+
+
+def build_create_request():
+    """
+    Build the encoding of a Create request for a 128-bit AES key.
+    """
+    attribute_factory = factory.AttributeFactory()
+    template_attribute = core_objects.TemplateAttribute(
+        attributes=[
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_ALGORITHM,
+                enums.CryptographicAlgorithm.AES
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_LENGTH,
+                128
+            ),
+            attribute_factory.create_attribute(
+                enums.AttributeType.CRYPTOGRAPHIC_USAGE_MASK,
+                [
+                    enums.CryptographicUsageMask.ENCRYPT,
+                    enums.CryptographicUsageMask.DECRYPT
+                ]
+            )
+        ]
+    )
+    header = messages.RequestHeader(
+        protocol_version=contents.ProtocolVersion.create(1, 2),
+        batch_count=contents.BatchCount(1)
+    )
+    batch_item = messages.RequestBatchItem(
+        operation=contents.Operation(enums.Operation.CREATE),
+        request_payload=create.CreateRequestPayload(
+            attributes.ObjectType(enums.ObjectType.SYMMETRIC_KEY),
+            template_attribute
+        )
+    )
+    request = messages.RequestMessage(
+        request_header=header,
+        batch_items=[batch_item]
+    )
+    stream = utils.BytearrayStream()
+    request.write(stream)
+    return stream.buffer
+
+
+def build_requests(identifiers, creates):
+    """
+    Build Get requests for the given objects, replacing the given percentage
+    of them with Create requests.
+    """
+    create_request = build_create_request()
+    return [
+        create_request if i % 100 < creates else
+        engine_concurrency.build_get_request(x)
+        for i, x in enumerate(identifiers)
+    ]
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark Get and Create throughput of the KmipEngine "
+                    "object stores."
+    )
+    parser.add_option(
+        "-c",
+        "--clients",
+        action="store",
+        type="int",
+        default=8,
+        dest="clients",
+        help="The number of concurrent clients. Defaults to 8."
+    )
+    parser.add_option(
+        "-d",
+        "--duration",
+        action="store",
+        type="float",
+        default=3.0,
+        dest="duration",
+        help="The number of seconds to run each measurement. Defaults to 3."
+    )
+    parser.add_option(
+        "-k",
+        "--keys",
+        action="store",
+        type="int",
+        default=10000,
+        dest="keys",
+        help="The number of keys stored. Defaults to 10000."
+    )
+    parser.add_option(
+        "-r",
+        "--creates",
+        action="store",
+        type="str",
+        default="0,1,10",
+        dest="creates",
+        help="A comma-separated list of the percentages of Create requests "
+             "to measure. Defaults to '0,1,10'."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+    create_shares = [int(x) for x in opts.creates.split(',')]
+
+    directory = tempfile.mkdtemp()
+    try:
+        urls = [
+            ('sqlite', 'sqlite:///' + os.path.join(directory, 'sqlite.db')),
+            ('memory', 'memory://'),
+            ('log', 'log://' + os.path.join(directory, 'log'))
+        ]
+        if lmdb_store.lmdb is not None:
+            urls.append(('lmdb', 'lmdb://' + os.path.join(directory, 'lmdb')))
+
+        print("{0:<10} {1:>10} {2:>10} {3:>10}".format(
+            "store", "load s", "creates %", "ops/s"
+        ))
+        for name, url in urls:
+            start = time.time()
+            kmip_engine, identifiers = build_engine(
+                opts.keys,
+                database_url=url
+            )
+            load_time = time.time() - start
+
+            random.shuffle(identifiers)
+            for creates in create_shares:
+                count = engine_concurrency.run_clients(
+                    kmip_engine,
+                    build_requests(identifiers, creates),
+                    opts.clients,
+                    opts.duration
+                )
+                print("{0:<10} {1:>10.2f} {2:>10} {3:>10.1f}".format(
+                    name,
+                    load_time,
+                    creates,
+                    count / opts.duration
+                ))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure the effect of the pie schema indexes on a large SQLite database.
+
+The database is filled with symmetric keys using the bulk loader of the
+Locate benchmark. Every secondary index is then dropped, as in a database
+created by an older version, and a set of typical lookups is timed. The
+schema is upgraded with sqltypes.upgrade_schema, which recreates the
+indexes, and the lookups are timed again.
+
+Usage:
+    python -m kmip.tests.performance.schema [options]
+"""
+
+import optparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+import sqlalchemy
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.tests.performance import locate
+
+
+def build_lookups(object_count, owner_count):
+    """
+    Build the lookups to time, as (description, statement factory) pairs.
+    Each factory returns a statement for a randomly chosen object or owner.
+    """
+    managed_objects = objects.ManagedObject.__table__
+    keys = objects.Key.__table__
+    names = sqltypes.ManagedObjectName.__table__
+
+    def by_name():
+        return sqlalchemy.text(
+            "SELECT mo_uid FROM {0} WHERE name = :name".format(names.name)
+        ).bindparams(name='key-{0}'.format(random.randint(1, object_count)))
+
+    def names_of_object():
+        return sqlalchemy.text(
+            "SELECT name FROM {0} WHERE mo_uid = :uid".format(names.name)
+        ).bindparams(uid=random.randint(1, object_count))
+
+    def by_owner():
+        return sqlalchemy.text(
+            "SELECT uid FROM {0} WHERE owner = :owner "
+            "AND object_type = :object_type "
+            "AND operation_policy_name = 'default' "
+            "ORDER BY uid LIMIT 100".format(managed_objects.name)
+        ).bindparams(
+            owner='client-{0}'.format(random.randint(0, owner_count - 1)),
+            object_type=enums.ObjectType.SYMMETRIC_KEY.value
+        )
+
+    def by_algorithm():
+        algorithm, length = random.choice(locate.ALGORITHMS)
+        return sqlalchemy.text(
+            "SELECT uid FROM {0} WHERE cryptographic_algorithm = :algorithm "
+            "AND cryptographic_length = :length "
+            "ORDER BY uid LIMIT 100".format(keys.name)
+        ).bindparams(algorithm=algorithm.value, length=length)
+
+    return [
+        ("name lookup", by_name),
+        ("names of object", names_of_object),
+        ("owner filter", by_owner),
+        ("algorithm filter", by_algorithm)
+    ]
+
+
+def drop_indexes(data_store):
+    """
+    Drop every secondary index of the pie tables.
+    """
+    inspector = sqlalchemy.inspect(data_store)
+    with data_store.begin() as connection:
+        for table in sqltypes.Base.metadata.sorted_tables:
+            for index in inspector.get_indexes(table.name):
+                connection.execute(sqlalchemy.text(
+                    "DROP INDEX {0}".format(index['name'])
+                ))
+
+
+def measure(data_store, lookups, iterations):
+    """
+    Run each lookup iterations times. Returns the mean latency of each
+    lookup in milliseconds.
+    """
+    results = []
+    with data_store.connect() as connection:
+        for _, factory in lookups:
+            elapsed = 0.0
+            for _ in range(iterations):
+                statement = factory()
+                start = time.time()
+                connection.execute(statement).fetchall()
+                elapsed += time.time() - start
+            results.append(elapsed * 1000 / iterations)
+    return results
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark pie schema lookups with and without indexes."
+    )
+    parser.add_option(
+        "-n",
+        "--objects",
+        action="store",
+        type="int",
+        default=1000000,
+        dest="objects",
+        help="The number of objects stored in the database. Defaults to "
+             "1000000."
+    )
+    parser.add_option(
+        "-o",
+        "--owners",
+        action="store",
+        type="int",
+        default=100,
+        dest="owners",
+        help="The number of clients owning the objects. Defaults to 100."
+    )
+    parser.add_option(
+        "-i",
+        "--iterations",
+        action="store",
+        type="int",
+        default=20,
+        dest="iterations",
+        help="The number of times each lookup is run. Defaults to 20."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+
+    directory = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        kmip_engine = locate.build_engine(
+            os.path.join(directory, 'benchmark.db'),
+            opts.objects,
+            opts.owners
+        )
+        data_store = kmip_engine._data_store
+        print("Loaded {0} objects in {1:.1f} s".format(
+            opts.objects,
+            time.time() - start
+        ))
+
+        lookups = build_lookups(opts.objects, opts.owners)
+
+        drop_indexes(data_store)
+        before = measure(data_store, lookups, opts.iterations)
+
+        start = time.time()
+        sqltypes.upgrade_schema(data_store)
+        print("Upgraded the schema in {0:.1f} s".format(time.time() - start))
+
+        after = measure(data_store, lookups, opts.iterations)
+
+        print("{0:<20} {1:>14} {2:>14}".format(
+            "lookup", "unindexed ms", "indexed ms"
+        ))
+        for (description, _), x, y in zip(lookups, before, after):
+            print("{0:<20} {1:>14.3f} {2:>14.3f}".format(description, x, y))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,146 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+"""
+Measure KmipEngine throughput against the number of data store shards.
+
+For each shard count, a KmipEngine is created with that many SQLite files
+as shards, or with a single SQLite file as its data store for a count of 0,
+and filled with symmetric keys. Get requests for random keys, mixed with a
+given share of Create requests, are then sent from concurrent client
+threads, as in the object store benchmark. Writers of different shards do
+not wait for each other, so the share of Create requests shows the effect
+of sharding.
+
+Usage:
+    python -m kmip.tests.performance.sharded_store [options]
+"""
+
+import optparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+from kmip.tests.performance import engine_concurrency
+from kmip.tests.performance import object_store
+
+
+def build_argument_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options]",
+        description="Benchmark Get and Create throughput of the KmipEngine "
+                    "against the number of data store shards."
+    )
+    parser.add_option(
+        "-c",
+        "--clients",
+        action="store",
+        type="int",
+        default=8,
+        dest="clients",
+        help="The number of concurrent clients. Defaults to 8."
+    )
+    parser.add_option(
+        "-d",
+        "--duration",
+        action="store",
+        type="float",
+        default=3.0,
+        dest="duration",
+        help="The number of seconds to run each measurement. Defaults to 3."
+    )
+    parser.add_option(
+        "-k",
+        "--keys",
+        action="store",
+        type="int",
+        default=10000,
+        dest="keys",
+        help="The number of keys stored. Defaults to 10000."
+    )
+    parser.add_option(
+        "-n",
+        "--shards",
+        action="store",
+        type="str",
+        default="0,1,2,4,8",
+        dest="shards",
+        help="A comma-separated list of the shard counts to measure, 0 "
+             "standing for an unsharded data store. Defaults to '0,1,2,4,8'."
+    )
+    parser.add_option(
+        "-r",
+        "--creates",
+        action="store",
+        type="str",
+        default="0,10,50",
+        dest="creates",
+        help="A comma-separated list of the percentages of Create requests "
+             "to measure. Defaults to '0,10,50'."
+    )
+    return parser
+
+
+def main(args=None):
+    parser = build_argument_parser()
+    opts, _ = parser.parse_args(sys.argv[1:] if args is None else args)
+    shard_counts = [int(x) for x in opts.shards.split(',')]
+    create_shares = [int(x) for x in opts.creates.split(',')]
+
+    print("{0:>10} {1:>10} {2:>10} {3:>10}".format(
+        "shards", "load s", "creates %", "ops/s"
+    ))
+    for shard_count in shard_counts:
+        directory = tempfile.mkdtemp()
+        try:
+            urls = [
+                'sqlite:///' + os.path.join(directory, '{0}.db'.format(i))
+                for i in range(max(shard_count, 1))
+            ]
+            if shard_count:
+                options = {'database_shard_urls': urls}
+            else:
+                options = {'database_url': urls[0]}
+
+            start = time.time()
+            kmip_engine, identifiers = object_store.build_engine(
+                opts.keys,
+                **options
+            )
+            load_time = time.time() - start
+
+            random.shuffle(identifiers)
+            for creates in create_shares:
+                count = engine_concurrency.run_clients(
+                    kmip_engine,
+                    object_store.build_requests(identifiers, creates),
+                    opts.clients,
+                    opts.duration
+                )
+                print("{0:>10} {1:>10.2f} {2:>10} {3:>10.1f}".format(
+                    shard_count,
+                    load_time,
+                    creates,
+                    count / opts.duration
+                ))
+        finally:
+            shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main()
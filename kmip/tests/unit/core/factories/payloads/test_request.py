@@ -19,6 +19,7 @@ from kmip.core.enums import Operation
 from kmip.core.factories.payloads.request import RequestPayloadFactory
 
 from kmip.core.messages.payloads import activate
+from kmip.core.messages.payloads import cancel
 from kmip.core.messages.payloads import create
 from kmip.core.messages.payloads import create_key_pair
 from kmip.core.messages.payloads import destroy
@@ -26,6 +27,7 @@ from kmip.core.messages.payloads import discover_versions
 from kmip.core.messages.payloads import get
 from kmip.core.messages.payloads import get_attribute_list
 from kmip.core.messages.payloads import locate
+from kmip.core.messages.payloads import poll
 from kmip.core.messages.payloads import query
 from kmip.core.messages.payloads import rekey_key_pair
 from kmip.core.messages.payloads import register
@@ -147,12 +149,12 @@ class TestRequestPayloadFactory(testtools.TestCase):
         self._test_payload_type(payload, query.QueryRequestPayload)
 
     def test_create_cancel_payload(self):
-        self._test_not_implemented(
-            self.factory.create, Operation.CANCEL)
+        payload = self.factory.create(Operation.CANCEL)
+        self._test_payload_type(payload, cancel.CancelRequestPayload)
 
     def test_create_poll_payload(self):
-        self._test_not_implemented(
-            self.factory.create, Operation.POLL)
+        payload = self.factory.create(Operation.POLL)
+        self._test_payload_type(payload, poll.PollRequestPayload)
 
     def test_create_notify_payload(self):
         self._test_not_implemented(
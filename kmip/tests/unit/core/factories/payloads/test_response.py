@@ -19,6 +19,7 @@ from kmip.core.enums import Operation
 from kmip.core.factories.payloads.response import ResponsePayloadFactory
 
 from kmip.core.messages.payloads import activate
+from kmip.core.messages.payloads import cancel
 from kmip.core.messages.payloads import create
 from kmip.core.messages.payloads import create_key_pair
 from kmip.core.messages.payloads import destroy
@@ -147,8 +148,8 @@ class TestResponsePayloadFactory(testtools.TestCase):
         self._test_payload_type(payload, query.QueryResponsePayload)
 
     def test_create_cancel_payload(self):
-        self._test_not_implemented(
-            self.factory.create, Operation.CANCEL)
+        payload = self.factory.create(Operation.CANCEL)
+        self._test_payload_type(payload, cancel.CancelResponsePayload)
 
     def test_create_poll_payload(self):
         self._test_not_implemented(
@@ -47,7 +47,13 @@ class TestAttributeValueFactory(testtools.TestCase):
         """
         Test that an ObjectType attribute can be created.
         """
-        self.skip('')
+        value = self.factory.create_attribute_value(
+            enums.AttributeType.OBJECT_TYPE,
+            enums.ObjectType.SYMMETRIC_KEY
+        )
+
+        self.assertIsInstance(value, attributes.ObjectType)
+        self.assertEqual(enums.ObjectType.SYMMETRIC_KEY, value.value)
 
     def test_create_cryptographic_algorithm(self):
         """
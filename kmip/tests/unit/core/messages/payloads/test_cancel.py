@@ -0,0 +1,144 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages.payloads import cancel
+
+
+class TestCancelRequestPayload(testtools.TestCase):
+    """
+    Test suite for the CancelRequestPayload class.
+    """
+
+    def setUp(self):
+        super(TestCancelRequestPayload, self).setUp()
+
+        self.correlation_value = contents.AsynchronousCorrelationValue(
+            b'\x01\x02\x03\x04'
+        )
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x10'
+            b'\x42\x00\x06\x08\x00\x00\x00\x04\x01\x02\x03\x04\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestCancelRequestPayload, self).tearDown()
+
+    def test_validate_with_invalid_correlation_value(self):
+        """
+        Test that a TypeError is raised when an invalid correlation value is
+        used to construct a CancelRequestPayload.
+        """
+        self.assertRaisesRegexp(
+            TypeError,
+            "invalid asynchronous correlation value",
+            cancel.CancelRequestPayload,
+            'invalid'
+        )
+
+    def test_read(self):
+        """
+        Test that a CancelRequestPayload can be read from a data stream.
+        """
+        payload = cancel.CancelRequestPayload()
+        payload.read(self.encoding)
+
+        self.assertEqual(
+            b'\x01\x02\x03\x04',
+            payload.asynchronous_correlation_value.value
+        )
+
+    def test_write(self):
+        """
+        Test that a CancelRequestPayload can be written to a data stream.
+        """
+        payload = cancel.CancelRequestPayload(self.correlation_value)
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
+
+
+class TestCancelResponsePayload(testtools.TestCase):
+    """
+    Test suite for the CancelResponsePayload class.
+    """
+
+    def setUp(self):
+        super(TestCancelResponsePayload, self).setUp()
+
+        self.correlation_value = contents.AsynchronousCorrelationValue(
+            b'\x01\x02\x03\x04'
+        )
+        self.cancellation_result = contents.CancellationResult(
+            enums.CancellationResult.CANCELED
+        )
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x7C\x01\x00\x00\x00\x20'
+            b'\x42\x00\x06\x08\x00\x00\x00\x04\x01\x02\x03\x04\x00\x00\x00\x00'
+            b'\x42\x00\x12\x05\x00\x00\x00\x04\x00\x00\x00\x01\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestCancelResponsePayload, self).tearDown()
+
+    def test_validate_with_invalid_cancellation_result(self):
+        """
+        Test that a TypeError is raised when an invalid cancellation result
+        is used to construct a CancelResponsePayload.
+        """
+        self.assertRaisesRegexp(
+            TypeError,
+            "invalid cancellation result",
+            cancel.CancelResponsePayload,
+            self.correlation_value,
+            'invalid'
+        )
+
+    def test_read(self):
+        """
+        Test that a CancelResponsePayload can be read from a data stream.
+        """
+        payload = cancel.CancelResponsePayload()
+        payload.read(self.encoding)
+
+        self.assertEqual(
+            b'\x01\x02\x03\x04',
+            payload.asynchronous_correlation_value.value
+        )
+        self.assertEqual(
+            enums.CancellationResult.CANCELED,
+            payload.cancellation_result.value
+        )
+
+    def test_write(self):
+        """
+        Test that a CancelResponsePayload can be written to a data stream.
+        """
+        payload = cancel.CancelResponsePayload(
+            self.correlation_value,
+            self.cancellation_result
+        )
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
@@ -12,3 +12,149 @@
 # WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 # License for the specific language governing permissions and limitations
 # under the License.
+
+import testtools
+
+from kmip.core import attributes
+from kmip.core import enums
+from kmip.core import utils
+
+from kmip.core.messages.payloads import locate
+
+
+class TestLocateRequestPayload(testtools.TestCase):
+    """
+    Test suite for the Locate request payload.
+    """
+
+    def setUp(self):
+        super(TestLocateRequestPayload, self).setUp()
+
+        # Encoding of a Locate request payload with a maximum items value of
+        # 2 and a storage status mask covering online and archival storage.
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x20'
+            b'\x42\x00\x4F\x02\x00\x00\x00\x04\x00\x00\x00\x02\x00\x00\x00\x00'
+            b'\x42\x00\x8E\x02\x00\x00\x00\x04\x00\x00\x00\x03\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestLocateRequestPayload, self).tearDown()
+
+    def test_read(self):
+        """
+        Test that a Locate request payload with a storage status mask can be
+        read from a data stream.
+        """
+        payload = locate.LocateRequestPayload()
+        payload.read(self.encoding)
+
+        self.assertEqual(2, payload.maximum_items.value)
+        self.assertEqual(
+            enums.StorageStatus.ONLINE_STORAGE.value |
+            enums.StorageStatus.ARCHIVAL_STORAGE.value,
+            payload.storage_status_mask.value
+        )
+        self.assertEqual([], payload.attributes)
+
+    def test_write(self):
+        """
+        Test that a Locate request payload with a storage status mask can be
+        written to a data stream.
+        """
+        payload = locate.LocateRequestPayload(
+            maximum_items=locate.LocateRequestPayload.MaximumItems(2),
+            storage_status_mask=locate.LocateRequestPayload.StorageStatusMask(
+                enums.StorageStatus.ONLINE_STORAGE.value |
+                enums.StorageStatus.ARCHIVAL_STORAGE.value
+            )
+        )
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
+
+    def test_read_with_offset_items(self):
+        """
+        Test that a Locate request payload with an offset items value can be
+        read from a data stream.
+        """
+        encoding = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x20'
+            b'\x42\x00\x4F\x02\x00\x00\x00\x04\x00\x00\x00\x02\x00\x00\x00\x00'
+            b'\x42\x00\xD4\x02\x00\x00\x00\x04\x00\x00\x00\x03\x00\x00\x00\x00'
+        )
+        payload = locate.LocateRequestPayload()
+        payload.read(encoding)
+
+        self.assertEqual(2, payload.maximum_items.value)
+        self.assertEqual(3, payload.offset_items.value)
+        self.assertIsNone(payload.storage_status_mask)
+
+    def test_write_with_offset_items(self):
+        """
+        Test that a Locate request payload with an offset items value can be
+        written to a data stream.
+        """
+        encoding = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x20'
+            b'\x42\x00\x4F\x02\x00\x00\x00\x04\x00\x00\x00\x02\x00\x00\x00\x00'
+            b'\x42\x00\xD4\x02\x00\x00\x00\x04\x00\x00\x00\x03\x00\x00\x00\x00'
+        )
+        payload = locate.LocateRequestPayload(
+            maximum_items=locate.LocateRequestPayload.MaximumItems(2),
+            offset_items=locate.LocateRequestPayload.OffsetItems(3)
+        )
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(encoding), len(stream))
+        self.assertEqual(str(encoding), str(stream))
+
+
+class TestLocateResponsePayload(testtools.TestCase):
+    """
+    Test suite for the Locate response payload.
+    """
+
+    def setUp(self):
+        super(TestLocateResponsePayload, self).setUp()
+
+        # Encoding of a Locate response payload with a located items value
+        # of 10 and a single unique identifier, '1'.
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x7C\x01\x00\x00\x00\x20'
+            b'\x42\x00\xD5\x02\x00\x00\x00\x04\x00\x00\x00\x0A\x00\x00\x00\x00'
+            b'\x42\x00\x94\x07\x00\x00\x00\x01\x31\x00\x00\x00\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestLocateResponsePayload, self).tearDown()
+
+    def test_read(self):
+        """
+        Test that a Locate response payload with a located items value can be
+        read from a data stream.
+        """
+        payload = locate.LocateResponsePayload()
+        payload.read(self.encoding)
+
+        self.assertEqual(10, payload.located_items.value)
+        self.assertEqual(1, len(payload.unique_identifiers))
+        self.assertEqual('1', payload.unique_identifiers[0].value)
+
+    def test_write(self):
+        """
+        Test that a Locate response payload with a located items value can be
+        written to a data stream.
+        """
+        payload = locate.LocateResponsePayload(
+            unique_identifiers=[attributes.UniqueIdentifier('1')],
+            located_items=locate.LocateResponsePayload.LocatedItems(10)
+        )
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
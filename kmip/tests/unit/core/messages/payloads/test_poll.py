@@ -0,0 +1,90 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import utils
+
+from kmip.core.messages import contents
+from kmip.core.messages.payloads import poll
+
+
+class TestPollRequestPayload(testtools.TestCase):
+    """
+    Test suite for the PollRequestPayload class.
+    """
+
+    def setUp(self):
+        super(TestPollRequestPayload, self).setUp()
+
+        self.correlation_value = contents.AsynchronousCorrelationValue(
+            b'\x01\x02\x03\x04'
+        )
+        self.encoding = utils.BytearrayStream(
+            b'\x42\x00\x79\x01\x00\x00\x00\x10'
+            b'\x42\x00\x06\x08\x00\x00\x00\x04\x01\x02\x03\x04\x00\x00\x00\x00'
+        )
+
+    def tearDown(self):
+        super(TestPollRequestPayload, self).tearDown()
+
+    def test_init(self):
+        """
+        Test that a PollRequestPayload can be constructed with and without
+        a correlation value.
+        """
+        payload = poll.PollRequestPayload()
+        self.assertIsNone(payload.asynchronous_correlation_value)
+
+        payload = poll.PollRequestPayload(self.correlation_value)
+        self.assertEqual(
+            self.correlation_value,
+            payload.asynchronous_correlation_value
+        )
+
+    def test_validate_with_invalid_correlation_value(self):
+        """
+        Test that a TypeError is raised when an invalid correlation value is
+        used to construct a PollRequestPayload.
+        """
+        self.assertRaisesRegexp(
+            TypeError,
+            "invalid asynchronous correlation value",
+            poll.PollRequestPayload,
+            'invalid'
+        )
+
+    def test_read(self):
+        """
+        Test that a PollRequestPayload can be read from a data stream.
+        """
+        payload = poll.PollRequestPayload()
+        payload.read(self.encoding)
+
+        self.assertEqual(
+            b'\x01\x02\x03\x04',
+            payload.asynchronous_correlation_value.value
+        )
+
+    def test_write(self):
+        """
+        Test that a PollRequestPayload can be written to a data stream.
+        """
+        payload = poll.PollRequestPayload(self.correlation_value)
+        stream = utils.BytearrayStream()
+        payload.write(stream)
+
+        self.assertEqual(len(self.encoding), len(stream))
+        self.assertEqual(str(self.encoding), str(stream))
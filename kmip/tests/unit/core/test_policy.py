@@ -0,0 +1,124 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import os
+import shutil
+import tempfile
+import testtools
+
+from kmip.core import enums
+from kmip.core import policy
+
+
+class TestPolicy(testtools.TestCase):
+
+    def setUp(self):
+        super(TestPolicy, self).setUp()
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def tearDown(self):
+        super(TestPolicy, self).tearDown()
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_parse_policy(self):
+        """
+        Test that a JSON policy is converted to its enumeration form.
+        """
+        result = policy.parse_policy(
+            {
+                'CERTIFICATE': {
+                    'LOCATE': 'ALLOW_ALL',
+                    'DESTROY': 'ALLOW_OWNER'
+                }
+            }
+        )
+
+        self.assertEqual(
+            {
+                enums.ObjectType.CERTIFICATE: {
+                    enums.Operation.LOCATE: enums.Policy.ALLOW_ALL,
+                    enums.Operation.DESTROY: enums.Policy.ALLOW_OWNER
+                }
+            },
+            result
+        )
+
+    def test_parse_policy_invalid(self):
+        """
+        Test that an error is raised for an unknown enumeration name.
+        """
+        self.assertRaises(
+            KeyError,
+            policy.parse_policy,
+            {'CERTIFICATE': {'INVALID': 'ALLOW_ALL'}}
+        )
+
+    def test_read_policy_from_file(self):
+        """
+        Test that the policies in a JSON file can be read.
+        """
+        path = self._write(
+            'test.json',
+            '{"test": {"CERTIFICATE": {"LOCATE": "ALLOW_ALL"}}}'
+        )
+
+        result = policy.read_policy_from_file(path)
+
+        self.assertEqual(
+            {
+                'test': {
+                    enums.ObjectType.CERTIFICATE: {
+                        enums.Operation.LOCATE: enums.Policy.ALLOW_ALL
+                    }
+                }
+            },
+            result
+        )
+
+    def test_read_policy_from_file_invalid_json(self):
+        """
+        Test that an error is raised when the file is not valid JSON.
+        """
+        path = self._write('test.json', '{"test": ')
+
+        self.assertRaisesRegexp(
+            ValueError,
+            "An error occurred while attempting to parse the JSON file.",
+            policy.read_policy_from_file,
+            path
+        )
+
+    def test_read_policy_from_file_invalid_policy(self):
+        """
+        Test that an error is raised when a policy in the file is invalid.
+        """
+        path = self._write(
+            'test.json',
+            '{"test": {"INVALID": {"LOCATE": "ALLOW_ALL"}}}'
+        )
+
+        self.assertRaisesRegexp(
+            ValueError,
+            "Failure parsing policy 'test'",
+            policy.read_policy_from_file,
+            path
+        )
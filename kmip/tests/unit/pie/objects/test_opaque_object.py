@@ -240,6 +240,26 @@ class TestOpaqueObject(testtools.TestCase):
         self.assertEqual(enums.ObjectType.OPAQUE_DATA, get_obj.object_type)
         self.assertEqual(enums.OpaqueDataType.NONE, get_obj.opaque_type)
 
+    def test_get_large_value(self):
+        """
+        Test that a value larger than a typical key can be saved and
+        retrieved, and that it is only loaded when accessed.
+        """
+        value = b'\x01' * 65536
+        obj = OpaqueObject(value, enums.OpaqueDataType.NONE)
+        Session = sessionmaker(bind=self.engine)
+        session = Session()
+        session.add(obj)
+        session.commit()
+
+        session = Session()
+        get_obj = session.query(OpaqueObject).filter(
+            ManagedObject.unique_identifier == obj.unique_identifier
+            ).one()
+        self.assertNotIn('value', get_obj.__dict__)
+        self.assertEqual(value, get_obj.value)
+        session.commit()
+
     def test_add_multiple_names(self):
         """
         Test that multiple names can be added to a managed object. This
@@ -13,11 +13,100 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
+import mock
+import re
+import sqlalchemy
 import testtools
 
 from kmip.core import enums
+from kmip.pie import objects
+from kmip.pie import sqltypes
 from kmip.pie.sqltypes import ManagedObjectName
 
+from kmip.services.server import bulk
+
+
+# The tables created by PyKMIP 0.5.0, and the rows it stores for a 128-bit
+# AES key named 'key'.
+BASELINE_SCHEMA = [
+    "CREATE TABLE managed_objects ("
+    "uid INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, "
+    "object_type INTEGER, "
+    "class_type VARCHAR(50), "
+    "value VARBINARY(1024), "
+    "name_index INTEGER, "
+    "operation_policy_name VARCHAR(50), "
+    "owner VARCHAR(50))",
+    "CREATE INDEX ix_managed_objects_owner ON managed_objects (owner)",
+    "CREATE INDEX ix_managed_objects_object_type "
+    "ON managed_objects (object_type)",
+    "CREATE INDEX ix_managed_objects_operation_policy_name "
+    "ON managed_objects (operation_policy_name)",
+    "CREATE TABLE managed_object_names ("
+    "id INTEGER NOT NULL, "
+    "mo_uid INTEGER, "
+    "name VARCHAR, "
+    "name_index INTEGER, "
+    "name_type INTEGER, "
+    "PRIMARY KEY (id), "
+    "FOREIGN KEY(mo_uid) REFERENCES managed_objects (uid))",
+    "CREATE INDEX ix_managed_object_names_name "
+    "ON managed_object_names (name)",
+    "CREATE TABLE crypto_objects ("
+    "uid INTEGER NOT NULL, "
+    "cryptographic_usage_mask INTEGER, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES managed_objects (uid))",
+    "CREATE TABLE opaque_objects ("
+    "uid INTEGER NOT NULL, "
+    "opaque_type INTEGER, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES managed_objects (uid))",
+    "CREATE TABLE keys ("
+    "uid INTEGER NOT NULL, "
+    "cryptographic_algorithm INTEGER, "
+    "cryptographic_length INTEGER, "
+    "key_format_type INTEGER, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES crypto_objects (uid))",
+    "CREATE INDEX ix_keys_cryptographic_algorithm "
+    "ON keys (cryptographic_algorithm)",
+    "CREATE INDEX ix_keys_cryptographic_length ON keys (cryptographic_length)",
+    "CREATE TABLE certificates ("
+    "uid INTEGER NOT NULL, "
+    "certificate_type INTEGER, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES crypto_objects (uid))",
+    "CREATE TABLE secret_data_objects ("
+    "uid INTEGER NOT NULL, "
+    "data_type INTEGER, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES crypto_objects (uid))",
+    "CREATE TABLE symmetric_keys ("
+    "uid INTEGER NOT NULL, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES keys (uid))",
+    "CREATE TABLE public_keys ("
+    "uid INTEGER NOT NULL, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES keys (uid))",
+    "CREATE TABLE private_keys ("
+    "uid INTEGER NOT NULL, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES keys (uid))",
+    "CREATE TABLE x509_certificates ("
+    "uid INTEGER NOT NULL, "
+    "PRIMARY KEY (uid), "
+    "FOREIGN KEY(uid) REFERENCES certificates (uid))",
+    "INSERT INTO managed_objects VALUES "
+    "(1, 2, 'SymmetricKey', X'01010101010101010101010101010101', 1, "
+    "'default', NULL)",
+    "INSERT INTO managed_object_names VALUES (1, 1, 'key', 0, 1)",
+    "INSERT INTO crypto_objects VALUES (1, 0)",
+    "INSERT INTO keys VALUES (1, 3, 128, 1)",
+    "INSERT INTO symmetric_keys VALUES (1)"
+]
+
 
 class TestSqlTypesManagedObjectName(testtools.TestCase):
     """
@@ -130,3 +219,334 @@ class TestSqlTypesManagedObjectName(testtools.TestCase):
         """
         a = ManagedObjectName('a', 0, enums.NameType.UNINTERPRETED_TEXT_STRING)
         repr(a)
+
+
+class TestUsageMaskType(testtools.TestCase):
+    """
+    Test suite for the UsageMaskType column type.
+    """
+
+    def test_process_bind_param(self):
+        """
+        Test that a list of usage masks is stored as their bitmask.
+        """
+        usage_mask_type = sqltypes.UsageMaskType()
+        self.assertEqual(
+            0x0C,
+            usage_mask_type.process_bind_param(
+                [
+                    enums.CryptographicUsageMask.ENCRYPT,
+                    enums.CryptographicUsageMask.DECRYPT
+                ],
+                None
+            )
+        )
+        self.assertEqual(0, usage_mask_type.process_bind_param([], None))
+
+    def test_process_result_value(self):
+        """
+        Test that a bitmask is read as a new list of usage masks each time,
+        built once per bitmask.
+        """
+        usage_mask_type = sqltypes.UsageMaskType()
+        masks = usage_mask_type.process_result_value(0x0C, None)
+        self.assertEqual(
+            [
+                enums.CryptographicUsageMask.ENCRYPT,
+                enums.CryptographicUsageMask.DECRYPT
+            ],
+            masks
+        )
+        self.assertIn(0x0C, sqltypes.UsageMaskType._masks)
+
+        masks.append(enums.CryptographicUsageMask.SIGN)
+        self.assertEqual(
+            [
+                enums.CryptographicUsageMask.ENCRYPT,
+                enums.CryptographicUsageMask.DECRYPT
+            ],
+            usage_mask_type.process_result_value(0x0C, None)
+        )
+        self.assertEqual([], usage_mask_type.process_result_value(0, None))
+        self.assertEqual(
+            [],
+            usage_mask_type.process_result_value(None, None)
+        )
+
+
+class TestGenerateIdentifiers(testtools.TestCase):
+    """
+    Test suite for the object ID generators.
+    """
+
+    def test_generate_ulid(self):
+        """
+        Test that ULIDs hold their timestamp and increase within the same
+        millisecond.
+        """
+        with mock.patch('time.time', return_value=1.5):
+            with mock.patch.object(sqltypes, '_ulid_last', [0, 0]):
+                ids = [sqltypes.generate_ulid() for _ in range(100)]
+
+        for uid in ids:
+            self.assertTrue(re.match('^[0-9A-HJKMNP-TV-Z]{26}$', uid))
+            self.assertEqual('00000001EW', uid[:10])
+        self.assertEqual(sorted(ids), ids)
+        self.assertEqual(100, len(set(ids)))
+
+        self.assertLess(ids[-1], sqltypes.generate_ulid())
+
+    def test_generate_uuid(self):
+        """
+        Test that UUIDs are random version 4 UUIDs.
+        """
+        uid = sqltypes.generate_uuid()
+        self.assertEqual(36, len(uid))
+        self.assertEqual('4', uid[14])
+        self.assertNotEqual(uid, sqltypes.generate_uuid())
+
+
+class TestUpgradeSchema(testtools.TestCase):
+    """
+    Test suite for the upgrade_schema function.
+    """
+
+    def setUp(self):
+        super(TestUpgradeSchema, self).setUp()
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+
+    def tearDown(self):
+        super(TestUpgradeSchema, self).tearDown()
+
+    def test_upgrade_schema_new(self):
+        """
+        Test that every table and index is created in an empty data store.
+        """
+        sqltypes.upgrade_schema(self.engine)
+
+        inspector = sqlalchemy.inspect(self.engine)
+        self.assertIn(
+            objects.SymmetricKey.__tablename__,
+            inspector.get_table_names()
+        )
+        for table in sqltypes.Base.metadata.sorted_tables:
+            self.assertIn(table.name, inspector.get_table_names())
+            self.assertEqual(
+                set(x.name for x in table.indexes),
+                set(x['name'] for x in inspector.get_indexes(table.name))
+            )
+
+    def test_upgrade_schema_existing(self):
+        """
+        Test that the missing columns and indexes are added to tables created
+        by an earlier version, keeping the stored rows.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(sqlalchemy.text(
+                "CREATE TABLE managed_objects ("
+                "uid INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "object_type INTEGER, "
+                "class_type VARCHAR(50), "
+                "value VARBINARY(1024), "
+                "name_index INTEGER, "
+                "operation_policy_name VARCHAR(50), "
+                "owner VARCHAR(50))"
+            ))
+            connection.execute(sqlalchemy.text(
+                "CREATE TABLE managed_object_names ("
+                "id INTEGER PRIMARY KEY, "
+                "mo_uid INTEGER REFERENCES managed_objects (uid), "
+                "name VARCHAR, "
+                "name_index INTEGER, "
+                "name_type INTEGER)"
+            ))
+            connection.execute(sqlalchemy.text(
+                "INSERT INTO managed_objects (uid, class_type, owner) "
+                "VALUES (1, 'OpaqueObject', 'test')"
+            ))
+
+        sqltypes.upgrade_schema(self.engine)
+
+        inspector = sqlalchemy.inspect(self.engine)
+        columns = [
+            x['name'] for x in inspector.get_columns('managed_objects')
+        ]
+        self.assertIn('encoded_secret', columns)
+        self.assertEqual(
+            set([
+                'ix_managed_objects_object_type',
+                'ix_managed_objects_operation_policy_name',
+                'ix_managed_objects_owner',
+                'ix_managed_objects_object_type_policy',
+                'ix_managed_objects_owner_object_type_policy'
+            ]),
+            set(x['name'] for x in inspector.get_indexes('managed_objects'))
+        )
+        self.assertEqual(
+            set([
+                'ix_managed_object_names_mo_uid',
+                'ix_managed_object_names_name'
+            ]),
+            set(
+                x['name'] for x in inspector.get_indexes(
+                    'managed_object_names'
+                )
+            )
+        )
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(sqlalchemy.text(
+                "SELECT uid, owner, encoded_secret FROM managed_objects"
+            )).fetchall()
+        self.assertEqual([('1', 'test', None)], [tuple(x) for x in rows])
+
+        # Test that upgrading an up-to-date schema changes nothing.
+        sqltypes.upgrade_schema(self.engine)
+
+    def _get_value_type(self):
+        inspector = sqlalchemy.inspect(self.engine)
+        return [
+            x['type'] for x in inspector.get_columns('managed_objects')
+            if x['name'] == 'value'
+        ][0]
+
+    def test_upgrade_schema_baseline(self):
+        """
+        Test that a data store created by PyKMIP 0.5.0 is rebuilt with an
+        unbounded secret value column, keeping its objects.
+        """
+        with self.engine.begin() as connection:
+            for statement in BASELINE_SCHEMA:
+                connection.execute(sqlalchemy.text(statement))
+        self.assertNotIsInstance(
+            self._get_value_type(),
+            sqlalchemy.LargeBinary
+        )
+
+        sqltypes.upgrade_schema(self.engine)
+
+        self.assertIsInstance(self._get_value_type(), sqlalchemy.LargeBinary)
+        self.assertEqual(
+            [],
+            [
+                x for x in sqlalchemy.inspect(self.engine).get_table_names()
+                if x.endswith('_old')
+            ]
+        )
+
+        session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        managed_object = session.query(objects.SymmetricKey).filter(
+            objects.ManagedObject.unique_identifier == '1'
+        ).one()
+        self.assertEqual(b'\x01' * 16, managed_object.value)
+        self.assertEqual(['key'], managed_object.names)
+        self.assertEqual(
+            enums.CryptographicAlgorithm.AES,
+            managed_object.cryptographic_algorithm
+        )
+
+        # Test that values larger than the old column are stored in full.
+        opaque = objects.OpaqueObject(
+            b'\x02' * 4096,
+            enums.OpaqueDataType.NONE
+        )
+        opaque.unique_identifier = '2'
+        session.add(opaque)
+        session.commit()
+        session.close()
+
+        session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        managed_object = session.query(objects.OpaqueObject).filter(
+            objects.ManagedObject.unique_identifier == '2'
+        ).one()
+        self.assertEqual(b'\x02' * 4096, managed_object.value)
+        session.close()
+
+    def test_upgrade_schema_bounded_value(self):
+        """
+        Test that a data store with string IDs but a bounded secret value
+        column is rebuilt, keeping its objects.
+        """
+        metadata = sqlalchemy.MetaData()
+        for table in sqltypes.Base.metadata.sorted_tables:
+            table = table.tometadata(metadata)
+            if table.name == 'managed_objects':
+                table.c.value.type = sqlalchemy.VARBINARY(1024)
+        metadata.create_all(self.engine)
+
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            name='key'
+        )
+        key.unique_identifier = 'a'
+        with self.engine.begin() as connection:
+            bulk.insert_managed_objects(connection, [key])
+
+        sqltypes.upgrade_schema(self.engine)
+
+        self.assertIsInstance(self._get_value_type(), sqlalchemy.LargeBinary)
+        session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        managed_object = session.query(objects.SymmetricKey).filter(
+            objects.ManagedObject.unique_identifier == 'a'
+        ).one()
+        self.assertEqual(b'\x01' * 16, managed_object.value)
+        self.assertEqual(['key'], managed_object.names)
+        session.close()
+
+    def test_upgrade_schema_integer_identifiers(self):
+        """
+        Test that the integer IDs of a data store created by an earlier
+        version are converted to strings, keeping every row.
+        """
+        metadata = sqlalchemy.MetaData()
+        for table in sqltypes.Base.metadata.sorted_tables:
+            table = table.tometadata(metadata)
+            for column in table.columns:
+                if column.name in ('uid', 'mo_uid'):
+                    column.type = sqlalchemy.Integer()
+        metadata.create_all(self.engine)
+
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            name='key'
+        )
+        key.unique_identifier = 7
+        with self.engine.begin() as connection:
+            bulk.insert_managed_objects(connection, [key])
+
+        sqltypes.upgrade_schema(self.engine)
+
+        inspector = sqlalchemy.inspect(self.engine)
+        self.assertEqual(
+            [],
+            [
+                x for x in inspector.get_table_names()
+                if x.endswith('_old')
+            ]
+        )
+        for table in ('managed_objects', 'symmetric_keys'):
+            uid = [
+                x for x in inspector.get_columns(table) if x['name'] == 'uid'
+            ][0]
+            self.assertIsInstance(uid['type'], sqlalchemy.String)
+
+        session = sqlalchemy.orm.sessionmaker(bind=self.engine)()
+        managed_object = session.query(objects.SymmetricKey).filter(
+            objects.ManagedObject.unique_identifier == '7'
+        ).one()
+        self.assertEqual(b'\x01' * 16, managed_object.value)
+        self.assertEqual(['key'], managed_object.names)
+        session.close()
+
+        # Test that upgrading a converted schema changes nothing.
+        tables = sqlalchemy.inspect(self.engine).get_table_names()
+        sqltypes.upgrade_schema(self.engine)
+        self.assertEqual(
+            tables,
+            sqlalchemy.inspect(self.engine).get_table_names()
+        )
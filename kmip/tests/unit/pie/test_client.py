@@ -474,6 +474,88 @@ class TestProxyKmipClient(testtools.TestCase):
             KmipOperationFailure, error_msg,
             client.create_key_pair, *args)
 
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_locate_iter(self):
+        """
+        Test that the client can iterate over located IDs one page at a time.
+        """
+        status = contents.ResultStatus(enums.ResultStatus.SUCCESS)
+        pages = [
+            results.LocateResult(
+                status,
+                uuids=[attr.UniqueIdentifier('1'), attr.UniqueIdentifier('2')]
+            ),
+            results.LocateResult(
+                status,
+                uuids=[attr.UniqueIdentifier('3'), attr.UniqueIdentifier('4')]
+            ),
+            results.LocateResult(
+                status,
+                uuids=[attr.UniqueIdentifier('5')]
+            )
+        ]
+
+        with ProxyKmipClient() as client:
+            client.proxy.locate.side_effect = pages
+            result = client.locate_iter(page_size=2)
+
+            self.assertEqual(['1', '2', '3', '4', '5'], list(result))
+            self.assertEqual(3, client.proxy.locate.call_count)
+            client.proxy.locate.assert_called_with(
+                maximum_items=2,
+                storage_status_mask=None,
+                object_group_member=None,
+                attributes=[],
+                offset_items=4
+            )
+
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_locate_iter_on_invalid_page_size(self):
+        """
+        Test that the right errors are raised when iterating over located IDs
+        with an invalid page size.
+        """
+        with ProxyKmipClient() as client:
+            self.assertRaises(TypeError, client.locate_iter, page_size='1')
+            self.assertRaises(ValueError, client.locate_iter, page_size=0)
+
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_locate_iter_on_closed(self):
+        """
+        Test that a ClientConnectionNotOpen exception is raised when trying
+        to locate secrets on an unopened client connection.
+        """
+        client = ProxyKmipClient()
+        self.assertRaises(ClientConnectionNotOpen, client.locate_iter)
+
+    @mock.patch('kmip.pie.client.KMIPProxy',
+                mock.MagicMock(spec_set=KMIPProxy))
+    def test_locate_iter_on_operation_failure(self):
+        """
+        Test that a KmipOperationFailure exception is raised when the
+        backend fails to locate secrets.
+        """
+        status = enums.ResultStatus.OPERATION_FAILED
+        reason = enums.ResultReason.GENERAL_FAILURE
+        message = "Test failure message"
+
+        result = results.LocateResult(
+            contents.ResultStatus(status),
+            contents.ResultReason(reason),
+            contents.ResultMessage(message))
+        error_msg = str(KmipOperationFailure(status, reason, message))
+
+        client = ProxyKmipClient()
+        client.open()
+        client.proxy.locate.return_value = result
+        located = client.locate_iter()
+
+        self.assertRaisesRegexp(
+            KmipOperationFailure, error_msg, list, located)
+
     @mock.patch('kmip.pie.client.KMIPProxy',
                 mock.MagicMock(spec_set=KMIPProxy))
     def test_get(self):
@@ -0,0 +1,137 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import shutil
+import six
+import tempfile
+import testtools
+
+from kmip.core import enums
+from kmip.core import exceptions
+
+from kmip.pie import objects
+
+from kmip.services.server.repo import lmdb_store
+from kmip.services.server.repo import store
+
+
+class TestLmdbStore(testtools.TestCase):
+    """
+    Test suite for the LMDB object store.
+    """
+
+    def setUp(self):
+        super(TestLmdbStore, self).setUp()
+
+        if lmdb_store.lmdb is None:
+            self.skipTest("The lmdb package is not installed.")
+
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.store = lmdb_store.LmdbStore(self.path, map_size=1 << 24)
+        self.addCleanup(lambda: self.store.close())
+
+    def tearDown(self):
+        super(TestLmdbStore, self).tearDown()
+
+    def _reopen(self):
+        self.store.close()
+        self.store = lmdb_store.LmdbStore(self.path, map_size=1 << 24)
+
+    def test_missing_package(self):
+        """
+        Test that a ConfigurationError is raised if lmdb is missing.
+        """
+        with mock.patch.object(lmdb_store, 'lmdb', None):
+            args = (self.path, )
+            regex = "The lmdb package is required for LMDB data stores."
+            six.assertRaisesRegex(
+                self,
+                exceptions.ConfigurationError,
+                regex,
+                lmdb_store.LmdbStore,
+                *args
+            )
+
+    def test_persistence(self):
+        """
+        Test that committed objects and their secrets survive reopening the
+        store.
+        """
+        session = self.store.open_session()
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            name='key'
+        )
+        opaque = objects.OpaqueObject(b'\x02', enums.OpaqueDataType.NONE)
+        self.store.add_objects(session, [key, opaque])
+        session.commit()
+        self.store.delete_object(session, opaque.unique_identifier)
+        session.commit()
+
+        self._reopen()
+        session = self.store.open_session()
+
+        uid = key.unique_identifier
+        managed_object = self.store.get_object(session, uid)
+        self.assertIsInstance(managed_object, objects.SymmetricKey)
+        self.assertIsNone(managed_object.value)
+        self.assertEqual(['key'], managed_object.names)
+
+        managed_object = self.store.get_object(session, uid, load_secret=True)
+        self.assertEqual(b'\x01' * 16, managed_object.value)
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            opaque.unique_identifier
+        )
+        self.assertRaises(KeyError, self.store.get_object, session, '')
+        self.assertRaises(KeyError, self.store.get_object, session, 'a' * 512)
+
+        # Locate entries are rebuilt.
+        criteria = store.LocateCriteria()
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'])
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['default'])
+        self.assertEqual([uid], self.store.locate(session, criteria))
+
+    def test_detach(self):
+        """
+        Test that detaching a committed object drops its secret, while an
+        uncommitted one keeps it until it is written.
+        """
+        session = self.store.open_session()
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16
+        )
+        self.store.add_objects(session, [key])
+
+        self.store.detach(session, key)
+        self.assertEqual(b'\x01' * 16, key.value)
+        session.commit()
+
+        uid = key.unique_identifier
+        managed_object = self.store.get_object(session, uid, load_secret=True)
+        self.store.detach(session, managed_object)
+        self.assertIsNone(managed_object.value)
+        self.assertEqual(
+            b'\x01' * 16,
+            self.store.get_object(session, uid, load_secret=True).value
+        )
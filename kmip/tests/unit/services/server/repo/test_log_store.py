@@ -0,0 +1,280 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import os
+import shutil
+import tempfile
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+
+from kmip.services.server.repo import log_store
+from kmip.services.server.repo import store
+
+
+class TestLogStore(testtools.TestCase):
+    """
+    Test suite for the append-only log object store.
+    """
+
+    def setUp(self):
+        super(TestLogStore, self).setUp()
+
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+        self.log_path = os.path.join(self.path, 'objects.log')
+        self.store = log_store.LogStore(self.path)
+        self.addCleanup(lambda: self.store.close())
+
+    def tearDown(self):
+        super(TestLogStore, self).tearDown()
+
+    def _reopen(self, **kwargs):
+        self.store.close()
+        self.store = log_store.LogStore(self.path, **kwargs)
+
+    def _add_keys(self, count):
+        session = self.store.open_session()
+        keys = [
+            objects.SymmetricKey(
+                enums.CryptographicAlgorithm.AES,
+                128,
+                os.urandom(16)
+            )
+            for _ in range(count)
+        ]
+        self.store.add_objects(session, keys)
+        session.commit()
+        return keys
+
+    def test_persistence(self):
+        """
+        Test that committed objects and their secrets survive reopening the
+        store.
+        """
+        session = self.store.open_session()
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            name='key'
+        )
+        key._encoded_secret = b'\x03'
+        opaque = objects.OpaqueObject(b'\x02', enums.OpaqueDataType.NONE)
+        self.store.add_objects(session, [key, opaque])
+        session.commit()
+        self.store.delete_object(session, opaque.unique_identifier)
+        session.commit()
+
+        self._reopen()
+        session = self.store.open_session()
+
+        uid = key.unique_identifier
+        managed_object = self.store.get_object(session, uid)
+        self.assertIsInstance(managed_object, objects.SymmetricKey)
+        self.assertIsNone(managed_object.value)
+        self.assertEqual(['key'], managed_object.names)
+
+        managed_object = self.store.get_object(session, uid, load_secret=True)
+        self.assertEqual(b'\x01' * 16, managed_object.value)
+        self.assertEqual(b'\x03', managed_object._encoded_secret)
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            opaque.unique_identifier
+        )
+        self.assertRaises(KeyError, self.store.get_object, session, 'a')
+
+        # Locate entries are rebuilt.
+        criteria = store.LocateCriteria()
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'])
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['default'])
+        self.assertEqual([uid], self.store.locate(session, criteria))
+
+    def test_recover_incomplete_frame(self):
+        """
+        Test that a frame cut short at the end of the log is discarded on
+        opening, and that later commits are kept.
+        """
+        keys = self._add_keys(2)
+        size = os.path.getsize(self.log_path)
+        lost = self._add_keys(1)[0]
+        self.store.close()
+
+        with open(self.log_path, 'r+b') as log_file:
+            log_file.truncate(os.path.getsize(self.log_path) - 1)
+
+        self._reopen()
+        self.assertEqual(size, os.path.getsize(self.log_path))
+        session = self.store.open_session()
+        self.assertEqual(
+            keys[1].value,
+            self.store.get_object(
+                session,
+                keys[1].unique_identifier,
+                load_secret=True
+            ).value
+        )
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            lost.unique_identifier
+        )
+
+        key = self._add_keys(1)[0]
+        self._reopen()
+        session = self.store.open_session()
+        self.assertIsNotNone(
+            self.store.get_object(session, key.unique_identifier)
+        )
+
+    def test_recover_corrupt_frame(self):
+        """
+        Test that a frame failing its checksum is discarded with the frames
+        after it.
+        """
+        key = self._add_keys(1)[0]
+        size = os.path.getsize(self.log_path)
+        lost = self._add_keys(2)[0]
+        self.store.close()
+
+        with open(self.log_path, 'r+b') as log_file:
+            log_file.seek(size + 20)
+            data = bytearray(log_file.read(1))
+            log_file.seek(size + 20)
+            log_file.write(bytes(bytearray([data[0] ^ 0xff])))
+
+        self._reopen()
+        self.assertEqual(size, os.path.getsize(self.log_path))
+        session = self.store.open_session()
+        self.assertIsNotNone(
+            self.store.get_object(session, key.unique_identifier)
+        )
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            lost.unique_identifier
+        )
+
+    def test_compact(self):
+        """
+        Test that compaction drops dead entries, and keeps the live objects
+        and the frames written while it runs.
+        """
+        keys = self._add_keys(10)
+        session = self.store.open_session()
+        for key in keys[:9]:
+            self.store.delete_object(session, key.unique_identifier)
+        session.commit()
+        size = os.path.getsize(self.log_path)
+
+        open_log_file = log_store._open_log_file
+        written = list()
+
+        def open_log_file_and_commit(path):
+            # Commit once the live entries have been read.
+            written.extend(self._add_keys(1))
+            return open_log_file(path)
+
+        with mock.patch.object(
+                log_store,
+                '_open_log_file',
+                side_effect=open_log_file_and_commit):
+            self.store.compact()
+
+        self.assertLess(os.path.getsize(self.log_path), size)
+        self.assertFalse(
+            os.path.exists(os.path.join(self.path, 'objects.log.compact'))
+        )
+
+        for store_session in (session, None):
+            if store_session is None:
+                self._reopen()
+                store_session = self.store.open_session()
+            self.assertEqual(
+                keys[9].value,
+                self.store.get_object(
+                    store_session,
+                    keys[9].unique_identifier,
+                    load_secret=True
+                ).value
+            )
+            self.assertEqual(
+                written[0].value,
+                self.store.get_object(
+                    store_session,
+                    written[0].unique_identifier,
+                    load_secret=True
+                ).value
+            )
+            self.assertRaises(
+                KeyError,
+                self.store.get_object,
+                store_session,
+                keys[0].unique_identifier
+            )
+
+    def test_compact_in_background(self):
+        """
+        Test that a commit leaving too many dead entries starts a background
+        compaction.
+        """
+        self._reopen(compaction_ratio=0.5, compaction_min_size=0)
+        keys = self._add_keys(4)
+        session = self.store.open_session()
+
+        self.store.delete_object(session, keys[0].unique_identifier)
+        session.commit()
+        self.assertIsNone(self.store._compaction)
+
+        self.store.delete_object(session, keys[1].unique_identifier)
+        self.store.delete_object(session, keys[2].unique_identifier)
+        session.commit()
+        self.assertIsNotNone(self.store._compaction)
+        self.store._compaction.join()
+
+        # A single frame holds the one live entry.
+        self.assertEqual(
+            self.store._live_size + len(log_store._build_frame([])),
+            os.path.getsize(self.log_path)
+        )
+        self.assertIsNotNone(
+            self.store.get_object(session, keys[3].unique_identifier)
+        )
+
+    def test_leftover_compaction(self):
+        """
+        Test that the output of an interrupted compaction is removed on
+        opening.
+        """
+        key = self._add_keys(1)[0]
+        compaction_path = os.path.join(self.path, 'objects.log.compact')
+        with open(compaction_path, 'wb') as compaction_file:
+            compaction_file.write(b'\x00' * 8)
+
+        self._reopen()
+        self.assertFalse(os.path.exists(compaction_path))
+        self.assertIsNotNone(
+            self.store.get_object(
+                self.store.open_session(),
+                key.unique_identifier
+            )
+        )
@@ -0,0 +1,196 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+
+from kmip.services.server.repo import memory_store
+from kmip.services.server.repo import store
+
+
+class TestMemoryStore(testtools.TestCase):
+    """
+    Test suite for the in-memory object store.
+    """
+
+    def setUp(self):
+        super(TestMemoryStore, self).setUp()
+
+        self.store = memory_store.MemoryStore()
+
+    def tearDown(self):
+        super(TestMemoryStore, self).tearDown()
+
+    def _build_key(self, length=128, owner='test'):
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            length,
+            b'\x00' * (length // 8),
+            name='key'
+        )
+        key._owner = owner
+        return key
+
+    def test_add_and_get_objects(self):
+        """
+        Test that added objects get IDs, unless they have one, and default
+        attributes, and are seen by their own session right away and by
+        other sessions once committed.
+        """
+        key = self._build_key()
+        opaque = objects.OpaqueObject(b'\x01', enums.OpaqueDataType.NONE)
+        opaque.unique_identifier = 'opaque'
+
+        session = self.store.open_session()
+        self.store.add_objects(session, [key, opaque])
+
+        uid = key.unique_identifier
+        self.assertEqual(26, len(uid))
+        self.assertEqual('opaque', opaque.unique_identifier)
+        self.assertEqual('default', key.operation_policy_name)
+        self.assertIs(key, self.store.get_object(session, uid))
+
+        other = self.store.open_session()
+        self.assertRaises(KeyError, self.store.get_object, other, uid)
+
+        session.commit()
+        self.assertIs(key, self.store.get_object(other, uid))
+        self.assertIs(opaque, self.store.get_object(other, 'opaque'))
+        self.assertRaises(KeyError, self.store.get_object, other, 'a')
+
+    def test_get_objects(self):
+        """
+        Test that many objects are read at once, leaving out missing ones.
+        """
+        session = self.store.open_session()
+        keys = [self._build_key(), self._build_key()]
+        self.store.add_objects(session, keys)
+        ids = [x.unique_identifier for x in keys]
+
+        self.assertEqual(
+            {ids[0]: keys[0], ids[1]: keys[1]},
+            self.store.get_objects(session, ids + ['a'])
+        )
+
+    def test_rollback(self):
+        """
+        Test that objects added by a rolled back savepoint or session are
+        not stored.
+        """
+        session = self.store.open_session()
+        savepoint = session.begin_nested()
+        key = self._build_key()
+        self.store.add_objects(session, [key])
+        savepoint.rollback()
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            key.unique_identifier
+        )
+
+        key = self._build_key()
+        self.store.add_objects(session, [key])
+        session.rollback()
+        session.commit()
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            key.unique_identifier
+        )
+
+    def test_delete_object(self):
+        """
+        Test that a deleted object is gone for its session right away and
+        for every session once committed.
+        """
+        session = self.store.open_session()
+        key = self._build_key()
+        self.store.add_objects(session, [key])
+        session.commit()
+        uid = key.unique_identifier
+
+        self.store.delete_object(session, uid)
+        self.assertRaises(KeyError, self.store.get_object, session, uid)
+        self.assertIsNotNone(
+            self.store.get_object(self.store.open_session(), uid)
+        )
+
+        session.commit()
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            self.store.open_session(),
+            uid
+        )
+
+    def test_detach(self):
+        """
+        Test that detaching an object keeps its secret, since the stored
+        object is the only copy.
+        """
+        session = self.store.open_session()
+        key = self._build_key()
+        self.store.add_objects(session, [key])
+        session.commit()
+
+        managed_object = self.store.get_object(
+            session,
+            key.unique_identifier,
+            load_secret=True
+        )
+        self.store.detach(session, managed_object)
+        self.assertEqual(b'\x00' * 16, managed_object.value)
+
+    def test_locate(self):
+        """
+        Test that Locate finds the committed and uncommitted objects of the
+        session in ID order, honoring after, offset and limit.
+        """
+        session = self.store.open_session()
+        keys = [
+            self._build_key(),
+            self._build_key(256),
+            self._build_key(owner='other'),
+            self._build_key(256)
+        ]
+        ids = ['1', '2', '3', '4']
+        for key, uid in zip(keys, ids):
+            key.unique_identifier = uid
+        self.store.add_objects(session, keys[:3])
+        session.commit()
+        self.store.add_objects(session, keys[3:])
+        self.store.delete_object(session, '1')
+
+        criteria = store.LocateCriteria(owner='test')
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'], True)
+
+        self.assertEqual(['2', '4'], self.store.locate(session, criteria))
+        self.assertEqual(
+            ['2'],
+            self.store.locate(self.store.open_session(), criteria, after='1')
+        )
+        self.assertEqual(
+            ['4'],
+            self.store.locate(session, criteria, offset=1, limit=5)
+        )
+        self.assertEqual(['2'], self.store.locate(session, criteria, limit=1))
+
+        criteria.cryptographic_lengths.append(128)
+        self.assertEqual([], self.store.locate(session, criteria))
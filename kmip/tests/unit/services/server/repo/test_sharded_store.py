@@ -0,0 +1,386 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import os
+import shutil
+import sqlalchemy
+import tempfile
+import testtools
+import threading
+
+from concurrent import futures
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server.repo import sharded_store
+from kmip.services.server.repo import sqlalchemy_store
+from kmip.services.server.repo import store
+
+
+class TestShardedStore(testtools.TestCase):
+    """
+    Test suite for the sharded object store, with shards kept in SQLite
+    files.
+    """
+
+    def setUp(self):
+        super(TestShardedStore, self).setUp()
+
+        self.path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.path)
+
+        shards = list()
+        for i in range(3):
+            engine = sqlalchemy.create_engine(
+                'sqlite:///' + os.path.join(self.path, '{0}.db'.format(i))
+            )
+            sqltypes.Base.metadata.create_all(engine)
+            shards.append(sqlalchemy_store.SqlAlchemyStore(engine))
+        self.store = sharded_store.ShardedStore(shards)
+        self.addCleanup(self.store.close)
+
+    def tearDown(self):
+        super(TestShardedStore, self).tearDown()
+
+    def _build_keys(self, count, owner='test'):
+        keys = list()
+        for i in range(count):
+            key = objects.SymmetricKey(
+                enums.CryptographicAlgorithm.AES,
+                128,
+                os.urandom(16),
+                name='key{0}'.format(i)
+            )
+            key._owner = owner
+            keys.append(key)
+        return keys
+
+    def _add_keys(self, count, owner='test'):
+        keys = self._build_keys(count, owner)
+        session = self.store.open_session()
+        self.store.add_objects(session, keys)
+        session.commit()
+        session.close()
+        return [x.unique_identifier for x in keys]
+
+    def _get_shard_object(self, uid):
+        index = self.store.get_shard_index(uid)
+        shard = self.store.shards[index]
+        session = shard.open_session()
+        try:
+            return shard.get_object(session, uid)
+        finally:
+            session.close()
+
+    def test_get_shard_index(self):
+        """
+        Test that objects are placed by a hash of their IDs that does not
+        change between calls.
+        """
+        self.assertEqual(
+            self.store.get_shard_index('a'),
+            self.store.get_shard_index(u'a')
+        )
+        indexes = set(
+            self.store.get_shard_index(str(i)) for i in range(100)
+        )
+        self.assertEqual(set([0, 1, 2]), indexes)
+
+    def test_commit(self):
+        """
+        Test that committed objects are written to their own shards only,
+        and read back through any session.
+        """
+        ids = self._add_keys(20)
+
+        for uid in ids:
+            self.assertEqual(
+                uid,
+                self._get_shard_object(uid).unique_identifier
+            )
+            for index, shard in enumerate(self.store.shards):
+                if index != self.store.get_shard_index(uid):
+                    self.assertRaises(
+                        KeyError,
+                        shard.get_object,
+                        shard.open_session(),
+                        uid
+                    )
+
+        session = self.store.open_session()
+        managed_object = self.store.get_object(session, ids[0])
+        self.assertEqual(['key0'], managed_object.names)
+        found = self.store.get_objects(
+            session,
+            ids + ['missing'],
+            load_secret=True
+        )
+        self.assertEqual(set(ids), set(found.keys()))
+        self.assertEqual(16, len(found[ids[1]].value))
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            'missing'
+        )
+        session.close()
+
+    def test_session_changes(self):
+        """
+        Test that a session sees its own changes before they are committed,
+        and that savepoints and rollbacks discard them.
+        """
+        uid = self._add_keys(1)[0]
+        keys = self._build_keys(2)
+
+        session = self.store.open_session()
+        self.store.add_objects(session, keys[:1])
+        savepoint = session.begin_nested()
+        self.store.add_objects(session, keys[1:])
+        self.store.delete_object(session, uid)
+
+        self.assertIs(
+            keys[1],
+            self.store.get_object(session, keys[1].unique_identifier)
+        )
+        self.assertRaises(KeyError, self.store.get_object, session, uid)
+        self.assertEqual(
+            [keys[1].unique_identifier],
+            list(self.store.get_objects(
+                session,
+                [uid, keys[1].unique_identifier]
+            ).keys())
+        )
+
+        other_session = self.store.open_session()
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            other_session,
+            keys[0].unique_identifier
+        )
+        other_session.close()
+
+        savepoint.rollback()
+        self.assertIsNotNone(self.store.get_object(session, uid))
+        session.commit()
+        session.close()
+
+        self.assertIsNotNone(
+            self._get_shard_object(keys[0].unique_identifier)
+        )
+        self.assertRaises(
+            KeyError,
+            self._get_shard_object,
+            keys[1].unique_identifier
+        )
+
+        session = self.store.open_session()
+        self.store.add_objects(session, self._build_keys(1))
+        self.store.delete_object(session, uid)
+        session.rollback()
+        session.commit()
+        self.assertIsNotNone(self.store.get_object(session, uid))
+        session.close()
+
+    def test_delete_object(self):
+        """
+        Test that a deleted object is removed from its shard, and that an
+        object added and deleted in the same session is never written.
+        """
+        uid = self._add_keys(1)[0]
+        key = self._build_keys(1)[0]
+
+        session = self.store.open_session()
+        self.store.delete_object(session, uid)
+        self.store.add_objects(session, [key])
+        self.store.delete_object(session, key.unique_identifier)
+        session.commit()
+        session.close()
+
+        self.assertRaises(KeyError, self._get_shard_object, uid)
+        self.assertRaises(
+            KeyError,
+            self._get_shard_object,
+            key.unique_identifier
+        )
+
+    def test_locate(self):
+        """
+        Test that Locate merges the IDs found in every shard and in the
+        session in order, before applying the offset and limit.
+        """
+        ids = sorted(self._add_keys(10))
+        self._add_keys(3, owner='other')
+        keys = self._build_keys(2)
+
+        session = self.store.open_session()
+        self.store.add_objects(session, keys)
+        self.store.delete_object(session, ids[0])
+        ids = sorted(ids[1:] + [x.unique_identifier for x in keys])
+
+        criteria = store.LocateCriteria(owner='test')
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'], True)
+        self.assertEqual(ids, self.store.locate(session, criteria))
+        self.assertEqual(
+            ids[2:4],
+            self.store.locate(session, criteria, after=ids[1], limit=2)
+        )
+        self.assertEqual(
+            ids[4:7],
+            self.store.locate(session, criteria, offset=4, limit=3)
+        )
+        self.assertEqual(
+            ids[9:],
+            self.store.locate(session, criteria, offset=9)
+        )
+
+        criteria.names.append('key1')
+        self.assertEqual(
+            sorted(
+                [x for x in ids if x != keys[0].unique_identifier and
+                 self.store.get_object(session, x).names == ['key1']]
+            ),
+            self.store.locate(session, criteria)
+        )
+        session.close()
+
+    def test_changes(self):
+        """
+        Test that change records are written to the first shard when the
+        session is committed.
+        """
+        session = self.store.open_session()
+        self.assertEqual(0, self.store.get_last_change(session))
+
+        self.store.record_change(session, '5', 10.0, 0.0)
+        savepoint = session.begin_nested()
+        self.store.record_change(session, '6', 20.0, 0.0)
+        savepoint.rollback()
+        self.assertEqual(0, self.store.get_last_change(session))
+        session.commit()
+
+        last_change = self.store.get_last_change(session)
+        self.assertEqual(
+            [(last_change, '5')],
+            self.store.get_changes(session, 0)
+        )
+        shard = self.store.shards[0]
+        self.assertEqual(
+            [(last_change, '5')],
+            shard.get_changes(shard.open_session(), 0)
+        )
+        session.close()
+
+    def test_commit_locks(self):
+        """
+        Test that a commit takes the locks of the shards it writes to in
+        shard order, and that a shard refusing its changes leaves every
+        shard untouched.
+        """
+        calls = list()
+        for index in range(len(self.store.locks)):
+            lock = mock.MagicMock()
+            lock.acquire.side_effect = lambda i=index: calls.append(
+                ('acquire', i)
+            )
+            lock.release.side_effect = lambda i=index: calls.append(
+                ('release', i)
+            )
+            self.store.locks[index] = lock
+
+        keys = self._build_keys(20)
+        session = self.store.open_session()
+        self.store.add_objects(session, keys)
+        session.commit()
+        session.close()
+
+        indexes = sorted(set(
+            self.store.get_shard_index(x.unique_identifier) for x in keys
+        ))
+        self.assertEqual(
+            [('acquire', x) for x in indexes] +
+            [('release', x) for x in reversed(indexes)],
+            calls
+        )
+
+        keys = self._build_keys(20)
+        session = self.store.open_session()
+        self.store.add_objects(session, keys)
+        with mock.patch.object(
+                self.store.shards[-1],
+                'insert_objects',
+                side_effect=sqlalchemy.exc.IntegrityError('', {}, None)):
+            self.assertRaises(sqlalchemy.exc.IntegrityError, session.commit)
+        session.rollback()
+        session.close()
+
+        for key in keys:
+            self.assertRaises(
+                KeyError,
+                self._get_shard_object,
+                key.unique_identifier
+            )
+
+    def test_scatter(self):
+        """
+        Test that scattered calls return their results in order, run in the
+        calling thread and the reused executor threads, and that an error
+        raised by any call is raised again.
+        """
+        executor = futures.ThreadPoolExecutor(max_workers=2)
+        self.addCleanup(executor.shutdown)
+        threads = set()
+
+        def double(x):
+            threads.add(threading.current_thread())
+            return x * 2
+
+        for _ in range(5):
+            self.assertEqual(
+                [0, 2, 4, 6],
+                sharded_store._scatter(executor, double, [0, 1, 2, 3])
+            )
+        self.assertIn(threading.current_thread(), threads)
+        self.assertLessEqual(len(threads), 3)
+
+        def fail(x):
+            if x == 2:
+                raise ValueError(x)
+            return x
+
+        for arguments in ([0, 1, 2, 3], [2, 1]):
+            self.assertRaises(
+                ValueError,
+                sharded_store._scatter,
+                executor,
+                fail,
+                arguments
+            )
+
+    def test_close(self):
+        """
+        Test that closing the store stops its query threads.
+        """
+        self.store.close()
+        self.assertRaises(
+            RuntimeError,
+            self.store._executor.submit,
+            lambda: None
+        )
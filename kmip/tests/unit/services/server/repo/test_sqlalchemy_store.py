@@ -0,0 +1,254 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import sqlalchemy
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server.repo import sqlalchemy_store
+from kmip.services.server.repo import store
+
+
+class TestSqlAlchemyStore(testtools.TestCase):
+    """
+    Test suite for the SQLAlchemy object store.
+    """
+
+    def setUp(self):
+        super(TestSqlAlchemyStore, self).setUp()
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        sqltypes.Base.metadata.create_all(self.engine)
+        self.store = sqlalchemy_store.SqlAlchemyStore(self.engine)
+
+    def tearDown(self):
+        super(TestSqlAlchemyStore, self).tearDown()
+
+    def _count_queries(self):
+        statements = list()
+        sqlalchemy.event.listen(
+            self.engine,
+            'before_cursor_execute',
+            lambda *args: statements.append(args[2])
+        )
+        return statements
+
+    def _add_keys(self, *specs):
+        session = self.store.open_session()
+        keys = list()
+        for length, owner, policy_name, name in specs:
+            key = objects.SymmetricKey(
+                enums.CryptographicAlgorithm.AES,
+                length,
+                b'\x00' * (length // 8),
+                name=name
+            )
+            key._owner = owner
+            key.operation_policy_name = policy_name
+            keys.append(key)
+        self.store.add_objects(session, keys)
+        session.commit()
+        identifiers = [x.unique_identifier for x in keys]
+        session.close()
+        return identifiers
+
+    def test_get_object(self):
+        """
+        Test that an object is read as an instance of its own class, with
+        its secret only if asked for, and that a KeyError is raised for
+        missing objects.
+        """
+        uid = self._add_keys((128, 'test', 'default', 'key'))[0]
+        statements = self._count_queries()
+
+        session = self.store.open_session()
+        managed_object = self.store.get_object(session, str(uid))
+        self.assertIsInstance(managed_object, objects.SymmetricKey)
+        self.assertNotIn('value', managed_object.__dict__)
+        self.assertEqual(['key'], managed_object.names)
+        self.assertEqual(1, len(statements))
+        session.close()
+
+        session = self.store.open_session()
+        managed_object = self.store.get_object(
+            session,
+            str(uid),
+            load_secret=True
+        )
+        self.assertEqual(b'\x00' * 16, managed_object.__dict__['value'])
+
+        self.assertRaises(
+            KeyError,
+            self.store.get_object,
+            session,
+            'missing'
+        )
+        session.close()
+
+    def test_get_objects(self):
+        """
+        Test that many objects are read with their names by a number of
+        queries that does not depend on the number of objects.
+        """
+        ids = self._add_keys(
+            (128, 'test', 'default', 'a'),
+            (256, 'test', 'default', 'b'),
+            (128, 'other', 'default', 'c')
+        )
+        session = self.store.open_session()
+        managed_object = self.store.get_object(session, str(ids[0]))
+        managed_object.names.append('d')
+        session.commit()
+        session.close()
+
+        statements = self._count_queries()
+        session = self.store.open_session()
+        found = self.store.get_objects(
+            session,
+            [str(x) for x in ids] + ['missing'],
+            load_secret=True
+        )
+        self.assertEqual(set(str(x) for x in ids), set(found.keys()))
+        self.assertEqual(
+            [['a', 'd'], ['b'], ['c']],
+            [found[str(x)].names for x in ids]
+        )
+        self.assertEqual(b'\x00' * 32, found[str(ids[1])].value)
+        self.assertEqual(2, len(statements))
+        session.close()
+
+        del statements[:]
+        session = self.store.open_session()
+        with mock.patch.object(sqlalchemy_store, '_CHUNK_SIZE', 2):
+            found = self.store.get_objects(session, [str(x) for x in ids])
+        self.assertEqual(3, len(found))
+        self.assertEqual(4, len(statements))
+        session.close()
+
+    def test_detach(self):
+        """
+        Test that a detached object outlives its session without its secret.
+        """
+        uid = self._add_keys((128, 'test', 'default', 'key'))[0]
+
+        session = self.store.open_session()
+        managed_object = self.store.get_object(
+            session,
+            str(uid),
+            load_secret=True
+        )
+        self.store.detach(session, managed_object)
+        session.commit()
+        session.close()
+
+        self.assertEqual(uid, managed_object.unique_identifier)
+        self.assertIsNone(managed_object.value)
+        self.assertIsNone(managed_object._encoded_secret)
+
+    def test_delete_object(self):
+        """
+        Test that a deleted object is gone along with its names.
+        """
+        uid = self._add_keys((128, 'test', 'default', 'key'))[0]
+
+        session = self.store.open_session()
+        self.store.delete_object(session, str(uid))
+        session.commit()
+
+        self.assertRaises(KeyError, self.store.get_object, session, str(uid))
+        self.assertEqual(
+            0,
+            session.query(objects.ManagedObject).count()
+        )
+        session.close()
+
+    def test_locate(self):
+        """
+        Test that Locate applies every criterion in the query.
+        """
+        ids = self._add_keys(
+            (128, 'test', 'default', 'a'),
+            (256, 'test', 'default', 'b'),
+            (128, 'other', 'default', 'a'),
+            (128, 'other', 'shared', 'a')
+        )
+        session = self.store.open_session()
+
+        criteria = store.LocateCriteria(owner='test')
+        self.assertEqual([], self.store.locate(session, criteria))
+
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'], True)
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['shared'])
+        self.assertEqual(
+            [ids[0], ids[1], ids[3]],
+            self.store.locate(session, criteria)
+        )
+        self.assertEqual(
+            [ids[1]],
+            self.store.locate(session, criteria, after=ids[0], limit=1)
+        )
+        self.assertEqual(
+            [ids[3]],
+            self.store.locate(session, criteria, offset=2)
+        )
+
+        criteria.names.append('a')
+        criteria.cryptographic_algorithms.append(
+            enums.CryptographicAlgorithm.AES
+        )
+        criteria.cryptographic_lengths.append(128)
+        self.assertEqual(
+            [ids[0], ids[3]],
+            self.store.locate(session, criteria)
+        )
+
+        criteria.operation_policy_names.append('shared')
+        self.assertEqual([ids[3]], self.store.locate(session, criteria))
+        session.close()
+
+    def test_changes(self):
+        """
+        Test that change records are written in order and pruned once
+        expired.
+        """
+        session = self.store.open_session()
+        self.assertEqual(0, self.store.get_last_change(session))
+
+        self.store.record_change(session, '5', 10.0, 0.0)
+        self.store.record_change(session, '6', 20.0, 0.0)
+        session.commit()
+
+        last_change = self.store.get_last_change(session)
+        self.assertEqual(
+            [(last_change - 1, '5'), (last_change, '6')],
+            self.store.get_changes(session, 0)
+        )
+        self.assertEqual(
+            [(last_change, '6')],
+            self.store.get_changes(session, last_change - 1)
+        )
+
+        self.store.record_change(session, '7', 30.0, 15.0)
+        session.commit()
+        self.assertEqual(
+            ['6', '7'],
+            [x[1] for x in self.store.get_changes(session, 0)]
+        )
+        session.close()
@@ -0,0 +1,248 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+
+from kmip.services.server.repo import store
+
+
+class TestLocateCriteria(testtools.TestCase):
+    """
+    Test suite for the store-independent Locate search.
+    """
+
+    def setUp(self):
+        super(TestLocateCriteria, self).setUp()
+
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x00' * 16,
+            name='key'
+        )
+        key.unique_identifier = 1
+        key.operation_policy_name = 'default'
+        key._owner = 'test'
+        self.key = store.get_locate_entry(key)
+
+        opaque = objects.OpaqueObject(b'', enums.OpaqueDataType.NONE)
+        opaque.unique_identifier = 2
+        opaque.operation_policy_name = 'default'
+        self.opaque = store.get_locate_entry(opaque)
+
+    def tearDown(self):
+        super(TestLocateCriteria, self).tearDown()
+
+    def test_get_locate_entry(self):
+        """
+        Test that a LocateEntry holds the attributes Locate searches by, and
+        no algorithm or length for objects other than keys.
+        """
+        self.assertEqual(
+            store.LocateEntry(
+                1,
+                enums.ObjectType.SYMMETRIC_KEY,
+                'default',
+                'test',
+                ('key', ),
+                enums.CryptographicAlgorithm.AES,
+                128
+            ),
+            self.key
+        )
+        self.assertIsNone(self.opaque.cryptographic_algorithm)
+        self.assertIsNone(self.opaque.cryptographic_length)
+
+    def test_matches_permissions(self):
+        """
+        Test that an entry only matches if a permission covers its type and
+        policy, and its owner for owner-only permissions.
+        """
+        criteria = store.LocateCriteria(owner='test')
+        self.assertFalse(criteria.matches(self.key))
+
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'], True)
+        self.assertTrue(criteria.matches(self.key))
+        self.assertFalse(criteria.matches(self.opaque))
+
+        criteria.owner = 'other'
+        self.assertFalse(criteria.matches(self.key))
+
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['shared'])
+        self.assertFalse(criteria.matches(self.opaque))
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['default'])
+        self.assertTrue(criteria.matches(self.opaque))
+
+    def test_matches_attributes(self):
+        """
+        Test that an entry must match every attribute of the search.
+        """
+        criteria = store.LocateCriteria()
+        criteria.permit(enums.ObjectType.SYMMETRIC_KEY, ['default'])
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['default'])
+
+        criteria.names.append('key')
+        self.assertTrue(criteria.matches(self.key))
+        self.assertFalse(criteria.matches(self.opaque))
+        criteria.names = list()
+
+        criteria.cryptographic_algorithms.append(
+            enums.CryptographicAlgorithm.AES
+        )
+        criteria.cryptographic_lengths.append(128)
+        self.assertTrue(criteria.matches(self.key))
+        self.assertFalse(criteria.matches(self.opaque))
+        criteria.cryptographic_lengths.append(256)
+        self.assertFalse(criteria.matches(self.key))
+        criteria.cryptographic_algorithms = list()
+        criteria.cryptographic_lengths = list()
+
+        criteria.operation_policy_names.append('default')
+        self.assertTrue(criteria.matches(self.opaque))
+        criteria.operation_policy_names.append('shared')
+        self.assertFalse(criteria.matches(self.opaque))
+
+
+class TestEncodeObject(testtools.TestCase):
+    """
+    Test suite for the encoding of objects kept outside SQLAlchemy.
+    """
+
+    def setUp(self):
+        super(TestEncodeObject, self).setUp()
+
+    def tearDown(self):
+        super(TestEncodeObject, self).tearDown()
+
+    def test_round_trip(self):
+        """
+        Test that a decoded object equals the encoded one, and only holds
+        the secret it is given.
+        """
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            masks=[enums.CryptographicUsageMask.ENCRYPT],
+            name='key'
+        )
+        key.names.append('alias')
+        key.unique_identifier = 7
+        key.operation_policy_name = 'default'
+        key._owner = 'test'
+
+        data = store.encode_object(key)
+        self.assertNotIn(b'\x01' * 16, data)
+
+        decoded = store.decode_object(data, b'\x01' * 16, b'\x02')
+        self.assertIsInstance(decoded, objects.SymmetricKey)
+        self.assertEqual(key, decoded)
+        self.assertEqual(7, decoded.unique_identifier)
+        self.assertEqual(['key', 'alias'], decoded.names)
+        self.assertEqual(
+            [enums.CryptographicUsageMask.ENCRYPT],
+            decoded.cryptographic_usage_masks
+        )
+        self.assertEqual('test', decoded._owner)
+        self.assertEqual(b'\x02', decoded._encoded_secret)
+
+        decoded = store.decode_object(data)
+        self.assertIsNone(decoded.value)
+
+
+class TestStoreSession(testtools.TestCase):
+    """
+    Test suite for the sessions of buffered stores.
+    """
+
+    def setUp(self):
+        super(TestStoreSession, self).setUp()
+
+    def tearDown(self):
+        super(TestStoreSession, self).tearDown()
+
+    def test_savepoint(self):
+        """
+        Test that rolling back a savepoint only drops the changes made after
+        it, and that committing writes the remaining changes once.
+        """
+        buffered_store = mock.MagicMock()
+        session = store.StoreSession(buffered_store)
+        a = mock.MagicMock()
+        b = mock.MagicMock()
+
+        session.changes.append(('1', a))
+        savepoint = session.begin_nested()
+        session.changes.append(('2', b))
+        session.changes.append(('1', None))
+        self.assertEqual((True, None), session.find('1'))
+
+        savepoint.rollback()
+        self.assertEqual((True, a), session.find('1'))
+        self.assertEqual((False, None), session.find('2'))
+
+        session.commit()
+        buffered_store.apply_changes.assert_called_once_with([('1', a)])
+        self.assertEqual([], session.changes)
+
+        session.commit()
+        self.assertEqual(1, buffered_store.apply_changes.call_count)
+
+    def test_rollback(self):
+        """
+        Test that rolling back or closing a session drops its changes.
+        """
+        buffered_store = mock.MagicMock()
+        session = store.StoreSession(buffered_store)
+
+        session.changes.append(('1', mock.MagicMock()))
+        session.rollback()
+        session.changes.append(('2', mock.MagicMock()))
+        session.close()
+        session.commit()
+
+        buffered_store.apply_changes.assert_not_called()
+
+
+class TestApplyDefaults(testtools.TestCase):
+    """
+    Test suite for the column defaults of new objects.
+    """
+
+    def setUp(self):
+        super(TestApplyDefaults, self).setUp()
+
+    def tearDown(self):
+        super(TestApplyDefaults, self).tearDown()
+
+    def test_apply_defaults(self):
+        """
+        Test that unset attributes get their column defaults and set ones
+        are kept.
+        """
+        opaque = objects.OpaqueObject(b'', enums.OpaqueDataType.NONE)
+        self.assertIsNone(opaque.operation_policy_name)
+
+        store.apply_defaults(opaque)
+        self.assertEqual('default', opaque.operation_policy_name)
+
+        opaque.operation_policy_name = 'shared'
+        store.apply_defaults(opaque)
+        self.assertEqual('shared', opaque.operation_policy_name)
@@ -0,0 +1,313 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+import threading
+import time
+
+from kmip.core import enums
+from kmip.core import exceptions
+
+from kmip.services.server import asynchronous
+
+
+class TestAsynchronousOperationManager(testtools.TestCase):
+    """
+    Test suite for the AsynchronousOperationManager.
+    """
+
+    def setUp(self):
+        super(TestAsynchronousOperationManager, self).setUp()
+
+    def tearDown(self):
+        super(TestAsynchronousOperationManager, self).tearDown()
+
+    def wait_for(self, job):
+        for _ in range(100):
+            if job.state == asynchronous.AsynchronousOperation.COMPLETED:
+                return
+            time.sleep(0.05)
+        self.fail("Asynchronous operation did not complete.")
+
+    def test_submit(self):
+        """
+        Test that a submitted operation is processed in the background and
+        its result retained.
+        """
+        result = (enums.ResultStatus.SUCCESS, None, None, 'payload')
+        processor = mock.MagicMock(return_value=result)
+        manager = asynchronous.AsynchronousOperationManager(
+            processor,
+            workers=1
+        )
+
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            'payload',
+            'protocol_version',
+            'test'
+        )
+        job = manager.get(correlation_value, 'test')
+        self.wait_for(job)
+
+        processor.assert_called_once_with(job)
+        self.assertEqual(result, job.result)
+        self.assertIsNone(job.payload)
+        self.assertIsNone(job.protocol_version)
+
+    def test_submit_with_failure(self):
+        """
+        Test that an unexpected processing error is stored as a failed result.
+        """
+        processor = mock.MagicMock(side_effect=Exception("bad"))
+        manager = asynchronous.AsynchronousOperationManager(
+            processor,
+            workers=1
+        )
+        manager._logger = mock.MagicMock()
+
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            None,
+            None,
+            'test'
+        )
+        job = manager.get(correlation_value, 'test')
+        self.wait_for(job)
+
+        self.assertEqual(enums.ResultStatus.OPERATION_FAILED, job.result[0])
+        self.assertEqual(enums.ResultReason.GENERAL_FAILURE, job.result[1])
+        manager._logger.warning.assert_called_once_with(
+            "Error occurred while processing asynchronous operation."
+        )
+
+    def test_get_with_other_owner(self):
+        """
+        Test that an operation is not visible to other clients.
+        """
+        manager = asynchronous.AsynchronousOperationManager(mock.MagicMock())
+        manager._start_workers = mock.MagicMock()
+
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            None,
+            None,
+            'test'
+        )
+
+        self.assertIsNotNone(manager.get(correlation_value, 'test'))
+        self.assertIsNone(manager.get(correlation_value, 'other'))
+        self.assertIsNone(manager.get(b'unknown', 'test'))
+
+    def test_get_expired(self):
+        """
+        Test that finished operations are discarded after the result TTL, in
+        the order they finished.
+        """
+        manager = asynchronous.AsynchronousOperationManager(
+            mock.MagicMock(),
+            result_ttl=10
+        )
+        manager._start_workers = mock.MagicMock()
+
+        correlation_values = list()
+        for i in range(2):
+            with mock.patch('time.time', return_value=1000.0 + i):
+                correlation_values.append(manager.submit(
+                    enums.Operation.CREATE,
+                    None,
+                    None,
+                    'test'
+                ))
+                manager.cancel(correlation_values[-1], 'test')
+
+        with mock.patch('time.time', return_value=1005.0):
+            self.assertIsNotNone(manager.get(correlation_values[0], 'test'))
+            self.assertIsNotNone(manager.get(correlation_values[1], 'test'))
+        with mock.patch('time.time', return_value=1010.5):
+            self.assertIsNone(manager.get(correlation_values[0], 'test'))
+            self.assertIsNotNone(manager.get(correlation_values[1], 'test'))
+        with mock.patch('time.time', return_value=1020.0):
+            self.assertIsNone(manager.get(correlation_values[1], 'test'))
+        self.assertEqual(0, len(manager._expiry))
+
+    def test_submit_limits(self):
+        """
+        Test that submissions fail once the queue is full or the client has
+        reached its limit, and succeed again once operations are dequeued.
+        """
+        manager = asynchronous.AsynchronousOperationManager(
+            mock.MagicMock(),
+            queue_size=3,
+            client_limit=2
+        )
+        manager._start_workers = mock.MagicMock()
+
+        manager.submit(enums.Operation.CREATE, None, None, 'a')
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            None,
+            None,
+            'a'
+        )
+        e = self.assertRaises(
+            exceptions.KmipError,
+            manager.submit,
+            enums.Operation.CREATE,
+            None,
+            None,
+            'a'
+        )
+        self.assertEqual(enums.ResultStatus.OPERATION_FAILED, e.status)
+        self.assertEqual(enums.ResultReason.GENERAL_FAILURE, e.reason)
+        self.assertEqual(
+            "The client has too many asynchronous operations queued. Retry "
+            "the operation later.",
+            str(e)
+        )
+
+        manager.submit(enums.Operation.CREATE, None, None, 'b')
+        e = self.assertRaises(
+            exceptions.KmipError,
+            manager.submit,
+            enums.Operation.CREATE,
+            None,
+            None,
+            'c'
+        )
+        self.assertEqual(
+            "Too many asynchronous operations are queued. Retry the "
+            "operation later.",
+            str(e)
+        )
+
+        # Test that a canceled operation counts against the limits until a
+        # worker takes it off the queue.
+        manager.cancel(correlation_value, 'a')
+        self.assertRaises(
+            exceptions.KmipError,
+            manager.submit,
+            enums.Operation.CREATE,
+            None,
+            None,
+            'c'
+        )
+
+        processed = threading.Event()
+
+        def process(job):
+            processed.set()
+            return (enums.ResultStatus.SUCCESS, None, None, None)
+        manager._processor = mock.MagicMock(side_effect=process)
+        manager._workers = 1
+        del manager._start_workers
+        manager._start_workers()
+
+        self.assertTrue(processed.wait(5))
+        for _ in range(100):
+            with manager._lock:
+                if manager._queued_count == 0:
+                    break
+            time.sleep(0.05)
+        self.assertEqual(0, manager._queued_count)
+        self.assertEqual({}, manager._client_counts)
+        manager.submit(enums.Operation.CREATE, None, None, 'a')
+        manager.submit(enums.Operation.CREATE, None, None, 'a')
+
+    def test_cancel(self):
+        """
+        Test the cancellation results for operations in each state.
+        """
+        manager = asynchronous.AsynchronousOperationManager(mock.MagicMock())
+        manager._start_workers = mock.MagicMock()
+
+        self.assertEqual(
+            enums.CancellationResult.UNAVAILABLE,
+            manager.cancel(b'unknown', 'test')
+        )
+
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            None,
+            None,
+            'test'
+        )
+        job = manager.get(correlation_value, 'test')
+
+        self.assertEqual(
+            enums.CancellationResult.UNAVAILABLE,
+            manager.cancel(correlation_value, 'other')
+        )
+        self.assertEqual(
+            enums.CancellationResult.CANCELED,
+            manager.cancel(correlation_value, 'test')
+        )
+        self.assertEqual(asynchronous.AsynchronousOperation.CANCELED,
+                         job.state)
+        self.assertIsNotNone(job.completed_at)
+
+        job.state = asynchronous.AsynchronousOperation.PROCESSING
+        self.assertEqual(
+            enums.CancellationResult.UNABLE_TO_CANCEL,
+            manager.cancel(correlation_value, 'test')
+        )
+
+        job.state = asynchronous.AsynchronousOperation.COMPLETED
+        job.completed_at = time.time()
+        job.result = (enums.ResultStatus.SUCCESS, None, None, None)
+        self.assertEqual(
+            enums.CancellationResult.COMPLETED,
+            manager.cancel(correlation_value, 'test')
+        )
+
+        job.result = (enums.ResultStatus.OPERATION_FAILED, None, None, None)
+        self.assertEqual(
+            enums.CancellationResult.FAILED,
+            manager.cancel(correlation_value, 'test')
+        )
+
+    def test_canceled_operation_is_not_processed(self):
+        """
+        Test that a worker skips an operation canceled before it started.
+        """
+        event = threading.Event()
+        processor = mock.MagicMock()
+        manager = asynchronous.AsynchronousOperationManager(
+            processor,
+            workers=1
+        )
+        manager._start_workers = mock.MagicMock()
+
+        correlation_value = manager.submit(
+            enums.Operation.CREATE,
+            None,
+            None,
+            'test'
+        )
+        manager.cancel(correlation_value, 'test')
+
+        def process(job):
+            event.set()
+            return (enums.ResultStatus.SUCCESS, None, None, None)
+        processor.side_effect = process
+
+        second = manager.submit(enums.Operation.CREATE, None, None, 'test')
+        del manager._start_workers
+        manager._start_workers()
+
+        self.assertTrue(event.wait(5))
+        self.assertEqual(1, processor.call_count)
+        self.assertEqual(second, processor.call_args[0][0].correlation_value)
@@ -0,0 +1,141 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import sqlalchemy
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import bulk
+
+
+class TestInsertManagedObjects(testtools.TestCase):
+    """
+    Test suite for the bulk insertion of managed objects.
+    """
+
+    def setUp(self):
+        super(TestInsertManagedObjects, self).setUp()
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        sqltypes.Base.metadata.create_all(self.engine)
+        self.session_factory = sqlalchemy.orm.sessionmaker(
+            bind=self.engine
+        )
+
+    def tearDown(self):
+        super(TestInsertManagedObjects, self).tearDown()
+
+    def test_insert_managed_objects(self):
+        """
+        Test that objects of different types are inserted with their
+        attributes and names, and that each gets a new unique identifier.
+        """
+        key = objects.SymmetricKey(
+            enums.CryptographicAlgorithm.AES,
+            128,
+            b'\x01' * 16,
+            masks=[enums.CryptographicUsageMask.ENCRYPT],
+            name='key'
+        )
+        key.names.append('alias')
+        key._owner = 'test'
+        opaque = objects.OpaqueObject(
+            b'\x02',
+            enums.OpaqueDataType.NONE,
+            name='opaque'
+        )
+
+        with self.engine.begin() as connection:
+            bulk.insert_managed_objects(connection, [key, opaque])
+
+        self.assertIsNotNone(key.unique_identifier)
+        self.assertIsNotNone(opaque.unique_identifier)
+        self.assertNotEqual(key.unique_identifier, opaque.unique_identifier)
+
+        session = self.session_factory()
+        stored_key = session.query(objects.SymmetricKey).filter(
+            objects.ManagedObject.unique_identifier == key.unique_identifier
+        ).one()
+        stored_opaque = session.query(objects.OpaqueObject).filter(
+            objects.ManagedObject.unique_identifier ==
+            opaque.unique_identifier
+        ).one()
+
+        self.assertEqual(key, stored_key)
+        self.assertEqual(['key', 'alias'], stored_key.names)
+        self.assertEqual(
+            [enums.CryptographicUsageMask.ENCRYPT],
+            stored_key.cryptographic_usage_masks
+        )
+        self.assertEqual('test', stored_key._owner)
+        self.assertEqual('default', stored_key.operation_policy_name)
+        self.assertEqual(opaque, stored_opaque)
+        self.assertEqual(['opaque'], stored_opaque.names)
+        session.close()
+
+    def test_insert_managed_objects_executemany(self):
+        """
+        Test that the rows of each table are inserted by a single statement,
+        and that objects with a unique identifier keep it.
+        """
+        opaques = [
+            objects.OpaqueObject(
+                b'\x01',
+                enums.OpaqueDataType.NONE,
+                name=str(i)
+            )
+            for i in range(3)
+        ]
+        opaques[0].unique_identifier = 'opaque'
+
+        statements = list()
+        sqlalchemy.event.listen(
+            self.engine,
+            'before_cursor_execute',
+            lambda *args: statements.append(args[2])
+        )
+        with self.engine.begin() as connection:
+            bulk.insert_managed_objects(connection, opaques)
+
+        self.assertEqual(3, len(statements))
+        self.assertEqual('opaque', opaques[0].unique_identifier)
+
+        session = self.session_factory()
+        self.assertEqual(
+            ['0', '1', '2'],
+            [
+                session.query(objects.OpaqueObject).filter(
+                    objects.ManagedObject.unique_identifier ==
+                    x.unique_identifier
+                ).one().names[0]
+                for x in opaques
+            ]
+        )
+        session.close()
+
+    def test_insert_managed_objects_empty(self):
+        """
+        Test that inserting no objects issues no statements.
+        """
+        with self.engine.begin() as connection:
+            bulk.insert_managed_objects(connection, [])
+
+        session = self.session_factory()
+        self.assertEqual(0, session.query(objects.ManagedObject).count())
+        session.close()
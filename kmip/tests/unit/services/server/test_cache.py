@@ -0,0 +1,200 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import testtools
+
+from kmip.services.server import cache
+
+
+class TestManagedObjectCache(testtools.TestCase):
+    """
+    Test suite for the ManagedObjectCache.
+    """
+
+    def setUp(self):
+        super(TestManagedObjectCache, self).setUp()
+
+    def tearDown(self):
+        super(TestManagedObjectCache, self).tearDown()
+
+    def test_get(self):
+        """
+        Test that a cached object is returned with a copy of its secret.
+        """
+        c = cache.ManagedObjectCache()
+        c.synchronize(0)
+
+        self.assertIsNone(c.get('1'))
+
+        c.put('1', 'object', b'\x01\x02', 0)
+        managed_object, secret, encoding = c.get('1')
+
+        self.assertEqual('object', managed_object)
+        self.assertEqual(b'\x01\x02', secret)
+        self.assertIsInstance(secret, bytes)
+        self.assertIsNone(encoding)
+        self.assertEqual(1, len(c))
+
+    def test_get_encoding(self):
+        """
+        Test that a cached encoding is returned as a copy and zeroized with
+        its entry.
+        """
+        c = cache.ManagedObjectCache(max_secret_bytes=4)
+        c.synchronize(0)
+
+        c.put('1', 'object', b'\x01\x02', 0, encoding=b'\x03\x04')
+        entry = c._entries['1']
+        _, _, encoding = c.get('1')
+
+        self.assertEqual(b'\x03\x04', encoding)
+        self.assertIsInstance(encoding, bytes)
+        self.assertEqual(4, c._secret_bytes)
+
+        c.put('2', 'object', b'\x05', 0, encoding=b'\x06')
+
+        self.assertIsNone(c.get('1'))
+        self.assertEqual(bytearray(2), entry.encoding)
+        self.assertEqual(2, c._secret_bytes)
+
+    def test_get_expired(self):
+        """
+        Test that an expired object is discarded and zeroized.
+        """
+        c = cache.ManagedObjectCache(ttl=60)
+        c.synchronize(0)
+
+        with mock.patch('time.time', return_value=100):
+            c.put('1', 'object', b'\x01\x02', 0)
+        entry = c._entries['1']
+
+        with mock.patch('time.time', return_value=159):
+            self.assertIsNotNone(c.get('1'))
+        with mock.patch('time.time', return_value=160):
+            self.assertIsNone(c.get('1'))
+
+        self.assertEqual(bytearray(2), entry.secret)
+        self.assertEqual(0, len(c))
+
+    def test_put_evicts_least_recently_used(self):
+        """
+        Test that the least recently used object is evicted and zeroized
+        when the cache is full.
+        """
+        c = cache.ManagedObjectCache(max_entries=2)
+        c.synchronize(0)
+
+        c.put('1', 'a', b'\x01', 0)
+        c.put('2', 'b', b'\x02', 0)
+        entry = c._entries['2']
+        c.get('1')
+        c.put('3', 'c', b'\x03', 0)
+
+        self.assertIsNotNone(c.get('1'))
+        self.assertIsNone(c.get('2'))
+        self.assertIsNotNone(c.get('3'))
+        self.assertEqual(bytearray(1), entry.secret)
+
+    def test_put_memory_cap(self):
+        """
+        Test that objects are evicted to keep the cached secrets under the
+        memory cap, and that secrets larger than the cap are not cached.
+        """
+        c = cache.ManagedObjectCache(max_secret_bytes=4)
+        c.synchronize(0)
+
+        c.put('1', 'a', b'\x01' * 2, 0)
+        c.put('2', 'b', b'\x02' * 2, 0)
+        c.put('3', 'c', b'\x03' * 2, 0)
+
+        self.assertIsNone(c.get('1'))
+        self.assertIsNotNone(c.get('2'))
+        self.assertIsNotNone(c.get('3'))
+        self.assertEqual(4, c._secret_bytes)
+
+        c.put('4', 'd', b'\x04' * 5, 0)
+
+        self.assertIsNone(c.get('4'))
+        self.assertEqual(2, len(c))
+
+    def test_put_after_change(self):
+        """
+        Test that an object read before the last applied change is not
+        cached.
+        """
+        c = cache.ManagedObjectCache()
+        c.synchronize(1)
+
+        c.apply_changes([(2, '5')])
+        c.put('1', 'object', b'\x01', 1)
+
+        self.assertIsNone(c.get('1'))
+
+        c.put('1', 'object', b'\x01', 2)
+
+        self.assertIsNotNone(c.get('1'))
+
+    def test_invalidate(self):
+        """
+        Test that an invalidated object is removed and zeroized.
+        """
+        c = cache.ManagedObjectCache()
+        c.synchronize(0)
+
+        c.put('1', 'object', b'\x01\x02', 0)
+        entry = c._entries['1']
+        c.invalidate('1')
+        c.invalidate('2')
+
+        self.assertIsNone(c.get('1'))
+        self.assertEqual(bytearray(2), entry.secret)
+        self.assertEqual(0, c._secret_bytes)
+
+    def test_apply_changes(self):
+        """
+        Test that change records invalidate the objects they name and
+        advance the last applied change.
+        """
+        c = cache.ManagedObjectCache()
+        self.assertIsNone(c.last_change)
+        c.synchronize(3)
+
+        c.put('1', 'a', b'\x01', 3)
+        c.put('2', 'b', b'\x02', 3)
+        c.apply_changes([(4, '1'), (5, '7')])
+
+        self.assertIsNone(c.get('1'))
+        self.assertIsNotNone(c.get('2'))
+        self.assertEqual(5, c.last_change)
+
+        c.synchronize(4)
+        self.assertEqual(5, c.last_change)
+
+    def test_clear(self):
+        """
+        Test that clearing the cache zeroizes every secret.
+        """
+        c = cache.ManagedObjectCache()
+        c.synchronize(0)
+
+        c.put('1', 'a', b'\x01', 0)
+        c.put('2', 'b', b'\x02', 0)
+        entries = list(c._entries.values())
+        c.clear()
+
+        self.assertEqual(0, len(c))
+        for entry in entries:
+            self.assertEqual(bytearray(1), entry.secret)
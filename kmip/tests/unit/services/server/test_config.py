@@ -88,6 +88,132 @@ class TestKmipServerConfig(testtools.TestCase):
         c.set_setting('auth_suite', 'Basic')
         c._set_auth_suite.assert_called_once_with('Basic')
 
+        c._set_buffer_size = mock.MagicMock()
+        c.set_setting('buffer_size', 8192)
+        c._set_buffer_size.assert_called_once_with(8192)
+
+        c._set_max_buffer_size = mock.MagicMock()
+        c.set_setting('max_buffer_size', 65536)
+        c._set_max_buffer_size.assert_called_once_with(65536)
+
+        c._set_max_in_flight_requests = mock.MagicMock()
+        c.set_setting('max_in_flight_requests', 4)
+        c._set_max_in_flight_requests.assert_called_once_with(4)
+
+        c._set_asynchronous_workers = mock.MagicMock()
+        c.set_setting('asynchronous_workers', 4)
+        c._set_asynchronous_workers.assert_called_once_with(4)
+
+        c._set_asynchronous_result_ttl = mock.MagicMock()
+        c.set_setting('asynchronous_result_ttl', 60)
+        c._set_asynchronous_result_ttl.assert_called_once_with(60)
+
+        c._set_asynchronous_queue_size = mock.MagicMock()
+        c.set_setting('asynchronous_queue_size', 128)
+        c._set_asynchronous_queue_size.assert_called_once_with(128)
+
+        c._set_asynchronous_client_limit = mock.MagicMock()
+        c.set_setting('asynchronous_client_limit', 8)
+        c._set_asynchronous_client_limit.assert_called_once_with(8)
+
+        c._set_session_idle_timeout = mock.MagicMock()
+        c.set_setting('session_idle_timeout', 30)
+        c._set_session_idle_timeout.assert_called_once_with(30)
+
+        c._set_tcp_keepalive_idle = mock.MagicMock()
+        c.set_setting('tcp_keepalive_idle', 60)
+        c._set_tcp_keepalive_idle.assert_called_once_with(60)
+
+        c._set_max_sessions = mock.MagicMock()
+        c.set_setting('max_sessions', 100)
+        c._set_max_sessions.assert_called_once_with(100)
+
+        c._set_shutdown_timeout = mock.MagicMock()
+        c.set_setting('shutdown_timeout', 5)
+        c._set_shutdown_timeout.assert_called_once_with(5)
+
+        c._set_restart_socket_path = mock.MagicMock()
+        c.set_setting('restart_socket_path', '/tmp/pykmip.sock')
+        c._set_restart_socket_path.assert_called_once_with(
+            '/tmp/pykmip.sock'
+        )
+
+        c._set_policy_path = mock.MagicMock()
+        c.set_setting('policy_path', '/etc/pykmip/policies')
+        c._set_policy_path.assert_called_once_with('/etc/pykmip/policies')
+
+        c._set_policy_reload_interval = mock.MagicMock()
+        c.set_setting('policy_reload_interval', 30)
+        c._set_policy_reload_interval.assert_called_once_with(30)
+
+        c._set_object_cache_size = mock.MagicMock()
+        c.set_setting('object_cache_size', 100)
+        c._set_object_cache_size.assert_called_once_with(100)
+
+        c._set_object_cache_ttl = mock.MagicMock()
+        c.set_setting('object_cache_ttl', 30)
+        c._set_object_cache_ttl.assert_called_once_with(30)
+
+        c._set_object_cache_memory = mock.MagicMock()
+        c.set_setting('object_cache_memory', 65536)
+        c._set_object_cache_memory.assert_called_once_with(65536)
+
+        c._set_precompute_get_responses = mock.MagicMock()
+        c.set_setting('precompute_get_responses', True)
+        c._set_precompute_get_responses.assert_called_once_with(True)
+
+        c._set_database_url = mock.MagicMock()
+        c.set_setting('database_url', 'sqlite:////var/pykmip.db')
+        c._set_database_url.assert_called_once_with('sqlite:////var/pykmip.db')
+
+        c._set_database_pool_size = mock.MagicMock()
+        c.set_setting('database_pool_size', 10)
+        c._set_database_pool_size.assert_called_once_with(10)
+
+        c._set_database_max_overflow = mock.MagicMock()
+        c.set_setting('database_max_overflow', 20)
+        c._set_database_max_overflow.assert_called_once_with(20)
+
+        c._set_database_pool_pre_ping = mock.MagicMock()
+        c.set_setting('database_pool_pre_ping', True)
+        c._set_database_pool_pre_ping.assert_called_once_with(True)
+
+        c._set_sqlite_journal_mode = mock.MagicMock()
+        c.set_setting('sqlite_journal_mode', 'DELETE')
+        c._set_sqlite_journal_mode.assert_called_once_with('DELETE')
+
+        c._set_sqlite_synchronous = mock.MagicMock()
+        c.set_setting('sqlite_synchronous', 'FULL')
+        c._set_sqlite_synchronous.assert_called_once_with('FULL')
+
+        c._set_sqlite_busy_timeout = mock.MagicMock()
+        c.set_setting('sqlite_busy_timeout', 1000)
+        c._set_sqlite_busy_timeout.assert_called_once_with(1000)
+
+        c._set_sqlite_mmap_size = mock.MagicMock()
+        c.set_setting('sqlite_mmap_size', 268435456)
+        c._set_sqlite_mmap_size.assert_called_once_with(268435456)
+
+        c._set_identifier_format = mock.MagicMock()
+        c.set_setting('identifier_format', 'UUID')
+        c._set_identifier_format.assert_called_once_with('UUID')
+
+        c._set_database_replica_urls = mock.MagicMock()
+        c.set_setting('database_replica_urls', ['sqlite:////tmp/a.db'])
+        c._set_database_replica_urls.assert_called_once_with(
+            ['sqlite:////tmp/a.db']
+        )
+
+        c._set_database_replica_lag = mock.MagicMock()
+        c.set_setting('database_replica_lag', 10)
+        c._set_database_replica_lag.assert_called_once_with(10)
+
+        c._set_database_shard_urls = mock.MagicMock()
+        c.set_setting('database_shard_urls', ['sqlite:////tmp/a.db'])
+        c._set_database_shard_urls.assert_called_once_with(
+            ['sqlite:////tmp/a.db']
+        )
+
     def test_load_settings(self):
         """
         Test that the right calls are made and the right errors generated when
@@ -161,6 +287,103 @@ class TestKmipServerConfig(testtools.TestCase):
         c._set_ca_path.assert_called_once_with('/test/path/ca.crt')
         c._set_auth_suite.assert_called_once_with('Basic')
 
+        # Test that optional settings are parsed when present.
+        c._set_buffer_size = mock.MagicMock()
+        c._set_max_buffer_size = mock.MagicMock()
+        parser.set('server', 'buffer_size', '8192')
+        parser.set('server', 'max_buffer_size', '65536')
+        c._set_max_in_flight_requests = mock.MagicMock()
+        parser.set('server', 'max_in_flight_requests', '4')
+        c._set_session_idle_timeout = mock.MagicMock()
+        parser.set('server', 'session_idle_timeout', '30')
+        c._set_tcp_keepalive_idle = mock.MagicMock()
+        parser.set('server', 'tcp_keepalive_idle', '60')
+        c._set_max_sessions = mock.MagicMock()
+        parser.set('server', 'max_sessions', '100')
+        c._set_shutdown_timeout = mock.MagicMock()
+        parser.set('server', 'shutdown_timeout', '5')
+        c._set_restart_socket_path = mock.MagicMock()
+        parser.set('server', 'restart_socket_path', '/tmp/pykmip.sock')
+        c._set_policy_path = mock.MagicMock()
+        parser.set('server', 'policy_path', '/etc/pykmip/policies')
+        c._set_policy_reload_interval = mock.MagicMock()
+        parser.set('server', 'policy_reload_interval', '30')
+        c._set_object_cache_size = mock.MagicMock()
+        parser.set('server', 'object_cache_size', '100')
+        c._set_object_cache_ttl = mock.MagicMock()
+        parser.set('server', 'object_cache_ttl', '30')
+        c._set_object_cache_memory = mock.MagicMock()
+        parser.set('server', 'object_cache_memory', '65536')
+        c._set_precompute_get_responses = mock.MagicMock()
+        parser.set('server', 'precompute_get_responses', 'True')
+        c._set_database_url = mock.MagicMock()
+        parser.set('server', 'database_url', 'sqlite:////var/pykmip.db')
+        c._set_database_pool_size = mock.MagicMock()
+        parser.set('server', 'database_pool_size', '10')
+        c._set_database_max_overflow = mock.MagicMock()
+        parser.set('server', 'database_max_overflow', '20')
+        c._set_database_pool_pre_ping = mock.MagicMock()
+        parser.set('server', 'database_pool_pre_ping', 'True')
+        c._set_sqlite_journal_mode = mock.MagicMock()
+        parser.set('server', 'sqlite_journal_mode', 'DELETE')
+        c._set_sqlite_synchronous = mock.MagicMock()
+        parser.set('server', 'sqlite_synchronous', 'FULL')
+        c._set_sqlite_busy_timeout = mock.MagicMock()
+        parser.set('server', 'sqlite_busy_timeout', '1000')
+        c._set_sqlite_mmap_size = mock.MagicMock()
+        parser.set('server', 'sqlite_mmap_size', '268435456')
+        c._set_identifier_format = mock.MagicMock()
+        parser.set('server', 'identifier_format', 'UUID')
+        c._set_database_replica_urls = mock.MagicMock()
+        parser.set(
+            'server',
+            'database_replica_urls',
+            'sqlite:////tmp/a.db\n    sqlite:////tmp/b.db'
+        )
+        c._set_database_replica_lag = mock.MagicMock()
+        parser.set('server', 'database_replica_lag', '10')
+        c._set_database_shard_urls = mock.MagicMock()
+        parser.set(
+            'server',
+            'database_shard_urls',
+            'sqlite:////tmp/a.db sqlite:////tmp/b.db'
+        )
+
+        c._parse_settings(parser)
+
+        c._set_buffer_size.assert_called_once_with(8192)
+        c._set_max_buffer_size.assert_called_once_with(65536)
+        c._set_max_in_flight_requests.assert_called_once_with(4)
+        c._set_session_idle_timeout.assert_called_once_with(30)
+        c._set_tcp_keepalive_idle.assert_called_once_with(60)
+        c._set_max_sessions.assert_called_once_with(100)
+        c._set_shutdown_timeout.assert_called_once_with(5)
+        c._set_restart_socket_path.assert_called_once_with(
+            '/tmp/pykmip.sock'
+        )
+        c._set_policy_path.assert_called_once_with('/etc/pykmip/policies')
+        c._set_policy_reload_interval.assert_called_once_with(30)
+        c._set_object_cache_size.assert_called_once_with(100)
+        c._set_object_cache_ttl.assert_called_once_with(30)
+        c._set_object_cache_memory.assert_called_once_with(65536)
+        c._set_precompute_get_responses.assert_called_once_with(True)
+        c._set_database_url.assert_called_once_with('sqlite:////var/pykmip.db')
+        c._set_database_pool_size.assert_called_once_with(10)
+        c._set_database_max_overflow.assert_called_once_with(20)
+        c._set_database_pool_pre_ping.assert_called_once_with(True)
+        c._set_sqlite_journal_mode.assert_called_once_with('DELETE')
+        c._set_sqlite_synchronous.assert_called_once_with('FULL')
+        c._set_sqlite_busy_timeout.assert_called_once_with(1000)
+        c._set_sqlite_mmap_size.assert_called_once_with(268435456)
+        c._set_identifier_format.assert_called_once_with('UUID')
+        c._set_database_replica_urls.assert_called_once_with(
+            ['sqlite:////tmp/a.db', 'sqlite:////tmp/b.db']
+        )
+        c._set_database_replica_lag.assert_called_once_with(10)
+        c._set_database_shard_urls.assert_called_once_with(
+            ['sqlite:////tmp/a.db', 'sqlite:////tmp/b.db']
+        )
+
         # Test that a ConfigurationError is generated when the expected
         # section is missing.
         parser = configparser.SafeConfigParser()
@@ -478,3 +701,848 @@ class TestKmipServerConfig(testtools.TestCase):
             *args
         )
         self.assertNotEqual('invalid', c.settings.get('auth_suite'))
+
+    def test_set_buffer_size(self):
+        """
+        Test that the buffer_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(4096, c.settings.get('buffer_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_buffer_size(8192)
+        self.assertEqual(8192, c.settings.get('buffer_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The buffer size value must be an integer greater than or equal "
+            "to 8."
+        )
+        for value in ('invalid', 4):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_buffer_size,
+                value
+            )
+        self.assertEqual(8192, c.settings.get('buffer_size'))
+
+    def test_set_max_buffer_size(self):
+        """
+        Test that the max_buffer_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1048576, c.settings.get('max_buffer_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_max_buffer_size(65536)
+        self.assertEqual(65536, c.settings.get('max_buffer_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The maximum buffer size value must be an integer greater than "
+            "or equal to 8."
+        )
+        for value in ('invalid', 4):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_max_buffer_size,
+                value
+            )
+        self.assertEqual(65536, c.settings.get('max_buffer_size'))
+
+    def test_set_max_in_flight_requests(self):
+        """
+        Test that the max_in_flight_requests configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1, c.settings.get('max_in_flight_requests'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_max_in_flight_requests(8)
+        self.assertEqual(8, c.settings.get('max_in_flight_requests'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The maximum in-flight requests value must be a positive integer."
+        )
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_max_in_flight_requests,
+                value
+            )
+        self.assertEqual(8, c.settings.get('max_in_flight_requests'))
+
+    def test_set_asynchronous_workers(self):
+        """
+        Test that the asynchronous_workers configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(2, c.settings.get('asynchronous_workers'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_asynchronous_workers(4)
+        self.assertEqual(4, c.settings.get('asynchronous_workers'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The asynchronous workers value must be a positive integer."
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_asynchronous_workers,
+                value
+            )
+        self.assertEqual(4, c.settings.get('asynchronous_workers'))
+
+    def test_set_asynchronous_result_ttl(self):
+        """
+        Test that the asynchronous_result_ttl configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(300, c.settings.get('asynchronous_result_ttl'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_asynchronous_result_ttl(0)
+        self.assertEqual(0, c.settings.get('asynchronous_result_ttl'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The asynchronous result TTL value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_asynchronous_result_ttl,
+                value
+            )
+        self.assertEqual(0, c.settings.get('asynchronous_result_ttl'))
+
+    def test_set_asynchronous_queue_size(self):
+        """
+        Test that the asynchronous_queue_size configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1024, c.settings.get('asynchronous_queue_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_asynchronous_queue_size(128)
+        self.assertEqual(128, c.settings.get('asynchronous_queue_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The asynchronous queue size value must be a positive integer."
+        )
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_asynchronous_queue_size,
+                value
+            )
+        self.assertEqual(128, c.settings.get('asynchronous_queue_size'))
+
+    def test_set_asynchronous_client_limit(self):
+        """
+        Test that the asynchronous_client_limit configuration property can
+        be set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(64, c.settings.get('asynchronous_client_limit'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_asynchronous_client_limit(8)
+        self.assertEqual(8, c.settings.get('asynchronous_client_limit'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The asynchronous client limit value must be a positive integer."
+        )
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_asynchronous_client_limit,
+                value
+            )
+        self.assertEqual(8, c.settings.get('asynchronous_client_limit'))
+
+    def test_set_session_idle_timeout(self):
+        """
+        Test that the session_idle_timeout configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(0, c.settings.get('session_idle_timeout'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_session_idle_timeout(30)
+        self.assertEqual(30, c.settings.get('session_idle_timeout'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The session idle timeout value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_session_idle_timeout,
+                value
+            )
+        self.assertEqual(30, c.settings.get('session_idle_timeout'))
+
+    def test_set_tcp_keepalive_idle(self):
+        """
+        Test that the tcp_keepalive_idle configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(0, c.settings.get('tcp_keepalive_idle'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_tcp_keepalive_idle(60)
+        self.assertEqual(60, c.settings.get('tcp_keepalive_idle'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The TCP keepalive idle value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_tcp_keepalive_idle,
+                value
+            )
+        self.assertEqual(60, c.settings.get('tcp_keepalive_idle'))
+
+    def test_set_max_sessions(self):
+        """
+        Test that the max_sessions configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(0, c.settings.get('max_sessions'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_max_sessions(100)
+        self.assertEqual(100, c.settings.get('max_sessions'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The maximum sessions value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_max_sessions,
+                value
+            )
+        self.assertEqual(100, c.settings.get('max_sessions'))
+
+    def test_set_shutdown_timeout(self):
+        """
+        Test that the shutdown_timeout configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(10, c.settings.get('shutdown_timeout'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_shutdown_timeout(0)
+        self.assertEqual(0, c.settings.get('shutdown_timeout'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The shutdown timeout value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_shutdown_timeout,
+                value
+            )
+        self.assertEqual(0, c.settings.get('shutdown_timeout'))
+
+    def test_set_restart_socket_path(self):
+        """
+        Test that the restart_socket_path configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertIsNone(c.settings.get('restart_socket_path'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_restart_socket_path('/tmp/pykmip.sock')
+        self.assertEqual(
+            '/tmp/pykmip.sock',
+            c.settings.get('restart_socket_path')
+        )
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The restart socket path value, if specified, must be a string."
+        )
+        self.assertRaisesRegexp(
+            exceptions.ConfigurationError,
+            regex,
+            c._set_restart_socket_path,
+            0
+        )
+        self.assertEqual(
+            '/tmp/pykmip.sock',
+            c.settings.get('restart_socket_path')
+        )
+
+    def test_set_policy_path(self):
+        """
+        Test that the policy_path configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertIsNone(c.settings.get('policy_path'))
+
+        # Test that the setting is set correctly with a valid value.
+        with mock.patch('os.path.isdir') as os_mock:
+            os_mock.return_value = True
+            c._set_policy_path('/etc/pykmip/policies')
+            self.assertEqual(
+                '/etc/pykmip/policies',
+                c.settings.get('policy_path')
+            )
+
+        c._set_policy_path(None)
+        self.assertIsNone(c.settings.get('policy_path'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The policy path value, if specified, must be a valid string "
+            "path to a directory."
+        )
+        with mock.patch('os.path.isdir') as os_mock:
+            os_mock.return_value = False
+            for value in ('/invalid/path', 0):
+                self.assertRaisesRegexp(
+                    exceptions.ConfigurationError,
+                    regex,
+                    c._set_policy_path,
+                    value
+                )
+        self.assertIsNone(c.settings.get('policy_path'))
+
+    def test_set_policy_reload_interval(self):
+        """
+        Test that the policy_reload_interval configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(0, c.settings.get('policy_reload_interval'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_policy_reload_interval(30)
+        self.assertEqual(30, c.settings.get('policy_reload_interval'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The policy reload interval value must be a non-negative "
+            "integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_policy_reload_interval,
+                value
+            )
+        self.assertEqual(30, c.settings.get('policy_reload_interval'))
+
+    def test_set_object_cache_size(self):
+        """
+        Test that the object_cache_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(1024, c.settings.get('object_cache_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_object_cache_size(0)
+        self.assertEqual(0, c.settings.get('object_cache_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The object cache size value must be a non-negative integer."
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_object_cache_size,
+                value
+            )
+        self.assertEqual(0, c.settings.get('object_cache_size'))
+
+    def test_set_object_cache_ttl(self):
+        """
+        Test that the object_cache_ttl configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(60, c.settings.get('object_cache_ttl'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_object_cache_ttl(30)
+        self.assertEqual(30, c.settings.get('object_cache_ttl'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The object cache TTL value must be a positive integer."
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_object_cache_ttl,
+                value
+            )
+        self.assertEqual(30, c.settings.get('object_cache_ttl'))
+
+    def test_set_object_cache_memory(self):
+        """
+        Test that the object_cache_memory configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(16777216, c.settings.get('object_cache_memory'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_object_cache_memory(65536)
+        self.assertEqual(65536, c.settings.get('object_cache_memory'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The object cache memory value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_object_cache_memory,
+                value
+            )
+        self.assertEqual(65536, c.settings.get('object_cache_memory'))
+
+    def test_set_precompute_get_responses(self):
+        """
+        Test that the precompute_get_responses configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertFalse(c.settings.get('precompute_get_responses'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_precompute_get_responses(True)
+        self.assertTrue(c.settings.get('precompute_get_responses'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The precompute Get responses value must be a boolean."
+        for value in ('invalid', 1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_precompute_get_responses,
+                value
+            )
+        self.assertTrue(c.settings.get('precompute_get_responses'))
+
+    def test_set_database_url(self):
+        """
+        Test that the database_url configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(
+            'sqlite:////tmp/pykmip.database',
+            c.settings.get('database_url')
+        )
+
+        # Test that the setting is set correctly with a valid value.
+        url = 'postgresql+psycopg2://pykmip@127.0.0.1/pykmip'
+        c._set_database_url(url)
+        self.assertEqual(url, c.settings.get('database_url'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The database URL value must be a non-empty string."
+        for value in (0, ''):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_url,
+                value
+            )
+        self.assertEqual(url, c.settings.get('database_url'))
+
+    def test_set_database_pool_size(self):
+        """
+        Test that the database_pool_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(5, c.settings.get('database_pool_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_database_pool_size(10)
+        self.assertEqual(10, c.settings.get('database_pool_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The database pool size value must be a positive integer."
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_pool_size,
+                value
+            )
+        self.assertEqual(10, c.settings.get('database_pool_size'))
+
+    def test_set_database_max_overflow(self):
+        """
+        Test that the database_max_overflow configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(10, c.settings.get('database_max_overflow'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_database_max_overflow(0)
+        self.assertEqual(0, c.settings.get('database_max_overflow'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The database max overflow value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_max_overflow,
+                value
+            )
+        self.assertEqual(0, c.settings.get('database_max_overflow'))
+
+    def test_set_database_pool_pre_ping(self):
+        """
+        Test that the database_pool_pre_ping configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertFalse(c.settings.get('database_pool_pre_ping'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_database_pool_pre_ping(True)
+        self.assertTrue(c.settings.get('database_pool_pre_ping'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The database pool pre-ping value must be a boolean."
+        for value in ('invalid', 1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_pool_pre_ping,
+                value
+            )
+        self.assertTrue(c.settings.get('database_pool_pre_ping'))
+
+    def test_set_sqlite_journal_mode(self):
+        """
+        Test that the sqlite_journal_mode configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual('WAL', c.settings.get('sqlite_journal_mode'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_sqlite_journal_mode('delete')
+        self.assertEqual('DELETE', c.settings.get('sqlite_journal_mode'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The SQLite journal mode value must be one of: "
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_sqlite_journal_mode,
+                value
+            )
+        self.assertEqual('DELETE', c.settings.get('sqlite_journal_mode'))
+
+    def test_set_sqlite_synchronous(self):
+        """
+        Test that the sqlite_synchronous configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual('FULL', c.settings.get('sqlite_synchronous'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_sqlite_synchronous('normal')
+        self.assertEqual('NORMAL', c.settings.get('sqlite_synchronous'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The SQLite synchronous value must be one of: "
+        for value in ('invalid', 0):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_sqlite_synchronous,
+                value
+            )
+        self.assertEqual('NORMAL', c.settings.get('sqlite_synchronous'))
+
+    def test_set_sqlite_busy_timeout(self):
+        """
+        Test that the sqlite_busy_timeout configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(5000, c.settings.get('sqlite_busy_timeout'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_sqlite_busy_timeout(0)
+        self.assertEqual(0, c.settings.get('sqlite_busy_timeout'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The SQLite busy timeout value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_sqlite_busy_timeout,
+                value
+            )
+        self.assertEqual(0, c.settings.get('sqlite_busy_timeout'))
+
+    def test_set_sqlite_mmap_size(self):
+        """
+        Test that the sqlite_mmap_size configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(0, c.settings.get('sqlite_mmap_size'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_sqlite_mmap_size(268435456)
+        self.assertEqual(268435456, c.settings.get('sqlite_mmap_size'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The SQLite mmap size value must be a non-negative integer."
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_sqlite_mmap_size,
+                value
+            )
+        self.assertEqual(268435456, c.settings.get('sqlite_mmap_size'))
+
+    def test_set_identifier_format(self):
+        """
+        Test that the identifier_format configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual('ulid', c.settings.get('identifier_format'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_identifier_format('UUID')
+        self.assertEqual('uuid', c.settings.get('identifier_format'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = "The identifier format value must be one of: ULID, UUID."
+        for value in ('invalid', 1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_identifier_format,
+                value
+            )
+        self.assertEqual('uuid', c.settings.get('identifier_format'))
+
+    def test_set_database_replica_urls(self):
+        """
+        Test that the database_replica_urls configuration property can be
+        set correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual([], c.settings.get('database_replica_urls'))
+
+        # Test that the setting is set correctly with a valid value.
+        urls = ['sqlite:////tmp/a.db', 'sqlite:////tmp/b.db']
+        c._set_database_replica_urls(urls)
+        self.assertEqual(urls, c.settings.get('database_replica_urls'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The database replica URLs value must be a list of non-empty "
+            "strings."
+        )
+        for value in ('sqlite:////tmp/a.db', [''], [1]):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_replica_urls,
+                value
+            )
+        self.assertEqual(urls, c.settings.get('database_replica_urls'))
+
+    def test_set_database_replica_lag(self):
+        """
+        Test that the database_replica_lag configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual(5, c.settings.get('database_replica_lag'))
+
+        # Test that the setting is set correctly with a valid value.
+        c._set_database_replica_lag(0)
+        self.assertEqual(0, c.settings.get('database_replica_lag'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The database replica lag value must be a non-negative integer."
+        )
+        for value in ('invalid', -1):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_replica_lag,
+                value
+            )
+        self.assertEqual(0, c.settings.get('database_replica_lag'))
+
+    def test_set_database_shard_urls(self):
+        """
+        Test that the database_shard_urls configuration property can be set
+        correctly.
+        """
+        c = config.KmipServerConfig()
+        c._logger = mock.MagicMock()
+
+        self.assertEqual([], c.settings.get('database_shard_urls'))
+
+        # Test that the setting is set correctly with a valid value.
+        urls = ['sqlite:////tmp/a.db', 'memory://']
+        c._set_database_shard_urls(urls)
+        self.assertEqual(urls, c.settings.get('database_shard_urls'))
+
+        # Test that a ConfigurationError is generated when setting the wrong
+        # value.
+        regex = (
+            "The database shard URLs value must be a list of non-empty "
+            "strings."
+        )
+        for value in ('sqlite:////tmp/a.db', [''], [1]):
+            self.assertRaisesRegexp(
+                exceptions.ConfigurationError,
+                regex,
+                c._set_database_shard_urls,
+                value
+            )
+        self.assertEqual(urls, c.settings.get('database_shard_urls'))
@@ -0,0 +1,229 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import os
+import shutil
+import socket
+import tempfile
+import testtools
+import threading
+
+from kmip.core import exceptions
+
+from kmip.services.server import handoff
+
+
+class TestHandoff(testtools.TestCase):
+    """
+    Test suite for the listening socket handoff helpers.
+    """
+
+    def setUp(self):
+        super(TestHandoff, self).setUp()
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'restart.sock')
+
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(('127.0.0.1', 0))
+        self.listener.listen(1)
+
+    def tearDown(self):
+        super(TestHandoff, self).tearDown()
+
+        self.listener.close()
+        shutil.rmtree(self.temp_dir)
+
+    def test_send_and_receive_fd(self):
+        """
+        Test that a listening socket can be passed over a Unix domain socket.
+        """
+        a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            handoff.send_fd(a, self.listener.fileno())
+            fd = handoff.receive_fd(b)
+        finally:
+            a.close()
+            b.close()
+
+        received = handoff._socket_from_fd(fd)
+        try:
+            self.assertEqual(
+                self.listener.getsockname(),
+                received.getsockname()
+            )
+        finally:
+            received.close()
+
+    def test_receive_fd_without_fd(self):
+        """
+        Test that a NetworkingError is raised if no descriptor is received.
+        """
+        a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            a.sendall(b'\x00')
+            self.assertRaisesRegexp(
+                exceptions.NetworkingError,
+                "No socket was received from the running server process.",
+                handoff.receive_fd,
+                b
+            )
+        finally:
+            a.close()
+            b.close()
+
+    def test_request_socket(self):
+        """
+        Test that a socket can be requested from a process serving handoff
+        requests at a path, and that None is returned if there is none.
+        """
+        self.assertIsNone(handoff.request_socket(self.path))
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.path)
+        server.listen(1)
+
+        def serve():
+            connection, _ = server.accept()
+            handoff.send_fd(connection, self.listener.fileno())
+            connection.close()
+
+        t = threading.Thread(target=serve)
+        t.start()
+        try:
+            received, connection = handoff.request_socket(self.path)
+        finally:
+            t.join()
+            server.close()
+
+        try:
+            self.assertEqual(
+                self.listener.getsockname(),
+                received.getsockname()
+            )
+        finally:
+            received.close()
+            connection.close()
+
+    def test_socket_from_fd_ipv6(self):
+        """
+        Test that a socket rebuilt from a descriptor keeps the address family
+        of an IPv6 listener.
+        """
+        if not socket.has_ipv6:
+            self.skipTest("IPv6 is not supported on this platform.")
+        listener = socket.socket(socket.AF_INET6, socket.SOCK_STREAM)
+        try:
+            listener.bind(('::1', 0))
+        except socket.error:
+            listener.close()
+            self.skipTest("The IPv6 loopback address is not available.")
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        received = handoff._socket_from_fd(os.dup(listener.fileno()))
+        try:
+            self.assertEqual(socket.AF_INET6, received.family)
+            self.assertEqual(listener.getsockname(), received.getsockname())
+        finally:
+            received.close()
+
+    def test_listen(self):
+        """
+        Test that the handoff socket replaces an existing file and can only
+        be used by the current user.
+        """
+        with open(self.path, 'w') as f:
+            f.write('stale')
+
+        listener = handoff.listen(self.path)
+        try:
+            self.assertEqual(
+                0o600,
+                os.stat(self.path).st_mode & 0o777
+            )
+            self.assertEqual(['restart.sock'], os.listdir(self.temp_dir))
+
+            client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                client.connect(self.path)
+                connection, _ = listener.accept()
+                connection.close()
+            finally:
+                client.close()
+        finally:
+            listener.close()
+
+    def test_check_peer(self):
+        """
+        Test that a connection is only accepted from a process running as
+        the current user.
+        """
+        a, b = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(a.close)
+        self.addCleanup(b.close)
+
+        if handoff.get_peer_uid(a) is None:
+            self.skipTest("Peer credentials are not supported.")
+        self.assertEqual(os.getuid(), handoff.get_peer_uid(a))
+        handoff.check_peer(a)
+
+        with mock.patch('os.getuid', return_value=os.getuid() + 1):
+            self.assertRaisesRegexp(
+                exceptions.NetworkingError,
+                "The peer server process runs as another user",
+                handoff.check_peer,
+                a
+            )
+
+        with mock.patch(
+            'kmip.services.server.handoff.get_peer_uid',
+            return_value=None
+        ):
+            self.assertRaisesRegexp(
+                exceptions.NetworkingError,
+                "The user of the peer server process cannot be verified on "
+                "this platform.",
+                handoff.check_peer,
+                a
+            )
+
+    def test_get_activation_socket(self):
+        """
+        Test that a socket passed by socket activation is only used when it
+        was passed to this process.
+        """
+        environment = {
+            'LISTEN_PID': str(os.getpid() + 1),
+            'LISTEN_FDS': '1'
+        }
+        with mock.patch.dict(os.environ, environment):
+            self.assertIsNone(handoff.get_activation_socket())
+
+        environment = {'LISTEN_PID': str(os.getpid()), 'LISTEN_FDS': '1'}
+        with mock.patch.dict(os.environ, environment):
+            with mock.patch(
+                'kmip.services.server.handoff._socket_from_fd'
+            ) as socket_mock:
+                socket_mock.return_value = 'socket'
+                self.assertEqual('socket', handoff.get_activation_socket())
+                socket_mock.assert_called_once_with(3)
+                self.assertNotIn('LISTEN_PID', os.environ)
+                self.assertNotIn('LISTEN_FDS', os.environ)
+
+        environment = {'LISTEN_PID': str(os.getpid()), 'LISTEN_FDS': '0'}
+        with mock.patch.dict(os.environ, environment):
+            self.assertIsNone(handoff.get_activation_socket())
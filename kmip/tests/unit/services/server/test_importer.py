@@ -0,0 +1,293 @@
+# Copyright (c) 2016 The Johns Hopkins University/Applied Physics Laboratory
+# All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import mock
+import os
+import shutil
+import six
+import sqlalchemy
+import tempfile
+import testtools
+
+from kmip.core import enums
+
+from kmip.pie import objects
+from kmip.pie import sqltypes
+
+from kmip.services.server import config
+from kmip.services.server import importer
+from kmip.services.server.repo import log_store
+from kmip.services.server.repo import sharded_store
+from kmip.services.server.repo import sqlalchemy_store
+from kmip.services.server.repo import store
+
+
+class TestImporter(testtools.TestCase):
+    """
+    Test suite for the managed object importer.
+    """
+
+    def setUp(self):
+        super(TestImporter, self).setUp()
+
+        self.engine = sqlalchemy.create_engine('sqlite://')
+        sqltypes.Base.metadata.create_all(self.engine)
+        self.session_factory = sqlalchemy.orm.sessionmaker(
+            bind=self.engine
+        )
+        self.store = sqlalchemy_store.SqlAlchemyStore(self.engine)
+
+    def tearDown(self):
+        super(TestImporter, self).tearDown()
+
+    def test_build_managed_object(self):
+        """
+        Test that objects of every supported type can be built from import
+        records.
+        """
+        key = importer.build_managed_object(
+            {
+                'object_type': 'SYMMETRIC_KEY',
+                'cryptographic_algorithm': 'AES',
+                'cryptographic_length': 128,
+                'cryptographic_usage_mask': ['ENCRYPT', 'DECRYPT'],
+                'value': '00' * 16,
+                'name': 'key'
+            },
+            owner='test'
+        )
+        self.assertIsInstance(key, objects.SymmetricKey)
+        self.assertEqual(b'\x00' * 16, key.value)
+        self.assertEqual(
+            enums.CryptographicAlgorithm.AES,
+            key.cryptographic_algorithm
+        )
+        self.assertEqual(
+            [
+                enums.CryptographicUsageMask.ENCRYPT,
+                enums.CryptographicUsageMask.DECRYPT
+            ],
+            key.cryptographic_usage_masks
+        )
+        self.assertEqual(['key'], key.names)
+        self.assertEqual('test', key._owner)
+        self.assertEqual('default', key.operation_policy_name)
+
+        secret = importer.build_managed_object({
+            'object_type': 'SECRET_DATA',
+            'secret_data_type': 'PASSWORD',
+            'value': '01',
+            'owner': 'other',
+            'operation_policy_name': 'public'
+        }, owner='test')
+        self.assertIsInstance(secret, objects.SecretData)
+        self.assertEqual(enums.SecretDataType.PASSWORD, secret.data_type)
+        self.assertEqual('other', secret._owner)
+        self.assertEqual('public', secret.operation_policy_name)
+
+        opaque = importer.build_managed_object({
+            'object_type': 'OPAQUE_DATA',
+            'opaque_data_type': 'NONE',
+            'value': '02'
+        })
+        self.assertIsInstance(opaque, objects.OpaqueObject)
+        self.assertEqual(b'\x02', opaque.value)
+        self.assertIsNone(opaque._owner)
+
+    def test_build_managed_object_invalid(self):
+        """
+        Test that a ValueError is raised for invalid import records.
+        """
+        records = [
+            (
+                ['SYMMETRIC_KEY'],
+                "Each line must hold a JSON object."
+            ),
+            (
+                {'object_type': 'INVALID', 'value': '00'},
+                "Missing or invalid object_type: INVALID"
+            ),
+            (
+                {'object_type': 'CERTIFICATE', 'value': '00'},
+                "Unsupported object_type: CERTIFICATE"
+            ),
+            (
+                {'object_type': 'OPAQUE_DATA', 'opaque_data_type': 'NONE'},
+                "Missing or invalid value."
+            ),
+            (
+                {
+                    'object_type': 'SYMMETRIC_KEY',
+                    'cryptographic_algorithm': 'AES',
+                    'value': '00'
+                },
+                "Missing or invalid cryptographic_length: None"
+            ),
+            (
+                {
+                    'object_type': 'SYMMETRIC_KEY',
+                    'cryptographic_algorithm': 'AES',
+                    'cryptographic_length': 128,
+                    'cryptographic_usage_mask': ['INVALID'],
+                    'value': '00'
+                },
+                "Missing or invalid cryptographic_usage_mask: INVALID"
+            )
+        ]
+        for record, regex in records:
+            six.assertRaisesRegex(
+                self,
+                ValueError,
+                regex,
+                importer.build_managed_object,
+                record
+            )
+
+    def test_import_objects(self):
+        """
+        Test that the objects of an import file are inserted in chunks, and
+        that the chunks before an invalid line are kept.
+        """
+        line = (
+            '{"object_type": "OPAQUE_DATA", "opaque_data_type": "NONE", '
+            '"value": "00", "name": "%s"}'
+        )
+        lines = [line % 'a', '', line % 'b', line % 'c']
+
+        count = importer.import_objects(
+            self.store,
+            lines,
+            chunk_size=2,
+            generate_identifier=sqltypes.generate_uuid
+        )
+        self.assertEqual(3, count)
+
+        session = self.session_factory()
+        names = sorted(
+            x[0] for x in session.query(sqltypes.ManagedObjectName.name)
+        )
+        self.assertEqual(['a', 'b', 'c'], names)
+        self.assertEqual(
+            [36] * 3,
+            [
+                len(x[0]) for x in session.query(
+                    objects.ManagedObject.unique_identifier
+                )
+            ]
+        )
+        session.close()
+
+        lines = [line % 'd', line % 'e', 'invalid']
+        six.assertRaisesRegex(
+            self,
+            ValueError,
+            "Line 3: ",
+            importer.import_objects,
+            self.store,
+            lines,
+            chunk_size=2
+        )
+
+        session = self.session_factory()
+        self.assertEqual(5, session.query(objects.ManagedObject).count())
+        session.close()
+
+    def test_main(self):
+        """
+        Test that the import script writes through the object store named
+        by the data store URL, and refuses the memory object store.
+        """
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        import_path = os.path.join(path, 'objects.jsonl')
+        with open(import_path, 'w') as import_file:
+            import_file.write(
+                '{"object_type": "OPAQUE_DATA", "opaque_data_type": "NONE", '
+                '"value": "01"}\n'
+            )
+
+        log_path = os.path.join(path, 'log')
+        with mock.patch('sys.stdout'):
+            importer.main(['-d', 'log://' + log_path, '-o', 'a', import_path])
+
+        object_store = log_store.LogStore(log_path)
+        self.addCleanup(object_store.close)
+        session = object_store.open_session()
+        uid = list(object_store._catalogue)[0]
+        managed_object = object_store.get_object(
+            session,
+            uid,
+            load_secret=True
+        )
+        self.assertEqual(b'\x01', managed_object.value)
+        self.assertEqual('a', managed_object._owner)
+
+        with mock.patch('sys.stderr'):
+            self.assertRaises(
+                SystemExit,
+                importer.main,
+                ['-d', 'memory://', import_path]
+            )
+
+    def test_main_shards(self):
+        """
+        Test that the import script spreads objects across the shards the
+        server is configured with.
+        """
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        import_path = os.path.join(path, 'objects.jsonl')
+        with open(import_path, 'w') as import_file:
+            for i in range(20):
+                import_file.write(
+                    '{"object_type": "OPAQUE_DATA", '
+                    '"opaque_data_type": "NONE", "value": "%02x"}\n' % i
+                )
+        log_paths = [os.path.join(path, x) for x in ('a', 'b')]
+
+        def load_settings(settings, config_path):
+            settings.settings['database_shard_urls'] = [
+                'log://' + x for x in log_paths
+            ]
+
+        with mock.patch.object(
+                config.KmipServerConfig,
+                'load_settings',
+                autospec=True,
+                side_effect=load_settings):
+            with mock.patch('sys.stdout'):
+                importer.main(['-f', 'server.conf', import_path])
+
+        shards = [log_store.LogStore(x) for x in log_paths]
+        object_store = sharded_store.ShardedStore(shards)
+        self.addCleanup(object_store.close)
+
+        session = object_store.open_session()
+        criteria = store.LocateCriteria()
+        criteria.permit(enums.ObjectType.OPAQUE_DATA, ['default'])
+        uids = object_store.locate(session, criteria)
+        self.assertEqual(20, len(uids))
+        for shard in shards:
+            self.assertNotEqual(0, len(shard._catalogue))
+        self.assertEqual(
+            set(bytes(bytearray([i])) for i in range(20)),
+            set(
+                x.value for x in object_store.get_objects(
+                    session,
+                    uids,
+                    load_secret=True
+                ).values()
+            )
+        )
@@ -112,3 +112,182 @@ class TestAttributePolicy(testtools.TestCase):
 
         result = rules.is_attribute_multivalued(attribute_b)
         self.assertTrue(result)
+
+    def test_precomputed_tables(self):
+        """
+        Test that the version-dependent attribute tables are exposed as
+        read-only frozensets.
+        """
+        rules = policy.AttributePolicy(contents.ProtocolVersion.create(1, 1))
+
+        self.assertEqual(
+            contents.ProtocolVersion.create(1, 1),
+            rules.version
+        )
+        self.assertIsInstance(rules.supported_attributes, frozenset)
+        self.assertIn('Certificate Length', rules.supported_attributes)
+        self.assertNotIn('invalid', rules.supported_attributes)
+        self.assertIsInstance(rules.deprecated_attributes, frozenset)
+        self.assertIn('Certificate Subject', rules.deprecated_attributes)
+        self.assertNotIn('Name', rules.deprecated_attributes)
+        self.assertIsInstance(rules.multivalued_attributes, frozenset)
+        self.assertIn('Link', rules.multivalued_attributes)
+        self.assertNotIn('Object Type', rules.multivalued_attributes)
+
+        args = ('supported_attributes', frozenset())
+        self.assertRaises(AttributeError, setattr, rules, *args)
+
+        self.assertFalse(rules.is_attribute_deprecated('invalid'))
+
+    def test_rule_set_is_read_only(self):
+        """
+        Test that attribute rule sets cannot be modified once created.
+        """
+        rules = policy.AttributePolicy(contents.ProtocolVersion.create(1, 0))
+        rule_set = rules.get_rule_set('Cryptographic Algorithm')
+
+        self.assertIsInstance(rule_set.applies_to_object_types, frozenset)
+        self.assertIn(
+            enums.ObjectType.SYMMETRIC_KEY,
+            rule_set.applies_to_object_types
+        )
+        self.assertIsInstance(rule_set.implicitly_set_by, tuple)
+
+        args = (rule_set, 'multiple_instances_permitted', True)
+        self.assertRaisesRegexp(
+            AttributeError,
+            "AttributeRuleSet objects are read-only.",
+            setattr,
+            *args
+        )
+        self.assertFalse(rule_set.multiple_instances_permitted)
+
+        self.assertIsNone(rules.get_rule_set('invalid'))
+
+
+class TestOperationPolicyTable(testtools.TestCase):
+    """
+    A test suite for OperationPolicyTable.
+    """
+
+    def setUp(self):
+        super(TestOperationPolicyTable, self).setUp()
+
+        self.policies = {
+            'test': {
+                enums.ObjectType.SYMMETRIC_KEY: {
+                    enums.Operation.GET: enums.Policy.ALLOW_ALL,
+                    enums.Operation.DESTROY: enums.Policy.ALLOW_OWNER
+                }
+            },
+            'empty': {}
+        }
+
+    def tearDown(self):
+        super(TestOperationPolicyTable, self).tearDown()
+
+    def test_init(self):
+        """
+        Test that an OperationPolicyTable can be built from operation
+        policies.
+        """
+        table = policy.OperationPolicyTable(self.policies)
+
+        self.assertEqual(self.policies, table.policies)
+        self.assertEqual(
+            frozenset(['test', 'empty']),
+            table.policy_names
+        )
+
+    def test_has_object_type(self):
+        """
+        Test that the table reports which object types a policy covers.
+        """
+        table = policy.OperationPolicyTable(self.policies)
+
+        self.assertTrue(
+            table.has_object_type('test', enums.ObjectType.SYMMETRIC_KEY)
+        )
+        self.assertFalse(
+            table.has_object_type('test', enums.ObjectType.PRIVATE_KEY)
+        )
+        self.assertFalse(
+            table.has_object_type('empty', enums.ObjectType.SYMMETRIC_KEY)
+        )
+        self.assertFalse(
+            table.has_object_type('invalid', enums.ObjectType.SYMMETRIC_KEY)
+        )
+
+    def test_get_decision(self):
+        """
+        Test that the table returns the compiled decision for an operation.
+        """
+        table = policy.OperationPolicyTable(self.policies)
+
+        self.assertEqual(
+            enums.Policy.ALLOW_ALL,
+            table.get_decision(
+                'test',
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.GET
+            )
+        )
+        self.assertEqual(
+            enums.Policy.ALLOW_OWNER,
+            table.get_decision(
+                'test',
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.DESTROY
+            )
+        )
+        self.assertIsNone(
+            table.get_decision(
+                'test',
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.ACTIVATE
+            )
+        )
+        self.assertIsNone(
+            table.get_decision(
+                'invalid',
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.GET
+            )
+        )
+
+    def test_get_policy_names(self):
+        """
+        Test that the table returns the policies making a decision.
+        """
+        policies = dict(self.policies)
+        policies['other'] = {
+            enums.ObjectType.SYMMETRIC_KEY: {
+                enums.Operation.GET: enums.Policy.ALLOW_ALL
+            }
+        }
+        table = policy.OperationPolicyTable(policies)
+
+        self.assertEqual(
+            frozenset(['test', 'other']),
+            table.get_policy_names(
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.GET,
+                enums.Policy.ALLOW_ALL
+            )
+        )
+        self.assertEqual(
+            frozenset(['test']),
+            table.get_policy_names(
+                enums.ObjectType.SYMMETRIC_KEY,
+                enums.Operation.DESTROY,
+                enums.Policy.ALLOW_OWNER
+            )
+        )
+        self.assertEqual(
+            frozenset(),
+            table.get_policy_names(
+                enums.ObjectType.PRIVATE_KEY,
+                enums.Operation.GET,
+                enums.Policy.ALLOW_ALL
+            )
+        )
@@ -73,8 +73,15 @@ class TestServerProcessor(testtools.TestCase):
            with expected data (excluding the TimeStamp data -- TODO).
         """
 
+        chunks = [request[:8], request[8:]]
+
+        def recv_into(buffer, nbytes=0):
+            chunk = chunks.pop(0)
+            buffer[:len(chunk)] = chunk
+            return len(chunk)
+
         socket = mock.MagicMock()
-        socket.recv = mock.MagicMock(side_effect=[request[:8], request[8:]])
+        socket.recv_into = mock.MagicMock(side_effect=recv_into)
 
         socket.sendall = mock.MagicMock()
 
@@ -16,12 +16,17 @@
 import errno
 import logging
 import mock
+import os
+import shutil
 import signal
 import socket
+import tempfile
 import testtools
+import threading
 
 from kmip.core import exceptions
 from kmip.services import auth
+from kmip.services.server import handoff
 from kmip.services.server import server
 
 
@@ -205,6 +210,117 @@ class TestKmipServer(testtools.TestCase):
                 )
                 s._logger.exception.assert_called_once_with(test_exception)
 
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_start_with_shared_socket(self, logging_mock):
+        """
+        Test that the server adopts a listening socket passed by socket
+        activation or handed over by a running server process instead of
+        binding a new one.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s.config.settings['restart_socket_path'] = '/tmp/pykmip.sock'
+
+        listener = mock.MagicMock()
+        wrapped = mock.MagicMock()
+        wrapped.getsockname.return_value = ('127.0.0.1', 5696)
+
+        # Test that a socket passed by socket activation is used first.
+        with mock.patch(
+            'kmip.services.server.handoff.get_activation_socket'
+        ) as activation_mock, mock.patch(
+            'kmip.services.server.handoff.request_socket'
+        ) as request_mock, mock.patch('ssl.wrap_socket') as ssl_mock:
+            activation_mock.return_value = listener
+            ssl_mock.return_value = wrapped
+
+            s.start()
+
+            request_mock.assert_not_called()
+            self.assertEqual(listener, ssl_mock.call_args[0][0])
+            wrapped.bind.assert_not_called()
+            s._logger.info.assert_any_call(
+                "Using the listening socket passed by socket activation."
+            )
+            s._logger.info.assert_called_with(
+                "Server adopted socket handler bound to 127.0.0.1:5696"
+            )
+            self.assertTrue(s._is_socket_shared)
+            self.assertTrue(s._is_serving)
+            self.assertIsNone(s._handoff_connection)
+
+        # Test that a socket is requested from a running server process.
+        s._is_socket_shared = False
+        s._logger.reset_mock()
+
+        with mock.patch(
+            'kmip.services.server.handoff.get_activation_socket'
+        ) as activation_mock, mock.patch(
+            'kmip.services.server.handoff.request_socket'
+        ) as request_mock, mock.patch('ssl.wrap_socket') as ssl_mock:
+            activation_mock.return_value = None
+            request_mock.return_value = (listener, 'connection')
+            ssl_mock.return_value = wrapped
+
+            s.start()
+
+            request_mock.assert_called_once_with('/tmp/pykmip.sock')
+            self.assertEqual(listener, ssl_mock.call_args[0][0])
+            wrapped.bind.assert_not_called()
+            s._logger.info.assert_any_call(
+                "Took over the listening socket from the running server "
+                "process."
+            )
+            self.assertTrue(s._is_socket_shared)
+            self.assertEqual('connection', s._handoff_connection)
+
+        # Test that a failed handoff falls back to binding a new socket.
+        s._is_socket_shared = False
+        s._handoff_connection = None
+        s._logger.reset_mock()
+        test_exception = Exception()
+
+        with mock.patch(
+            'kmip.services.server.handoff.get_activation_socket'
+        ) as activation_mock, mock.patch(
+            'kmip.services.server.handoff.request_socket'
+        ) as request_mock, mock.patch(
+            'socket.socket'
+        ) as socket_mock, mock.patch('ssl.wrap_socket') as ssl_mock:
+            activation_mock.return_value = None
+            request_mock.side_effect = test_exception
+            ssl_mock.return_value = wrapped
+
+            s.start()
+
+            self.assertTrue(socket_mock.called)
+            wrapped.bind.assert_called_once_with(('127.0.0.1', 5696))
+            s._logger.exception.assert_called_once_with(test_exception)
+            self.assertFalse(s._is_socket_shared)
+
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_stop_with_shared_socket(self, logging_mock):
+        """
+        Test that a shared listening socket is closed but not shut down.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s._is_socket_shared = True
+
+        s.stop()
+
+        s._socket.shutdown.assert_not_called()
+        s._socket.close.assert_called_once_with()
+
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_stop(self, logging_mock):
         """
@@ -225,15 +341,17 @@ class TestKmipServer(testtools.TestCase):
         thread_mock.is_alive = mock.MagicMock(return_value=False)
         thread_mock.name = 'TestThread'
 
-        with mock.patch('threading.enumerate') as threading_mock:
-            threading_mock.return_value = [thread_mock]
+        s._sessions = [thread_mock]
+        with mock.patch('time.time') as time_mock:
+            time_mock.return_value = 100.0
 
             s.stop()
             s._logger.info.assert_any_call(
                 "Cleaning up remaining connection threads."
             )
-            self.assertTrue(threading_mock.called)
+            thread_mock.close.assert_called_once_with()
             thread_mock.join.assert_called_once_with(10.0)
+            self.assertEqual([], s._sessions)
             s._logger.info.assert_any_call(
                 "Cleanup succeeded for thread: TestThread"
             )
@@ -252,15 +370,17 @@ class TestKmipServer(testtools.TestCase):
         s._logger.reset_mock()
         s._socket.reset_mock()
 
-        with mock.patch('threading.enumerate') as threading_mock:
-            threading_mock.return_value = [thread_mock]
+        s._sessions = [thread_mock]
+        with mock.patch('time.time') as time_mock:
+            time_mock.return_value = 100.0
 
             s.stop()
             s._logger.info.assert_any_call(
                 "Cleaning up remaining connection threads."
             )
-            self.assertTrue(threading_mock.called)
+            thread_mock.close.assert_called_once_with()
             thread_mock.join.assert_called_once_with(10.0)
+            self.assertEqual([], s._sessions)
             s._logger.info.assert_any_call(
                 "Error occurred while attempting to cleanup thread: TestThread"
             )
@@ -279,15 +399,17 @@ class TestKmipServer(testtools.TestCase):
         s._logger.reset_mock()
         s._socket.reset_mock()
 
-        with mock.patch('threading.enumerate') as threading_mock:
-            threading_mock.return_value = [thread_mock]
+        s._sessions = [thread_mock]
+        with mock.patch('time.time') as time_mock:
+            time_mock.return_value = 100.0
 
             s.stop()
             s._logger.info.assert_any_call(
                 "Cleaning up remaining connection threads."
             )
-            self.assertTrue(threading_mock.called)
+            thread_mock.close.assert_called_once_with()
             thread_mock.join.assert_called_once_with(10.0)
+            self.assertEqual([], s._sessions)
             s._logger.warning.assert_any_call(
                 "Cleanup failed for thread: TestThread. Thread is still alive"
             )
@@ -321,6 +443,49 @@ class TestKmipServer(testtools.TestCase):
         s._socket.close.assert_called_once_with()
         s._logger.exception(test_exception)
 
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_stop_with_shared_deadline(self, logging_mock):
+        """
+        Test that all sessions are closed before any are joined and that the
+        joins share a single shutdown deadline.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s.config.settings['shutdown_timeout'] = 5
+
+        calls = []
+        sessions = []
+        for i in range(3):
+            session_mock = mock.MagicMock()
+            session_mock.name = 'Session{0}'.format(i)
+            session_mock.is_alive.return_value = True
+            session_mock.close.side_effect = \
+                lambda n=i: calls.append(('close', n))
+            session_mock.join.side_effect = \
+                lambda t, n=i: calls.append(('join', n))
+            sessions.append(session_mock)
+        s._sessions = list(sessions)
+
+        with mock.patch('time.time') as time_mock:
+            time_mock.side_effect = [100.0, 100.0, 103.0, 106.0]
+            s.stop()
+
+        self.assertEqual(
+            [('close', 0), ('close', 1), ('close', 2)],
+            calls[:3]
+        )
+        sessions[0].join.assert_called_once_with(5.0)
+        sessions[1].join.assert_called_once_with(2.0)
+        sessions[2].join.assert_called_once_with(0.0)
+        s._logger.warning.assert_any_call(
+            "Cleanup failed for thread: Session2. Thread is still alive"
+        )
+
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_serve(self, logging_mock):
         """
@@ -400,6 +565,159 @@ class TestKmipServer(testtools.TestCase):
         handler(None, None)
         self.assertFalse(s._is_serving)
 
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_with_handoff(self, logging_mock):
+        """
+        Test that the connection service completes a pending handoff, starts
+        the handoff service and keeps serving across accept timeouts.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._is_serving = True
+        s._is_socket_shared = True
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s._setup_connection_handler = mock.MagicMock()
+        s._serve_handoff = mock.MagicMock()
+        s.config.settings['restart_socket_path'] = '/tmp/pykmip.sock'
+
+        connection = mock.MagicMock()
+        connection.recv.return_value = b''
+        s._handoff_connection = connection
+
+        expected_error = socket.error()
+        expected_error.errno = errno.EINTR
+        s._socket.accept = mock.MagicMock(
+            side_effect=[
+                socket.timeout(),
+                ('connection', 'address'),
+                expected_error
+            ]
+        )
+
+        s.serve()
+
+        s._socket.listen.assert_not_called()
+        connection.sendall.assert_called_once_with(handoff.READY)
+        connection.settimeout.assert_called_once_with(handoff.TIMEOUT)
+        connection.recv.assert_called_once_with(1)
+        connection.close.assert_called_once_with()
+        self.assertIsNone(s._handoff_connection)
+        s._socket.settimeout.assert_called_once_with(1.0)
+        s._serve_handoff.assert_called_once_with('/tmp/pykmip.sock')
+        self.assertEqual(3, s._socket.accept.call_count)
+        s._setup_connection_handler.assert_called_once_with(
+            'connection',
+            'address'
+        )
+
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_handoff(self, logging_mock):
+        """
+        Test that the listening socket is handed to a new server process and
+        that this process then stops serving.
+        """
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = os.path.join(temp_dir, 'restart.sock')
+
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        self.addCleanup(listener.close)
+
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s._socket = listener
+        s._is_serving = True
+
+        t = threading.Thread(target=s._serve_handoff, args=(path, ))
+        t.start()
+
+        result = None
+        for _ in range(50):
+            result = handoff.request_socket(path)
+            if result is not None:
+                break
+            t.join(0.1)
+        self.assertIsNotNone(result)
+
+        received, connection = result
+        self.addCleanup(received.close)
+        self.assertEqual(listener.getsockname(), received.getsockname())
+
+        connection.sendall(handoff.READY)
+        self.assertEqual(b'', connection.recv(1))
+        connection.close()
+        t.join(5)
+
+        self.assertFalse(t.is_alive())
+        self.assertFalse(s._is_serving)
+        self.assertTrue(s._is_socket_shared)
+        self.assertFalse(os.path.exists(path))
+
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_serve_handoff_from_other_user(self, logging_mock):
+        """
+        Test that a handoff request from a process running as another user is
+        refused and that this process keeps serving.
+        """
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        path = os.path.join(temp_dir, 'restart.sock')
+
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s._socket = mock.MagicMock()
+        s._is_serving = True
+
+        t = threading.Thread(target=s._serve_handoff, args=(path, ))
+        uid = os.getuid()
+
+        def get_peer_uid(connection):
+            # Only the handoff service sees a peer running as another user.
+            if threading.current_thread() is t:
+                return uid + 1
+            return uid
+
+        with mock.patch(
+            'kmip.services.server.handoff.get_peer_uid',
+            side_effect=get_peer_uid
+        ):
+            t.start()
+            for _ in range(50):
+                if os.path.exists(path):
+                    break
+                t.join(0.1)
+
+            self.assertRaisesRegexp(
+                exceptions.NetworkingError,
+                "No socket was received from the running server process.",
+                handoff.request_socket,
+                path
+            )
+
+            s._is_serving = False
+            t.join(5)
+
+        self.assertFalse(t.is_alive())
+        self.assertFalse(s._is_socket_shared)
+        s._socket.fileno.assert_not_called()
+        s._logger.warning.assert_any_call(
+            "Refusing a socket handoff request."
+        )
+
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_setup_connection_handler(self, logging_mock):
         """
@@ -455,6 +773,90 @@ class TestKmipServer(testtools.TestCase):
 
         self.assertEqual(3, s._session_id)
 
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_setup_connection_handler_max_sessions(self, logging_mock):
+        """
+        Test that new connections are rejected once the maximum number of
+        concurrent sessions is reached and that finished sessions no longer
+        count against the limit.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s.config.settings['max_sessions'] = 1
+
+        live_session = mock.MagicMock()
+        live_session.is_alive.return_value = True
+        s._sessions = [live_session]
+
+        connection = mock.MagicMock()
+        address = ('127.0.0.1', 5696)
+
+        with mock.patch(
+            'kmip.services.server.session.KmipSession.start'
+        ) as session_mock:
+            s._setup_connection_handler(connection, address)
+
+            session_mock.assert_not_called()
+            connection.shutdown.assert_called_once_with(socket.SHUT_RDWR)
+            connection.close.assert_called_once_with()
+            s._logger.warning.assert_called_once_with(
+                "Rejecting connection from 127.0.0.1:5696. The maximum "
+                "number of concurrent sessions (1) has been reached."
+            )
+            self.assertEqual(1, s._session_id)
+
+            live_session.is_alive.return_value = False
+            connection.reset_mock()
+            s._setup_connection_handler(connection, address)
+
+            session_mock.assert_called_once_with()
+            connection.close.assert_not_called()
+            self.assertEqual(1, len(s._sessions))
+            self.assertIsNot(live_session, s._sessions[0])
+
+    @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
+    def test_setup_connection_handler_keepalive(self, logging_mock):
+        """
+        Test that TCP keepalive is enabled on new connections when
+        configured.
+        """
+        s = server.KmipServer(
+            hostname='127.0.0.1',
+            port=5696,
+            config_path=None
+        )
+        s._logger = mock.MagicMock()
+        s.config.settings['tcp_keepalive_idle'] = 60
+        s.config.settings['session_idle_timeout'] = 30
+
+        connection = mock.MagicMock()
+        address = ('127.0.0.1', 5696)
+
+        with mock.patch(
+            'kmip.services.server.session.KmipSession'
+        ) as session_mock:
+            s._setup_connection_handler(connection, address)
+
+            connection.setsockopt.assert_any_call(
+                socket.SOL_SOCKET,
+                socket.SO_KEEPALIVE,
+                1
+            )
+            if hasattr(socket, 'TCP_KEEPIDLE'):
+                connection.setsockopt.assert_any_call(
+                    socket.IPPROTO_TCP,
+                    socket.TCP_KEEPIDLE,
+                    60
+                )
+            self.assertEqual(
+                30,
+                session_mock.call_args[1].get('idle_timeout')
+            )
+
     @mock.patch('kmip.services.server.server.KmipServer._setup_logging')
     def test_as_context_manager(self, logging_mock):
         """
@@ -22,8 +22,14 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 
 import datetime
 import mock
+import os
+import shutil
 import socket
+import ssl
+import struct
+import tempfile
 import testtools
+import threading
 import time
 
 from kmip.core import enums
@@ -107,6 +113,179 @@ def build_certificate(
     return builder.sign(private_key, hashes.SHA256(), default_backend())
 
 
+def build_tls_contexts(path):
+    """
+    Build the server and client SSL contexts of a TLS connection, the server
+    side using a self-signed certificate written to the given directory.
+
+    Returns:
+        tuple: The server and client SSLContexts.
+    """
+    private_key = rsa.generate_private_key(
+        public_exponent=65537,
+        key_size=2048,
+        backend=default_backend()
+    )
+    name = x509.Name(
+        [x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, u'localhost')]
+    )
+    t = datetime.datetime.now()
+    certificate = x509.CertificateBuilder().serial_number(
+        1
+    ).issuer_name(
+        name
+    ).subject_name(
+        name
+    ).not_valid_before(
+        t - datetime.timedelta(days=1)
+    ).not_valid_after(
+        t + datetime.timedelta(days=1)
+    ).public_key(
+        private_key.public_key()
+    ).sign(private_key, hashes.SHA256(), default_backend())
+
+    certificate_path = os.path.join(path, 'certificate.pem')
+    key_path = os.path.join(path, 'key.pem')
+    with open(certificate_path, 'wb') as f:
+        f.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, 'wb') as f:
+        f.write(private_key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.TraditionalOpenSSL,
+            serialization.NoEncryption()
+        ))
+
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(certificate_path, key_path)
+    client_context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    client_context.load_verify_locations(certificate_path)
+    return server_context, client_context
+
+
+def build_tls_socket_pair(path):
+    """
+    Build a connected pair of TLS sockets, the server side using a
+    self-signed certificate written to the given directory.
+
+    Returns:
+        tuple: The server and client SSLSockets, after the handshake.
+    """
+    server_context, client_context = build_tls_contexts(path)
+
+    server_socket, client_socket = socket.socketpair()
+    connections = dict()
+
+    def accept():
+        connections['server'] = server_context.wrap_socket(
+            server_socket,
+            server_side=True
+        )
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    client = client_context.wrap_socket(
+        client_socket,
+        server_hostname='localhost'
+    )
+    thread.join()
+    return connections['server'], client
+
+
+class TlsRecordClient(object):
+    """
+    The client side of a TLS connection that exposes the encrypted records
+    it sends, so that a test can send part of a record only.
+    """
+
+    def __init__(self, context, connection):
+        self.connection = connection
+        self.incoming = ssl.MemoryBIO()
+        self.outgoing = ssl.MemoryBIO()
+        self.tls = context.wrap_bio(
+            self.incoming,
+            self.outgoing,
+            server_hostname='localhost'
+        )
+        while True:
+            try:
+                self.tls.do_handshake()
+                break
+            except ssl.SSLWantReadError:
+                self.flush()
+                self.incoming.write(self.connection.recv(65536))
+        self.flush()
+
+    def flush(self):
+        data = self.outgoing.read()
+        if data:
+            self.connection.sendall(data)
+
+    def encrypt(self, data):
+        """
+        Return the TLS records carrying the data, without sending them.
+        """
+        self.tls.write(data)
+        return self.outgoing.read()
+
+    def read(self, size):
+        """
+        Read exactly size bytes of decrypted data.
+        """
+        data = b''
+        while len(data) < size:
+            try:
+                data += self.tls.read(size - len(data))
+            except ssl.SSLWantReadError:
+                chunk = self.connection.recv(65536)
+                if not chunk:
+                    break
+                self.incoming.write(chunk)
+        return data
+
+
+def build_tls_record_client_pair(path):
+    """
+    Build a connected TLS server socket and TlsRecordClient.
+
+    Returns:
+        tuple: The server SSLSocket and the client, after the handshake.
+    """
+    server_context, client_context = build_tls_contexts(path)
+
+    server_socket, client_socket = socket.socketpair()
+    connections = dict()
+
+    def accept():
+        connections['server'] = server_context.wrap_socket(
+            server_socket,
+            server_side=True
+        )
+
+    thread = threading.Thread(target=accept)
+    thread.start()
+    client = TlsRecordClient(client_context, client_socket)
+    thread.join()
+    return connections['server'], client
+
+
+def build_recv_into(chunks):
+    """
+    Build a socket.recv_into replacement that copies each of the provided
+    chunks into the caller's buffer, one chunk per call. A None chunk is
+    returned as-is.
+    """
+    chunks = list(chunks)
+
+    def recv_into(buffer, nbytes=0):
+        chunk = chunks.pop(0)
+        if chunk is None:
+            return None
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 class TestKmipSession(testtools.TestCase):
     """
     A test suite for the KmipSession.
@@ -186,6 +365,196 @@ class TestKmipSession(testtools.TestCase):
         kmip_session._connection.close.assert_called_once_with()
         kmip_session._logger.info.assert_called_with("Stopping session: name")
 
+    def test_run_with_idle_timeout(self):
+        """
+        Test that the session applies its idle timeout to the connection and
+        closes the connection when the timeout expires.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            idle_timeout=30
+        )
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._handle_message_loop = mock.MagicMock(
+            side_effect=[
+                None,
+                socket.timeout()
+            ]
+        )
+
+        kmip_session.run()
+
+        kmip_session._connection.settimeout.assert_called_once_with(30)
+        self.assertEqual(2, kmip_session._handle_message_loop.call_count)
+        kmip_session._logger.info.assert_any_call(
+            "Session idle timeout exceeded. Closing connection."
+        )
+        kmip_session._logger.exception.assert_not_called()
+        kmip_session._connection.close.assert_called_once_with()
+
+    def test_close(self):
+        """
+        Test that closing a session shuts down reading from its connection
+        and stops the message handling loop without logging the resulting
+        read failure.
+        """
+        kmip_session = session.KmipSession(None, None, 'name')
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+
+        def handle_message_loop():
+            kmip_session.close()
+            raise socket.error("Connection shut down.")
+
+        kmip_session._handle_message_loop = mock.MagicMock(
+            side_effect=handle_message_loop
+        )
+
+        kmip_session.run()
+
+        kmip_session._handle_message_loop.assert_called_once_with()
+        kmip_session._logger.exception.assert_not_called()
+        kmip_session._connection.shutdown.assert_any_call(socket.SHUT_RD)
+        self.assertEqual(2, kmip_session._connection.shutdown.call_count)
+        kmip_session._connection.close.assert_called_once_with()
+
+        # Test that errors from shutting down a closed connection are
+        # ignored.
+        kmip_session._connection.shutdown.side_effect = socket.error()
+        kmip_session.close()
+
+    def test_run_pipelined(self):
+        """
+        Test that a session configured for pipelining processes requests
+        concurrently but sends the responses in request order.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            max_in_flight_requests=3
+        )
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._receive_request = mock.MagicMock(
+            side_effect=[
+                b'\x03',
+                b'\x02',
+                b'\x01',
+                exceptions.ConnectionClosed()
+            ]
+        )
+
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def process_request(request_data):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05 * ord(request_data))
+            with lock:
+                state['active'] -= 1
+            return request_data
+
+        sent = []
+        kmip_session._process_request = process_request
+        kmip_session._send_response = sent.append
+
+        kmip_session.run()
+
+        self.assertEqual([b'\x03', b'\x02', b'\x01'], sent)
+        self.assertTrue(1 < state['peak'] <= 3)
+        kmip_session._connection.shutdown.assert_called_once_with(
+            socket.SHUT_RDWR
+        )
+        kmip_session._connection.close.assert_called_once_with()
+        kmip_session._logger.info.assert_called_with("Stopping session: name")
+
+    def test_run_pipelined_with_in_flight_limit(self):
+        """
+        Test that a pipelined session never has more requests in progress
+        than the configured limit.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            max_in_flight_requests=2
+        )
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+
+        lock = threading.Lock()
+        state = {'in_flight': 0, 'peak': 0}
+        requests = [b'\x01'] * 6
+
+        def receive_request():
+            if not requests:
+                raise exceptions.ConnectionClosed()
+            with lock:
+                state['in_flight'] += 1
+                state['peak'] = max(state['peak'], state['in_flight'])
+            return requests.pop()
+
+        def send_response(response_data):
+            time.sleep(0.01)
+            with lock:
+                state['in_flight'] -= 1
+
+        kmip_session._receive_request = receive_request
+        kmip_session._process_request = mock.MagicMock(return_value=b'\x00')
+        kmip_session._send_response = send_response
+
+        kmip_session.run()
+
+        self.assertEqual(6, kmip_session._process_request.call_count)
+        self.assertEqual(0, state['in_flight'])
+        self.assertTrue(state['peak'] <= 2)
+
+    def test_run_pipelined_with_failure(self):
+        """
+        Test that a pipelined session logs processing failures, skips the
+        failed response and keeps handling later requests.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            max_in_flight_requests=2
+        )
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._receive_request = mock.MagicMock(
+            side_effect=[
+                b'\x01',
+                b'\x02',
+                exceptions.ConnectionClosed()
+            ]
+        )
+
+        test_exception = Exception("test")
+
+        def process_request(request_data):
+            if request_data == b'\x01':
+                raise test_exception
+            return request_data
+
+        sent = []
+        kmip_session._process_request = process_request
+        kmip_session._send_response = sent.append
+
+        kmip_session.run()
+
+        self.assertEqual([b'\x02'], sent)
+        kmip_session._logger.info.assert_any_call(
+            "Failure handling message loop"
+        )
+        kmip_session._logger.exception.assert_called_once_with(test_exception)
+
     def test_get_client_identity(self):
         """
         Test that a client identity is obtained from a valid client
@@ -472,40 +841,161 @@ class TestKmipSession(testtools.TestCase):
         expected = utils.BytearrayStream((content))
 
         kmip_session = session.KmipSession(None, None, 'name')
-        kmip_session._receive_bytes = mock.MagicMock(
-            side_effect=[content, b'']
-        )
+        kmip_session._receive_bytes = mock.MagicMock()
 
         observed = kmip_session._receive_request()
 
-        kmip_session._receive_bytes.assert_any_call(8)
-        kmip_session._receive_bytes.assert_any_call(0)
+        kmip_session._receive_bytes.assert_any_call(0, 8)
+        kmip_session._receive_bytes.assert_any_call(8, 8)
 
         self.assertEqual(expected.buffer, observed.buffer)
 
+    def test_receive_request_grows_buffer(self):
+        """
+        Test that the receive buffer grows to hold a request larger than its
+        initial size, and that it is reused for subsequent requests.
+        """
+        header = b'\x42\x00\x78\x01\x00\x00\x00\x10'
+        payload = b'\x01' * 16
+
+        kmip_session = session.KmipSession(None, None, 'name', buffer_size=8)
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([header, payload, header, payload])
+        )
+
+        observed = kmip_session._receive_request()
+        self.assertEqual(header + payload, observed.buffer)
+        self.assertEqual(24, len(kmip_session._buffer))
+
+        buffer = kmip_session._buffer
+        observed = kmip_session._receive_request()
+        self.assertEqual(header + payload, observed.buffer)
+        self.assertIs(buffer, kmip_session._buffer)
+
+    def test_receive_request_releases_oversized_buffer(self):
+        """
+        Test that a receive buffer grown beyond the maximum buffer size is
+        released once the request has been read.
+        """
+        header = b'\x42\x00\x78\x01\x00\x00\x00\x10'
+        payload = b'\x01' * 16
+
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            buffer_size=8,
+            max_buffer_size=16
+        )
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([header, payload])
+        )
+
+        observed = kmip_session._receive_request()
+        self.assertEqual(header + payload, observed.buffer)
+        self.assertEqual(8, len(kmip_session._buffer))
+
+    def test_receive_request_too_large(self):
+        """
+        Test that a request header advertising a length larger than the
+        maximum request size is rejected before any buffer is reserved for
+        its payload.
+        """
+        header = b'\x42\x00\x78\x01\xff\xff\xff\xf0'
+
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            buffer_size=8,
+            max_request_size=1024
+        )
+        kmip_session._logger = mock.MagicMock()
+        kmip_session._connection = mock.MagicMock()
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([header])
+        )
+
+        self.assertRaises(
+            exceptions.InvalidMessage,
+            kmip_session._receive_request
+        )
+        self.assertEqual(1, kmip_session._connection.recv_into.call_count)
+        self.assertEqual(8, len(kmip_session._buffer))
+        kmip_session._logger.warning.assert_called_once_with(
+            "Request message length too large: "
+            "4294967288 bytes, max 1024 bytes"
+        )
+
+    def test_run_with_request_too_large(self):
+        """
+        Test that a session answers an oversized request with an error and
+        closes the connection, in both the serial and the pipelined modes.
+        """
+        header = b'\x42\x00\x78\x01\x00\x10\x00\x00'
+
+        for max_in_flight_requests in (1, 2):
+            kmip_engine = engine.KmipEngine()
+            kmip_engine._logger = mock.MagicMock()
+            kmip_session = session.KmipSession(
+                kmip_engine,
+                None,
+                'name',
+                max_in_flight_requests=max_in_flight_requests
+            )
+            kmip_session._logger = mock.MagicMock()
+            kmip_session._connection = mock.MagicMock()
+            kmip_session._connection.recv_into = mock.MagicMock(
+                side_effect=build_recv_into([header])
+            )
+            kmip_session._connection.pending.return_value = 8
+
+            kmip_session.run()
+
+            kmip_session._connection.sendall.assert_called_once_with(
+                mock.ANY
+            )
+            response = messages.ResponseMessage()
+            response.read(utils.BytearrayStream(
+                kmip_session._connection.sendall.call_args[0][0]
+            ))
+            batch_item = response.batch_items[0]
+            self.assertEqual(
+                enums.ResultStatus.OPERATION_FAILED,
+                batch_item.result_status.value
+            )
+            self.assertEqual(
+                enums.ResultReason.INVALID_MESSAGE,
+                batch_item.result_reason.value
+            )
+            kmip_session._connection.close.assert_called_once_with()
+            kmip_session._logger.exception.assert_not_called()
+
     def test_receive_bytes(self):
         """
         Test that the session can receive a message.
         """
-        content = b'\x00\x00\x00\x00\x00\x00\x00\x00'
+        content = b'\x00\x01\x02\x03\x04\x05\x06\x07'
 
-        kmip_session = session.KmipSession(None, None, 'name')
+        kmip_session = session.KmipSession(None, None, 'name', buffer_size=16)
         kmip_session._connection = mock.MagicMock()
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=[content, content]
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([content, content])
         )
 
-        observed = kmip_session._receive_bytes(16)
+        kmip_session._receive_bytes(0, 16)
 
-        kmip_session._connection.recv.assert_any_call(16)
-        kmip_session._connection.recv.assert_called_with(8)
-        self.assertEqual(content + content, observed)
+        calls = kmip_session._connection.recv_into.call_args_list
+        self.assertEqual([16, 8], [c[0][1] for c in calls])
+        self.assertEqual(content + content, bytes(kmip_session._buffer))
 
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=['']
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([b''])
         )
 
-        args = (8, )
+        args = (0, 8)
         self.assertRaises(
             exceptions.ConnectionClosed,
             kmip_session._receive_bytes,
@@ -519,17 +1009,17 @@ class TestKmipSession(testtools.TestCase):
         """
         content = b'\x00\x00\x00\x00\x00\x00\x00\x00'
 
-        kmip_session = session.KmipSession(None, None, 'name')
+        kmip_session = session.KmipSession(None, None, 'name', buffer_size=32)
         kmip_session._connection = mock.MagicMock()
-        kmip_session._connection.recv = mock.MagicMock(
-            side_effect=[content, content, None]
+        kmip_session._connection.recv_into = mock.MagicMock(
+            side_effect=build_recv_into([content, content, None])
         )
 
-        args = [32]
+        args = [0, 32]
         self.assertRaises(ValueError, kmip_session._receive_bytes, *args)
 
-        kmip_session._connection.recv.assert_any_call(16)
-        kmip_session._connection.recv.assert_called_with(16)
+        calls = kmip_session._connection.recv_into.call_args_list
+        self.assertEqual([32, 24, 16], [c[0][1] for c in calls])
 
     def test_send_message(self):
         """
@@ -550,3 +1040,226 @@ class TestKmipSession(testtools.TestCase):
         kmip_session._connection.sendall.assert_called_once_with(
             bytes(buffer_full.buffer)
         )
+
+    def test_run_pipelined_over_tls(self):
+        """
+        Test that a pipelined session reads requests and sends responses
+        concurrently over a TLS connection, never using the connection from
+        two threads at once.
+        """
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        server, client = build_tls_socket_pair(path)
+        self.addCleanup(client.close)
+
+        kmip_session = session.KmipSession(
+            None,
+            server,
+            'name',
+            max_in_flight_requests=4
+        )
+        kmip_session._logger = mock.MagicMock()
+
+        def process_request(request_data):
+            time.sleep(0.001)
+            return bytes(request_data.buffer)
+
+        kmip_session._process_request = process_request
+
+        # Every call on the connection checks that no other thread is
+        # using it.
+        state = {'busy': False, 'overlaps': 0}
+        state_lock = threading.Lock()
+
+        def guard(method):
+            def call(*args, **kwargs):
+                with state_lock:
+                    if state['busy']:
+                        state['overlaps'] += 1
+                    state['busy'] = True
+                try:
+                    return method(*args, **kwargs)
+                finally:
+                    with state_lock:
+                        state['busy'] = False
+            return call
+
+        connection = mock.MagicMock(wraps=server)
+        connection.recv_into = guard(server.recv_into)
+        connection.sendall = guard(server.sendall)
+        connection.pending = server.pending
+        connection.fileno = server.fileno
+        kmip_session._connection = connection
+
+        requests = [
+            b'\x42\x00\x78\x01' + struct.pack('!I', 100) +
+            bytes(bytearray([i % 256])) * 100
+            for i in range(200)
+        ]
+
+        def send_requests():
+            for request in requests:
+                client.sendall(request)
+
+        kmip_session.start()
+        sender = threading.Thread(target=send_requests)
+        sender.start()
+
+        received = bytearray()
+        expected = b''.join(requests)
+        while len(received) < len(expected):
+            data = client.recv(65536)
+            if not data:
+                break
+            received.extend(data)
+        sender.join()
+
+        kmip_session.close()
+        kmip_session.join(5)
+
+        self.assertFalse(kmip_session.is_alive())
+        self.assertEqual(expected, bytes(received))
+        self.assertEqual(0, state['overlaps'])
+        kmip_session._logger.exception.assert_not_called()
+
+    def test_close_over_tls(self):
+        """
+        Test that a request being processed when the session is closed is
+        still answered over the TLS connection, in both the serial and the
+        pipelined modes.
+        """
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+
+        request = (
+            b'\x42\x00\x78\x01' + struct.pack('!I', 16) + b'\x01' * 16
+        )
+
+        for max_in_flight_requests in (1, 2):
+            server, client = build_tls_socket_pair(path)
+            client.settimeout(5)
+            self.addCleanup(client.close)
+
+            kmip_session = session.KmipSession(
+                None,
+                server,
+                'name',
+                max_in_flight_requests=max_in_flight_requests
+            )
+            kmip_session._logger = mock.MagicMock()
+
+            processing = threading.Event()
+            proceed = threading.Event()
+
+            def process_request(request_data):
+                processing.set()
+                proceed.wait(5)
+                return bytes(request_data.buffer)
+
+            kmip_session._process_request = process_request
+
+            kmip_session.start()
+            client.sendall(request)
+            self.assertTrue(processing.wait(5))
+
+            kmip_session.close()
+            time.sleep(0.1)
+            proceed.set()
+
+            # The client decrypting the response shows it was sent as a TLS
+            # record rather than in the clear.
+            received = b''
+            while len(received) < len(request):
+                data = client.recv(len(request) - len(received))
+                if not data:
+                    break
+                received += data
+            self.assertEqual(request, received)
+
+            kmip_session.join(5)
+            self.assertFalse(kmip_session.is_alive())
+            kmip_session._logger.exception.assert_not_called()
+
+    def test_run_pipelined_with_partial_record(self):
+        """
+        Test that a pipelined session keeps sending responses while the
+        client has sent only part of the TLS record carrying a request.
+        """
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        server, client = build_tls_record_client_pair(path)
+        client.connection.settimeout(5)
+        self.addCleanup(client.connection.close)
+
+        kmip_session = session.KmipSession(
+            None,
+            server,
+            'name',
+            max_in_flight_requests=2
+        )
+        kmip_session._logger = mock.MagicMock()
+
+        stalled = threading.Event()
+
+        def process_request(request_data):
+            # Answer the first request only once the session has started
+            # reading the partial record that follows it.
+            stalled.wait(5)
+            time.sleep(0.2)
+            return bytes(request_data.buffer)
+
+        kmip_session._process_request = process_request
+
+        requests = [
+            b'\x42\x00\x78\x01' + struct.pack('!I', 16) +
+            bytes(bytearray([i])) * 16
+            for i in range(2)
+        ]
+        first = client.encrypt(requests[0])
+        second = client.encrypt(requests[1])
+
+        kmip_session.start()
+        client.connection.sendall(first)
+        client.connection.sendall(second[:len(second) // 2])
+        stalled.set()
+
+        self.assertEqual(requests[0], client.read(len(requests[0])))
+
+        client.connection.sendall(second[len(second) // 2:])
+        self.assertEqual(requests[1], client.read(len(requests[1])))
+
+        kmip_session.close()
+        kmip_session.join(5)
+
+        self.assertFalse(kmip_session.is_alive())
+        kmip_session._logger.exception.assert_not_called()
+
+    def test_wait_for_data(self):
+        """
+        Test that a pipelined read waits for the connection to become
+        readable, unless the connection holds decrypted data already, and
+        times out after the idle timeout.
+        """
+        kmip_session = session.KmipSession(
+            None,
+            None,
+            'name',
+            idle_timeout=5
+        )
+        kmip_session._connection = mock.MagicMock()
+
+        kmip_session._connection.pending.return_value = 3
+        with mock.patch('select.select') as select_mock:
+            kmip_session._wait_for_data()
+        select_mock.assert_not_called()
+
+        kmip_session._connection.pending.return_value = 0
+        with mock.patch('select.select', return_value=([], [], [])) as \
+                select_mock:
+            self.assertRaises(socket.timeout, kmip_session._wait_for_data)
+        select_mock.assert_called_once_with(
+            [kmip_session._connection],
+            [],
+            [],
+            5
+        )
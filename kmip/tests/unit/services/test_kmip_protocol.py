@@ -13,16 +13,32 @@
 # License for the specific language governing permissions and limitations
 # under the License.
 
-from mock import call, MagicMock
+from mock import MagicMock
 from testtools import TestCase
 
 import binascii
 
 from kmip.services.server.kmip_protocol import KMIPProtocol
+from kmip.services.server.kmip_protocol import MessageTooLarge
 from kmip.services.server.kmip_protocol import RequestLengthMismatch
 from kmip.services.server.kmip_protocol import KMIPProtocolFactory
 
 
+def build_recv_into(chunks):
+    """
+    Build a socket.recv_into replacement that copies each of the provided
+    chunks into the caller's buffer, one chunk per call.
+    """
+    chunks = list(chunks)
+
+    def recv_into(buffer, nbytes=0):
+        chunk = chunks.pop(0)
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+    return recv_into
+
+
 class TestKMIPProtocol(TestCase):
 
     request = binascii.unhexlify(
@@ -77,20 +93,20 @@ class TestKMIPProtocol(TestCase):
 
     def test_IO_read(self):
         socket = MagicMock()
-        socket.recv = MagicMock(
-            side_effect=[self.response[:8], self.response[8:]])
+        socket.recv_into = MagicMock(side_effect=build_recv_into(
+            [self.response[:8], self.response[8:]]))
         protocol = self.factory.getProtocol(socket)
 
         received = protocol.read()
 
-        socket.recv.assert_any_call(8)
-        socket.recv.assert_any_call(len(self.response) - 8)
+        nbytes = [c[0][1] for c in socket.recv_into.call_args_list]
+        self.assertEqual([8, len(self.response) - 8], nbytes)
 
         self.assertEqual(self.response, received.peek())
 
     def test_IO_read_EOF(self):
         socket = MagicMock()
-        socket.recv = MagicMock(side_effect=[[]])
+        socket.recv_into = MagicMock(side_effect=build_recv_into([b'']))
         protocol = self.factory.getProtocol(socket)
 
         try:
@@ -100,12 +116,12 @@ class TestKMIPProtocol(TestCase):
         else:
             self.assertTrue(False, "Unexpected error")
 
-        socket.recv.assert_any_call(8)
+        self.assertEqual(8, socket.recv_into.call_args[0][1])
 
     def test_IO_read_request_length_mismatch(self):
         socket = MagicMock()
-        socket.recv = MagicMock(
-            side_effect=[self.response[:8], self.response[8:16], []])
+        socket.recv_into = MagicMock(side_effect=build_recv_into(
+            [self.response[:8], self.response[8:16], b'']))
         protocol = self.factory.getProtocol(socket)
         resp_len = len(self.response)
 
@@ -124,5 +140,46 @@ class TestKMIPProtocol(TestCase):
         else:
             self.assertTrue(False, "Unexpected error")
 
-        calls = [call(8), call(resp_len - 8), call(resp_len - 16)]
-        socket.recv.assert_has_calls(calls)
+        nbytes = [c[0][1] for c in socket.recv_into.call_args_list]
+        self.assertEqual([8, resp_len - 8, resp_len - 16], nbytes)
+
+    def test_IO_read_grows_buffer(self):
+        """
+        Test that the receive buffer grows to hold a message larger than its
+        initial size and is reused for subsequent reads.
+        """
+        socket = MagicMock()
+        socket.recv_into = MagicMock(side_effect=build_recv_into(
+            [self.response[:8], self.response[8:],
+             self.request[:8], self.request[8:]]))
+        protocol = KMIPProtocol(socket, buffer_size=16)
+
+        received = protocol.read()
+        self.assertEqual(self.response, received.peek())
+        buffer = protocol._buffer
+        self.assertTrue(len(buffer) >= len(self.response))
+
+        received = protocol.read()
+        self.assertEqual(self.request, received.peek())
+        self.assertIs(buffer, protocol._buffer)
+
+    def test_IO_read_message_too_large(self):
+        """
+        Test that a message header advertising a length larger than the
+        maximum message size is rejected before the buffer is grown.
+        """
+        socket = MagicMock()
+        socket.recv_into = MagicMock(side_effect=build_recv_into(
+            [b'\x42\x00\x7b\x01\xff\xff\xff\xf0']))
+        protocol = KMIPProtocol(socket, buffer_size=16, max_message_size=64)
+
+        e = self.assertRaises(MessageTooLarge, protocol.read)
+        self.assertEqual(4294967288, e.size)
+        self.assertEqual(64, e.max_size)
+        self.assertEqual(
+            "KMIPProtocol read error: message of 4294967288 bytes exceeds "
+            "the maximum of 64",
+            str(e)
+        )
+        self.assertEqual(1, socket.recv_into.call_count)
+        self.assertEqual(16, len(protocol._buffer))
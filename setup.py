@@ -38,15 +38,20 @@ setuptools.setup(
                   'kmip.demos': ['certs/server.crt', 'certs/server.key']},
     entry_points={
         'console_scripts':[
-            'pykmip-server = kmip.services.server.server:main'
+            'pykmip-server = kmip.services.server.server:main',
+            'pykmip-import = kmip.services.server.importer:main'
         ]
     },
     install_requires=[
         "cryptography",
         "enum34",
+        "futures; python_version < '3'",
         "six",
         "sqlalchemy"
     ],
+    extras_require={
+        'lmdb': ["lmdb"]
+    },
     classifiers=[
         "Intended Audience :: Developers",
         "License :: OSI Approved :: Apache Software License",